@@ -0,0 +1,223 @@
+""" Realistic response fixtures for the benchmark mock server """
+
+import enum
+import json
+import random
+import string
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+from matterapi.models import Config
+
+_rng = random.Random(4711)
+
+
+def make_id() -> str:
+    """Create a random 26 character id like the ones used by Mattermost"""
+    return "".join(_rng.choices(string.ascii_lowercase + string.digits, k=26))
+
+
+def _words(count: int) -> str:
+    return " ".join(
+        "".join(_rng.choices(string.ascii_lowercase, k=_rng.randint(2, 9)))
+        for _ in range(count)
+    )
+
+
+def make_user(user_id: str = None) -> Dict[str, Any]:
+    user_id = user_id or make_id()
+    username = "".join(_rng.choices(string.ascii_lowercase, k=8))
+    return {
+        "id": user_id,
+        "create_at": 1640995200000,
+        "update_at": 1650995200000,
+        "delete_at": 0,
+        "username": username,
+        "first_name": username.capitalize(),
+        "last_name": "Benchmark",
+        "nickname": username[:4],
+        "email": f"{username}@example.com",
+        "email_verified": True,
+        "auth_service": "",
+        "roles": "system_user",
+        "locale": "en",
+        "notify_props": {
+            "email": "true",
+            "push": "mention",
+            "desktop": "mention",
+            "desktop_sound": "true",
+            "mention_keys": f"{username},@{username}",
+            "channel": "true",
+            "first_name": "false",
+        },
+        "props": {"customStatus": ""},
+        "last_password_update": 1640995200000,
+        "last_picture_update": 1640995200000,
+        "failed_attempts": 0,
+        "mfa_active": False,
+        "timezone": {
+            "useAutomaticTimezone": "true",
+            "manualTimezone": "",
+            "automaticTimezone": "Europe/Vienna",
+        },
+    }
+
+
+def make_post(channel_id: str, user_id: str, create_at: int, root_id: str = ""):
+    post_id = make_id()
+    post = {
+        "id": post_id,
+        "create_at": create_at,
+        "update_at": create_at,
+        "edit_at": 0,
+        "delete_at": 0,
+        "is_pinned": False,
+        "user_id": user_id,
+        "channel_id": channel_id,
+        "root_id": root_id,
+        "original_id": "",
+        "message": _words(_rng.randint(3, 40)),
+        "type": "",
+        "props": {"from_bot": "false"} if _rng.random() < 0.2 else {},
+        "hashtag": "",
+        "file_ids": [],
+        "pending_post_id": "",
+        "reply_count": 0,
+        "metadata": {},
+    }
+    if _rng.random() < 0.3:
+        post["metadata"]["reactions"] = [
+            {
+                "user_id": make_id(),
+                "post_id": post_id,
+                "emoji_name": _rng.choice(["+1", "smile", "tada", "eyes"]),
+                "create_at": create_at + 1000,
+            }
+            for _ in range(_rng.randint(1, 4))
+        ]
+    if _rng.random() < 0.1:
+        post["metadata"]["embeds"] = [
+            {
+                "type": "opengraph",
+                "url": "https://example.com/article",
+                "data": {"title": _words(5), "description": _words(20)},
+            }
+        ]
+    if _rng.random() < 0.1:
+        file_id = make_id()
+        post["file_ids"] = [file_id]
+        post["metadata"]["files"] = [
+            {
+                "id": file_id,
+                "user_id": user_id,
+                "post_id": post_id,
+                "create_at": create_at,
+                "update_at": create_at,
+                "delete_at": 0,
+                "name": "screenshot.png",
+                "extension": "png",
+                "size": 123456,
+                "mime_type": "image/png",
+                "width": 1280,
+                "height": 720,
+                "has_preview_image": True,
+            }
+        ]
+    return post
+
+
+def make_post_list(channel_id: str, count: int = 60) -> Dict[str, Any]:
+    users = [make_id() for _ in range(12)]
+    posts = {}
+    order = []
+    roots: List[str] = []
+    create_at = 1650000000000
+    for _ in range(count):
+        create_at += _rng.randint(1000, 600000)
+        root_id = _rng.choice(roots) if roots and _rng.random() < 0.3 else ""
+        post = make_post(channel_id, _rng.choice(users), create_at, root_id)
+        if not root_id:
+            roots.append(post["id"])
+        posts[post["id"]] = post
+        order.insert(0, post["id"])
+    return {
+        "order": order,
+        "posts": posts,
+        "next_post_id": "",
+        "prev_post_id": make_id(),
+    }
+
+
+def _sample_value(type_, name: str):
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        return make_model_sample(type_)
+    if isinstance(type_, type) and issubclass(type_, enum.Enum):
+        return next(iter(type_)).value
+    if type_ is bool:
+        return True
+    if type_ is int:
+        return 300
+    if type_ is float:
+        return 1.5
+    if type_ is str:
+        return f"{name}_value"
+    return None
+
+
+def make_model_sample(model) -> Dict[str, Any]:
+    """Create a dictionary containing sample values for all fields of a model"""
+    sample = {}
+    for field in model.__fields__.values():
+        value = _sample_value(field.type_, field.alias)
+        if field.outer_type_ is not field.type_ and value is not None:
+            value = [value, value]
+        sample[field.alias] = value
+    return sample
+
+
+def make_config() -> Dict[str, Any]:
+    return make_model_sample(Config)
+
+
+class Fixtures:
+    """Pre-encoded response bodies for the benchmarked endpoints"""
+
+    def __init__(self, posts_per_page: int = 60, users_per_page: int = 60):
+        self.channel_id = make_id()
+        self.users = [make_user() for _ in range(users_per_page)]
+        self.users_by_id = {user["id"]: user for user in self.users}
+        self.post_list = make_post_list(self.channel_id, posts_per_page)
+        self.config = make_config()
+        self.encoded = {
+            "post_list": json.dumps(self.post_list).encode(),
+            "users": json.dumps(self.users).encode(),
+            "config": json.dumps(self.config).encode(),
+        }
+        self.user_ids = list(self.users_by_id)
+
+    def posted_event(self, seq: int) -> str:
+        """Create a websocket ``posted`` event as sent by the server"""
+        post_id = self.post_list["order"][seq % len(self.post_list["order"])]
+        post = self.post_list["posts"][post_id]
+        return json.dumps(
+            {
+                "event": "posted",
+                "data": {
+                    "channel_display_name": "Town Square",
+                    "channel_name": "town-square",
+                    "channel_type": "O",
+                    "post": json.dumps(post),
+                    "sender_name": "@benchmark",
+                    "set_online": True,
+                    "team_id": "",
+                },
+                "broadcast": {
+                    "omit_users": None,
+                    "user_id": "",
+                    "channel_id": self.channel_id,
+                    "team_id": "",
+                },
+                "seq": seq,
+            }
+        )
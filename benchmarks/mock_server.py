@@ -0,0 +1,111 @@
+""" In-process stand-in for a Mattermost server used by the benchmarks """
+
+import asyncio
+import json
+import re
+
+import httpx
+import websockets.server as ws_server
+
+from .fixtures import Fixtures, make_id
+
+BASEPATH = "/api/v4"
+
+
+class MockMattermost:
+    """Serves fixture responses for the benchmarked endpoints
+
+    Use :meth:`transport` to get a ``httpx.MockTransport`` which can be passed to the
+    clients through ``httpx_client_options`` and :meth:`serve_websocket` to run a local
+    websocket server emitting ``posted`` events.
+    """
+
+    def __init__(self, fixtures: Fixtures):
+        self.fixtures = fixtures
+        self.requests = 0
+        self._routes = [
+            ("GET", re.compile(r"/channels/[a-z0-9]+/posts"), self._get_posts),
+            ("GET", re.compile(r"/users"), self._get_users),
+            ("POST", re.compile(r"/users/ids"), self._get_users_by_ids),
+            ("POST", re.compile(r"/posts"), self._create_post),
+            ("GET", re.compile(r"/config"), self._get_config),
+        ]
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        path = request.url.path[len(BASEPATH) :]
+        for method, pattern, handler in self._routes:
+            if request.method == method and pattern.fullmatch(path):
+                return handler(request)
+        return httpx.Response(
+            404,
+            json={
+                "id": "api.context.404.app_error",
+                "message": "Sorry, we could not find the page.",
+                "request_id": make_id(),
+                "status_code": 404,
+            },
+        )
+
+    def _json(self, status_code: int, content: bytes) -> httpx.Response:
+        return httpx.Response(
+            status_code,
+            content=content,
+            headers={"Content-Type": "application/json", "X-Request-Id": make_id()},
+        )
+
+    def _get_posts(self, request):
+        return self._json(200, self.fixtures.encoded["post_list"])
+
+    def _get_users(self, request):
+        return self._json(200, self.fixtures.encoded["users"])
+
+    def _get_users_by_ids(self, request):
+        users_by_id = self.fixtures.users_by_id
+        users = [users_by_id[user_id] for user_id in json.loads(request.content)]
+        return self._json(200, json.dumps(users).encode())
+
+    def _create_post(self, request):
+        post = json.loads(request.content)
+        post.update(
+            id=make_id(),
+            create_at=1650000000000,
+            update_at=1650000000000,
+            delete_at=0,
+            user_id=self.fixtures.user_ids[0],
+        )
+        return self._json(201, json.dumps(post).encode())
+
+    def _get_config(self, request):
+        return self._json(200, self.fixtures.encoded["config"])
+
+    async def serve_websocket(self, event_count: int):
+        """Start a websocket server which sends ``event_count`` events to each client
+
+        Returns the server and the url to connect to.
+        """
+
+        async def handler(websocket, path=None):
+            # pylint: disable=unused-argument
+            await websocket.recv()
+            await websocket.send(
+                json.dumps(
+                    {
+                        "event": "hello",
+                        "data": {"server_version": "benchmark"},
+                        "seq": 0,
+                    }
+                )
+            )
+            await websocket.send(json.dumps({"status": "OK", "seq_reply": 1}))
+            for seq in range(1, event_count + 1):
+                await websocket.send(self.fixtures.posted_event(seq))
+            await websocket.wait_closed()
+
+        server = await ws_server.serve(handler, "127.0.0.1", 0)
+        port = next(iter(server.sockets)).getsockname()[1]
+        await asyncio.sleep(0)
+        return server, f"ws://127.0.0.1:{port}"
@@ -0,0 +1,112 @@
+"""Compare the model backends on the frequently parsed models
+
+Usage::
+
+    python -m benchmarks.models [--rounds N] [--json FILE]
+
+Every model is created from the same decoded json with pydantic validation
+(``parse_obj``), as lazy model and as fast model, reporting microseconds per object.
+Before measuring, the fast and lazy results are checked against ``parse_obj``,
+including unusual shapes pydantic accepts.
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from matterapi import models
+from matterapi.fast import fast_parse_obj
+from matterapi.lazy import lazy_parse_obj
+
+from .fixtures import make_id, make_model_sample, make_post_list, make_user
+
+BACKENDS: Dict[str, Callable[[Any, Any], Any]] = {
+    "pydantic": lambda model, data: model.parse_obj(data),
+    "lazy": lazy_parse_obj,
+    "fast": fast_parse_obj,
+}
+
+
+def samples() -> Dict[str, Any]:
+    post_list = make_post_list(make_id(), 60)
+    return {
+        "Post": (models.Post, next(iter(post_list["posts"].values()))),
+        "User": (models.User, make_user()),
+        "Channel": (models.Channel, make_model_sample(models.Channel)),
+        "ChannelMember": (
+            models.ChannelMember,
+            make_model_sample(models.ChannelMember),
+        ),
+        "TeamMember": (models.TeamMember, make_model_sample(models.TeamMember)),
+        "Status": (models.Status, make_model_sample(models.Status)),
+        "Reaction": (models.Reaction, make_model_sample(models.Reaction)),
+        "PostList (60 posts)": (models.PostList, post_list),
+    }
+
+
+# Nested models sent as lists, which pydantic converts with dict()
+EDGE_CASES = [
+    (models.Post, {"id": "p", "props": []}),
+    (models.Post, {"id": "p", "props": [["key", "value"]]}),
+    (models.Post, {"id": "p", "metadata": []}),
+    (models.User, {"id": "u", "notify_props": []}),
+    (models.User, {"id": "u", "timezone": []}),
+    (models.PostList, {"order": ["p"], "posts": {"p": [["id", "p"]]}}),
+]
+
+
+def check_parity(cases):
+    """Raise ``AssertionError`` if a backend creates a different object than ``parse_obj``"""
+    for model, data in cases:
+        expected = model.parse_obj(data)
+        for name, parse in BACKENDS.items():
+            result = parse(model, data)
+            if result != expected or result.__fields_set__ != expected.__fields_set__:
+                raise AssertionError(
+                    f"{name} differs from parse_obj for {model.__name__}: {data!r}"
+                )
+
+
+def measure(parse: Callable, model, data, rounds: int) -> float:
+    """Return the best time of creating one object in microseconds"""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            parse(model, data)
+        best = min(best, (time.perf_counter() - start) / rounds)
+    return best * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--json", help="Write results as json to this file")
+    args = parser.parse_args(argv)
+
+    check_parity(list(samples().values()) + EDGE_CASES)
+    results: List[Dict[str, Any]] = []
+    header = f"{'model':<22}" + "".join(f"{name + ' us':>13}" for name in BACKENDS)
+    print(header + f"{'speedup':>9}")
+    print("-" * (len(header) + 9))
+    for name, (model, data) in samples().items():
+        rounds = max(1, args.rounds // 60) if model is models.PostList else args.rounds
+        timings = {
+            backend: measure(parse, model, data, rounds)
+            for backend, parse in BACKENDS.items()
+        }
+        speedup = timings["pydantic"] / timings["fast"]
+        results.append({"model": name, **timings, "speedup": speedup})
+        print(
+            f"{name:<22}"
+            + "".join(f"{timings[backend]:>13.2f}" for backend in BACKENDS)
+            + f"{speedup:>8.1f}x"
+        )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+""" Run the offline benchmarks
+
+Usage::
+
+    python -m benchmarks.run [--iterations N] [--concurrency N] [--only ENDPOINT] [--json FILE]
+
+All requests are served by an in-process stand-in server, so results only
+reflect client side costs (request building, httpx, json decoding and model parsing).
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from matterapi import AsyncClient, SyncClient
+from matterapi.client.tracing import TraceHooks
+
+from .fixtures import Fixtures
+from .mock_server import MockMattermost
+
+CALLS: Dict[str, Callable] = {
+    "get_posts_for_channel": lambda api, fx: api.posts.get_posts_for_channel(
+        fx.channel_id
+    ),
+    "get_users": lambda api, fx: api.users.get_users(per_page=60),
+    "get_users_by_ids": lambda api, fx: api.users.get_users_by_ids(
+        json_body=fx.user_ids[:20]
+    ),
+    "create_post": lambda api, fx: api.posts.create_post(
+        json_body={"channel_id": fx.channel_id, "message": "benchmark message"}
+    ),
+    "get_config": lambda api, fx: api.system.get_config(),
+}
+
+MODES = ("sync", "sync-session", "async", "async-session")
+
+MEMORY_ITERATIONS = 20
+
+
+class ParseTimeCollector(TraceHooks):
+    """Collects the parse time of all finished spans"""
+
+    def __init__(self):
+        self.parse_times: List[float] = []
+
+    def on_end(self, span):
+        self.parse_times.append(span.timings["parse"])
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[round(fraction * (len(ordered) - 1))]
+
+
+def summarize(mode, endpoint, latencies, total, parse_times, peak_memory):
+    return {
+        "mode": mode,
+        "endpoint": endpoint,
+        "requests": len(latencies),
+        "requests_per_second": len(latencies) / total,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "parse_ms": sum(parse_times) / len(parse_times) * 1000,
+        "peak_memory_kib": peak_memory / 1024,
+    }
+
+
+def client_options(server: MockMattermost, collector: ParseTimeCollector, **kwargs):
+    return {
+        "url": "http://mattermost.bench",
+        "auth": {"token": "benchmark-token"},
+        "httpx_client_options": {"transport": server.transport()},
+        "trace_hooks": [collector],
+        **kwargs,
+    }
+
+
+def run_sync(mode, endpoint, server, fixtures, iterations):
+    collector = ParseTimeCollector()
+    client = SyncClient(options=client_options(server, collector))
+    call = CALLS[endpoint]
+
+    def timed_calls(api, count):
+        latencies = []
+        for _ in range(count):
+            start = time.perf_counter()
+            call(api, fixtures)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    def measure(count):
+        if mode == "sync-session":
+            with client.session() as api:
+                return timed_calls(api, count)
+        return timed_calls(client, count)
+
+    start = time.perf_counter()
+    latencies = measure(iterations)
+    total = time.perf_counter() - start
+    parse_times = list(collector.parse_times)
+
+    tracemalloc.start()
+    measure(min(iterations, MEMORY_ITERATIONS))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return summarize(mode, endpoint, latencies, total, parse_times, peak)
+
+
+async def run_async(mode, endpoint, server, fixtures, iterations, concurrency):
+    collector = ParseTimeCollector()
+    client = AsyncClient(options=client_options(server, collector))
+    call = CALLS[endpoint]
+
+    async def timed_calls(api, count):
+        latencies = []
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def timed_call():
+            async with semaphore:
+                start = time.perf_counter()
+                await call(api, fixtures)
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(timed_call() for _ in range(count)))
+        return latencies
+
+    async def measure(count):
+        if mode == "async-session":
+            async with client.session() as api:
+                return await timed_calls(api, count)
+        return await timed_calls(client, count)
+
+    start = time.perf_counter()
+    latencies = await measure(iterations)
+    total = time.perf_counter() - start
+    parse_times = list(collector.parse_times)
+
+    tracemalloc.start()
+    await measure(min(iterations, MEMORY_ITERATIONS))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return summarize(mode, endpoint, latencies, total, parse_times, peak)
+
+
+async def run_websocket(server: MockMattermost, event_count: int):
+    ws_server, ws_url = await server.serve_websocket(event_count)
+    client = AsyncClient(
+        options=client_options(server, ParseTimeCollector(), ws_url=ws_url)
+    )
+    received = 0
+    done = asyncio.Event()
+
+    async def handler(message):
+        nonlocal received
+        json.loads(message["data"]["post"])
+        received += 1
+        if received == event_count:
+            done.set()
+
+    start = time.perf_counter()
+    listener = asyncio.create_task(client.start_ws(handler))
+    await done.wait()
+    total = time.perf_counter() - start
+    listener.cancel()
+    try:
+        await listener
+    except asyncio.CancelledError:
+        pass
+    ws_server.close()
+    await ws_server.wait_closed()
+    return {
+        "mode": "websocket",
+        "endpoint": "posted events",
+        "events": event_count,
+        "events_per_second": event_count / total,
+    }
+
+
+def print_results(results):
+    header = (
+        f"{'mode':<14} {'endpoint':<22} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'parse ms':>9} {'peak KiB':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        if result["mode"] == "websocket":
+            print(
+                f"{result['mode']:<14} {result['endpoint']:<22} "
+                f"{result['events_per_second']:>9.0f} events/s"
+            )
+            continue
+        print(
+            f"{result['mode']:<14} {result['endpoint']:<22} "
+            f"{result['requests_per_second']:>9.0f} {result['p50_ms']:>8.2f} "
+            f"{result['p99_ms']:>8.2f} {result['parse_ms']:>9.2f} "
+            f"{result['peak_memory_kib']:>9.0f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Number of concurrent requests for the async client",
+    )
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument(
+        "--only", choices=sorted(CALLS), action="append", help="Limit endpoints"
+    )
+    parser.add_argument("--mode", choices=MODES, action="append", help="Limit modes")
+    parser.add_argument("--json", help="Write results as json to this file")
+    args = parser.parse_args(argv)
+
+    fixtures = Fixtures()
+    server = MockMattermost(fixtures)
+    results = []
+    for mode in args.mode or MODES:
+        for endpoint in args.only or CALLS:
+            if mode.startswith("sync"):
+                result = run_sync(mode, endpoint, server, fixtures, args.iterations)
+            else:
+                result = asyncio.run(
+                    run_async(
+                        mode,
+                        endpoint,
+                        server,
+                        fixtures,
+                        args.iterations,
+                        args.concurrency,
+                    )
+                )
+            results.append(result)
+    if args.events:
+        results.append(asyncio.run(run_websocket(server, args.events)))
+
+    print_results(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+""" Columnar export of posts, users, channels, members and reactions to Arrow and Parquet """
+
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from pydantic import BaseModel, Extra
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+
+from .models import Channel, ChannelMember, Post, Reaction, User
+from .paging import channel_posts, paginate, post_reactions
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+EXPORT_MODELS = (Post, User, Channel, ChannelMember, Reaction)
+""" Models with a predefined column layout """
+
+POST_PROPS_KEYS = (
+    "from_webhook",
+    "from_bot",
+    "override_username",
+    "override_icon_url",
+    "attachments",
+)
+""" Keys of ``Post.props`` which get their own column by default """
+
+EXTRA_COLUMN = "extra"
+""" Column holding all undeclared top level keys of a row as json """
+
+_KINDS = {str: "string", int: "int", float: "float", bool: "bool"}
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    # Some nested props like notify props are sent as "true" and "false"
+    if isinstance(value, str):
+        return value == "true"
+    return bool(value)
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "string": str,
+    "int": int,
+    "float": float,
+    "bool": _to_bool,
+}
+_PYTHON_TYPES = {"string": str, "int": int, "float": float, "bool": bool}
+
+
+def _require_pyarrow():
+    if pyarrow is None:
+        raise ImportError(
+            "pyarrow is required for the arrow export, install it with "
+            "'pip install matterapi[arrow]'"
+        )
+
+
+class ColumnSpec:
+    """Description of a single exported column
+
+    Args:
+        name: Column name, nested fields are joined by ``.``, e.g. ``metadata.files``
+        path: Keys leading to the value in the decoded json of a row
+        kind: One of ``string``, ``int``, ``float``, ``bool``, ``strings`` (list of
+            strings) or ``json`` (any value encoded as json text)
+    """
+
+    __slots__ = ("name", "path", "kind")
+
+    def __init__(self, name: str, path: Sequence[str], kind: str):
+        self.name = name
+        self.path = tuple(path)
+        self.kind = kind
+
+    def __repr__(self):
+        return f"ColumnSpec({self.name!r}, {self.kind!r})"
+
+    def arrow_type(self):
+        """Return the Arrow data type of the column"""
+        _require_pyarrow()
+        if self.kind == "int":
+            return pyarrow.int64()
+        if self.kind == "float":
+            return pyarrow.float64()
+        if self.kind == "bool":
+            return pyarrow.bool_()
+        if self.kind == "strings":
+            return pyarrow.list_(pyarrow.string())
+        return pyarrow.string()
+
+
+def _field_columns(model, prefix: Sequence[str]) -> List[ColumnSpec]:
+    columns = []
+    for field in model.__fields__.values():
+        path = tuple(prefix) + (field.alias,)
+        name = ".".join(path)
+        type_ = field.type_
+        if field.shape == SHAPE_SINGLETON and type_ in _KINDS and not field.sub_fields:
+            columns.append(ColumnSpec(name, path, _KINDS[type_]))
+        elif field.shape == SHAPE_LIST and type_ is str:
+            columns.append(ColumnSpec(name, path, "strings"))
+        elif (
+            field.shape == SHAPE_SINGLETON
+            and isinstance(type_, type)
+            and issubclass(type_, BaseModel)
+            and type_.__fields__
+            and not type_.__custom_root_type__
+        ):
+            # Nested objects with known keys are flattened into one column per key
+            columns.extend(_field_columns(type_, path))
+        else:
+            columns.append(ColumnSpec(name, path, "json"))
+    return columns
+
+
+def column_specs(
+    model: type, props_keys: Optional[Sequence[str]] = None
+) -> List[ColumnSpec]:
+    """Return the columns a model is exported into
+
+    Fields of basic types and lists of strings map to typed columns. Nested objects
+    with declared fields, like ``Post.metadata`` or ``User.timezone``, are flattened into
+    one column per field. Free form objects and lists of objects are stored as json text.
+    For posts, the ``props`` keys given in ``props_keys`` get their own column as well.
+    If the model allows undeclared keys, they are kept as json in :data:`EXTRA_COLUMN`.
+
+    Args:
+        model: The model class, e.g. :class:`~matterapi.models.Post`
+        props_keys: Keys of ``props`` to store in ``props.<key>`` columns as json
+            text. Defaults to :data:`POST_PROPS_KEYS` for posts.
+    """
+    columns = _field_columns(model, ())
+    if props_keys is None and model is Post:
+        props_keys = POST_PROPS_KEYS
+    if props_keys:
+        position = next(
+            (
+                index + 1
+                for index, column in enumerate(columns)
+                if column.name == "props"
+            ),
+            len(columns),
+        )
+        columns[position:position] = [
+            ColumnSpec(f"props.{key}", ("props", key), "json") for key in props_keys
+        ]
+    if model.__config__.extra == Extra.allow:
+        columns.append(ColumnSpec(EXTRA_COLUMN, (), "json"))
+    return columns
+
+
+def arrow_schema(model: type, props_keys: Optional[Sequence[str]] = None):
+    """Return the ``pyarrow.Schema`` rows of ``model`` are exported with"""
+    _require_pyarrow()
+    return pyarrow.schema(
+        [
+            pyarrow.field(column.name, column.arrow_type())
+            for column in column_specs(model, props_keys)
+        ]
+    )
+
+
+def _dump(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+class ColumnBuffer:
+    """Collects rows column by column until they are converted into a record batch
+
+    Rows are decoded json objects as returned with ``skip_response_parsing`` or
+    model instances.
+    """
+
+    def __init__(self, model: type, props_keys: Optional[Sequence[str]] = None):
+        self.model = model
+        self.props_keys = props_keys
+        self.columns = column_specs(model, props_keys)
+        self._schema = None
+        self.values: Dict[str, List[Any]] = {column.name: [] for column in self.columns}
+        self._declared = frozenset(field.alias for field in model.__fields__.values())
+        self._rows = 0
+
+    def __len__(self):
+        return self._rows
+
+    def append(self, row: Any):
+        """Add a single row"""
+        if isinstance(row, BaseModel):
+            row = row.dict(by_alias=True, exclude_unset=True)
+        for column in self.columns:
+            if not column.path:
+                extra = {
+                    key: value
+                    for key, value in row.items()
+                    if key not in self._declared
+                }
+                self.values[column.name].append(_dump(extra) if extra else None)
+                continue
+            value = row
+            for key in column.path:
+                value = value.get(key) if isinstance(value, dict) else None
+            if column.kind == "json":
+                value = _dump(value)
+            elif (
+                value is not None
+                and column.kind in _CONVERTERS
+                and type(value) is not _PYTHON_TYPES[column.kind]
+            ):
+                value = _CONVERTERS[column.kind](value)
+            self.values[column.name].append(value)
+        self._rows += 1
+
+    def take(self) -> Dict[str, List[Any]]:
+        """Return the collected values per column name and start over"""
+        values = self.values
+        self.values = {column.name: [] for column in self.columns}
+        self._rows = 0
+        return values
+
+    def record_batch(self):
+        """Convert the collected rows into a ``pyarrow.RecordBatch`` and start over"""
+        values = self.take()
+        schema = self.schema
+        return pyarrow.RecordBatch.from_arrays(
+            [
+                pyarrow.array(values[column.name], type=schema.field(column.name).type)
+                for column in self.columns
+            ],
+            schema=schema,
+        )
+
+    @property
+    def schema(self):
+        """The ``pyarrow.Schema`` of the record batches"""
+        if self._schema is None:
+            self._schema = arrow_schema(self.model, self.props_keys)
+        return self._schema
+
+
+def record_batches(
+    model: type,
+    rows: Iterable[Any],
+    batch_size: int = 10000,
+    props_keys: Optional[Sequence[str]] = None,
+) -> Iterator[Any]:
+    """Convert rows into ``pyarrow.RecordBatch`` objects of at most ``batch_size`` rows
+
+    Only one batch is held in memory at a time, so arbitrarily long streams can be
+    converted, e.g. the elements yielded by :func:`paginate`.
+    """
+    buffer = ColumnBuffer(model, props_keys)
+    for row in rows:
+        buffer.append(row)
+        if len(buffer) >= batch_size:
+            yield buffer.record_batch()
+    if len(buffer):
+        yield buffer.record_batch()
+
+
+class ColumnarWriter:
+    """Write rows of one model into a Parquet or Arrow IPC file
+
+    Every ``batch_size`` rows are written as one Parquet row group or Arrow record batch,
+    which bounds the memory needed for exports of any size.
+
+    .. code-block:: python
+
+        api = SyncClient(options={..., "skip_response_parsing": True})
+        with ColumnarWriter(Post, "posts.parquet") as writer:
+            for channel_id in channel_ids:
+                writer.write(channel_posts(api, channel_id))
+
+    Args:
+        model: Model of the rows, one of :data:`EXPORT_MODELS` or any other model
+        path: Path of the file to write
+        format: ``parquet`` or ``arrow`` for the Arrow IPC file format
+        batch_size: Number of rows per row group or record batch
+        props_keys: See :func:`column_specs`
+        compression: Compression codec, e.g. ``zstd``, ``snappy`` or ``None``
+    """
+
+    def __init__(
+        self,
+        model: type,
+        path: str,
+        *,
+        format: str = "parquet",  # pylint: disable=redefined-builtin
+        batch_size: int = 10000,
+        props_keys: Optional[Sequence[str]] = None,
+        compression: Optional[str] = "zstd",
+    ):
+        _require_pyarrow()
+        if format not in ("parquet", "arrow"):
+            raise ValueError(f"Unknown format {format!r}")
+        self.batch_size = batch_size
+        self.rows = 0
+        self._buffer = ColumnBuffer(model, props_keys)
+        schema = self._buffer.schema
+        if format == "parquet":
+            self._writer = pyarrow.parquet.ParquetWriter(
+                path, schema, compression=compression or "none"
+            )
+        else:
+            options = pyarrow.ipc.IpcWriteOptions(compression=compression)
+            self._writer = pyarrow.ipc.new_file(path, schema, options=options)
+
+    def write(self, rows: Iterable[Any]) -> int:
+        """Write rows and return their number"""
+        count = 0
+        for row in rows:
+            self._buffer.append(row)
+            count += 1
+            if len(self._buffer) >= self.batch_size:
+                self._flush()
+        self.rows += count
+        return count
+
+    def _flush(self):
+        if len(self._buffer):
+            self._writer.write_batch(self._buffer.record_batch())
+
+    def close(self):
+        """Write the remaining rows and finish the file"""
+        self._flush()
+        self._writer.close()
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+__all__ = [
+    "ColumnSpec",
+    "ColumnBuffer",
+    "ColumnarWriter",
+    "column_specs",
+    "arrow_schema",
+    "record_batches",
+    "paginate",
+    "channel_posts",
+    "post_reactions",
+    "EXPORT_MODELS",
+    "POST_PROPS_KEYS",
+    "EXTRA_COLUMN",
+]
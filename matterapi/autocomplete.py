@@ -0,0 +1,416 @@
+""" Local prefix index answering autocomplete queries for users, channels and emoji """
+
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .fast import fast_parse_obj
+from .models import Channel, Emoji, User
+from .paging import _apply_event, _decoded, _loads, paginate
+
+
+class _Node:
+    __slots__ = ("children", "items", "ordered")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.items: Set[Hashable] = set()
+        # Sorted items and child keys, reset on every change
+        self.ordered: Optional[Tuple[List[Hashable], List[str]]] = None
+
+
+class PrefixTrie:
+    """Map string keys to items and find all items of keys starting with a prefix
+
+    Keys are case insensitive and an item can be stored under any number of keys.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+
+    def add(self, key: str, item: Hashable):
+        node = self._root
+        for char in key.casefold():
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+                node.ordered = None
+            node = child
+        node.items.add(item)
+        node.ordered = None
+
+    def discard(self, key: str, item: Hashable):
+        """Remove an item from a key, nodes left without items are pruned"""
+        chars = key.casefold()
+        path = [self._root]
+        for char in chars:
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].items.discard(item)
+        path[-1].ordered = None
+        for depth in range(len(chars), 0, -1):
+            if path[depth].items or path[depth].children:
+                break
+            del path[depth - 1].children[chars[depth - 1]]
+            path[depth - 1].ordered = None
+
+    def find(self, prefix: str, limit: Optional[int] = None) -> List[Hashable]:
+        """Return distinct items of the keys starting with ``prefix`` in key order
+
+        Stops after ``limit`` items, so short prefixes matching many keys stay fast.
+        """
+        node = self._root
+        for char in prefix.casefold():
+            node = node.children.get(char)
+            if node is None:
+                return []
+        found: Dict[Hashable, None] = {}
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.ordered is None:
+                node.ordered = (sorted(node.items), sorted(node.children, reverse=True))
+            items, children = node.ordered
+            for item in items:
+                found[item] = None
+                if limit is not None and len(found) >= limit:
+                    return list(found)
+            stack.extend(node.children[char] for char in children)
+        return list(found)
+
+
+def _words(*names: Optional[str]) -> Set[str]:
+    """Return the names and each of their words as trie keys"""
+    keys = set()
+    for name in names:
+        if name:
+            keys.add(name)
+            keys.update(name.split())
+    return keys
+
+
+class AutocompleteCache:
+    """Answer autocomplete queries for users, channels and custom emoji locally
+
+    Users, public channels and custom emoji are loaded once with the ``load_*`` methods
+    and stored in prefix tries over the username, nickname, first and last name of users,
+    the name and display name of channels and the name of emoji. Queries are answered
+    from the tries without a request, changes are applied from websocket events.
+
+    The ``autocomplete_*`` methods fall back to the server if nothing matches locally
+    and the data of the query was not loaded completely, and add the results returned by
+    the server to the cache.
+
+    .. code-block:: python
+
+        cache = AutocompleteCache()
+        cache.load_users(sd)
+        cache.load_channels(sd, team_id)
+        cache.load_emoji(sd)
+        sd.start_ws_sync(cache.apply)
+
+        cache.autocomplete_users(sd, "jo")  # answered locally
+        cache.find_channels(team_id, "town")
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.users: Dict[str, User] = {}
+        self.channels: Dict[str, Channel] = {}
+        self.emoji: Dict[str, Emoji] = {}
+        self.users_complete = False
+        """ Whether all users were loaded, misses are not requested from the server """
+        self.emoji_complete = False
+        """ Whether all custom emoji were loaded """
+        self.complete_teams: Set[str] = set()
+        """ Teams whose public channels were all loaded """
+        self._tries = {
+            "users": PrefixTrie(),
+            "channels": PrefixTrie(),
+            "emoji": PrefixTrie(),
+        }
+        self._keys: Dict[str, Dict[str, Set[str]]] = {
+            "users": {},
+            "channels": {},
+            "emoji": {},
+        }
+
+    def _index(self, kind: str, item_id: str, keys: Set[str]):
+        trie = self._tries[kind]
+        previous = self._keys[kind].get(item_id, set())
+        for key in previous - keys:
+            trie.discard(key, item_id)
+        for key in keys - previous:
+            trie.add(key, item_id)
+        if keys:
+            self._keys[kind][item_id] = keys
+        else:
+            self._keys[kind].pop(item_id, None)
+
+    # Updating
+
+    def put_users(self, users: Iterable[Any]):
+        """Add or update users given as models or decoded json, deleted users are removed"""
+        with self._lock:
+            for user in users:
+                if not isinstance(user, User):
+                    user = fast_parse_obj(User, user)
+                if user.delete_at:
+                    self.remove_user(user.id)
+                    continue
+                self.users[user.id] = user
+                self._index(
+                    "users",
+                    user.id,
+                    _words(
+                        user.username, user.nickname, user.first_name, user.last_name
+                    ),
+                )
+
+    def remove_user(self, user_id: str):
+        with self._lock:
+            self.users.pop(user_id, None)
+            self._index("users", user_id, set())
+
+    def put_channels(self, channels: Iterable[Any]):
+        """Add or update channels given as models or decoded json
+
+        Only public channels are kept, like the server only autocompletes those.
+        """
+        with self._lock:
+            for channel in channels:
+                if not isinstance(channel, Channel):
+                    channel = fast_parse_obj(Channel, channel)
+                if channel.delete_at or channel.type != "O":
+                    self.remove_channel(channel.id)
+                    continue
+                self.channels[channel.id] = channel
+                self._index(
+                    "channels", channel.id, _words(channel.name, channel.display_name)
+                )
+
+    def remove_channel(self, channel_id: str):
+        with self._lock:
+            self.channels.pop(channel_id, None)
+            self._index("channels", channel_id, set())
+
+    def put_emoji(self, emoji: Iterable[Any]):
+        """Add or update custom emoji given as models or decoded json"""
+        with self._lock:
+            for item in emoji:
+                if not isinstance(item, Emoji):
+                    item = fast_parse_obj(Emoji, item)
+                if item.delete_at:
+                    self.emoji.pop(item.id, None)
+                    self._index("emoji", item.id, set())
+                    continue
+                self.emoji[item.id] = item
+                self._index("emoji", item.id, {item.name} if item.name else set())
+
+    # Loading
+
+    def load_users(self, api, per_page: int = 200, **filters) -> int:
+        """Load users from ``get_users`` with a :class:`~matterapi.client.sync_client.SyncClient`
+
+        Without ``filters`` all users are loaded and local misses are final.
+        """
+        users = list(paginate(api.users.get_users, per_page=per_page, **filters))
+        self.put_users(users)
+        if not filters:
+            self.users_complete = True
+        return len(users)
+
+    def load_channels(self, api, team_id: str, per_page: int = 200) -> int:
+        """Load the public channels of a team"""
+        channels = list(
+            paginate(
+                api.channels.get_public_channels_for_team, team_id, per_page=per_page
+            )
+        )
+        self.put_channels(channels)
+        self.complete_teams.add(team_id)
+        return len(channels)
+
+    def load_emoji(self, api, per_page: int = 200) -> int:
+        """Load all custom emoji"""
+        # The emoji list is declared as a single emoji, so it is read unparsed
+        endpoint = type(api.emoji)(client=api, skip_response_parsing=True)
+        emoji = list(paginate(endpoint.get_emoji_list, per_page=per_page))
+        self.put_emoji(emoji)
+        self.emoji_complete = True
+        return len(emoji)
+
+    # Local queries
+
+    def find_users(self, term: str, limit: Optional[int] = 100) -> List[User]:
+        """Return loaded users with a name starting with ``term``"""
+        with self._lock:
+            return [
+                self.users[user_id]
+                for user_id in self._tries["users"].find(term.lstrip("@"), limit)
+            ]
+
+    def find_channels(
+        self, team_id: str, term: str, limit: Optional[int] = 50
+    ) -> List[Channel]:
+        """Return loaded public channels of a team with a name starting with ``term``"""
+        with self._lock:
+            channels = []
+            for channel_id in self._tries["channels"].find(term.lstrip("~")):
+                channel = self.channels[channel_id]
+                if channel.team_id == team_id:
+                    channels.append(channel)
+                    if limit is not None and len(channels) >= limit:
+                        break
+            return channels
+
+    def find_emoji(self, term: str, limit: Optional[int] = 100) -> List[Emoji]:
+        """Return loaded custom emoji with a name starting with ``term``"""
+        with self._lock:
+            return [
+                self.emoji[emoji_id]
+                for emoji_id in self._tries["emoji"].find(term.strip(":"), limit)
+            ]
+
+    # Queries falling back to the server
+
+    def _server_users(self, response: Any) -> List[User]:
+        response = _decoded(response)
+        users = [_decoded(user) for user in response.get("users") or ()]
+        self.put_users(users)
+        return [fast_parse_obj(User, user) for user in users]
+
+    def autocomplete_users(self, api, name: str, limit: int = 100) -> List[User]:
+        """Same as ``api.users.autocomplete_users(name=name, limit=limit).users``
+
+        Requests the server only if no loaded user matches and not all users are loaded.
+        """
+        users = self.find_users(name, limit)
+        if users or self.users_complete:
+            return users
+        return self._server_users(api.users.autocomplete_users(name=name, limit=limit))
+
+    async def autocomplete_users_async(
+        self, api, name: str, limit: int = 100
+    ) -> List[User]:
+        """Same as :meth:`autocomplete_users` with an :class:`~matterapi.client.async_client.AsyncClient`"""
+        users = self.find_users(name, limit)
+        if users or self.users_complete:
+            return users
+        return self._server_users(
+            await api.users.autocomplete_users(name=name, limit=limit)
+        )
+
+    def _server_channels(self, response: Any) -> List[Channel]:
+        channels = [_decoded(channel) for channel in _decoded(response)]
+        self.put_channels(channels)
+        return [fast_parse_obj(Channel, channel) for channel in channels]
+
+    def autocomplete_channels(self, api, team_id: str, name: str) -> List[Channel]:
+        """Same as ``api.channels.autocomplete_channels_for_team(team_id, name=name)``
+
+        Requests the server only if no loaded channel matches and not all public
+        channels of the team are loaded.
+        """
+        channels = self.find_channels(team_id, name)
+        if channels or team_id in self.complete_teams:
+            return channels
+        return self._server_channels(
+            api.channels.autocomplete_channels_for_team(team_id, name=name)
+        )
+
+    async def autocomplete_channels_async(
+        self, api, team_id: str, name: str
+    ) -> List[Channel]:
+        """Same as :meth:`autocomplete_channels` with an :class:`~matterapi.client.async_client.AsyncClient`"""
+        channels = self.find_channels(team_id, name)
+        if channels or team_id in self.complete_teams:
+            return channels
+        return self._server_channels(
+            await api.channels.autocomplete_channels_for_team(team_id, name=name)
+        )
+
+    def _server_emoji(self, response: Any) -> List[Emoji]:
+        emoji = [_decoded(item) for item in response.json()]
+        self.put_emoji(emoji)
+        return [fast_parse_obj(Emoji, item) for item in emoji]
+
+    def autocomplete_emoji(self, api, name: str) -> List[Emoji]:
+        """Same as ``api.emoji.autocomplete_emoji(name=name)``, returning a list of emoji
+
+        Requests the server only if no loaded emoji matches and not all emoji are loaded.
+        """
+        emoji = self.find_emoji(name)
+        if emoji or self.emoji_complete:
+            return emoji
+        endpoint = type(api.emoji)(client=api, skip_response_parsing=True)
+        return self._server_emoji(endpoint.autocomplete_emoji(name=name))
+
+    async def autocomplete_emoji_async(self, api, name: str) -> List[Emoji]:
+        """Same as :meth:`autocomplete_emoji` with an :class:`~matterapi.client.async_client.AsyncClient`"""
+        emoji = self.find_emoji(name)
+        if emoji or self.emoji_complete:
+            return emoji
+        endpoint = type(api.emoji)(client=api, skip_response_parsing=True)
+        return self._server_emoji(await endpoint.autocomplete_emoji(name=name))
+
+    # Websocket events
+
+    def apply(self, event: Dict[str, Any]) -> bool:
+        """Apply a websocket event, returns ``True`` if the event changed the cache
+
+        Can be passed to :meth:`~matterapi.client.base.BaseClient.start_ws` directly.
+        """
+        return _apply_event(self, self._EVENT_HANDLERS, event)
+
+    def _on_user_updated(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self.put_users([_loads(data["user"])])
+
+    def _on_new_user(self, data, broadcast):
+        # pylint: disable=unused-argument
+        # Only the id is sent, misses are requested until the user is known
+        self.users_complete = False
+
+    def _on_channel_created(self, data, broadcast):
+        self.complete_teams.discard(data.get("team_id") or broadcast["team_id"])
+
+    def _on_channel_updated(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self.put_channels([_loads(data["channel"])])
+
+    def _on_channel_converted(self, data, broadcast):
+        # pylint: disable=unused-argument
+        # Converted channels are private, which are not autocompleted
+        self.remove_channel(data["channel_id"])
+
+    def _on_channel_deleted(self, data, broadcast):
+        self.remove_channel(data.get("channel_id") or broadcast["channel_id"])
+
+    def _on_emoji_added(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self.put_emoji([_loads(data["emoji"])])
+
+    _EVENT_HANDLERS: Dict[str, Callable] = {
+        "user_updated": _on_user_updated,
+        "new_user": _on_new_user,
+        "channel_created": _on_channel_created,
+        "channel_updated": _on_channel_updated,
+        "channel_converted": _on_channel_converted,
+        "channel_deleted": _on_channel_deleted,
+        "emoji_added": _on_emoji_added,
+    }
+
+
+__all__ = ["AutocompleteCache", "PrefixTrie"]
@@ -1,8 +1,18 @@
 """ Async client to access the mattermost API """
 
+import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import Optional, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    cast,
+)
 
 import httpx
 from pydantic import PrivateAttr
@@ -48,49 +58,53 @@ from ..endpoints.async_api.threads import ThreadsApi
 from ..endpoints.async_api.uploads import UploadsApi
 from ..endpoints.async_api.users import UsersApi
 from ..endpoints.async_api.webhooks import WebhooksApi
-from .base import ApiClientOptions, AuthLogin, AuthToken, BaseClient, HttpxClientOptions
-from .exceptions import (
-    ContentTooLarge,
-    FeatureDisabled,
-    InternalServerError,
-    InvalidOrMissingParameters,
-    MethodNotAllowed,
-    NoAccessTokenProvided,
-    NotEnoughPermissions,
-    ResourceNotFound,
-    TooManyRequests,
+from ..endpoints.engine import STREAM_CHUNK_SIZE, JsonArrayDecoder
+from .base import (
+    ApiClientOptions,
+    AuthLogin,
+    AuthToken,
+    BaseClient,
+    HttpxClientOptions,
+    logger,
+)
+from .breaker import PROBE_REQUEST
+from .bulk import BulkResult, record_operation, run_async
+from .exceptions import STATUS_EXCEPTIONS, ExceptionBody, ResourceNotFound
+from .limiter import AdaptiveLimiter
+from .offload import ParseStats, parse_response
+from .scheduler import BULK
+from .tracing import (
+    aiter_in_span,
+    async_trace_request_hook,
+    async_trace_response_hook,
+    trace_call,
 )
 
 
 async def raise_on_4xx_5xx(response):
+    if response.status_code < 400:
+        # e.g. 304 Not Modified of conditional requests
+        return
     try:
         response.raise_for_status()
     except httpx.HTTPStatusError as http_error:
+        details = None
+        request_id = response.headers.get("x-request-id")
         try:
             await http_error.response.aread()
             data = http_error.response.json()
             message = data.get("message", data)
         except ValueError:
             message = response.text
-        if http_error.response.status_code == 400:
-            raise InvalidOrMissingParameters(message) from http_error
-        if http_error.response.status_code == 401:
-            raise NoAccessTokenProvided(message) from http_error
-        if http_error.response.status_code == 403:
-            raise NotEnoughPermissions(message) from http_error
-        if http_error.response.status_code == 404:
-            raise ResourceNotFound(message) from http_error
-        if http_error.response.status_code == 405:
-            raise MethodNotAllowed(message) from http_error
-        if http_error.response.status_code == 413:
-            raise ContentTooLarge(message) from http_error
-        if http_error.response.status_code == 429:
-            raise TooManyRequests(message) from http_error
-        if http_error.response.status_code == 500:
-            raise InternalServerError(message) from http_error
-        if http_error.response.status_code == 501:
-            raise FeatureDisabled(message) from http_error
-        raise
+        else:
+            try:
+                details = ExceptionBody.parse_obj(data)
+            except ValueError:
+                logger.debug("Unexpected error body: %s", data)
+        error_class = STATUS_EXCEPTIONS.get(http_error.response.status_code)
+        if error_class is None:
+            raise
+        raise error_class(message, details, request_id) from http_error
 
 
 class AsyncClient(BaseClient):
@@ -98,9 +112,15 @@ class AsyncClient(BaseClient):
 
     _httpx_client: Optional[httpx.AsyncClient] = PrivateAttr(None)
     """ The underlying httpx client which handles requests to the api in case we are inside a session """
+    _parse_stats: Dict[str, ParseStats] = PrivateAttr(default_factory=dict)
+    """ Response parsing statistics per operation, shared with sessions """
+
+    async def _create_httpx_client(self, reuse_token: bool = False, **client_kwargs):
+        """Create a httpx.AsyncClient instance to be used for requests and perform authentication if needed
 
-    async def _create_httpx_client(self):
-        """Create a httpx.AsyncClient instance to be used for requests and perform authentication if needed"""
+        If ``reuse_token`` is set, an already acquired session token is reused instead of logging in again.
+        ``client_kwargs`` are passed to ``httpx.AsyncClient`` and take precedence over ``httpx_client_options``.
+        """
         self.options = cast(ApiClientOptions, self.options)
         httpx_client_options = (
             self.options.httpx_client_options
@@ -109,15 +129,23 @@ class AsyncClient(BaseClient):
         )
         base_url = str(httpx.URL(self.options.url).join(self.options.basepath))
         httpx_client = httpx.AsyncClient(
-            base_url=base_url, **dict(httpx_client_options)
+            base_url=base_url, **{**dict(httpx_client_options), **client_kwargs}
         )
+        self._pid = os.getpid()
+        httpx_client.event_hooks["request"] = [
+            async_trace_request_hook(httpx.URL(base_url).path.rstrip("/"))
+        ] + httpx_client.event_hooks["request"]
         httpx_client.event_hooks["response"] = [
-            raise_on_4xx_5xx
+            async_trace_response_hook,
+            raise_on_4xx_5xx,
         ] + httpx_client.event_hooks["response"]
         if isinstance(self.options.auth, AuthToken):
             httpx_client.auth = self.options.auth
             self.active_token = self.options.auth.token
         if isinstance(self.options.auth, AuthLogin):
+            if reuse_token and self.active_token:
+                httpx_client.auth = AuthToken(token=self.active_token)
+                return httpx_client
             # Login with username and password and get a session_token
             response = await httpx_client.post(
                 url="/users/login", json=self.options.auth.dict(exclude_unset=True)
@@ -131,9 +159,114 @@ class AsyncClient(BaseClient):
         """Calling this creates a httpx client and sets .active_token, needed for websockets"""
         await self._create_httpx_client()
 
+    async def _execute(self, api, operation, arguments: Dict[str, Any]):
+        record_operation(operation)
+        with trace_call(self.options, api, operation, arguments):
+            request = operation.build_request(arguments, api.headers)
+            response = await self._fetch(operation, request)
+            if api.skip_response_parsing:
+                return response
+            return await parse_response(
+                self.options, self._parse_stats, operation, response
+            )
+
+    async def _fetch(self, operation, request: Dict[str, Any]) -> httpx.Response:
+        """Send a request, answered from the negative cache or coalesced if enabled"""
+        key = self._request_key(operation, request)
+        if key is None:
+            response = await self._send(request)
+            if not operation.read_only:
+                self._negative_cache.invalidate(operation.tags)
+            return response
+        cache_misses = self._cache_misses(operation)
+        if cache_misses:
+            self._negative_cache.check(key, operation.tags)
+        try:
+            if self._coalesce(operation):
+                return await self._singleflight.run_async(
+                    key, operation.name, lambda: self._send(request)
+                )
+            return await self._send(request)
+        except ResourceNotFound as error:
+            if cache_misses:
+                self._negative_cache.add(
+                    key, operation.tags, error, self.options.negative_cache_ttl
+                )
+            raise
+
+    async def _send(self, request: Dict[str, Any]) -> httpx.Response:
+        """Send a request through the circuit breaker if one is configured"""
+        async with self._guard():
+            return await self._request(request)
+
+    @asynccontextmanager
+    async def _guard(self):
+        """Wait for the circuit breaker if one is configured and record the outcome"""
+        breaker = self.options.circuit_breaker
+        if breaker is None:
+            yield
+            return
+        await breaker.acquire_async(
+            lambda: self._request(PROBE_REQUEST), self._priority() == BULK
+        )
+        try:
+            yield
+        except Exception as error:
+            breaker.record(error)
+            raise
+        breaker.record()
+
+    async def _request(self, request: Dict[str, Any]) -> httpx.Response:
+        async with self._get_httpx_client() as httpx_client:
+            async with self._slot():
+                return await httpx_client.request(**request)
+
+    @asynccontextmanager
+    async def _slot(self):
+        """Hold a slot of the request scheduler if one is configured"""
+        scheduler = self.options.scheduler
+        if scheduler is None:
+            yield
+        else:
+            async with scheduler.slot_async(self._priority()):
+                yield
+
+    async def _stream(
+        self, api, operation, arguments: Dict[str, Any]
+    ) -> AsyncIterator[Any]:
+        parse_item = operation.item_parser(
+            self.options.lazy_models, self.options.fast_models
+        )
+        with trace_call(
+            self.options, api, operation, arguments, activate=False
+        ) as span:
+            request = operation.build_request(arguments, api.headers)
+            decoder = JsonArrayDecoder()
+            async with self._guard():
+                async with self._get_httpx_client() as httpx_client, self._slot():
+                    chunks = self._iter_response(httpx_client, request)
+                    async for chunk in aiter_in_span(span, chunks):
+                        for item in decoder.feed(chunk):
+                            if not api.skip_response_parsing:
+                                item = parse_item(item)
+                            yield item
+            decoder.close()
+
+    @staticmethod
+    async def _iter_response(
+        httpx_client: httpx.AsyncClient, request: Dict[str, Any]
+    ) -> AsyncIterator[bytes]:
+        async with httpx_client.stream(**request) as response:
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                yield chunk
+
     @asynccontextmanager
     async def _get_httpx_client(self):
         """Get the currently set httpx.Client instance or create a new one"""
+        if self._httpx_client and self._forked():
+            # Leave the inherited client untouched, closing it would affect the parent
+            logger.info("Process fork detected, re-creating http client")
+            self._httpx_client = await self._create_httpx_client(reuse_token=True)
         if not self._httpx_client or self._httpx_client.is_closed:
             httpx_client = await self._create_httpx_client()
             try:
@@ -144,16 +277,94 @@ class AsyncClient(BaseClient):
             yield self._httpx_client
 
     @asynccontextmanager
-    async def session(self) -> AsyncGenerator["AsyncClient", None, None]:
-        """Open a Session which re-uses the underlying httpx client and it's connections"""
+    async def session(
+        self, priority: Optional[str] = None
+    ) -> AsyncGenerator["AsyncClient", None, None]:
+        """Open a Session which re-uses the underlying httpx client and it's connections
+
+        Args:
+            priority: Priority of the calls made through the session, one of
+                :data:`~matterapi.client.scheduler.PRIORITIES`. Used by the
+                :attr:`~matterapi.client.base.ApiClientOptions.scheduler`.
+        """
         # pylint: disable=protected-access
-        api_client = self.copy()
+        api_client = self._session_copy(priority)
         api_client._httpx_client = await api_client._create_httpx_client()
         try:
             yield api_client
         finally:
             await api_client._httpx_client.aclose()
 
+    async def bulk(
+        self,
+        calls: Iterable[Callable[["AsyncClient"], Awaitable[Any]]],
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+        checkpoint: Optional[str] = None,
+        retries: int = 0,
+        retry_backoff: float = 1.0,
+        limiter: Optional[AdaptiveLimiter] = None,
+    ) -> AsyncGenerator[BulkResult, None]:
+        """Run many independent endpoint calls with bounded concurrency
+
+        The calls are executed as asyncio tasks sharing one session. Results are yielded as
+        :class:`~matterapi.client.bulk.BulkResult` objects; exceptions raised by a call are
+        returned in the result instead of being raised.
+
+        .. code-block:: python
+
+            calls = (
+                lambda api, user_id=user_id: api.channels.add_channel_member(
+                    channel_id, json_body={"user_id": user_id}
+                )
+                for user_id in user_ids
+            )
+            async for result in ad.bulk(calls, concurrency=16, checkpoint="members.ckpt"):
+                if not result.ok:
+                    print(result.index, result.error)
+
+        Args:
+            calls: Callables which get the session client passed and return an awaitable
+                performing one call each. The iterable is consumed lazily.
+            concurrency: Maximum number of calls running at the same time
+            ordered: Yield results in input order if ``True``, otherwise in completion order
+            checkpoint: Path to a checkpoint file. Successful calls are recorded there and
+                skipped when the same file is used again to resume an interrupted run.
+            retries: Number of retries for calls failing with 429, 5xx or transport errors.
+                Calls with non idempotent operations, like creating a post, are only retried
+                if the failed request did not reach the server, see :func:`~matterapi.client.bulk.is_safe_to_retry`
+            retry_backoff: Delay in seconds before the first retry, doubled for every further retry
+            limiter: Adapt the number of concurrent calls to the latency and errors of the
+                server instead of using the fixed ``concurrency``, see
+                :class:`~matterapi.client.limiter.AdaptiveLimiter`. Its ``limit`` shows the
+                current concurrency.
+        """
+        # pylint: disable=protected-access
+        bulk_kwargs = dict(
+            concurrency=concurrency,
+            ordered=ordered,
+            checkpoint=checkpoint,
+            retries=retries,
+            retry_backoff=retry_backoff,
+            limiter=limiter,
+        )
+        if self._httpx_client and not self._httpx_client.is_closed:
+            async for result in run_async(self, calls, **bulk_kwargs):
+                yield result
+            return
+        async with self.session() as api_session:
+            async for result in run_async(api_session, calls, **bulk_kwargs):
+                yield result
+
+    def parse_stats(self) -> Dict[str, ParseStats]:
+        """Return the response parsing statistics per operation name
+
+        Includes the time each operation blocked the event loop, see
+        :attr:`~matterapi.client.base.ApiClientOptions.parse_offload_threshold`.
+        """
+        return dict(self._parse_stats)
+
     @property
     def users(self) -> UsersApi:
         """Api endpoint for Users
@@ -1,4 +1,5 @@
 """ Base class and options for API clients """
+
 # pylint: disable=no-self-use,too-few-public-methods
 
 import abc
@@ -6,14 +7,19 @@ import asyncio
 import inspect
 import json
 import logging
+import os
 import socket
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
 from urllib.parse import urljoin, urlparse
 
 import httpx
 import websockets.client as ws_client
 import websockets.exceptions as ws_exceptions
-from pydantic import AnyHttpUrl, AnyUrl, BaseModel, validator
+from pydantic import AnyHttpUrl, AnyUrl, BaseModel, PrivateAttr, validator
+
+from .negative_cache import LOOKUP_OPERATIONS, NegativeCache
+from .scheduler import NORMAL, PRIORITIES, current_priority
+from .singleflight import CoalescingStats, SingleFlight, request_key
 
 logger = logging.getLogger("matterapi.client")
 logger.setLevel(logging.INFO)
@@ -95,6 +101,90 @@ class ApiClientOptions(BaseModel):
     skip_response_parsing: bool = False
     """ If this is set, responses will not be parsed into objects, but
         will be returned as raw httpx response """
+    trace_hooks: List[Any] = []
+    """ Tracing hooks notified about every endpoint call
+
+    Each entry should be an instance of :class:`~matterapi.client.tracing.TraceHooks`.
+    The hooks get a :class:`~matterapi.client.tracing.Span` passed before the call starts
+    and after it ended, including the path template, sizes, server request id and
+    a timing breakdown.
+    """
+    slow_call_threshold: Optional[float] = None
+    """ Log endpoint calls which take longer than this many seconds
+
+    Slow calls are logged as warning to the ``matterapi.client`` logger together with
+    their timing breakdown (connect, tls, server wait, body read, parse) and the
+    request id assigned by the server.
+    """
+    lazy_models: bool = False
+    """ Parse responses into lazy models
+
+    Lazy models are instances of the regular models, but convert and validate each field
+    only when it is accessed for the first time, see :func:`~matterapi.lazy.lazy_parse_obj`.
+    This saves most of the parsing time for large responses of which only a few fields are used.
+    Invalid fields raise a ``ValidationError`` on access instead of when the response is parsed.
+    """
+    fast_models: bool = False
+    """ Create frequently parsed models without validation
+
+    Posts, users, channels, channel and team members, statuses and reactions, as well as
+    models containing them like post lists, are created directly from the decoded json
+    without running pydantic validation, see :func:`~matterapi.fast.fast_parse_obj`.
+    The results are regular model instances, equal to validated ones for responses matching
+    the api specification, but several times faster to create. Can be combined with
+    :attr:`lazy_models`, which is then used for all other nested models.
+    """
+    parse_offload_threshold: Optional[int] = None
+    """ Parse responses of at least this many bytes outside of the event loop
+
+    Only used by the :class:`~matterapi.client.async_client.AsyncClient`. Decoding and
+    parsing large responses like a full channel history or the server config can block
+    the event loop for tens of milliseconds, which stalls websocket handling and other
+    coroutines. Responses above the threshold are parsed in :attr:`parse_executor` instead.
+    Use :meth:`AsyncClient.parse_stats() <matterapi.client.async_client.AsyncClient.parse_stats>`
+    to see how long each operation blocked the event loop when tuning the threshold.
+    """
+    parse_executor: Optional[Any] = None
+    """ Executor used to parse responses above :attr:`parse_offload_threshold`
+
+    Defaults to the thread pool of the event loop. A ``concurrent.futures.ProcessPoolExecutor``
+    avoids contention on the GIL at the cost of pickling the parsed models.
+    """
+    coalesce_requests: bool = False
+    """ Send a single request for identical ``GET`` calls running at the same time
+
+    Calls with the same method, url, query parameters, headers and token which are started
+    while an identical request is in flight wait for its response instead of sending their
+    own, e.g. many handlers requesting the same user after a burst of websocket events.
+    Each caller parses the shared response into its own objects, errors are raised in all
+    callers. Shared with sessions, see
+    :meth:`~matterapi.client.base.BaseClient.coalescing_stats` for the number of coalesced calls.
+    """
+    negative_cache_ttl: Optional[float] = None
+    """ Remember lookups which failed with ``404 Not Found`` for this many seconds
+
+    Repeated calls of lookup endpoints like ``get_user_by_username``, ``get_channel_by_name``
+    or ``get_post`` (see :data:`~matterapi.client.negative_cache.LOOKUP_OPERATIONS`) for objects
+    which do not exist raise ``ResourceNotFound`` without a request until the time expired.
+    Calls creating or changing objects of the same kind, e.g. ``create_user``, drop the cached
+    errors. Pass websocket events to ``negative_cache.apply()`` to notice objects created by others,
+    see :class:`~matterapi.client.negative_cache.NegativeCache`. Shared with sessions.
+    """
+    circuit_breaker: Optional[Any] = None
+    """ Circuit breaker all requests pass through
+
+    Should be an instance of :class:`~matterapi.client.breaker.CircuitBreaker`. Once the
+    server keeps failing or reports being busy, background traffic like bulk calls is deferred
+    and interactive calls are rate limited until a ``/system/ping`` probe succeeds.
+    """
+    scheduler: Optional[Any] = None
+    """ Scheduler sharing the concurrent requests between priority classes
+
+    Should be an instance of :class:`~matterapi.client.scheduler.RequestScheduler`. Requests
+    wait for a slot of their priority class, so background traffic can't delay interactive
+    calls by filling the connection pool. See :func:`~matterapi.client.scheduler.priority`
+    and the ``priority`` argument of ``session()``.
+    """
 
     # pylint: disable=no-self-argument
     @validator("ws_url", pre=True, always=True)
@@ -129,6 +219,15 @@ class BaseClient(BaseModel, metaclass=abc.ABCMeta):
     Used for websocket connections
     """
 
+    _pid: int = PrivateAttr(default_factory=os.getpid)
+    """ Id of the process which created the current http client """
+    _singleflight: SingleFlight = PrivateAttr(default_factory=SingleFlight)
+    """ Identical requests in flight, shared with sessions """
+    _negative_cache: NegativeCache = PrivateAttr(default_factory=NegativeCache)
+    """ Lookups which failed with 404, shared with sessions """
+    _session_priority: Optional[str] = PrivateAttr(None)
+    """ Priority of calls made through a session, see :func:`~matterapi.client.scheduler.priority` """
+
     # pylint: disable=no-self-argument
     @validator("options")
     def set_logging_mode(cls, value):
@@ -140,6 +239,83 @@ class BaseClient(BaseModel, metaclass=abc.ABCMeta):
     async def _login(self):
         pass
 
+    @abc.abstractmethod
+    def _execute(self, api, operation, arguments: Dict[str, Any]):
+        """Send the request of an operation and parse the response
+
+        Args:
+            api: The endpoint class instance the operation was called on
+            operation: The :class:`~matterapi.endpoints.engine.Operation` to execute
+            arguments: Arguments the endpoint method was called with
+        """
+
+    @abc.abstractmethod
+    def _stream(self, api, operation, arguments: Dict[str, Any]):
+        """Send the request of an operation returning a json array and iterate over its elements
+
+        Elements are decoded and parsed while the response body is received.
+        Takes the same arguments as :meth:`_execute`.
+        """
+
+    def _coalesce(self, operation) -> bool:
+        """Check if identical concurrent calls of an operation share one request"""
+        return self.options.coalesce_requests and operation.method == "GET"
+
+    def _priority(self) -> str:
+        """Return the priority of the current call"""
+        return current_priority() or self._session_priority or NORMAL
+
+    def _session_copy(self, priority: Optional[str]) -> "BaseClient":
+        """Copy the client for a session sending its calls with the given priority"""
+        # pylint: disable=protected-access
+        if priority is not None and priority not in PRIORITIES:
+            raise ValueError(
+                f"Unknown priority {priority!r}, expected one of {PRIORITIES}"
+            )
+        api_client = self.copy()
+        api_client._session_priority = priority or self._session_priority
+        return api_client
+
+    def _cache_misses(self, operation) -> bool:
+        """Check if ``ResourceNotFound`` errors of an operation are cached"""
+        return (
+            self.options.negative_cache_ttl is not None
+            and operation.name in LOOKUP_OPERATIONS
+        )
+
+    def _request_key(self, operation, request: Dict[str, Any]) -> Optional[Hashable]:
+        """Return the key of a request if it is coalesced or cached, otherwise ``None``"""
+        if self._coalesce(operation) or self._cache_misses(operation):
+            # Before the first request the token of a login is not known yet
+            identity = self.active_token or getattr(
+                self.options.auth, "token", getattr(self.options.auth, "login_id", None)
+            )
+            return request_key(request, identity)
+        return None
+
+    @property
+    def negative_cache(self) -> NegativeCache:
+        """Lookups which failed with ``404 Not Found``
+
+        See :attr:`~matterapi.client.base.ApiClientOptions.negative_cache_ttl`.
+        """
+        return self._negative_cache
+
+    def coalescing_stats(self) -> Dict[str, CoalescingStats]:
+        """Return the request coalescing statistics per operation name
+
+        See :attr:`~matterapi.client.base.ApiClientOptions.coalesce_requests`.
+        """
+        return dict(self._singleflight.stats)
+
+    def _forked(self) -> bool:
+        """Check if the process was forked since the http client was created
+
+        Connections inherited from the parent process must not be used (or closed)
+        in the child, as both processes would read and write the same sockets.
+        """
+        return self._pid != os.getpid()
+
     async def _relogin(self):
         if inspect.iscoroutinefunction(self._login):
             await self._login()
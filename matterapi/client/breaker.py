@@ -0,0 +1,320 @@
+""" Circuit breaker shedding load while the server is failing or busy """
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generator, Optional, Tuple
+
+import httpx
+
+from .base import logger
+from .exceptions import CircuitOpen, InternalServerError
+from .scheduler import BULK, current_priority, priority
+
+CLOSED = "closed"
+""" Requests are sent normally """
+OPEN = "open"
+""" The server is considered unavailable, requests are shed, deferred or rate limited """
+HALF_OPEN = "half_open"
+""" A probe request checks if the server recovered """
+
+PROBE_REQUEST = {"method": "GET", "url": "/system/ping"}
+""" Request sent to check if the server recovered """
+
+_SEND = "send"
+_PROBE = "probe"
+_WAIT = "wait"
+_REJECT = "reject"
+
+
+@contextmanager
+def background() -> Generator[None, None, None]:
+    """Mark all calls made in the block as low priority background traffic
+
+    Same as ``priority(BULK)``, see :func:`~matterapi.client.scheduler.priority`.
+
+    Calls of :meth:`SyncClient.bulk <matterapi.client.sync_client.SyncClient.bulk>` and
+    :meth:`AsyncClient.bulk <matterapi.client.async_client.AsyncClient.bulk>` are marked
+    automatically.
+
+    .. code-block:: python
+
+        with background():
+            for user in paginate(sd.users.get_users, per_page=200):
+                ...
+    """
+    with priority(BULK):
+        yield
+
+
+def is_background() -> bool:
+    """Check if the current call is low priority background traffic"""
+    return current_priority() == BULK
+
+
+def is_server_busy(error: BaseException) -> bool:
+    """Check if an error is a ``503 Service Unavailable`` response"""
+    return (
+        isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 503
+    )
+
+
+def is_failure(error: BaseException) -> bool:
+    """Check if an error indicates an unavailable server
+
+    Timeouts, connection errors and 5xx responses, except for ``501 Feature disabled``,
+    count as failures.
+    """
+    if isinstance(error, (InternalServerError, httpx.TransportError)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 and error.response.status_code != 501
+    return False
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    try:
+        return float(error.response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+
+@dataclass
+class BreakerStats:
+    """Statistics of a circuit breaker"""
+
+    opened: int = 0
+    """ Number of times the breaker opened """
+    failures: int = 0
+    """ Number of failed requests """
+    rejected: int = 0
+    """ Number of calls failed with ``CircuitOpen`` without a request """
+    deferred: int = 0
+    """ Number of background calls which waited for the breaker to close """
+    throttled: int = 0
+    """ Number of interactive calls which waited for the reduced rate while open """
+    probes: int = 0
+    """ Number of ``/system/ping`` probes sent """
+
+
+class CircuitBreaker:
+    """Stop sending full load to a server which is failing or busy
+
+    After ``failure_threshold`` consecutive failures (timeouts, connection errors or 5xx
+    responses) or a single ``503 Service Unavailable``, which Mattermost returns while it
+    is marked busy, the breaker opens. While it is open:
+
+    * Background calls, e.g. of ``bulk()`` or inside :func:`background`, wait until the
+      breaker closes again, or fail with :class:`~matterapi.client.exceptions.CircuitOpen`
+      after ``background_timeout`` seconds. Use ``background_timeout=0`` to shed them
+      immediately.
+    * Interactive calls are still sent, but at most ``interactive_rate`` per second.
+      Calls which would have to wait longer than ``interactive_wait`` seconds fail with
+      :class:`~matterapi.client.exceptions.CircuitOpen`.
+
+    After ``recovery_time`` seconds, or the ``Retry-After`` time of a 503 response if
+    later, the next call sends a ``GET /system/ping`` probe first. If it succeeds, the
+    breaker closes, otherwise it stays open and the recovery time doubles up to
+    ``max_recovery_time``.
+
+    Pass it as :attr:`~matterapi.client.base.ApiClientOptions.circuit_breaker`. One
+    breaker can be shared by several clients of the same server.
+
+    .. code-block:: python
+
+        breaker = CircuitBreaker(failure_threshold=5, recovery_time=5.0)
+        sd = SyncClient(options={..., "circuit_breaker": breaker})
+        print(breaker.state, breaker.stats)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 5.0,
+        max_recovery_time: float = 60.0,
+        interactive_rate: float = 2.0,
+        interactive_wait: float = 1.0,
+        background_timeout: Optional[float] = None,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.max_recovery_time = max_recovery_time
+        self.interactive_rate = interactive_rate
+        self.interactive_wait = interactive_wait
+        self.background_timeout = background_timeout
+        self.state = CLOSED
+        """ One of :data:`CLOSED`, :data:`OPEN` or :data:`HALF_OPEN` """
+        self.stats = BreakerStats()
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._backoff = recovery_time
+        self._retry_at = 0.0
+        self._next_token = 0.0
+
+    def _admit(self, now: float, background_call: bool) -> Tuple[str, float]:
+        """Decide how to handle a call, returns the action and a delay in seconds"""
+        with self._lock:
+            if self.state == CLOSED:
+                return _SEND, 0.0
+            if self.state == OPEN and now >= self._retry_at:
+                self.state = HALF_OPEN
+                self.stats.probes += 1
+                return _PROBE, 0.0
+            if background_call:
+                # Check again once a probe could have closed the breaker
+                return _WAIT, max(self._retry_at - now, 0.05)
+            delay = max(self._next_token - now, 0.0)
+            if delay > self.interactive_wait:
+                self.stats.rejected += 1
+                return _REJECT, 0.0
+            self._next_token = now + delay + 1 / self.interactive_rate
+            if delay:
+                self.stats.throttled += 1
+            return _SEND, delay
+
+    def _deadline(self, start: float, now: float):
+        """Fail a deferred background call once it waited too long"""
+        if self.background_timeout is not None and (
+            now - start >= self.background_timeout
+        ):
+            with self._lock:
+                self.stats.rejected += 1
+            raise CircuitOpen("Server unavailable, background call shed")
+
+    def _open(self, error: BaseException, now: float):
+        if self.state == CLOSED:
+            self.stats.opened += 1
+            logger.warning("Opening circuit breaker after %r", error)
+        self.state = OPEN
+        self._retry_at = now + max(self._backoff, _retry_after(error) or 0.0)
+        self._next_token = now
+
+    def _probed(self, error: Optional[BaseException]):
+        now = time.monotonic()
+        with self._lock:
+            if error is None:
+                logger.info("Closing circuit breaker, server is reachable again")
+                self.state = CLOSED
+                self._failures = 0
+                self._backoff = self.recovery_time
+                return
+            self.stats.failures += 1
+            self._backoff = min(self._backoff * 2, self.max_recovery_time)
+            self._open(error, now)
+
+    def _probe_aborted(self):
+        with self._lock:
+            # Let the next call send a new probe
+            self.state = OPEN
+
+    def record(self, error: Optional[BaseException] = None):
+        """Record the outcome of a request, ``error`` is ``None`` on success"""
+        if error is None:
+            if self._failures:
+                with self._lock:
+                    self._failures = 0
+            return
+        if not is_failure(error):
+            return
+        now = time.monotonic()
+        with self._lock:
+            self.stats.failures += 1
+            self._failures += 1
+            if self.state == CLOSED and (
+                self._failures >= self.failure_threshold or is_server_busy(error)
+            ):
+                self._open(error, now)
+
+    def _next(
+        self, start: float, background_call: bool, deferred: bool
+    ) -> Tuple[str, float]:
+        """Admit a call, returns the action and the delay to sleep before it"""
+        now = time.monotonic()
+        action, delay = self._admit(now, background_call)
+        if action == _REJECT:
+            raise CircuitOpen("Server unavailable, interactive call rejected")
+        if action == _WAIT:
+            self._deadline(start, now)
+            if not deferred:
+                with self._lock:
+                    self.stats.deferred += 1
+        return action, delay
+
+    @contextmanager
+    def _probing(self) -> Generator[None, None, None]:
+        """Record the outcome of the probe sent in the block"""
+        try:
+            yield
+        except Exception as error:  # pylint: disable=broad-except
+            self._probed(error)
+        except BaseException:
+            self._probe_aborted()
+            raise
+        else:
+            self._probed(None)
+
+    def acquire(self, probe: Callable[[], Any], background_call: Optional[bool] = None):
+        """Wait until a call may be sent, or raise ``CircuitOpen``
+
+        Args:
+            probe: Sends the ``/system/ping`` probe request, bypassing the breaker
+            background_call: Whether the call is background traffic, defaults to
+                :func:`is_background`
+        """
+        if background_call is None:
+            background_call = is_background()
+        start = time.monotonic()
+        deferred = False
+        while True:
+            action, delay = self._next(start, background_call, deferred)
+            if action == _PROBE:
+                with self._probing():
+                    probe()
+                continue
+            if delay:
+                time.sleep(delay)
+            if action == _SEND:
+                return
+            deferred = True
+
+    async def acquire_async(
+        self,
+        probe: Callable[[], Awaitable[Any]],
+        background_call: Optional[bool] = None,
+    ):
+        """Same as :meth:`acquire` without blocking the event loop"""
+        if background_call is None:
+            background_call = is_background()
+        start = time.monotonic()
+        deferred = False
+        while True:
+            action, delay = self._next(start, background_call, deferred)
+            if action == _PROBE:
+                with self._probing():
+                    await probe()
+                continue
+            if delay:
+                await asyncio.sleep(delay)
+            if action == _SEND:
+                return
+            deferred = True
+
+
+__all__ = [
+    "CircuitBreaker",
+    "BreakerStats",
+    "background",
+    "is_background",
+    "is_failure",
+    "is_server_busy",
+    "CLOSED",
+    "OPEN",
+    "HALF_OPEN",
+    "PROBE_REQUEST",
+]
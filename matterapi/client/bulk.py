@@ -0,0 +1,356 @@
+""" Bulk execution of independent endpoint calls """
+
+import asyncio
+import collections
+import contextvars
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+)
+
+import httpx
+
+from .base import logger
+from .breaker import is_server_busy
+from .exceptions import CircuitOpen, InternalServerError, TooManyRequests
+from .limiter import AdaptiveLimiter
+from .scheduler import BULK, priority
+
+_operations: contextvars.ContextVar = contextvars.ContextVar(
+    "matterapi_bulk_operations", default=None
+)
+
+
+@dataclass
+class BulkResult:
+    """Result of a single call executed by a bulk run"""
+
+    index: int
+    """ Position of the call in the input iterable """
+    result: Any = None
+    """ Return value of the call """
+    error: Optional[BaseException] = None
+    """ Exception raised by the last attempt of the call """
+    attempts: int = 1
+    """ Number of attempts which were needed """
+
+    @property
+    def ok(self) -> bool:
+        """``True`` if the call succeeded"""
+        return self.error is None
+
+
+def read_records(path: str) -> List[Dict[str, Any]]:
+    """Read the records of a json lines checkpoint file
+
+    Records are appended one line at a time, so a crash can only cut off the last one.
+    An incomplete last record is dropped and removed from the file, so new records are
+    not appended to it.
+
+    Raises:
+        ValueError: If a record other than the last one is invalid
+    """
+    records = []
+    with open(path, "rb+") as records_file:
+        lines = records_file.readlines()
+        size = 0
+        for number, line in enumerate(lines, 1):
+            try:
+                if line.strip():
+                    records.append(json.loads(line))
+            except ValueError:
+                if number < len(lines):
+                    raise
+                logger.warning("Dropping incomplete last record of %s", path)
+                records_file.truncate(size)
+                return records
+            size += len(line)
+        if lines and not lines[-1].endswith(b"\n"):
+            records_file.write(b"\n")
+    return records
+
+
+class Checkpoint:
+    """Records successfully completed calls of a bulk run in a file
+
+    The file contains one json line per completed call. Passing the same file
+    to a later run skips all calls which already completed, so interrupted runs
+    can be resumed as long as the input iterable yields the calls in the same order.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.completed: Set[int] = set()
+        if os.path.exists(path):
+            self.completed.update(record["index"] for record in read_records(path))
+        # pylint: disable-next=consider-using-with
+        self._file = open(path, "a", encoding="utf-8")
+
+    def mark(self, index: int):
+        self.completed.add(index)
+        self._file.write(json.dumps({"index": index}) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Check if a failed call failed for a transient reason"""
+    if isinstance(
+        error,
+        (TooManyRequests, InternalServerError, CircuitOpen, httpx.TransportError),
+    ):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return False
+
+
+def is_unsent(error: BaseException) -> bool:
+    """Check if a request failed before the server started processing it
+
+    Connection errors, waiting for a connection of the pool, ``CircuitOpen``,
+    ``429 Too Many Requests`` and ``503 Service Unavailable`` count as unsent.
+    """
+    return isinstance(
+        error,
+        (
+            TooManyRequests,
+            CircuitOpen,
+            httpx.ConnectError,
+            httpx.ConnectTimeout,
+            httpx.PoolTimeout,
+        ),
+    ) or is_server_busy(error)
+
+
+def is_safe_to_retry(error: BaseException, operations: Sequence[Any]) -> bool:
+    """Check if a failed call can be repeated without duplicating side effects
+
+    Retrying repeats every operation of the call. This is safe if all operations which
+    reached the server are :attr:`~matterapi.endpoints.engine.Operation.retryable`, the
+    last one only counts if the request was sent, see :func:`is_unsent`.
+
+    Args:
+        error: Exception raised by the call
+        operations: Operations executed by the call, the last one raised ``error``
+    """
+    if not is_retryable(error):
+        return False
+    if not operations:
+        return is_unsent(error)
+    *completed, failed = operations
+    return all(operation.retryable for operation in completed) and (
+        failed.retryable or is_unsent(error)
+    )
+
+
+def record_operation(operation: Any):
+    """Remember an operation executed by the current attempt of a bulk call"""
+    operations = _operations.get()
+    if operations is not None:
+        operations.append(operation)
+
+
+@contextmanager
+def _attempt() -> Generator[List[Any], None, None]:
+    """Run an attempt of a bulk call with bulk priority, recording its operations"""
+    operations: List[Any] = []
+    token = _operations.set(operations)
+    try:
+        with priority(BULK):
+            yield operations
+    finally:
+        _operations.reset(token)
+
+
+class _BulkState:
+    """Bookkeeping shared by the sync and async executor"""
+
+    def __init__(self, calls, concurrency, ordered, checkpoint, retries, backoff):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.calls = enumerate(calls)
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.checkpoint = Checkpoint(checkpoint) if checkpoint else None
+        self.retries = retries
+        self.backoff = backoff
+        self.exhausted = False
+        # Submitted indices in input order, only used for ordered results
+        self.order: collections.deque = collections.deque()
+        self.finished = {}
+
+    def submit_calls(self, pending: set, submit: Callable):
+        """Submit calls until the window is full or the input is exhausted"""
+        while not self.exhausted and not self.window_full(len(pending)):
+            item = self.next_call()
+            if item is not None:
+                pending.add(submit(*item))
+
+    def window_full(self, in_flight: int) -> bool:
+        # In ordered mode finished results waiting for a slow predecessor count as well,
+        # which keeps memory bounded for arbitrarily long inputs
+        used = len(self.order) if self.ordered else in_flight
+        return used >= 2 * self.concurrency
+
+    def next_call(self):
+        """Return the next (index, call) which still needs to run or None"""
+        for index, call in self.calls:
+            if self.checkpoint and index in self.checkpoint.completed:
+                continue
+            if self.ordered:
+                self.order.append(index)
+            return index, call
+        self.exhausted = True
+        return None
+
+    def complete(self, result: BulkResult):
+        if result.ok and self.checkpoint:
+            self.checkpoint.mark(result.index)
+        if not self.ordered:
+            return [result]
+        self.finished[result.index] = result
+        ready = []
+        while self.order and self.order[0] in self.finished:
+            ready.append(self.finished.pop(self.order.popleft()))
+        return ready
+
+    def retry_delay(
+        self, error: BaseException, attempt: int, operations: Sequence[Any]
+    ) -> Optional[float]:
+        if attempt > self.retries or not is_safe_to_retry(error, operations):
+            return None
+        logger.debug("Retrying bulk call after attempt %s: %s", attempt, error)
+        return self.backoff * 2 ** (attempt - 1)
+
+    def close(self):
+        if self.checkpoint:
+            self.checkpoint.close()
+
+
+def _execute_sync(api_client, state: _BulkState, index: int, call: Callable):
+    attempt = 0
+    while True:
+        attempt += 1
+        with _attempt() as operations:
+            # pylint: disable=broad-except
+            try:
+                return BulkResult(index, call(api_client), attempts=attempt)
+            except Exception as error:
+                delay = state.retry_delay(error, attempt, operations)
+                if delay is None:
+                    return BulkResult(index, error=error, attempts=attempt)
+        time.sleep(delay)
+
+
+async def _execute_async(
+    api_client, state: _BulkState, slot: Callable, index: int, call: Callable
+):
+    attempt = 0
+    while True:
+        attempt += 1
+        with _attempt() as operations:
+            # pylint: disable=broad-except
+            try:
+                async with slot():
+                    result = await call(api_client)
+                return BulkResult(index, result, attempts=attempt)
+            except Exception as error:
+                delay = state.retry_delay(error, attempt, operations)
+                if delay is None:
+                    return BulkResult(index, error=error, attempts=attempt)
+        await asyncio.sleep(delay)
+
+
+def run_sync(
+    api_client,
+    calls: Iterable[Callable],
+    concurrency: int,
+    ordered: bool,
+    checkpoint: Optional[str],
+    retries: int,
+    retry_backoff: float,
+):
+    """Run calls in a thread pool, see :meth:`~matterapi.client.sync_client.SyncClient.bulk`"""
+    state = _BulkState(calls, concurrency, ordered, checkpoint, retries, retry_backoff)
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending: Set[Any] = set()
+
+            def submit(index, call):
+                return executor.submit(_execute_sync, api_client, state, index, call)
+
+            while True:
+                state.submit_calls(pending, submit)
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from state.complete(future.result())
+    finally:
+        state.close()
+
+
+async def run_async(
+    api_client,
+    calls: Iterable[Callable],
+    concurrency: int,
+    ordered: bool,
+    checkpoint: Optional[str],
+    retries: int,
+    retry_backoff: float,
+    limiter: Optional[AdaptiveLimiter] = None,
+):
+    """Run calls as asyncio tasks, see :meth:`~matterapi.client.async_client.AsyncClient.bulk`"""
+    if limiter is not None:
+        concurrency = limiter.max_limit
+    semaphore = asyncio.Semaphore(concurrency)
+    slot = limiter.slot if limiter is not None else lambda: semaphore
+    state = _BulkState(calls, concurrency, ordered, checkpoint, retries, retry_backoff)
+
+    def submit(index, call):
+        return asyncio.ensure_future(
+            _execute_async(api_client, state, slot, index, call)
+        )
+
+    pending: Set[Any] = set()
+    try:
+        while True:
+            state.submit_calls(pending, submit)
+            if not pending:
+                break
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                for result in state.complete(task.result()):
+                    yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        state.close()
+
+
+__all__ = [
+    "BulkResult",
+    "Checkpoint",
+    "is_retryable",
+    "is_unsent",
+    "is_safe_to_retry",
+    "read_records",
+]
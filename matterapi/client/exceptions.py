@@ -21,9 +21,18 @@ class ApiError(Exception):
     Base for api errors
     """
 
-    def __init__(self, message, error_details: ExceptionBody = None):
+    def __init__(
+        self,
+        message,
+        error_details: ExceptionBody = None,
+        request_id: Optional[str] = None,
+    ):
         super().__init__(message)
         self.details = error_details
+        self.request_id = request_id or (
+            error_details.request_id if error_details else None
+        )
+        """ Request id assigned by the server, use it to find the request in the server logs """
 
 
 class InvalidOrMissingParameters(ApiError):
@@ -87,3 +96,24 @@ class FeatureDisabled(ApiError):
     Raised when mattermost returns a
     501 Feature is disabled
     """
+
+
+class CircuitOpen(ApiError):
+    """
+    Raised without sending a request while the
+    circuit breaker considers the server unavailable
+    """
+
+
+STATUS_EXCEPTIONS = {
+    400: InvalidOrMissingParameters,
+    401: NoAccessTokenProvided,
+    403: NotEnoughPermissions,
+    404: ResourceNotFound,
+    405: MethodNotAllowed,
+    413: ContentTooLarge,
+    429: TooManyRequests,
+    500: InternalServerError,
+    501: FeatureDisabled,
+}
+""" Exception raised for each error status code returned by mattermost """
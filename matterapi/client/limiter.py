@@ -0,0 +1,231 @@
+""" Adaptive concurrency limit for bulk calls """
+
+import asyncio
+import collections
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncGenerator, List, Optional
+
+import httpx
+
+from .base import logger
+from .breaker import is_server_busy
+from .exceptions import TooManyRequests
+
+
+def is_overload(error: BaseException) -> bool:
+    """Check if an error means that the server is overloaded
+
+    ``429 Too Many Requests``, ``503 Service Unavailable`` and timeouts count as overload.
+    """
+    return isinstance(
+        error, (TooManyRequests, httpx.TimeoutException)
+    ) or is_server_busy(error)
+
+
+@dataclass
+class LimiterStats:
+    """Current state of an adaptive limiter"""
+
+    limit: int
+    """ Number of calls currently allowed to run at the same time """
+    in_flight: int
+    """ Number of calls running """
+    waiting: int
+    """ Number of calls waiting for a free slot """
+    increases: int
+    """ Number of times the limit was increased """
+    decreases: int
+    """ Number of times the limit was decreased """
+    p99: Optional[float]
+    """ 99th percentile latency in seconds of the last completed window """
+    baseline_p99: Optional[float]
+    """ 99th percentile latency in seconds the current one is compared to """
+
+
+class AdaptiveLimiter:
+    """Limit concurrent calls, adapting the limit to the observed latency and errors
+
+    The limit follows an additive increase, multiplicative decrease scheme. Latencies of
+    completed calls are collected in windows of at least ``limit`` calls. After a window
+    in which the limit was reached, the limit grows by ``increase`` if the 99th percentile
+    latency did not rise above ``tolerance`` times the baseline, which tracks the lowest
+    recent 99th percentile. It is multiplied by ``decrease`` if the latency rose, or as soon
+    as a call fails with ``429 Too Many Requests``, ``503 Service Unavailable`` or a timeout,
+    at most once per window.
+
+    Pass it to :meth:`AsyncClient.bulk() <matterapi.client.async_client.AsyncClient.bulk>`
+    or use it around any calls of one event loop:
+
+    .. code-block:: python
+
+        limiter = AdaptiveLimiter(initial=4, max_limit=64)
+        async for result in ad.bulk(calls, limiter=limiter):
+            ...
+
+        async with limiter.slot():
+            await ad.users.get_user(user_id)
+
+        print(limiter.limit, limiter.stats())
+
+    Args:
+        initial: Limit to start with
+        min_limit: Lowest limit
+        max_limit: Highest limit
+        increase: Calls added to the limit after a window with stable latency
+        decrease: Factor the limit is multiplied with on overload
+        tolerance: Factor the 99th percentile latency may rise over the baseline before
+            the limit is decreased
+        min_window: Minimal number of calls in a window
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: int = 1,
+        decrease: float = 0.5,
+        tolerance: float = 2.0,
+        min_window: int = 10,
+    ):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("1 <= min_limit <= initial <= max_limit is required")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.tolerance = tolerance
+        self.min_window = min_window
+        self.limit = initial
+        """ Number of calls currently allowed to run at the same time """
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self.p99: Optional[float] = None
+        self.baseline_p99: Optional[float] = None
+        self._waiters: collections.deque = collections.deque()
+        self._samples: List[float] = []
+        self._calls = 0
+        self._changed_at = 0.0
+        self._saturated = False
+        self._decreased = False
+
+    def stats(self) -> LimiterStats:
+        """Return the current limit and latency statistics"""
+        return LimiterStats(
+            self.limit,
+            self.in_flight,
+            len(self._waiters),
+            self.increases,
+            self.decreases,
+            self.p99,
+            self.baseline_p99,
+        )
+
+    def _wake(self):
+        free = self.limit - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def acquire(self):
+        """Wait for a free slot"""
+        while self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass a slot this task was woken for on to the next waiter
+                self._wake()
+                raise
+        self.in_flight += 1
+        if self.in_flight >= self.limit:
+            self._saturated = True
+
+    def release(
+        self,
+        latency: Optional[float] = None,
+        error: Optional[BaseException] = None,
+        started: Optional[float] = None,
+    ):
+        """Free a slot and record the outcome of the call
+
+        Args:
+            latency: Duration of the call in seconds, ``None`` to not record the call,
+                e.g. if it was cancelled
+            error: Exception raised by the call
+            started: :func:`time.perf_counter` when the call started. Calls started before
+                the limit was last changed are not used to judge the new limit.
+        """
+        self.in_flight -= 1
+        if started is not None and started < self._changed_at:
+            latency = None
+        if latency is not None:
+            self._calls += 1
+            if error is not None and is_overload(error):
+                self._backoff(f"overload: {error!r}")
+            else:
+                self._samples.append(latency)
+            if self._calls >= max(self.limit, self.min_window):
+                self._adjust()
+        self._wake()
+
+    def _set_limit(self, limit: int):
+        self.limit = max(self.min_limit, min(self.max_limit, limit))
+        self._changed_at = time.perf_counter()
+
+    def _backoff(self, reason: str):
+        if self._decreased:
+            return
+        self._decreased = True
+        self.decreases += 1
+        self._set_limit(math.floor(self.limit * self.decrease))
+        logger.debug("Decreasing concurrency limit to %s, %s", self.limit, reason)
+
+    def _adjust(self):
+        if self._samples:
+            samples = sorted(self._samples)
+            p99 = samples[math.ceil(len(samples) * 0.99) - 1]
+            self.p99 = p99
+            if self.baseline_p99 is None or p99 < self.baseline_p99:
+                self.baseline_p99 = p99
+            else:
+                # Follow lasting changes slowly, e.g. the server got busier
+                self.baseline_p99 += (p99 - self.baseline_p99) * 0.05
+            if p99 > self.baseline_p99 * self.tolerance:
+                self._backoff(f"p99 latency rose to {p99:.3f}s")
+            elif (
+                self._saturated and not self._decreased and self.limit < self.max_limit
+            ):
+                self.increases += 1
+                self._set_limit(self.limit + self.increase)
+        self._calls = 0
+        self._samples = []
+        self._saturated = self.in_flight >= self.limit
+        self._decreased = False
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncGenerator[None, None]:
+        """Hold a slot while the block runs and record its latency and errors"""
+        await self.acquire()
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as error:
+            self.release(time.perf_counter() - start, error, start)
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.release(time.perf_counter() - start, started=start)
+
+
+__all__ = ["AdaptiveLimiter", "LimiterStats", "is_overload"]
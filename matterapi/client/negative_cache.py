@@ -0,0 +1,166 @@
+""" Short lived cache of lookups which returned 404 Not Found """
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, Tuple
+
+from .exceptions import ResourceNotFound
+
+LOOKUP_OPERATIONS = frozenset(
+    (
+        "get_user",
+        "get_user_by_username",
+        "get_user_by_email",
+        "get_bot",
+        "get_team",
+        "get_team_by_name",
+        "get_team_member",
+        "get_channel",
+        "get_channel_by_name",
+        "get_channel_by_name_for_team_name",
+        "get_channel_member",
+        "get_post",
+        "get_emoji",
+        "get_emoji_by_name",
+    )
+)
+""" Names of the operations whose ``ResourceNotFound`` errors are cached """
+
+_PURGE_SIZE = 10000
+
+_RELATED_TAGS = {
+    # Bots are users, creating one makes the user lookups succeed as well
+    "bots": ("bots", "users"),
+    "users": ("users", "bots"),
+}
+
+_EVENT_TAGS = {
+    "posted": ("posts",),
+    "post_edited": ("posts",),
+    "new_user": ("users", "bots"),
+    "user_updated": ("users", "bots"),
+    "user_activation_status_change": ("users", "bots"),
+    "added_to_team": ("teams",),
+    "update_team": ("teams",),
+    "restore_team": ("teams",),
+    "channel_created": ("channels",),
+    "channel_updated": ("channels",),
+    "channel_converted": ("channels",),
+    "channel_restored": ("channels",),
+    "direct_added": ("channels",),
+    "group_added": ("channels",),
+    "user_added": ("channels",),
+    "emoji_added": ("emoji",),
+}
+
+
+@dataclass
+class NegativeCacheStats:
+    """Statistics of the negative cache"""
+
+    hits: int = 0
+    """ Number of lookups answered from the cache """
+    misses: int = 0
+    """ Number of lookups sent to the server """
+    invalidations: int = 0
+    """ Number of cached errors removed before they expired """
+
+
+class NegativeCache:
+    """Remember lookups which failed with ``404 Not Found`` for a short time
+
+    Errors are grouped by the tags of the operation (``users``, ``channels``, ...). Any
+    other call with the same tag, like ``create_user``, as well as websocket events
+    creating or changing such objects, drop the cached errors of the tag, so a lookup
+    succeeds as soon as the object exists.
+
+    Used by the clients if :attr:`~matterapi.client.base.ApiClientOptions.negative_cache_ttl`
+    is set. Pass websocket events to :meth:`apply` to invalidate entries on changes made
+    by other clients:
+
+    .. code-block:: python
+
+        async def handler(event):
+            ad.negative_cache.apply(event)
+            ...
+
+        await ad.start_ws(handler)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._errors: Dict[str, Dict[Hashable, Tuple[float, ResourceNotFound]]] = {}
+        self.stats = NegativeCacheStats()
+        """ Hits, misses and invalidations of the cache """
+
+    def __len__(self):
+        return sum(len(errors) for errors in self._errors.values())
+
+    def check(self, key: Hashable, tags: Iterable[str]):
+        """Raise ``ResourceNotFound`` if a lookup is known to fail
+
+        Args:
+            key: Key of the request, see :func:`~matterapi.client.singleflight.request_key`
+            tags: Tags of the operation
+        """
+        now = time.monotonic()
+        with self._lock:
+            for tag in tags:
+                errors = self._errors.get(tag)
+                entry = errors.get(key) if errors else None
+                if entry is None:
+                    continue
+                if entry[0] <= now:
+                    del errors[key]
+                    continue
+                self.stats.hits += 1
+                error = entry[1]
+                # A new exception, raising the same instance again would extend its traceback
+                raise ResourceNotFound(error.args[0], error.details, error.request_id)
+            self.stats.misses += 1
+
+    def add(
+        self, key: Hashable, tags: Iterable[str], error: ResourceNotFound, ttl: float
+    ):
+        """Remember the error of a lookup for ``ttl`` seconds"""
+        now = time.monotonic()
+        with self._lock:
+            for tag in tags:
+                errors = self._errors.setdefault(tag, {})
+                if len(errors) >= _PURGE_SIZE:
+                    for expired in [
+                        stale for stale, entry in errors.items() if entry[0] <= now
+                    ]:
+                        del errors[expired]
+                errors[key] = (now + ttl, error)
+
+    def invalidate(self, tags: Iterable[str]):
+        """Drop the cached errors of lookups with any of the tags"""
+        if not self._errors:
+            return
+        with self._lock:
+            for tag in tags:
+                for related in _RELATED_TAGS.get(tag, (tag,)):
+                    errors = self._errors.pop(related, None)
+                    if errors:
+                        self.stats.invalidations += len(errors)
+
+    def apply(self, event: Dict[str, Any]) -> bool:
+        """Apply a websocket event, returns ``True`` if it may have created an object
+
+        Can be passed to :meth:`~matterapi.client.base.BaseClient.start_ws` directly.
+        """
+        tags = _EVENT_TAGS.get(event.get("event"))
+        if tags is None:
+            return False
+        self.invalidate(tags)
+        return True
+
+    def clear(self):
+        """Drop all cached errors"""
+        with self._lock:
+            self._errors.clear()
+
+
+__all__ = ["NegativeCache", "NegativeCacheStats", "LOOKUP_OPERATIONS"]
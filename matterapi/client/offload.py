@@ -0,0 +1,80 @@
+""" Parsing of large responses outside of the event loop """
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+import httpx
+
+from ..endpoints.engine import Operation
+from ..endpoints.operations import parse_operation_content
+
+
+@dataclass
+class ParseStats:
+    """Response parsing statistics of a single operation"""
+
+    calls: int = 0
+    """ Number of parsed responses """
+    offloaded: int = 0
+    """ Number of responses parsed in the executor """
+    response_bytes: int = 0
+    """ Total size of the parsed response bodies """
+    max_response_bytes: int = 0
+    """ Size of the largest parsed response body """
+    loop_time: float = 0.0
+    """ Total time in seconds the event loop was blocked by parsing """
+    max_loop_time: float = 0.0
+    """ Longest time in seconds the event loop was blocked by a single response """
+
+
+async def parse_response(
+    options,
+    stats: Dict[str, ParseStats],
+    operation: Operation,
+    response: httpx.Response,
+):
+    """Parse the response of an operation, in the executor if it exceeds the threshold
+
+    See :attr:`~matterapi.client.base.ApiClientOptions.parse_offload_threshold`.
+    """
+    start = time.perf_counter()
+    size = len(response.content)
+    threshold = options.parse_offload_threshold
+    offload = (
+        threshold is not None
+        and size >= threshold
+        and operation.parses(response.status_code)
+    )
+    if offload:
+        future = asyncio.get_running_loop().run_in_executor(
+            options.parse_executor,
+            parse_operation_content,
+            operation.name,
+            response.status_code,
+            response.content,
+            options.lazy_models,
+            options.fast_models,
+        )
+        loop_time = time.perf_counter() - start
+        result = await future
+    else:
+        result = operation.parse_response(
+            response, options.lazy_models, options.fast_models
+        )
+        loop_time = time.perf_counter() - start
+
+    operation_stats = stats.get(operation.name)
+    if operation_stats is None:
+        operation_stats = stats.setdefault(operation.name, ParseStats())
+    operation_stats.calls += 1
+    operation_stats.offloaded += offload
+    operation_stats.response_bytes += size
+    operation_stats.max_response_bytes = max(operation_stats.max_response_bytes, size)
+    operation_stats.loop_time += loop_time
+    operation_stats.max_loop_time = max(operation_stats.max_loop_time, loop_time)
+    return result
+
+
+__all__ = ["ParseStats"]
@@ -0,0 +1,163 @@
+""" Thread-safe pooled sessions for the SyncClient """
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Generator, Optional
+
+import httpx
+
+if TYPE_CHECKING:
+    from .sync_client import SyncClient
+
+
+@dataclass
+class CheckoutStats:
+    """Checkout statistics of a single thread"""
+
+    checkouts: int = 0
+    """ Number of checkouts """
+    active: int = 0
+    """ Number of checkouts currently held """
+    wait_time: float = 0.0
+    """ Total time in seconds spent waiting for a free slot """
+    max_wait_time: float = 0.0
+    """ Longest time in seconds spent waiting for a free slot """
+    hold_time: float = 0.0
+    """ Total time in seconds checkouts were held """
+
+
+class SessionPool:
+    """Share one session of a :class:`~matterapi.client.sync_client.SyncClient` between threads
+
+    All threads use the same ``httpx.Client`` and therefore the same bounded connection pool,
+    and the login flow is only run once. The number of concurrent checkouts is limited to
+    ``max_connections`` so threads queue up instead of overrunning the connection pool.
+
+    Create it with :meth:`SyncClient.pool() <matterapi.client.sync_client.SyncClient.pool>`:
+
+    .. code-block:: python
+
+        pool = sd.pool(max_connections=20)
+
+        def handle_request():
+            with pool.checkout() as api:
+                return api.users.get_user("me")
+
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        client: "SyncClient",
+        max_connections: int = 10,
+        max_keepalive_connections: Optional[int] = None,
+        checkout_timeout: Optional[float] = None,
+    ):
+        self._client = client
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._checkout_timeout = checkout_timeout
+        self._init_state()
+
+    def _init_state(self):
+        self._pid = os.getpid()
+        self._slots = threading.BoundedSemaphore(self._limits.max_connections)
+        self._lock = threading.Lock()
+        self._session: Optional["SyncClient"] = None
+        self._stats: Dict[str, CheckoutStats] = {}
+        # Session token to reuse in a forked child instead of logging in again
+        self._token: Optional[str] = None
+
+    def _reset_after_fork(self):
+        """Drop all state inherited from the parent process
+
+        Locks might have been held by threads which do not exist in the child and
+        the connections of the shared session belong to the parent.
+        """
+        if self._session is not None:
+            self._token = self._session.active_token or self._token
+        token = self._token
+        self._init_state()
+        self._token = token
+
+    def _get_session(self) -> "SyncClient":
+        # pylint: disable=protected-access
+        session = self._session
+        if session is not None and not session._httpx_client.is_closed:
+            return session
+        with self._lock:
+            if self._session is None or self._session._httpx_client.is_closed:
+                session = self._client.copy()
+                if self._token:
+                    session.active_token = self._token
+                session._httpx_client = session._create_httpx_client(
+                    reuse_token=True, limits=self._limits
+                )
+                self._session = session
+            return self._session
+
+    def _thread_stats(self) -> CheckoutStats:
+        name = threading.current_thread().name
+        stats = self._stats.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(name, CheckoutStats())
+        return stats
+
+    @contextmanager
+    def checkout(self) -> Generator["SyncClient", None, None]:
+        """Check out the shared session for the current thread
+
+        Raises:
+            TimeoutError: If no slot became available within ``checkout_timeout``
+        """
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+        stats = self._thread_stats()
+        start = time.perf_counter()
+        if not self._slots.acquire(timeout=self._checkout_timeout):
+            raise TimeoutError("No pooled session became available in time")
+        acquired = time.perf_counter()
+        wait_time = acquired - start
+        stats.checkouts += 1
+        stats.active += 1
+        stats.wait_time += wait_time
+        stats.max_wait_time = max(stats.max_wait_time, wait_time)
+        try:
+            yield self._get_session()
+        finally:
+            stats.active -= 1
+            stats.hold_time += time.perf_counter() - acquired
+            self._slots.release()
+
+    @property
+    def active_token(self) -> Optional[str]:
+        """The authentication token shared by all threads"""
+        return self._get_session().active_token
+
+    def stats(self) -> Dict[str, CheckoutStats]:
+        """Return the checkout statistics per thread name"""
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self):
+        """Close the shared session and its connections"""
+        # pylint: disable=protected-access
+        with self._lock:
+            if self._session is not None:
+                self._session._httpx_client.close()
+                self._session = None
+
+    def __enter__(self) -> "SessionPool":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+__all__ = ["CheckoutStats", "SessionPool"]
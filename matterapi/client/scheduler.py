@@ -0,0 +1,308 @@
+""" Priority aware scheduling of requests sharing one connection pool """
+
+import asyncio
+import collections
+import contextvars
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncGenerator, Deque, Dict, Generator, Optional
+
+INTERACTIVE = "interactive"
+""" Calls a user is waiting for, e.g. replies of a bot """
+NORMAL = "normal"
+""" Calls without a priority set """
+BULK = "bulk"
+""" Background traffic like syncs, exports and :meth:`bulk` runs """
+
+PRIORITIES = (INTERACTIVE, NORMAL, BULK)
+""" Priority classes from highest to lowest """
+
+_priority: contextvars.ContextVar = contextvars.ContextVar(
+    "matterapi_priority", default=None
+)
+
+
+def _check_priority(name: str):
+    if name not in PRIORITIES:
+        raise ValueError(f"Unknown priority {name!r}, expected one of {PRIORITIES}")
+
+
+@contextmanager
+def priority(name: str) -> Generator[None, None, None]:
+    """Send all calls made in the block with the given priority
+
+    Takes precedence over the priority of the session.
+
+    .. code-block:: python
+
+        with priority(INTERACTIVE):
+            sd.posts.create_post(json_body={"channel_id": channel_id, "message": "Hi"})
+    """
+    _check_priority(name)
+    token = _priority.set(name)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Optional[str]:
+    """Return the priority set with :func:`priority` for the current context, if any"""
+    return _priority.get()
+
+
+@dataclass
+class PriorityStats:
+    """Scheduling statistics of a single priority class"""
+
+    requests: int = 0
+    """ Number of requests sent """
+    in_flight: int = 0
+    """ Number of requests currently sent """
+    waiting: int = 0
+    """ Number of requests waiting for a slot """
+    wait_time: float = 0.0
+    """ Total time in seconds requests waited for a slot """
+    max_wait_time: float = 0.0
+    """ Longest time in seconds a request waited for a slot """
+    starved: int = 0
+    """ Number of requests preferred because they waited longer than ``max_wait`` """
+
+
+class _Waiter:
+    __slots__ = ("priority", "enqueued", "granted", "wake")
+
+    def __init__(self, priority_name: str, wake):
+        self.priority = priority_name
+        self.enqueued = time.monotonic()
+        self.granted = False
+        self.wake = wake
+
+
+class RequestScheduler:
+    """Share a limited number of concurrent requests between priority classes
+
+    At most ``max_concurrency`` requests are sent at the same time, which should match the
+    connection limit of the http client. As long as slots are free, requests of any class
+    are sent right away. Once requests have to wait, free slots are handed out so that the
+    number of requests in flight per class follows ``shares``, e.g. with the default shares
+    interactive calls get six times the slots of bulk calls. ``reserve`` slots are only used
+    by interactive calls, so a reply never waits for a full pool of slow background requests.
+    Requests which waited longer than ``max_wait`` seconds are served first regardless of
+    their class, so background work is slowed down but never starved.
+
+    Pass it as :attr:`~matterapi.client.base.ApiClientOptions.scheduler`. The priority of a
+    call is set with :func:`priority`, per session with ``session(priority=...)``, and
+    defaults to :data:`NORMAL`. Calls of ``bulk()`` are sent with :data:`BULK` priority.
+
+    .. code-block:: python
+
+        scheduler = RequestScheduler(max_concurrency=10)
+        sd = SyncClient(
+            options={
+                ...,
+                "scheduler": scheduler,
+                "httpx_client_options": {"limits": httpx.Limits(max_connections=10)},
+            }
+        )
+        with sd.session(priority=BULK) as background_api:
+            ...
+        with priority(INTERACTIVE):
+            sd.posts.create_post(...)
+        print(scheduler.stats())
+
+    Args:
+        max_concurrency: Maximum number of requests in flight
+        shares: Relative share of the slots per priority class
+        reserve: Slots only interactive requests may use
+        max_wait: Seconds after which a waiting request is served before all others
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        shares: Optional[Dict[str, float]] = None,
+        reserve: int = 2,
+        max_wait: float = 5.0,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if not 0 <= reserve < max_concurrency:
+            raise ValueError("reserve must be less than max_concurrency")
+        self.max_concurrency = max_concurrency
+        self.shares = {INTERACTIVE: 6.0, NORMAL: 3.0, BULK: 1.0}
+        for name, share in (shares or {}).items():
+            _check_priority(name)
+            if share <= 0:
+                raise ValueError("shares must be positive")
+            self.shares[name] = share
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.in_flight = 0
+        """ Number of requests in flight """
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Deque[_Waiter]] = {
+            name: collections.deque() for name in PRIORITIES
+        }
+        self._stats = {name: PriorityStats() for name in PRIORITIES}
+
+    def stats(self) -> Dict[str, PriorityStats]:
+        """Return the scheduling statistics per priority class"""
+        with self._lock:
+            return {
+                name: PriorityStats(**vars(stats))
+                for name, stats in self._stats.items()
+            }
+
+    def _capacity(self, name: str) -> int:
+        if name == INTERACTIVE:
+            return self.max_concurrency
+        return self.max_concurrency - self.reserve
+
+    def _grant(self, name: str, waited: float):
+        stats = self._stats[name]
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.wait_time += waited
+        stats.max_wait_time = max(stats.max_wait_time, waited)
+        self.in_flight += 1
+
+    def _next_waiter(self, now: float) -> Optional[_Waiter]:
+        best = None
+        best_load = 0.0
+        oldest = None
+        for name in PRIORITIES:
+            queue = self._queues[name]
+            if not queue or self.in_flight >= self._capacity(name):
+                continue
+            head = queue[0]
+            if now - head.enqueued >= self.max_wait and (
+                oldest is None or head.enqueued < oldest.enqueued
+            ):
+                oldest = head
+            load = self._stats[name].in_flight / self.shares[name]
+            if best is None or load < best_load:
+                best = head
+                best_load = load
+        if oldest is not None and oldest is not best:
+            self._stats[oldest.priority].starved += 1
+            return oldest
+        return best
+
+    def _dispatch(self):
+        """Hand free slots to waiting requests, called with the lock held"""
+        now = time.monotonic()
+        while self.in_flight < self.max_concurrency:
+            waiter = self._next_waiter(now)
+            if waiter is None:
+                break
+            self._queues[waiter.priority].popleft()
+            self._stats[waiter.priority].waiting -= 1
+            self._grant(waiter.priority, now - waiter.enqueued)
+            waiter.granted = True
+            waiter.wake()
+
+    def _try_acquire(self, name: str) -> bool:
+        """Take a slot right away if nobody of the same or a higher class waits"""
+        if self.in_flight >= self._capacity(name):
+            return False
+        for other in PRIORITIES:
+            if self._queues[other]:
+                return False
+            if other == name:
+                break
+        self._grant(name, 0.0)
+        return True
+
+    def _enqueue(self, waiter: _Waiter):
+        self._queues[waiter.priority].append(waiter)
+        self._stats[waiter.priority].waiting += 1
+
+    def _abandon(self, waiter: _Waiter):
+        """Remove a waiter which gave up, or return the slot it was granted"""
+        with self._lock:
+            if waiter.granted:
+                self._release(waiter.priority)
+            else:
+                self._queues[waiter.priority].remove(waiter)
+                self._stats[waiter.priority].waiting -= 1
+
+    def _release(self, name: str):
+        self.in_flight -= 1
+        self._stats[name].in_flight -= 1
+        self._dispatch()
+
+    def release(self, name: str):
+        """Return the slot of a finished request of the given priority"""
+        with self._lock:
+            self._release(name)
+
+    def acquire(self, name: str):
+        """Wait for a slot for a request of the given priority"""
+        _check_priority(name)
+        with self._lock:
+            if self._try_acquire(name):
+                return
+            event = threading.Event()
+            waiter = _Waiter(name, event.set)
+            self._enqueue(waiter)
+        try:
+            event.wait()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    async def acquire_async(self, name: str):
+        """Same as :meth:`acquire` without blocking the event loop"""
+        _check_priority(name)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_acquire(name):
+                return
+            future = loop.create_future()
+
+            def wake():
+                # May be called from another thread releasing a slot
+                loop.call_soon_threadsafe(
+                    lambda: future.done() or future.set_result(None)
+                )
+
+            waiter = _Waiter(name, wake)
+            self._enqueue(waiter)
+        try:
+            await future
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    @contextmanager
+    def slot(self, name: str) -> Generator[None, None, None]:
+        """Hold a slot of the given priority while the block runs"""
+        self.acquire(name)
+        try:
+            yield
+        finally:
+            self.release(name)
+
+    @asynccontextmanager
+    async def slot_async(self, name: str) -> AsyncGenerator[None, None]:
+        """Same as :meth:`slot` without blocking the event loop"""
+        await self.acquire_async(name)
+        try:
+            yield
+        finally:
+            self.release(name)
+
+
+__all__ = [
+    "RequestScheduler",
+    "PriorityStats",
+    "priority",
+    "current_priority",
+    "INTERACTIVE",
+    "NORMAL",
+    "BULK",
+    "PRIORITIES",
+]
@@ -0,0 +1,156 @@
+""" Coalescing of identical concurrent requests """
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+@dataclass
+class CoalescingStats:
+    """Request coalescing statistics of a single operation"""
+
+    calls: int = 0
+    """ Number of calls eligible for coalescing """
+    coalesced: int = 0
+    """ Number of calls which waited for the response of an identical call in flight """
+
+
+def request_key(request: Dict[str, Any], token: Optional[str]) -> Hashable:
+    """Return the key identifying identical requests
+
+    Requests are identical if method, url, query parameters, additional headers and the
+    token they are authenticated with match.
+
+    Args:
+        request: Keyword arguments for ``httpx.Client.request`` as returned by
+            :meth:`~matterapi.endpoints.engine.Operation.build_request`
+        token: The active authentication token of the client
+    """
+    params = request.get("params")
+    headers = request.get("headers")
+    return (
+        request["method"],
+        request["url"],
+        (
+            tuple(sorted((name, repr(value)) for name, value in params.items()))
+            if params
+            else ()
+        ),
+        tuple(sorted(headers.items())) if headers else (),
+        token,
+    )
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "finished")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.finished = False
+
+
+class SingleFlight:
+    """Run a single request for concurrent identical calls and share its response
+
+    The first caller of a key sends the request, callers arriving while it is in flight
+    wait for it and get the same response or exception. Responses are never cached, a
+    call arriving after the response was received sends a new request.
+
+    Threads and tasks of the same event loop are coalesced. If the caller sending the
+    request is cancelled, one of the waiting callers sends it again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Tuple[int, Hashable], "asyncio.Future[Any]"] = {}
+        self.stats: Dict[str, CoalescingStats] = {}
+        """ Coalescing statistics per operation name """
+
+    def _count(self, name: str, coalesced: bool):
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats.setdefault(name, CoalescingStats())
+        stats.calls += 1
+        stats.coalesced += coalesced
+
+    def run(self, key: Hashable, name: str, function: Callable[[], Any]) -> Any:
+        """Return the result of ``function``, shared with concurrent calls of ``key``
+
+        Args:
+            key: Key of the request, see :func:`request_key`
+            name: Name of the operation the statistics are recorded for
+            function: Sends the request and returns the response
+        """
+        coalesced = False
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is None:
+                    call = self._calls[key] = _Call()
+                    self._count(name, coalesced)
+                    break
+                if not coalesced:
+                    self._count(name, True)
+                    coalesced = True
+            call.done.wait()
+            if call.finished:
+                if call.error is not None:
+                    raise call.error
+                return call.result
+            # The sending thread was interrupted, send the request again
+        try:
+            call.result = function()
+            call.finished = True
+        except Exception as error:
+            call.error = error
+            call.finished = True
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def run_async(
+        self, key: Hashable, name: str, function: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Same as :meth:`run` for a coroutine function"""
+        # Futures are bound to their event loop
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+        coalesced = False
+        while True:
+            future = self._async_calls.get(call_key)
+            if future is None:
+                future = self._async_calls[call_key] = loop.create_future()
+                self._count(name, coalesced)
+                break
+            if not coalesced:
+                self._count(name, True)
+                coalesced = True
+            # Shielded, a cancelled waiter must not cancel the request of the others
+            call = await asyncio.shield(future)
+            if call.finished:
+                if call.error is not None:
+                    raise call.error
+                return call.result
+            # The sending task was cancelled, send the request again
+        call = _Call()
+        try:
+            call.result = await function()
+            call.finished = True
+        except Exception as error:
+            call.error = error
+            call.finished = True
+            raise
+        finally:
+            del self._async_calls[call_key]
+            future.set_result(call)
+        return call.result
+
+
+__all__ = ["SingleFlight", "CoalescingStats", "request_key"]
@@ -0,0 +1,287 @@
+""" Tracing hooks and slow call logging for api calls """
+
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+from urllib.parse import unquote
+
+import httpx
+
+logger = logging.getLogger("matterapi.client")
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar(
+    "matterapi_current_span", default=None
+)
+
+# Maps httpcore trace event names to the phases reported in :attr:`Span.timings`
+_TRACE_PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.connect_unix_socket": "connect",
+    "connection.start_tls": "tls",
+    "http11.receive_response_headers": "server_wait",
+    "http2.receive_response_headers": "server_wait",
+    "http11.receive_response_body": "body_read",
+    "http2.receive_response_body": "body_read",
+}
+
+TIMING_PHASES = ("connect", "tls", "server_wait", "body_read", "parse")
+""" Phases reported in the timing breakdown of a span """
+
+
+@dataclass
+class Span:
+    """Information about a single endpoint call
+
+    A span is started before an endpoint method sends its request and ended
+    after the response was parsed. All HTTP requests issued during the call
+    (e.g. the login flow) are accounted to the same span.
+    """
+
+    api: str
+    """ Name of the endpoint class, e.g. ``PostsApi`` """
+    operation: str
+    """ Name of the endpoint method, e.g. ``get_posts_for_channel`` """
+    path_params: Dict[str, str] = field(default_factory=dict)
+    """ Values of the path parameters the endpoint was called with """
+    method: Optional[str] = None
+    """ HTTP method of the last request """
+    path: Optional[str] = None
+    """ Path of the last request relative to the api base path """
+    path_template: Optional[str] = None
+    """ Path template of the operation, e.g. ``/channels/{channel_id}/posts`` """
+    params_size: int = 0
+    """ Size of the encoded query string in bytes """
+    body_size: int = 0
+    """ Size of the request body in bytes """
+    status_code: Optional[int] = None
+    """ Status code of the last response """
+    request_id: Optional[str] = None
+    """ Request id assigned by the server (``X-Request-Id`` header) """
+    error: Optional[BaseException] = None
+    """ Exception raised by the call, if any """
+    start: float = 0.0
+    """ Start of the call as returned by :func:`time.perf_counter` """
+    end: Optional[float] = None
+    """ End of the call as returned by :func:`time.perf_counter` """
+    timings: Dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(TIMING_PHASES, 0.0)
+    )
+    """ Timing breakdown in seconds for connect, tls, server_wait, body_read and parse """
+    _phase_start: Dict[str, float] = field(default_factory=dict, repr=False)
+    _body_end: Optional[float] = field(default=None, repr=False)
+
+    @property
+    def name(self) -> str:
+        """Full name of the operation, e.g. ``PostsApi.get_posts_for_channel``"""
+        return f"{self.api}.{self.operation}"
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Duration of the call in seconds or ``None`` if the span is still open"""
+        if self.end is None:
+            return None
+        return self.end - self.start
+
+    def trace_event(self, event_name: str, info: Dict):
+        """Record a httpcore trace event"""
+        # pylint: disable=unused-argument
+        prefix, _, state = event_name.rpartition(".")
+        phase = _TRACE_PHASES.get(prefix)
+        if phase is None:
+            return
+        now = time.perf_counter()
+        if state == "started":
+            self._phase_start[phase] = now
+        elif phase in self._phase_start:
+            self.timings[phase] += now - self._phase_start.pop(phase)
+            if phase == "body_read":
+                self._body_end = now
+
+    def bind_request(self, request: httpx.Request, basepath: str = ""):
+        """Record request information"""
+        self.method = request.method
+        path = unquote(request.url.path)
+        if basepath and path.startswith(basepath):
+            path = path[len(basepath) :]
+        self.path = path
+        self.params_size = len(request.url.query)
+        self.body_size = int(request.headers.get("content-length", 0))
+
+    def bind_response(self, response: httpx.Response):
+        """Record response information"""
+        self.status_code = response.status_code
+        self.request_id = response.headers.get("x-request-id", self.request_id)
+        # Transports without trace support never report the body read, so parsing
+        # is measured from the response headers on in that case
+        self._body_end = time.perf_counter()
+
+    def finish(self):
+        """Close the span and compute the parse time"""
+        self.end = time.perf_counter()
+        if self._body_end is not None:
+            self.timings["parse"] = self.end - self._body_end
+
+
+class TraceHooks:
+    """Base class for tracing hooks
+
+    Subclass this and pass instances in :attr:`~matterapi.client.base.ApiClientOptions.trace_hooks`
+    to get notified about every endpoint call. Exceptions raised by hooks are logged and
+    otherwise ignored.
+    """
+
+    def on_start(self, span: Span):
+        """Called before the endpoint sends its first request"""
+
+    def on_end(self, span: Span):
+        """Called after the endpoint call finished or raised"""
+
+
+def current_span() -> Optional[Span]:
+    """Return the span of the endpoint call currently executing, if any"""
+    return _current_span.get()
+
+
+def _call_hooks(hooks: List[Any], hook_name: str, span: Span):
+    for hook in hooks:
+        # pylint: disable=broad-except
+        try:
+            getattr(hook, hook_name)(span)
+        except Exception:
+            logger.exception("Trace hook %r failed", hook)
+
+
+def _log_slow_call(span: Span, threshold: float):
+    if span.duration is None or span.duration < threshold:
+        return
+    logger.warning(
+        "Slow call %s %s %s took %.3fs (connect=%.3fs tls=%.3fs server_wait=%.3fs "
+        "body_read=%.3fs parse=%.3fs) status=%s request_id=%s",
+        span.name,
+        span.method,
+        span.path_template,
+        span.duration,
+        *(span.timings[phase] for phase in TIMING_PHASES),
+        span.status_code,
+        span.request_id,
+    )
+
+
+@contextmanager
+def trace_call(
+    options, api, operation, arguments: Dict[str, Any], activate: bool = True
+):
+    """Open a span around the execution of an operation if tracing is enabled
+
+    Yields the span or ``None`` if neither trace hooks nor a slow call threshold are set.
+    Unless ``activate`` is false, the span is the current span while the block runs.
+    """
+    if not options.trace_hooks and options.slow_call_threshold is None:
+        yield None
+        return
+    span = Span(
+        api=type(api).__name__,
+        operation=operation.name,
+        path_template=operation.path,
+        path_params={name: str(arguments[name]) for name in operation.path_params},
+        start=time.perf_counter(),
+    )
+    _call_hooks(options.trace_hooks, "on_start", span)
+    token = _current_span.set(span) if activate else None
+    try:
+        yield span
+    except BaseException as error:
+        span.error = error
+        details = getattr(error, "details", None)
+        if details is not None and getattr(details, "request_id", None):
+            span.request_id = details.request_id
+        raise
+    finally:
+        if token is not None:
+            _current_span.reset(token)
+        span.finish()
+        _call_hooks(options.trace_hooks, "on_end", span)
+        if options.slow_call_threshold is not None:
+            _log_slow_call(span, options.slow_call_threshold)
+
+
+def iter_in_span(span: Optional[Span], iterator: Iterator) -> Iterator:
+    """Yield from a generator, making ``span`` the current span while it runs
+
+    Generators run in the context of their consumer. Setting the span around the whole
+    iteration would attribute everything the consumer does between two items to it.
+    """
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _current_span.reset(token)
+            yield item
+    finally:
+        iterator.close()
+
+
+async def aiter_in_span(span: Optional[Span], iterator: AsyncIterator) -> AsyncIterator:
+    """Same as :func:`iter_in_span` for an async generator"""
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _current_span.reset(token)
+            yield item
+    finally:
+        await iterator.aclose()
+
+
+def trace_request_hook(basepath: str) -> Callable:
+    """Create a httpx request event hook for a sync client which binds requests to the current span"""
+
+    def hook(request: httpx.Request):
+        span = _current_span.get()
+        if span is not None:
+            span.bind_request(request, basepath)
+            request.extensions["trace"] = span.trace_event
+
+    return hook
+
+
+def async_trace_request_hook(basepath: str) -> Callable:
+    """Create a httpx request event hook for an async client which binds requests to the current span"""
+
+    async def hook(request: httpx.Request):
+        span = _current_span.get()
+        if span is not None:
+            span.bind_request(request, basepath)
+
+            async def trace(event_name, info):
+                span.trace_event(event_name, info)
+
+            request.extensions["trace"] = trace
+
+    return hook
+
+
+def trace_response_hook(response: httpx.Response):
+    """httpx response event hook for sync clients recording response information"""
+    span = _current_span.get()
+    if span is not None:
+        span.bind_response(response)
+
+
+async def async_trace_response_hook(response: httpx.Response):
+    """httpx response event hook for async clients recording response information"""
+    trace_response_hook(response)
+
+
+__all__ = ["Span", "TraceHooks", "current_span", "TIMING_PHASES"]
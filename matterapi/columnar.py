@@ -0,0 +1,296 @@
+""" Compact column store for large numbers of posts """
+
+import json
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import httpx
+
+from .models import Post, PostList
+
+TIMESTAMP_FIELDS = ("create_at", "update_at", "delete_at", "edit_at")
+""" Post fields stored as integer columns """
+MISSING = -(2**63)
+""" Value of timestamp columns for posts without the field, omitted from rows """
+CODED_FIELDS = ("channel_id", "user_id", "root_id", "type")
+""" Post fields with few distinct values, stored dictionary encoded """
+COLUMN_FIELDS = ("id",) + TIMESTAMP_FIELDS + CODED_FIELDS + ("message",)
+""" Post fields stored in their own column, all other fields are kept as raw json """
+
+
+class _StringColumn:
+    """Variable length strings packed into one buffer with an offset per value"""
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array("Q", [0])
+
+    def append(self, value: Optional[str]):
+        self.data += (value or "").encode("utf-8")
+        self.offsets.append(len(self.data))
+
+    def __getitem__(self, index: int) -> str:
+        return self.data[self.offsets[index] : self.offsets[index + 1]].decode("utf-8")
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def take(self, indices: Sequence[int]) -> "_StringColumn":
+        column = _StringColumn()
+        data, offsets = self.data, self.offsets
+        for index in indices:
+            column.data += data[offsets[index] : offsets[index + 1]]
+            column.offsets.append(len(column.data))
+        return column
+
+    def nbytes(self) -> int:
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+
+class _CodedColumn:
+    """Strings stored as indices into a table of distinct values"""
+
+    __slots__ = ("values", "codes", "_lookup")
+
+    def __init__(self, values: Optional[List[Optional[str]]] = None):
+        self.values: List[Optional[str]] = values if values is not None else []
+        self.codes = array("I")
+        self._lookup = {value: code for code, value in enumerate(self.values)}
+
+    def code(self, value: Optional[str]) -> Optional[int]:
+        """Return the code of ``value`` or ``None`` if no row has this value"""
+        return self._lookup.get(value)
+
+    def append(self, value: Optional[str]):
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        return self.values[self.codes[index]]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def take(self, indices: Sequence[int]) -> "_CodedColumn":
+        # The value table is shared, it only ever grows
+        column = _CodedColumn.__new__(_CodedColumn)
+        column.values = self.values
+        column._lookup = self._lookup
+        codes = self.codes
+        column.codes = array("I", [codes[index] for index in indices])
+        return column
+
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes)
+
+
+class PostColumns:
+    """Array backed container holding posts in parallel columns
+
+    A parsed :class:`~matterapi.models.Post` with its nested props and metadata takes several
+    kilobytes of memory. This container stores the frequently used fields in compact columns
+    (``array`` based timestamps, dictionary encoded channel, user and root ids and a single buffer
+    for all messages) and keeps all other fields as raw json. Full models are only created when
+    rows are accessed.
+
+    Rows can be appended directly from ``get_posts_for_channel`` responses, without parsing them
+    into models first:
+
+    .. code-block:: python
+
+        columns = PostColumns()
+        api = SyncClient(options={..., "skip_response_parsing": True})
+        page = 0
+        while True:
+            response = api.posts.get_posts_for_channel(channel_id, page=page, per_page=200)
+            if not columns.extend(response):
+                break
+            page += 1
+
+        recent = columns.select(since=1640995200000, user_id=user_id)
+        for post in recent:
+            print(post.message)
+    """
+
+    def __init__(self):
+        self._ids = _StringColumn()
+        self._timestamps = {name: array("q") for name in TIMESTAMP_FIELDS}
+        self._coded = {name: _CodedColumn() for name in CODED_FIELDS}
+        self._messages = _StringColumn()
+        self._extra = _StringColumn()
+
+    @classmethod
+    def from_posts(
+        cls, posts: Union[PostList, httpx.Response, Dict[str, Any], Iterable]
+    ) -> "PostColumns":
+        """Create a container from a post list or an iterable of posts, see :meth:`extend`"""
+        columns = cls()
+        columns.extend(posts)
+        return columns
+
+    def __len__(self):
+        return len(self._ids)
+
+    def append(self, post: Union[Post, Dict[str, Any]]):
+        """Append a single post given as model or as decoded json"""
+        if isinstance(post, Post):
+            post = post.dict(exclude_unset=True)
+        self._ids.append(post.get("id"))
+        for name, column in self._timestamps.items():
+            value = post.get(name)
+            column.append(MISSING if value is None else value)
+        for name, coded in self._coded.items():
+            coded.append(post.get(name))
+        self._messages.append(post.get("message"))
+        extra = {key: value for key, value in post.items() if key not in COLUMN_FIELDS}
+        self._extra.append(json.dumps(extra, separators=(",", ":")) if extra else "")
+
+    def extend(
+        self, posts: Union[PostList, httpx.Response, Dict[str, Any], Iterable]
+    ) -> int:
+        """Append posts and return the number of appended posts
+
+        Args:
+            posts: A :class:`~matterapi.models.PostList`, the raw ``httpx.Response`` or decoded
+                json of an endpoint returning a post list, or an iterable of posts. Posts of a
+                post list are appended in the order given by its ``order`` field.
+        """
+        if isinstance(posts, httpx.Response):
+            posts = posts.json()
+        if isinstance(posts, PostList):
+            posts = posts.dict(exclude_unset=True)
+        if isinstance(posts, dict):
+            by_id = posts.get("posts") or {}
+            order = posts.get("order") or list(by_id)
+            posts = (by_id[post_id] for post_id in order if post_id in by_id)
+        count = 0
+        for post in posts:
+            self.append(post)
+            count += 1
+        return count
+
+    def column(self, name: str) -> Sequence:
+        """Return the values of the column ``name``
+
+        Timestamp columns are returned as the underlying ``array``, containing
+        :data:`MISSING` for posts without the field. All other columns are returned
+        as list of values.
+        """
+        if name in self._timestamps:
+            return self._timestamps[name]
+        if name in self._coded:
+            coded = self._coded[name]
+            return [coded.values[code] for code in coded.codes]
+        if name == "id":
+            return [self._ids[index] for index in range(len(self))]
+        if name == "message":
+            return [self._messages[index] for index in range(len(self))]
+        raise KeyError(f"Unknown column {name!r}")
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Return the post at ``index`` as decoded json"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PostColumns index out of range")
+        extra = self._extra[index]
+        post: Dict[str, Any] = json.loads(extra) if extra else {}
+        post["id"] = self._ids[index]
+        for name, column in self._timestamps.items():
+            if column[index] != MISSING:
+                post[name] = column[index]
+        for name, coded in self._coded.items():
+            post[name] = coded[index]
+        post["message"] = self._messages[index]
+        return post
+
+    def __getitem__(self, index: int) -> Post:
+        return Post.parse_obj(self.row(index))
+
+    def __iter__(self) -> Iterator[Post]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def indices(
+        self,
+        *,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        user_id: Optional[str] = None,
+        channel_id: Optional[str] = None,
+        root_id: Optional[str] = None,
+        include_deleted: bool = True,
+    ) -> List[int]:
+        """Return the row indices of all posts matching the given criteria
+
+        Every criterion is evaluated as one pass over its column. Ids are compared by
+        their dictionary code, so no strings are touched.
+
+        Args:
+            since: Only posts created at or after this time in milliseconds
+            until: Only posts created before this time in milliseconds
+            user_id: Only posts of this user
+            channel_id: Only posts in this channel
+            root_id: Only replies to this thread, pass ``""`` for root posts only
+            include_deleted: Include posts with ``delete_at`` set
+        """
+        selected: Iterable[int] = range(len(self))
+        for name, value in (
+            ("user_id", user_id),
+            ("channel_id", channel_id),
+            ("root_id", root_id),
+        ):
+            if value is None:
+                continue
+            code = self._coded[name].code(value)
+            if code is None:
+                return []
+            codes = self._coded[name].codes
+            selected = [index for index in selected if codes[index] == code]
+        create_at = self._timestamps["create_at"]
+        if since is not None:
+            selected = [index for index in selected if create_at[index] >= since]
+        if until is not None:
+            selected = [index for index in selected if create_at[index] < until]
+        if not include_deleted:
+            delete_at = self._timestamps["delete_at"]
+            selected = [index for index in selected if delete_at[index] <= 0]
+        return list(selected)
+
+    def select(self, **criteria) -> "PostColumns":
+        """Return a new container with all posts matching the criteria of :meth:`indices`"""
+        return self.take(self.indices(**criteria))
+
+    def take(self, indices: Sequence[int]) -> "PostColumns":
+        """Return a new container with the rows at ``indices``"""
+        columns = PostColumns.__new__(PostColumns)
+        # pylint: disable=protected-access
+        columns._ids = self._ids.take(indices)
+        columns._timestamps = {
+            name: array("q", [column[index] for index in indices])
+            for name, column in self._timestamps.items()
+        }
+        columns._coded = {
+            name: coded.take(indices) for name, coded in self._coded.items()
+        }
+        columns._messages = self._messages.take(indices)
+        columns._extra = self._extra.take(indices)
+        return columns
+
+    def nbytes(self) -> int:
+        """Approximate memory used by the column data in bytes, without the value tables"""
+        return (
+            self._ids.nbytes()
+            + sum(column.itemsize * len(column) for column in self._timestamps.values())
+            + sum(coded.nbytes() for coded in self._coded.values())
+            + self._messages.nbytes()
+            + self._extra.nbytes()
+        )
+
+
+__all__ = ["PostColumns", "COLUMN_FIELDS", "MISSING"]
@@ -3,8 +3,6 @@
 
 from typing import Dict, Union
 
-from pydantic import BaseModel
-
 from ...models import MigrateAuthToLdapJsonBody, MigrateAuthToSamlJsonBody
 from ..base import ApiBaseClass
 
@@ -32,27 +30,7 @@ class AuthenticationApi(ApiBaseClass):
             `MigrateAuthToLdap <https://api.mattermost.com/#operation/MigrateAuthToLdap>`_
         """
 
-        url = "/users/migrate_auth/ldap"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("migrate_auth_to_ldap", json_body=json_body)
 
     async def migrate_auth_to_saml(
         self,
@@ -74,24 +52,4 @@ class AuthenticationApi(ApiBaseClass):
             `MigrateAuthToSaml <https://api.mattermost.com/#operation/MigrateAuthToSaml>`_
         """
 
-        url = "/users/migrate_auth/saml"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("migrate_auth_to_saml", json_body=json_body)
@@ -27,22 +27,4 @@ class BleveApi(ApiBaseClass):
             `PurgeBleveIndexes <https://api.mattermost.com/#operation/PurgeBleveIndexes>`_
         """
 
-        url = "/bleve/purge_indexes"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("purge_bleve_indexes")
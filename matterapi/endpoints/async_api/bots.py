@@ -1,9 +1,7 @@
 """ Module to access the Bots endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import (
     Bot,
@@ -36,25 +34,7 @@ class BotsApi(ApiBaseClass):
             `ConvertUserToBot <https://api.mattermost.com/#operation/ConvertUserToBot>`_
         """
 
-        url = f"/users/{user_id}/convert_to_bot"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("convert_user_to_bot", user_id=user_id)
 
     async def get_bots(
         self,
@@ -79,38 +59,13 @@ class BotsApi(ApiBaseClass):
             `GetBots <https://api.mattermost.com/#operation/GetBots>`_
         """
 
-        url = "/bots"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "include_deleted": include_deleted,
-            "only_orphaned": only_orphaned,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Bot.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_bots",
+            page=page,
+            per_page=per_page,
+            include_deleted=include_deleted,
+            only_orphaned=only_orphaned,
+        )
 
     async def create_bot(
         self,
@@ -130,31 +85,7 @@ class BotsApi(ApiBaseClass):
             `CreateBot <https://api.mattermost.com/#operation/CreateBot>`_
         """
 
-        url = "/bots"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Bot.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call("create_bot", json_body=json_body)
 
     async def get_bot(
         self,
@@ -177,30 +108,11 @@ class BotsApi(ApiBaseClass):
             `GetBot <https://api.mattermost.com/#operation/GetBot>`_
         """
 
-        url = f"/bots/{bot_user_id}"
-        params: Dict[str, Any] = {
-            "include_deleted": include_deleted,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Bot.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "get_bot",
+            bot_user_id=bot_user_id,
+            include_deleted=include_deleted,
+        )
 
     async def patch_bot(
         self,
@@ -223,31 +135,11 @@ class BotsApi(ApiBaseClass):
             `PatchBot <https://api.mattermost.com/#operation/PatchBot>`_
         """
 
-        url = f"/bots/{bot_user_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Bot.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "patch_bot",
+            bot_user_id=bot_user_id,
+            json_body=json_body,
+        )
 
     async def disable_bot(
         self,
@@ -266,25 +158,7 @@ class BotsApi(ApiBaseClass):
             `DisableBot <https://api.mattermost.com/#operation/DisableBot>`_
         """
 
-        url = f"/bots/{bot_user_id}/disable"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Bot.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("disable_bot", bot_user_id=bot_user_id)
 
     async def enable_bot(
         self,
@@ -303,25 +177,7 @@ class BotsApi(ApiBaseClass):
             `EnableBot <https://api.mattermost.com/#operation/EnableBot>`_
         """
 
-        url = f"/bots/{bot_user_id}/enable"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Bot.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("enable_bot", bot_user_id=bot_user_id)
 
     async def assign_bot(
         self,
@@ -341,25 +197,7 @@ class BotsApi(ApiBaseClass):
             `AssignBot <https://api.mattermost.com/#operation/AssignBot>`_
         """
 
-        url = f"/bots/{bot_user_id}/assign/{user_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Bot.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("assign_bot", bot_user_id=bot_user_id, user_id=user_id)
 
     async def get_bot_icon_image(
         self,
@@ -378,21 +216,7 @@ class BotsApi(ApiBaseClass):
             `GetBotIconImage <https://api.mattermost.com/#operation/GetBotIconImage>`_
         """
 
-        url = f"/bots/{bot_user_id}/icon"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("get_bot_icon_image", bot_user_id=bot_user_id)
 
     async def set_bot_icon_image(
         self,
@@ -414,29 +238,11 @@ class BotsApi(ApiBaseClass):
             `SetBotIconImage <https://api.mattermost.com/#operation/SetBotIconImage>`_
         """
 
-        url = f"/bots/{bot_user_id}/icon"
-
-        multipart_body_data = SetBotIconImageMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "set_bot_icon_image",
+            bot_user_id=bot_user_id,
+            multipart_data=multipart_data,
+        )
 
     async def delete_bot_icon_image(
         self,
@@ -455,25 +261,7 @@ class BotsApi(ApiBaseClass):
             `DeleteBotIconImage <https://api.mattermost.com/#operation/DeleteBotIconImage>`_
         """
 
-        url = f"/bots/{bot_user_id}/icon"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("delete_bot_icon_image", bot_user_id=bot_user_id)
 
     async def convert_bot_to_user(
         self,
@@ -495,33 +283,9 @@ class BotsApi(ApiBaseClass):
             `ConvertBotToUser <https://api.mattermost.com/#operation/ConvertBotToUser>`_
         """
 
-        url = f"/bots/{bot_user_id}/convert_to_user"
-        params: Dict[str, Any] = {
-            "set_system_admin": set_system_admin,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "convert_bot_to_user",
+            bot_user_id=bot_user_id,
+            json_body=json_body,
+            set_system_admin=set_system_admin,
+        )
@@ -28,24 +28,7 @@ class BrandApi(ApiBaseClass):
             `GetBrandImage <https://api.mattermost.com/#operation/GetBrandImage>`_
         """
 
-        url = "/brand/image"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = response.json()
-            return response200
-        return response
+        return await self._call("get_brand_image")
 
     async def upload_brand_image(
         self,
@@ -63,29 +46,7 @@ class BrandApi(ApiBaseClass):
             `UploadBrandImage <https://api.mattermost.com/#operation/UploadBrandImage>`_
         """
 
-        url = "/brand/image"
-
-        multipart_body_data = UploadBrandImageMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = StatusOK.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call("upload_brand_image", multipart_data=multipart_data)
 
     async def delete_brand_image(
         self,
@@ -104,22 +65,4 @@ class BrandApi(ApiBaseClass):
             `DeleteBrandImage <https://api.mattermost.com/#operation/DeleteBrandImage>`_
         """
 
-        url = "/brand/image"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("delete_brand_image")
@@ -3,8 +3,6 @@
 
 from typing import Dict, List, Union
 
-from pydantic import BaseModel
-
 from ...models import (
     Address,
     CloudCustomer,
@@ -41,30 +39,7 @@ class CloudApi(ApiBaseClass):
             `GetCloudProducts <https://api.mattermost.com/#operation/GetCloudProducts>`_
         """
 
-        url = "/cloud/products"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Product.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_cloud_products")
 
     async def create_customer_payment(
         self,
@@ -86,25 +61,7 @@ class CloudApi(ApiBaseClass):
             `CreateCustomerPayment <https://api.mattermost.com/#operation/CreateCustomerPayment>`_
         """
 
-        url = "/cloud/payment"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = PaymentSetupIntent.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call("create_customer_payment")
 
     async def confirm_customer_payment(
         self,
@@ -128,27 +85,11 @@ class CloudApi(ApiBaseClass):
             `ConfirmCustomerPayment <https://api.mattermost.com/#operation/ConfirmCustomerPayment>`_
         """
 
-        url = "/cloud/payment/confirm"
-
-        multipart_body_data = ConfirmCustomerPaymentMultipartData.parse_obj(
-            multipart_data
+        return await self._call(
+            "confirm_customer_payment",
+            multipart_data=multipart_data,
         )
 
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
-
     async def get_cloud_customer(
         self,
     ) -> CloudCustomer:
@@ -169,25 +110,7 @@ class CloudApi(ApiBaseClass):
             `GetCloudCustomer <https://api.mattermost.com/#operation/GetCloudCustomer>`_
         """
 
-        url = "/cloud/customer"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = CloudCustomer.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_cloud_customer")
 
     async def update_cloud_customer(
         self,
@@ -211,31 +134,7 @@ class CloudApi(ApiBaseClass):
             `UpdateCloudCustomer <https://api.mattermost.com/#operation/UpdateCloudCustomer>`_
         """
 
-        url = "/cloud/customer"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = CloudCustomer.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("update_cloud_customer", json_body=json_body)
 
     async def update_cloud_customer_address(
         self,
@@ -259,31 +158,7 @@ class CloudApi(ApiBaseClass):
             `UpdateCloudCustomerAddress <https://api.mattermost.com/#operation/UpdateCloudCustomerAddress>`_
         """
 
-        url = "/cloud/customer/address"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = CloudCustomer.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("update_cloud_customer_address", json_body=json_body)
 
     async def get_subscription(
         self,
@@ -305,25 +180,7 @@ class CloudApi(ApiBaseClass):
             `GetSubscription <https://api.mattermost.com/#operation/GetSubscription>`_
         """
 
-        url = "/cloud/subscription"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Subscription.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_subscription")
 
     async def get_invoices_for_subscription(
         self,
@@ -344,30 +201,7 @@ class CloudApi(ApiBaseClass):
             `GetInvoicesForSubscription <https://api.mattermost.com/#operation/GetInvoicesForSubscription>`_
         """
 
-        url = "/cloud/subscription/invoices"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Invoice.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_invoices_for_subscription")
 
     async def get_invoice_for_subscription_as_pdf(
         self,
@@ -389,21 +223,10 @@ class CloudApi(ApiBaseClass):
             `GetInvoiceForSubscriptionAsPdf <https://api.mattermost.com/#operation/GetInvoiceForSubscriptionAsPdf>`_
         """
 
-        url = f"/cloud/subscription/invoices/{invoice_id}/pdf"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call(
+            "get_invoice_for_subscription_as_pdf",
+            invoice_id=invoice_id,
+        )
 
     async def post_endpoint_for_cws_webhooks(
         self,
@@ -424,21 +247,7 @@ class CloudApi(ApiBaseClass):
             `PostEndpointForCwsWebhooks <https://api.mattermost.com/#operation/PostEndpointForCwsWebhooks>`_
         """
 
-        url = "/cloud/webhook"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("post_endpoint_for_cws_webhooks")
 
     async def get_subscription_stats(
         self,
@@ -460,25 +269,7 @@ class CloudApi(ApiBaseClass):
             `GetSubscriptionStats <https://api.mattermost.com/#operation/GetSubscriptionStats>`_
         """
 
-        url = "/cloud/subscription/stats"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = SubscriptionStats.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_subscription_stats")
 
     async def send_admin_upgrade_request_email(
         self,
@@ -501,21 +292,7 @@ class CloudApi(ApiBaseClass):
             `SendAdminUpgradeRequestEmail <https://api.mattermost.com/#operation/SendAdminUpgradeRequestEmail>`_
         """
 
-        url = "/cloud/subscription/limitreached/invite"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("send_admin_upgrade_request_email")
 
     async def send_admin_upgrade_request_email_on_join(
         self,
@@ -538,18 +315,4 @@ class CloudApi(ApiBaseClass):
             `SendAdminUpgradeRequestEmailOnJoin <https://api.mattermost.com/#operation/SendAdminUpgradeRequestEmailOnJoin>`_
         """
 
-        url = "/cloud/subscription/limitreached/join"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("send_admin_upgrade_request_email_on_join")
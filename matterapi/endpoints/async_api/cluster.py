@@ -26,27 +26,4 @@ class ClusterApi(ApiBaseClass):
             `GetClusterStatus <https://api.mattermost.com/#operation/GetClusterStatus>`_
         """
 
-        url = "/cluster/status"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = ClusterInfo.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_cluster_status")
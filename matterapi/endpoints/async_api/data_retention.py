@@ -1,9 +1,7 @@
 """ Module to access the DataRetention endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import (
     ChannelListWithTeamData,
@@ -50,31 +48,12 @@ class DataRetentionApi(ApiBaseClass):
             `GetTeamPoliciesForUser <https://api.mattermost.com/#operation/GetTeamPoliciesForUser>`_
         """
 
-        url = f"/users/{user_id}/data_retention/team_policies"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = RetentionPolicyForTeamList.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "get_team_policies_for_user",
+            user_id=user_id,
+            page=page,
+            per_page=per_page,
+        )
 
     async def get_channel_policies_for_user(
         self,
@@ -101,31 +80,12 @@ class DataRetentionApi(ApiBaseClass):
             `GetChannelPoliciesForUser <https://api.mattermost.com/#operation/GetChannelPoliciesForUser>`_
         """
 
-        url = f"/users/{user_id}/data_retention/channel_policies"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = RetentionPolicyForChannelList.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "get_channel_policies_for_user",
+            user_id=user_id,
+            page=page,
+            per_page=per_page,
+        )
 
     async def get_data_retention_policy(
         self,
@@ -148,25 +108,7 @@ class DataRetentionApi(ApiBaseClass):
             `GetDataRetentionPolicy <https://api.mattermost.com/#operation/GetDataRetentionPolicy>`_
         """
 
-        url = "/data_retention/policy"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GlobalDataRetentionPolicy.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_data_retention_policy")
 
     async def get_data_retention_policies_count(
         self,
@@ -190,27 +132,7 @@ class DataRetentionApi(ApiBaseClass):
             `GetDataRetentionPoliciesCount <https://api.mattermost.com/#operation/GetDataRetentionPoliciesCount>`_
         """
 
-        url = "/data_retention/policies_count"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GetDataRetentionPoliciesCountResponse200.parse_obj(
-                response.json()
-            )
-
-            return response200
-        return response
+        return await self._call("get_data_retention_policies_count")
 
     async def get_data_retention_policies(
         self,
@@ -237,40 +159,11 @@ class DataRetentionApi(ApiBaseClass):
             `GetDataRetentionPolicies <https://api.mattermost.com/#operation/GetDataRetentionPolicies>`_
         """
 
-        url = "/data_retention/policies"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = (
-                    DataRetentionPolicyWithTeamAndChannelCounts.parse_obj(
-                        response200_item_data
-                    )
-                )
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_data_retention_policies",
+            page=page,
+            per_page=per_page,
+        )
 
     async def create_data_retention_policy(
         self,
@@ -295,33 +188,7 @@ class DataRetentionApi(ApiBaseClass):
             `CreateDataRetentionPolicy <https://api.mattermost.com/#operation/CreateDataRetentionPolicy>`_
         """
 
-        url = "/data_retention/policies"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = DataRetentionPolicyWithTeamAndChannelCounts.parse_obj(
-                response.json()
-            )
-
-            return response201
-        return response
+        return await self._call("create_data_retention_policy", json_body=json_body)
 
     async def get_data_retention_policy_by_id(
         self,
@@ -344,27 +211,7 @@ class DataRetentionApi(ApiBaseClass):
             `GetDataRetentionPolicyByID <https://api.mattermost.com/#operation/GetDataRetentionPolicyByID>`_
         """
 
-        url = f"/data_retention/policies/{policy_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = DataRetentionPolicyWithTeamAndChannelCounts.parse_obj(
-                response.json()
-            )
-
-            return response200
-        return response
+        return await self._call("get_data_retention_policy_by_id", policy_id=policy_id)
 
     async def delete_data_retention_policy(
         self,
@@ -387,25 +234,7 @@ class DataRetentionApi(ApiBaseClass):
             `DeleteDataRetentionPolicy <https://api.mattermost.com/#operation/DeleteDataRetentionPolicy>`_
         """
 
-        url = f"/data_retention/policies/{policy_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("delete_data_retention_policy", policy_id=policy_id)
 
     async def patch_data_retention_policy(
         self,
@@ -431,33 +260,11 @@ class DataRetentionApi(ApiBaseClass):
             `PatchDataRetentionPolicy <https://api.mattermost.com/#operation/PatchDataRetentionPolicy>`_
         """
 
-        url = f"/data_retention/policies/{policy_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.patch(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = DataRetentionPolicyWithTeamAndChannelCounts.parse_obj(
-                response.json()
-            )
-
-            return response200
-        return response
+        return await self._call(
+            "patch_data_retention_policy",
+            policy_id=policy_id,
+            json_body=json_body,
+        )
 
     async def get_teams_for_retention_policy(
         self,
@@ -483,36 +290,12 @@ class DataRetentionApi(ApiBaseClass):
             `GetTeamsForRetentionPolicy <https://api.mattermost.com/#operation/GetTeamsForRetentionPolicy>`_
         """
 
-        url = f"/data_retention/policies/{policy_id}/teams"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Team.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_teams_for_retention_policy",
+            policy_id=policy_id,
+            page=page,
+            per_page=per_page,
+        )
 
     async def add_teams_to_retention_policy(
         self,
@@ -539,27 +322,11 @@ class DataRetentionApi(ApiBaseClass):
             `AddTeamsToRetentionPolicy <https://api.mattermost.com/#operation/AddTeamsToRetentionPolicy>`_
         """
 
-        url = f"/data_retention/policies/{policy_id}/teams"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "add_teams_to_retention_policy",
+            policy_id=policy_id,
+            json_body=json_body,
+        )
 
     async def remove_teams_from_retention_policy(
         self,
@@ -586,27 +353,11 @@ class DataRetentionApi(ApiBaseClass):
             `RemoveTeamsFromRetentionPolicy <https://api.mattermost.com/#operation/RemoveTeamsFromRetentionPolicy>`_
         """
 
-        url = f"/data_retention/policies/{policy_id}/teams"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "remove_teams_from_retention_policy",
+            policy_id=policy_id,
+            json_body=json_body,
+        )
 
     async def search_teams_for_retention_policy(
         self,
@@ -632,36 +383,11 @@ class DataRetentionApi(ApiBaseClass):
             `SearchTeamsForRetentionPolicy <https://api.mattermost.com/#operation/SearchTeamsForRetentionPolicy>`_
         """
 
-        url = f"/data_retention/policies/{policy_id}/teams/search"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Team.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "search_teams_for_retention_policy",
+            policy_id=policy_id,
+            json_body=json_body,
+        )
 
     async def get_channels_for_retention_policy(
         self,
@@ -687,31 +413,12 @@ class DataRetentionApi(ApiBaseClass):
             `GetChannelsForRetentionPolicy <https://api.mattermost.com/#operation/GetChannelsForRetentionPolicy>`_
         """
 
-        url = f"/data_retention/policies/{policy_id}/channels"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = ChannelListWithTeamData.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "get_channels_for_retention_policy",
+            policy_id=policy_id,
+            page=page,
+            per_page=per_page,
+        )
 
     async def add_channels_to_retention_policy(
         self,
@@ -738,27 +445,11 @@ class DataRetentionApi(ApiBaseClass):
             `AddChannelsToRetentionPolicy <https://api.mattermost.com/#operation/AddChannelsToRetentionPolicy>`_
         """
 
-        url = f"/data_retention/policies/{policy_id}/channels"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "add_channels_to_retention_policy",
+            policy_id=policy_id,
+            json_body=json_body,
+        )
 
     async def remove_channels_from_retention_policy(
         self,
@@ -785,27 +476,11 @@ class DataRetentionApi(ApiBaseClass):
             `RemoveChannelsFromRetentionPolicy <https://api.mattermost.com/#operation/RemoveChannelsFromRetentionPolicy>`_
         """
 
-        url = f"/data_retention/policies/{policy_id}/channels"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "remove_channels_from_retention_policy",
+            policy_id=policy_id,
+            json_body=json_body,
+        )
 
     async def search_channels_for_retention_policy(
         self,
@@ -831,28 +506,8 @@ class DataRetentionApi(ApiBaseClass):
             `SearchChannelsForRetentionPolicy <https://api.mattermost.com/#operation/SearchChannelsForRetentionPolicy>`_
         """
 
-        url = f"/data_retention/policies/{policy_id}/channels/search"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = ChannelListWithTeamData.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "search_channels_for_retention_policy",
+            policy_id=policy_id,
+            json_body=json_body,
+        )
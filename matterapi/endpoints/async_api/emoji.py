@@ -1,9 +1,7 @@
 """ Module to access the Emoji endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import CreateEmojiMultipartData, Emoji, SearchEmojiJsonBody
 from ..base import ApiBaseClass
@@ -31,32 +29,12 @@ class EmojiApi(ApiBaseClass):
             `GetEmojiList <https://api.mattermost.com/#operation/GetEmojiList>`_
         """
 
-        url = "/emoji"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "sort": sort,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Emoji.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "get_emoji_list",
+            page=page,
+            per_page=per_page,
+            sort=sort,
+        )
 
     async def create_emoji(
         self,
@@ -74,29 +52,7 @@ class EmojiApi(ApiBaseClass):
             `CreateEmoji <https://api.mattermost.com/#operation/CreateEmoji>`_
         """
 
-        url = "/emoji"
-
-        multipart_body_data = CreateEmojiMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Emoji.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call("create_emoji", multipart_data=multipart_data)
 
     async def get_emoji(
         self,
@@ -113,25 +69,7 @@ class EmojiApi(ApiBaseClass):
             `GetEmoji <https://api.mattermost.com/#operation/GetEmoji>`_
         """
 
-        url = f"/emoji/{emoji_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Emoji.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_emoji", emoji_id=emoji_id)
 
     async def delete_emoji(
         self,
@@ -149,25 +87,7 @@ class EmojiApi(ApiBaseClass):
             `DeleteEmoji <https://api.mattermost.com/#operation/DeleteEmoji>`_
         """
 
-        url = f"/emoji/{emoji_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Emoji.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("delete_emoji", emoji_id=emoji_id)
 
     async def get_emoji_by_name(
         self,
@@ -186,25 +106,7 @@ class EmojiApi(ApiBaseClass):
             `GetEmojiByName <https://api.mattermost.com/#operation/GetEmojiByName>`_
         """
 
-        url = f"/emoji/name/{emoji_name}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Emoji.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_emoji_by_name", emoji_name=emoji_name)
 
     async def get_emoji_image(
         self,
@@ -221,21 +123,7 @@ class EmojiApi(ApiBaseClass):
             `GetEmojiImage <https://api.mattermost.com/#operation/GetEmojiImage>`_
         """
 
-        url = f"/emoji/{emoji_id}/image"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("get_emoji_image", emoji_id=emoji_id)
 
     async def search_emoji(
         self,
@@ -256,36 +144,7 @@ class EmojiApi(ApiBaseClass):
             `SearchEmoji <https://api.mattermost.com/#operation/SearchEmoji>`_
         """
 
-        url = "/emoji/search"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Emoji.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("search_emoji", json_body=json_body)
 
     async def autocomplete_emoji(
         self,
@@ -306,27 +165,4 @@ class EmojiApi(ApiBaseClass):
             `AutocompleteEmoji <https://api.mattermost.com/#operation/AutocompleteEmoji>`_
         """
 
-        url = "/emoji/autocomplete"
-        params: Dict[str, Any] = {
-            "name": name,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Emoji.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("autocomplete_emoji", name=name)
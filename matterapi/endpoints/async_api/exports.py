@@ -23,21 +23,7 @@ class ExportsApi(ApiBaseClass):
             `ListExports <https://api.mattermost.com/#operation/ListExports>`_
         """
 
-        url = "/exports"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("list_exports")
 
     async def download_export(
         self,
@@ -56,21 +42,7 @@ class ExportsApi(ApiBaseClass):
             `DownloadExport <https://api.mattermost.com/#operation/DownloadExport>`_
         """
 
-        url = f"/exports/{export_name}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("download_export", export_name=export_name)
 
     async def delete_export(
         self,
@@ -89,18 +61,4 @@ class ExportsApi(ApiBaseClass):
             `DeleteExport <https://api.mattermost.com/#operation/DeleteExport>`_
         """
 
-        url = f"/exports/{export_name}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("delete_export", export_name=export_name)
@@ -1,9 +1,7 @@
 """ Module to access the Groups endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import (
     AddGroupMembersJsonBody,
@@ -45,25 +43,7 @@ class GroupsApi(ApiBaseClass):
             `UnlinkLdapGroup <https://api.mattermost.com/#operation/UnlinkLdapGroup>`_
         """
 
-        url = f"/ldap/groups/{remote_id}/link"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("unlink_ldap_group", remote_id=remote_id)
 
     async def get_groups(
         self,
@@ -97,42 +77,17 @@ class GroupsApi(ApiBaseClass):
             `GetGroups <https://api.mattermost.com/#operation/GetGroups>`_
         """
 
-        url = "/groups"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "q": q,
-            "include_member_count": include_member_count,
-            "not_associated_to_team": not_associated_to_team,
-            "not_associated_to_channel": not_associated_to_channel,
-            "since": since,
-            "filter_allow_reference": filter_allow_reference,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Group.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_groups",
+            page=page,
+            per_page=per_page,
+            q=q,
+            include_member_count=include_member_count,
+            not_associated_to_team=not_associated_to_team,
+            not_associated_to_channel=not_associated_to_channel,
+            since=since,
+            filter_allow_reference=filter_allow_reference,
+        )
 
     async def create_group(
         self,
@@ -153,27 +108,7 @@ class GroupsApi(ApiBaseClass):
             `CreateGroup <https://api.mattermost.com/#operation/CreateGroup>`_
         """
 
-        url = "/groups"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("create_group", json_body=json_body)
 
     async def get_group(
         self,
@@ -192,25 +127,7 @@ class GroupsApi(ApiBaseClass):
             `GetGroup <https://api.mattermost.com/#operation/GetGroup>`_
         """
 
-        url = f"/groups/{group_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Group.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_group", group_id=group_id)
 
     async def delete_group(
         self,
@@ -230,25 +147,7 @@ class GroupsApi(ApiBaseClass):
             `DeleteGroup <https://api.mattermost.com/#operation/DeleteGroup>`_
         """
 
-        url = f"/groups/{group_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("delete_group", group_id=group_id)
 
     async def patch_group(
         self,
@@ -272,31 +171,7 @@ class GroupsApi(ApiBaseClass):
             `PatchGroup <https://api.mattermost.com/#operation/PatchGroup>`_
         """
 
-        url = f"/groups/{group_id}/patch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Group.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("patch_group", group_id=group_id, json_body=json_body)
 
     async def link_group_syncable_for_team(
         self,
@@ -316,25 +191,11 @@ class GroupsApi(ApiBaseClass):
             `LinkGroupSyncableForTeam <https://api.mattermost.com/#operation/LinkGroupSyncableForTeam>`_
         """
 
-        url = f"/groups/{group_id}/teams/{team_id}/link"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = GroupSyncableTeam.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call(
+            "link_group_syncable_for_team",
+            group_id=group_id,
+            team_id=team_id,
+        )
 
     async def unlink_group_syncable_for_team(
         self,
@@ -354,25 +215,11 @@ class GroupsApi(ApiBaseClass):
             `UnlinkGroupSyncableForTeam <https://api.mattermost.com/#operation/UnlinkGroupSyncableForTeam>`_
         """
 
-        url = f"/groups/{group_id}/teams/{team_id}/link"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "unlink_group_syncable_for_team",
+            group_id=group_id,
+            team_id=team_id,
+        )
 
     async def link_group_syncable_for_channel(
         self,
@@ -394,25 +241,11 @@ class GroupsApi(ApiBaseClass):
             `LinkGroupSyncableForChannel <https://api.mattermost.com/#operation/LinkGroupSyncableForChannel>`_
         """
 
-        url = f"/groups/{group_id}/channels/{channel_id}/link"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = GroupSyncableChannel.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call(
+            "link_group_syncable_for_channel",
+            group_id=group_id,
+            channel_id=channel_id,
+        )
 
     async def unlink_group_syncable_for_channel(
         self,
@@ -434,25 +267,11 @@ class GroupsApi(ApiBaseClass):
             `UnlinkGroupSyncableForChannel <https://api.mattermost.com/#operation/UnlinkGroupSyncableForChannel>`_
         """
 
-        url = f"/groups/{group_id}/channels/{channel_id}/link"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "unlink_group_syncable_for_channel",
+            group_id=group_id,
+            channel_id=channel_id,
+        )
 
     async def get_group_syncable_for_team_id(
         self,
@@ -472,25 +291,11 @@ class GroupsApi(ApiBaseClass):
             `GetGroupSyncableForTeamId <https://api.mattermost.com/#operation/GetGroupSyncableForTeamId>`_
         """
 
-        url = f"/groups/{group_id}/teams/{team_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GroupSyncableTeam.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "get_group_syncable_for_team_id",
+            group_id=group_id,
+            team_id=team_id,
+        )
 
     async def get_group_syncable_for_channel_id(
         self,
@@ -510,25 +315,11 @@ class GroupsApi(ApiBaseClass):
             `GetGroupSyncableForChannelId <https://api.mattermost.com/#operation/GetGroupSyncableForChannelId>`_
         """
 
-        url = f"/groups/{group_id}/channels/{channel_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GroupSyncableChannel.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "get_group_syncable_for_channel_id",
+            group_id=group_id,
+            channel_id=channel_id,
+        )
 
     async def get_group_syncables_teams(
         self,
@@ -547,30 +338,7 @@ class GroupsApi(ApiBaseClass):
             `GetGroupSyncablesTeams <https://api.mattermost.com/#operation/GetGroupSyncablesTeams>`_
         """
 
-        url = f"/groups/{group_id}/teams"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = GroupSyncableTeams.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_group_syncables_teams", group_id=group_id)
 
     async def get_group_syncables_channels(
         self,
@@ -589,32 +357,7 @@ class GroupsApi(ApiBaseClass):
             `GetGroupSyncablesChannels <https://api.mattermost.com/#operation/GetGroupSyncablesChannels>`_
         """
 
-        url = f"/groups/{group_id}/channels"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = GroupSyncableChannels.parse_obj(
-                    response200_item_data
-                )
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_group_syncables_channels", group_id=group_id)
 
     async def patch_group_syncable_for_team(
         self,
@@ -639,31 +382,12 @@ class GroupsApi(ApiBaseClass):
             `PatchGroupSyncableForTeam <https://api.mattermost.com/#operation/PatchGroupSyncableForTeam>`_
         """
 
-        url = f"/groups/{group_id}/teams/{team_id}/patch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GroupSyncableTeam.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "patch_group_syncable_for_team",
+            group_id=group_id,
+            team_id=team_id,
+            json_body=json_body,
+        )
 
     async def patch_group_syncable_for_channel(
         self,
@@ -688,31 +412,12 @@ class GroupsApi(ApiBaseClass):
             `PatchGroupSyncableForChannel <https://api.mattermost.com/#operation/PatchGroupSyncableForChannel>`_
         """
 
-        url = f"/groups/{group_id}/channels/{channel_id}/patch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GroupSyncableChannel.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "patch_group_syncable_for_channel",
+            group_id=group_id,
+            channel_id=channel_id,
+            json_body=json_body,
+        )
 
     async def get_group_users(
         self,
@@ -734,31 +439,12 @@ class GroupsApi(ApiBaseClass):
             `GetGroupUsers <https://api.mattermost.com/#operation/GetGroupUsers>`_
         """
 
-        url = f"/groups/{group_id}/members"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GetGroupUsersResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "get_group_users",
+            group_id=group_id,
+            page=page,
+            per_page=per_page,
+        )
 
     async def add_group_members(
         self,
@@ -780,31 +466,11 @@ class GroupsApi(ApiBaseClass):
             `AddGroupMembers <https://api.mattermost.com/#operation/AddGroupMembers>`_
         """
 
-        url = f"/groups/{group_id}/members"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "add_group_members",
+            group_id=group_id,
+            json_body=json_body,
+        )
 
     async def delete_group_members(
         self,
@@ -826,31 +492,11 @@ class GroupsApi(ApiBaseClass):
             `DeleteGroupMembers <https://api.mattermost.com/#operation/DeleteGroupMembers>`_
         """
 
-        url = f"/groups/{group_id}/members"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "delete_group_members",
+            group_id=group_id,
+            json_body=json_body,
+        )
 
     async def get_group_stats(
         self,
@@ -869,25 +515,7 @@ class GroupsApi(ApiBaseClass):
             `GetGroupStats <https://api.mattermost.com/#operation/GetGroupStats>`_
         """
 
-        url = f"/groups/{group_id}/stats"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GetGroupStatsResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_group_stats", group_id=group_id)
 
     async def get_groups_by_channel(
         self,
@@ -910,37 +538,13 @@ class GroupsApi(ApiBaseClass):
             `GetGroupsByChannel <https://api.mattermost.com/#operation/GetGroupsByChannel>`_
         """
 
-        url = f"/channels/{channel_id}/groups"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "filter_allow_reference": filter_allow_reference,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Group.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_groups_by_channel",
+            channel_id=channel_id,
+            page=page,
+            per_page=per_page,
+            filter_allow_reference=filter_allow_reference,
+        )
 
     async def get_groups_by_team(
         self,
@@ -961,37 +565,13 @@ class GroupsApi(ApiBaseClass):
             `GetGroupsByTeam <https://api.mattermost.com/#operation/GetGroupsByTeam>`_
         """
 
-        url = f"/teams/{team_id}/groups"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "filter_allow_reference": filter_allow_reference,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Group.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_groups_by_team",
+            team_id=team_id,
+            page=page,
+            per_page=per_page,
+            filter_allow_reference=filter_allow_reference,
+        )
 
     async def get_groups_associated_to_channels_by_team(
         self,
@@ -1017,35 +597,14 @@ class GroupsApi(ApiBaseClass):
             `GetGroupsAssociatedToChannelsByTeam <https://api.mattermost.com/#operation/GetGroupsAssociatedToChannelsByTeam>`_
         """
 
-        url = f"/teams/{team_id}/groups_by_channels"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "filter_allow_reference": filter_allow_reference,
-            "paginate": paginate,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GetGroupsAssociatedToChannelsByTeamResponse200.parse_obj(
-                response.json()
-            )
-
-            return response200
-        return response
+        return await self._call(
+            "get_groups_associated_to_channels_by_team",
+            team_id=team_id,
+            page=page,
+            per_page=per_page,
+            filter_allow_reference=filter_allow_reference,
+            paginate=paginate,
+        )
 
     async def get_groups_by_user_id(
         self,
@@ -1062,27 +621,4 @@ class GroupsApi(ApiBaseClass):
             `GetGroupsByUserId <https://api.mattermost.com/#operation/GetGroupsByUserId>`_
         """
 
-        url = f"/users/{user_id}/groups"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Group.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_groups_by_user_id", user_id=user_id)
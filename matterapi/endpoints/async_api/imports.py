@@ -23,18 +23,4 @@ class ImportsApi(ApiBaseClass):
             `ListImports <https://api.mattermost.com/#operation/ListImports>`_
         """
 
-        url = "/imports"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("list_imports")
@@ -3,8 +3,6 @@
 
 from typing import Dict, Union
 
-from pydantic import BaseModel
-
 from ...models import (
     OpenInteractiveDialogJsonBody,
     StatusOK,
@@ -35,31 +33,7 @@ class IntegrationActionsApi(ApiBaseClass):
             `OpenInteractiveDialog <https://api.mattermost.com/#operation/OpenInteractiveDialog>`_
         """
 
-        url = "/actions/dialogs/open"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("open_interactive_dialog", json_body=json_body)
 
     async def submit_interactive_dialog(
         self,
@@ -79,28 +53,4 @@ class IntegrationActionsApi(ApiBaseClass):
             `SubmitInteractiveDialog <https://api.mattermost.com/#operation/SubmitInteractiveDialog>`_
         """
 
-        url = "/actions/dialogs/submit"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("submit_interactive_dialog", json_body=json_body)
@@ -1,9 +1,7 @@
 """ Module to access the Ldap endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import (
     LDAPGroupsPaged,
@@ -39,27 +37,7 @@ class LdapApi(ApiBaseClass):
             `MigrateAuthToLdap <https://api.mattermost.com/#operation/MigrateAuthToLdap>`_
         """
 
-        url = "/users/migrate_auth/ldap"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("migrate_auth_to_ldap", json_body=json_body)
 
     async def sync_ldap(
         self,
@@ -76,25 +54,7 @@ class LdapApi(ApiBaseClass):
             `SyncLdap <https://api.mattermost.com/#operation/SyncLdap>`_
         """
 
-        url = "/ldap/sync"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("sync_ldap")
 
     async def test_ldap(
         self,
@@ -111,25 +71,7 @@ class LdapApi(ApiBaseClass):
             `TestLdap <https://api.mattermost.com/#operation/TestLdap>`_
         """
 
-        url = "/ldap/test"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("test_ldap")
 
     async def get_ldap_groups(
         self,
@@ -151,37 +93,7 @@ class LdapApi(ApiBaseClass):
             `GetLdapGroups <https://api.mattermost.com/#operation/GetLdapGroups>`_
         """
 
-        url = "/ldap/groups"
-        params: Dict[str, Any] = {
-            "q": q,
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = LDAPGroupsPaged.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_ldap_groups", q=q, page=page, per_page=per_page)
 
     async def link_ldap_group(
         self,
@@ -200,25 +112,7 @@ class LdapApi(ApiBaseClass):
             `LinkLdapGroup <https://api.mattermost.com/#operation/LinkLdapGroup>`_
         """
 
-        url = f"/ldap/groups/{remote_id}/link"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = StatusOK.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call("link_ldap_group", remote_id=remote_id)
 
     async def migrate_id_ldap(
         self,
@@ -238,31 +132,7 @@ class LdapApi(ApiBaseClass):
             `MigrateIdLdap <https://api.mattermost.com/#operation/MigrateIdLdap>`_
         """
 
-        url = "/ldap/migrateid"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("migrate_id_ldap", json_body=json_body)
 
     async def upload_ldap_public_certificate(
         self,
@@ -282,32 +152,11 @@ class LdapApi(ApiBaseClass):
             `UploadLdapPublicCertificate <https://api.mattermost.com/#operation/UploadLdapPublicCertificate>`_
         """
 
-        url = "/ldap/certificate/public"
-
-        multipart_body_data = UploadLdapPublicCertificateMultipartData.parse_obj(
-            multipart_data
+        return await self._call(
+            "upload_ldap_public_certificate",
+            multipart_data=multipart_data,
         )
 
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
-
     async def delete_ldap_public_certificate(
         self,
     ) -> StatusOK:
@@ -322,25 +171,7 @@ class LdapApi(ApiBaseClass):
             `DeleteLdapPublicCertificate <https://api.mattermost.com/#operation/DeleteLdapPublicCertificate>`_
         """
 
-        url = "/ldap/certificate/public"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("delete_ldap_public_certificate")
 
     async def upload_ldap_private_certificate(
         self,
@@ -360,32 +191,11 @@ class LdapApi(ApiBaseClass):
             `UploadLdapPrivateCertificate <https://api.mattermost.com/#operation/UploadLdapPrivateCertificate>`_
         """
 
-        url = "/ldap/certificate/private"
-
-        multipart_body_data = UploadLdapPrivateCertificateMultipartData.parse_obj(
-            multipart_data
+        return await self._call(
+            "upload_ldap_private_certificate",
+            multipart_data=multipart_data,
         )
 
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
-
     async def delete_ldap_private_certificate(
         self,
     ) -> StatusOK:
@@ -400,22 +210,4 @@ class LdapApi(ApiBaseClass):
             `DeleteLdapPrivateCertificate <https://api.mattermost.com/#operation/DeleteLdapPrivateCertificate>`_
         """
 
-        url = "/ldap/certificate/private"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("delete_ldap_private_certificate")
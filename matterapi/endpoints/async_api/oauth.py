@@ -1,9 +1,7 @@
 """ Module to access the Oauth endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import CreateOAuthAppJsonBody, OAuthApp, StatusOK, UpdateOAuthAppJsonBody
 from ..base import ApiBaseClass
@@ -32,36 +30,7 @@ class OauthApi(ApiBaseClass):
             `GetOAuthApps <https://api.mattermost.com/#operation/GetOAuthApps>`_
         """
 
-        url = "/oauth/apps"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = OAuthApp.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_oauth_apps", page=page, per_page=per_page)
 
     async def create_oauth_app(
         self,
@@ -80,31 +49,7 @@ class OauthApi(ApiBaseClass):
             `CreateOAuthApp <https://api.mattermost.com/#operation/CreateOAuthApp>`_
         """
 
-        url = "/oauth/apps"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = OAuthApp.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call("create_oauth_app", json_body=json_body)
 
     async def get_oauth_app(
         self,
@@ -122,25 +67,7 @@ class OauthApi(ApiBaseClass):
             `GetOAuthApp <https://api.mattermost.com/#operation/GetOAuthApp>`_
         """
 
-        url = f"/oauth/apps/{app_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = OAuthApp.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_oauth_app", app_id=app_id)
 
     async def update_oauth_app(
         self,
@@ -160,31 +87,7 @@ class OauthApi(ApiBaseClass):
             `UpdateOAuthApp <https://api.mattermost.com/#operation/UpdateOAuthApp>`_
         """
 
-        url = f"/oauth/apps/{app_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = OAuthApp.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("update_oauth_app", app_id=app_id, json_body=json_body)
 
     async def delete_oauth_app(
         self,
@@ -202,25 +105,7 @@ class OauthApi(ApiBaseClass):
             `DeleteOAuthApp <https://api.mattermost.com/#operation/DeleteOAuthApp>`_
         """
 
-        url = f"/oauth/apps/{app_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("delete_oauth_app", app_id=app_id)
 
     async def regenerate_oauth_app_secret(
         self,
@@ -239,25 +124,7 @@ class OauthApi(ApiBaseClass):
             `RegenerateOAuthAppSecret <https://api.mattermost.com/#operation/RegenerateOAuthAppSecret>`_
         """
 
-        url = f"/oauth/apps/{app_id}/regen_secret"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = OAuthApp.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("regenerate_oauth_app_secret", app_id=app_id)
 
     async def get_oauth_app_info(
         self,
@@ -275,25 +142,7 @@ class OauthApi(ApiBaseClass):
             `GetOAuthAppInfo <https://api.mattermost.com/#operation/GetOAuthAppInfo>`_
         """
 
-        url = f"/oauth/apps/{app_id}/info"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = OAuthApp.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_oauth_app_info", app_id=app_id)
 
     async def get_authorized_oauth_apps_for_user(
         self,
@@ -315,33 +164,9 @@ class OauthApi(ApiBaseClass):
             `GetAuthorizedOAuthAppsForUser <https://api.mattermost.com/#operation/GetAuthorizedOAuthAppsForUser>`_
         """
 
-        url = f"/users/{user_id}/oauth/apps/authorized"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = OAuthApp.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_authorized_oauth_apps_for_user",
+            user_id=user_id,
+            page=page,
+            per_page=per_page,
+        )
@@ -3,8 +3,6 @@
 
 from typing import Dict, Union
 
-from pydantic import BaseModel
-
 from ...models import OpenGraph, OpenGraphJsonBody
 from ..base import ApiBaseClass
 
@@ -31,28 +29,4 @@ class OpenGraphApi(ApiBaseClass):
             `OpenGraph <https://api.mattermost.com/#operation/OpenGraph>`_
         """
 
-        url = "/opengraph"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = OpenGraph.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("open_graph", json_body=json_body)
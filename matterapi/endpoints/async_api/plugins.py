@@ -1,9 +1,7 @@
 """ Module to access the Plugins endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import (
     GetPluginsResponse200,
@@ -39,25 +37,7 @@ class PluginsApi(ApiBaseClass):
             `GetPlugins <https://api.mattermost.com/#operation/GetPlugins>`_
         """
 
-        url = "/plugins"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GetPluginsResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_plugins")
 
     async def upload_plugin(
         self,
@@ -79,29 +59,7 @@ class PluginsApi(ApiBaseClass):
             `UploadPlugin <https://api.mattermost.com/#operation/UploadPlugin>`_
         """
 
-        url = "/plugins"
-
-        multipart_body_data = UploadPluginMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = StatusOK.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call("upload_plugin", multipart_data=multipart_data)
 
     async def install_plugin_from_url(
         self,
@@ -123,31 +81,11 @@ class PluginsApi(ApiBaseClass):
             `InstallPluginFromUrl <https://api.mattermost.com/#operation/InstallPluginFromUrl>`_
         """
 
-        url = "/plugins/install_from_url"
-        params: Dict[str, Any] = {
-            "plugin_download_url": plugin_download_url,
-            "force": force,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = StatusOK.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call(
+            "install_plugin_from_url",
+            plugin_download_url=plugin_download_url,
+            force=force,
+        )
 
     async def remove_plugin(
         self,
@@ -167,25 +105,7 @@ class PluginsApi(ApiBaseClass):
             `RemovePlugin <https://api.mattermost.com/#operation/RemovePlugin>`_
         """
 
-        url = f"/plugins/{plugin_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("remove_plugin", plugin_id=plugin_id)
 
     async def enable_plugin(
         self,
@@ -205,25 +125,7 @@ class PluginsApi(ApiBaseClass):
             `EnablePlugin <https://api.mattermost.com/#operation/EnablePlugin>`_
         """
 
-        url = f"/plugins/{plugin_id}/enable"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("enable_plugin", plugin_id=plugin_id)
 
     async def disable_plugin(
         self,
@@ -243,25 +145,7 @@ class PluginsApi(ApiBaseClass):
             `DisablePlugin <https://api.mattermost.com/#operation/DisablePlugin>`_
         """
 
-        url = f"/plugins/{plugin_id}/disable"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("disable_plugin", plugin_id=plugin_id)
 
     async def get_webapp_plugins(
         self,
@@ -279,30 +163,7 @@ class PluginsApi(ApiBaseClass):
             `GetWebappPlugins <https://api.mattermost.com/#operation/GetWebappPlugins>`_
         """
 
-        url = "/plugins/webapp"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = PluginManifestWebapp.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_webapp_plugins")
 
     async def get_plugin_statuses(
         self,
@@ -320,30 +181,7 @@ class PluginsApi(ApiBaseClass):
             `GetPluginStatuses <https://api.mattermost.com/#operation/GetPluginStatuses>`_
         """
 
-        url = "/plugins/statuses"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = PluginStatus.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_plugin_statuses")
 
     async def get_marketplace_plugins(
         self,
@@ -369,39 +207,14 @@ class PluginsApi(ApiBaseClass):
             `GetMarketplacePlugins <https://api.mattermost.com/#operation/GetMarketplacePlugins>`_
         """
 
-        url = "/plugins/marketplace"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "filter": filter,
-            "server_version": server_version,
-            "local_only": local_only,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = MarketplacePlugin.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_marketplace_plugins",
+            page=page,
+            per_page=per_page,
+            filter=filter,
+            server_version=server_version,
+            local_only=local_only,
+        )
 
     async def install_marketplace_plugin(
         self,
@@ -421,31 +234,7 @@ class PluginsApi(ApiBaseClass):
             `InstallMarketplacePlugin <https://api.mattermost.com/#operation/InstallMarketplacePlugin>`_
         """
 
-        url = "/plugins/marketplace"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = PluginManifest.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("install_marketplace_plugin", json_body=json_body)
 
     async def get_marketplace_visited_by_admin(
         self,
@@ -464,22 +253,4 @@ class PluginsApi(ApiBaseClass):
             `GetMarketplaceVisitedByAdmin <https://api.mattermost.com/#operation/GetMarketplaceVisitedByAdmin>`_
         """
 
-        url = "/plugins/marketplace/first_admin_visit"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = System.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_marketplace_visited_by_admin")
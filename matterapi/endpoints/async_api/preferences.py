@@ -3,8 +3,6 @@
 
 from typing import Dict, List, Union
 
-from pydantic import BaseModel
-
 from ...models import Preference, StatusOK
 from ..base import ApiBaseClass
 
@@ -28,30 +26,7 @@ class PreferencesApi(ApiBaseClass):
             `GetPreferences <https://api.mattermost.com/#operation/GetPreferences>`_
         """
 
-        url = f"/users/{user_id}/preferences"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Preference.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_preferences", user_id=user_id)
 
     async def update_preferences(
         self,
@@ -71,35 +46,11 @@ class PreferencesApi(ApiBaseClass):
             `UpdatePreferences <https://api.mattermost.com/#operation/UpdatePreferences>`_
         """
 
-        url = f"/users/{user_id}/preferences"
-        json_json_body = []
-        for json_body_item_data in json_body:
-
-            if isinstance(json_body_item_data, BaseModel):
-                json_body_item = json_body_item_data.dict(exclude_unset=True)
-            else:
-                json_body_item = json_body_item_data
-
-            json_json_body.append(json_body_item)
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "update_preferences",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def delete_preferences(
         self,
@@ -119,35 +70,11 @@ class PreferencesApi(ApiBaseClass):
             `DeletePreferences <https://api.mattermost.com/#operation/DeletePreferences>`_
         """
 
-        url = f"/users/{user_id}/preferences/delete"
-        json_json_body = []
-        for json_body_item_data in json_body:
-
-            if isinstance(json_body_item_data, BaseModel):
-                json_body_item = json_body_item_data.dict(exclude_unset=True)
-            else:
-                json_body_item = json_body_item_data
-
-            json_json_body.append(json_body_item)
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "delete_preferences",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def get_preferences_by_category(
         self,
@@ -166,30 +93,11 @@ class PreferencesApi(ApiBaseClass):
             `GetPreferencesByCategory <https://api.mattermost.com/#operation/GetPreferencesByCategory>`_
         """
 
-        url = f"/users/{user_id}/preferences/{category}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Preference.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_preferences_by_category",
+            user_id=user_id,
+            category=category,
+        )
 
     async def get_preferences_by_category_by_name(
         self,
@@ -210,22 +118,9 @@ class PreferencesApi(ApiBaseClass):
             `GetPreferencesByCategoryByName <https://api.mattermost.com/#operation/GetPreferencesByCategoryByName>`_
         """
 
-        url = f"/users/{user_id}/preferences/{category}/name/{preference_name}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Preference.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "get_preferences_by_category_by_name",
+            user_id=user_id,
+            category=category,
+            preference_name=preference_name,
+        )
@@ -24,22 +24,4 @@ class RootApi(ApiBaseClass):
             `AcknowledgeNotification <https://api.mattermost.com/#operation/AcknowledgeNotification>`_
         """
 
-        url = "/notifications/ack"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = PushNotification.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("acknowledge_notification")
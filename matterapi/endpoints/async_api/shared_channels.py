@@ -1,7 +1,7 @@
 """ Module to access the SharedChannels endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional
+from typing import List, Optional
 
 from ...models import RemoteClusterInfo, SharedChannel
 from ..base import ApiBaseClass
@@ -30,36 +30,12 @@ class SharedChannelsApi(ApiBaseClass):
             `GetAllSharedChannels <https://api.mattermost.com/#operation/GetAllSharedChannels>`_
         """
 
-        url = f"/sharedchannels/{team_id}"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = SharedChannel.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_all_shared_channels",
+            team_id=team_id,
+            page=page,
+            per_page=per_page,
+        )
 
     async def get_remote_cluster_info(
         self,
@@ -79,22 +55,4 @@ class SharedChannelsApi(ApiBaseClass):
             `GetRemoteClusterInfo <https://api.mattermost.com/#operation/GetRemoteClusterInfo>`_
         """
 
-        url = f"/sharedchannels/remote_info/{remote_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = RemoteClusterInfo.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_remote_cluster_info", remote_id=remote_id)
@@ -3,8 +3,6 @@
 
 from typing import Dict, List, Union
 
-from pydantic import BaseModel
-
 from ...models import (
     PostUserRecentCustomStatusDeleteJsonBody,
     RemoveRecentCustomStatusJsonBody,
@@ -33,25 +31,7 @@ class StatusApi(ApiBaseClass):
             `GetUserStatus <https://api.mattermost.com/#operation/GetUserStatus>`_
         """
 
-        url = f"/users/{user_id}/status"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Status.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_user_status", user_id=user_id)
 
     async def update_user_status(
         self,
@@ -72,31 +52,11 @@ class StatusApi(ApiBaseClass):
             `UpdateUserStatus <https://api.mattermost.com/#operation/UpdateUserStatus>`_
         """
 
-        url = f"/users/{user_id}/status"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Status.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "update_user_status",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def get_users_statuses_by_ids(
         self,
@@ -114,32 +74,7 @@ class StatusApi(ApiBaseClass):
             `GetUsersStatusesByIds <https://api.mattermost.com/#operation/GetUsersStatusesByIds>`_
         """
 
-        url = "/users/status/ids"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Status.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_users_statuses_by_ids", json_body=json_body)
 
     async def update_user_custom_status(
         self,
@@ -161,27 +96,11 @@ class StatusApi(ApiBaseClass):
             `UpdateUserCustomStatus <https://api.mattermost.com/#operation/UpdateUserCustomStatus>`_
         """
 
-        url = f"/users/{user_id}/status/custom"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call(
+            "update_user_custom_status",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def unset_user_custom_status(
         self,
@@ -200,21 +119,7 @@ class StatusApi(ApiBaseClass):
             `UnsetUserCustomStatus <https://api.mattermost.com/#operation/UnsetUserCustomStatus>`_
         """
 
-        url = f"/users/{user_id}/status/custom"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("unset_user_custom_status", user_id=user_id)
 
     async def remove_recent_custom_status(
         self,
@@ -235,27 +140,11 @@ class StatusApi(ApiBaseClass):
             `RemoveRecentCustomStatus <https://api.mattermost.com/#operation/RemoveRecentCustomStatus>`_
         """
 
-        url = f"/users/{user_id}/status/custom/recent"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call(
+            "remove_recent_custom_status",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def post_user_recent_custom_status_delete(
         self,
@@ -276,24 +165,8 @@ class StatusApi(ApiBaseClass):
             `PostUserRecentCustomStatusDelete <https://api.mattermost.com/#operation/PostUserRecentCustomStatusDelete>`_
         """
 
-        url = f"/users/{user_id}/status/custom/recent/delete"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call(
+            "post_user_recent_custom_status_delete",
+            user_id=user_id,
+            json_body=json_body,
+        )
@@ -3,8 +3,6 @@
 
 from typing import Dict, Union
 
-from pydantic import BaseModel
-
 from ...models import (
     AppError,
     RegisterTermsOfServiceActionJsonBody,
@@ -38,29 +36,7 @@ class TermsOfServiceApi(ApiBaseClass):
             `GetUserTermsOfService <https://api.mattermost.com/#operation/GetUserTermsOfService>`_
         """
 
-        url = f"/users/{user_id}/terms_of_service"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = UserTermsOfService.parse_obj(response.json())
-
-            return response200
-        if response.status_code == 404:
-            response404 = AppError.parse_obj(response.json())
-
-            return response404
-        return response
+        return await self._call("get_user_terms_of_service", user_id=user_id)
 
     async def register_terms_of_service_action(
         self,
@@ -83,31 +59,11 @@ class TermsOfServiceApi(ApiBaseClass):
             `RegisterTermsOfServiceAction <https://api.mattermost.com/#operation/RegisterTermsOfServiceAction>`_
         """
 
-        url = f"/users/{user_id}/terms_of_service"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "register_terms_of_service_action",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def get_terms_of_service(
         self,
@@ -125,25 +81,7 @@ class TermsOfServiceApi(ApiBaseClass):
             `GetTermsOfService <https://api.mattermost.com/#operation/GetTermsOfService>`_
         """
 
-        url = "/terms_of_service"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = TermsOfService.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_terms_of_service")
 
     async def create_terms_of_service(
         self,
@@ -161,22 +99,4 @@ class TermsOfServiceApi(ApiBaseClass):
             `CreateTermsOfService <https://api.mattermost.com/#operation/CreateTermsOfService>`_
         """
 
-        url = "/terms_of_service"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = TermsOfService.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("create_terms_of_service")
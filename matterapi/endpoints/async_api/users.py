@@ -1,9 +1,7 @@
 """ Module to access the Users endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import AsyncIterator, Dict, List, Optional, Union
 
 from ...models import (
     AppError,
@@ -79,31 +77,7 @@ class UsersApi(ApiBaseClass):
             `Login <https://api.mattermost.com/#operation/Login>`_
         """
 
-        url = "/users/login"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = User.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call("login", json_body=json_body)
 
     async def login_by_cws_token(
         self,
@@ -122,27 +96,7 @@ class UsersApi(ApiBaseClass):
             `LoginByCwsToken <https://api.mattermost.com/#operation/LoginByCwsToken>`_
         """
 
-        url = "/users/login/cws"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("login_by_cws_token", json_body=json_body)
 
     async def logout(
         self,
@@ -158,27 +112,66 @@ class UsersApi(ApiBaseClass):
             `Logout <https://api.mattermost.com/#operation/Logout>`_
         """
 
-        url = "/users/logout"
+        return await self._call("logout")
 
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
+    async def get_users(
+        self,
+        *,
+        page: Optional[int] = 0,
+        per_page: Optional[int] = 60,
+        in_team: Optional[str] = None,
+        not_in_team: Optional[str] = None,
+        in_channel: Optional[str] = None,
+        not_in_channel: Optional[str] = None,
+        in_group: Optional[str] = None,
+        group_constrained: Optional[bool] = None,
+        without_team: Optional[bool] = None,
+        active: Optional[bool] = None,
+        inactive: Optional[bool] = None,
+        role: Optional[str] = None,
+        sort: Optional[str] = None,
+        roles: Optional[str] = None,
+        channel_roles: Optional[str] = None,
+        team_roles: Optional[str] = None,
+    ) -> List[User]:
+        """Get users
 
-        if self.skip_response_parsing:
-            return response
+        Get a page of a list of users. Based on query string parameters, select
+        users from a team, channel, or select users not in a specific channel.
+
+        Since server version 4.0, some basic sorting is available using the
+        `sort` query parameter. Sorting is currently only supported when
+        selecting users on a team.
 
-        if response.status_code == 201:
-            response201 = StatusOK.parse_obj(response.json())
+        Permissions:
+            Requires an active session and (if specified) membership to
+            the channel or team being selected from.
 
-            return response201
-        return response
+        Api Reference:
+            `GetUsers <https://api.mattermost.com/#operation/GetUsers>`_
+        """
 
-    async def get_users(
+        return await self._call(
+            "get_users",
+            page=page,
+            per_page=per_page,
+            in_team=in_team,
+            not_in_team=not_in_team,
+            in_channel=in_channel,
+            not_in_channel=not_in_channel,
+            in_group=in_group,
+            group_constrained=group_constrained,
+            without_team=without_team,
+            active=active,
+            inactive=inactive,
+            role=role,
+            sort=sort,
+            roles=roles,
+            channel_roles=channel_roles,
+            team_roles=team_roles,
+        )
+
+    def iter_users(
         self,
         *,
         page: Optional[int] = 0,
@@ -197,8 +190,11 @@ class UsersApi(ApiBaseClass):
         roles: Optional[str] = None,
         channel_roles: Optional[str] = None,
         team_roles: Optional[str] = None,
-    ) -> List[User]:
-        """Get users
+    ) -> AsyncIterator[User]:
+        """Get users, one at a time
+
+        Streaming variant of :meth:`get_users`. Elements are yielded as soon as they
+        were received and parsed instead of reading the whole response first.
 
         Get a page of a list of users. Based on query string parameters, select
         users from a team, channel, or select users not in a specific channel.
@@ -215,50 +211,25 @@ class UsersApi(ApiBaseClass):
             `GetUsers <https://api.mattermost.com/#operation/GetUsers>`_
         """
 
-        url = "/users"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "in_team": in_team,
-            "not_in_team": not_in_team,
-            "in_channel": in_channel,
-            "not_in_channel": not_in_channel,
-            "in_group": in_group,
-            "group_constrained": group_constrained,
-            "without_team": without_team,
-            "active": active,
-            "inactive": inactive,
-            "role": role,
-            "sort": sort,
-            "roles": roles,
-            "channel_roles": channel_roles,
-            "team_roles": team_roles,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = User.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._stream(
+            "get_users",
+            page=page,
+            per_page=per_page,
+            in_team=in_team,
+            not_in_team=not_in_team,
+            in_channel=in_channel,
+            not_in_channel=not_in_channel,
+            in_group=in_group,
+            group_constrained=group_constrained,
+            without_team=without_team,
+            active=active,
+            inactive=inactive,
+            role=role,
+            sort=sort,
+            roles=roles,
+            channel_roles=channel_roles,
+            team_roles=team_roles,
+        )
 
     async def create_user(
         self,
@@ -282,37 +253,7 @@ class UsersApi(ApiBaseClass):
             `CreateUser <https://api.mattermost.com/#operation/CreateUser>`_
         """
 
-        url = "/users"
-        params: Dict[str, Any] = {
-            "t": t,
-            "iid": iid,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = User.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call("create_user", json_body=json_body, t=t, iid=iid)
 
     async def permanent_delete_all_users(
         self,
@@ -333,21 +274,7 @@ class UsersApi(ApiBaseClass):
             `PermanentDeleteAllUsers <https://api.mattermost.com/#operation/PermanentDeleteAllUsers>`_
         """
 
-        url = "/users"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("permanent_delete_all_users")
 
     async def get_users_by_ids(
         self,
@@ -366,38 +293,7 @@ class UsersApi(ApiBaseClass):
             `GetUsersByIds <https://api.mattermost.com/#operation/GetUsersByIds>`_
         """
 
-        url = "/users/ids"
-        params: Dict[str, Any] = {
-            "since": since,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = User.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_users_by_ids", json_body=json_body, since=since)
 
     async def get_users_by_group_channel_ids(
         self,
@@ -422,29 +318,7 @@ class UsersApi(ApiBaseClass):
             `GetUsersByGroupChannelIds <https://api.mattermost.com/#operation/GetUsersByGroupChannelIds>`_
         """
 
-        url = "/users/group_channels"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GetUsersByGroupChannelIdsResponse200.parse_obj(
-                response.json()
-            )
-
-            return response200
-        return response
+        return await self._call("get_users_by_group_channel_ids", json_body=json_body)
 
     async def get_users_by_usernames(
         self,
@@ -462,32 +336,7 @@ class UsersApi(ApiBaseClass):
             `GetUsersByUsernames <https://api.mattermost.com/#operation/GetUsersByUsernames>`_
         """
 
-        url = "/users/usernames"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = User.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_users_by_usernames", json_body=json_body)
 
     async def search_users(
         self,
@@ -509,36 +358,7 @@ class UsersApi(ApiBaseClass):
             `SearchUsers <https://api.mattermost.com/#operation/SearchUsers>`_
         """
 
-        url = "/users/search"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = User.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("search_users", json_body=json_body)
 
     async def autocomplete_users(
         self,
@@ -563,33 +383,13 @@ class UsersApi(ApiBaseClass):
             `AutocompleteUsers <https://api.mattermost.com/#operation/AutocompleteUsers>`_
         """
 
-        url = "/users/autocomplete"
-        params: Dict[str, Any] = {
-            "team_id": team_id,
-            "channel_id": channel_id,
-            "name": name,
-            "limit": limit,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = UserAutocomplete.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "autocomplete_users",
+            team_id=team_id,
+            channel_id=channel_id,
+            name=name,
+            limit=limit,
+        )
 
     async def get_known_users(
         self,
@@ -609,25 +409,7 @@ class UsersApi(ApiBaseClass):
             `GetKnownUsers <https://api.mattermost.com/#operation/GetKnownUsers>`_
         """
 
-        url = "/users/known"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = UsersStats.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_known_users")
 
     async def get_total_users_stats(
         self,
@@ -643,25 +425,7 @@ class UsersApi(ApiBaseClass):
             `GetTotalUsersStats <https://api.mattermost.com/#operation/GetTotalUsersStats>`_
         """
 
-        url = "/users/stats"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = UsersStats.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_total_users_stats")
 
     async def get_total_users_stats_filtered(
         self,
@@ -687,36 +451,16 @@ class UsersApi(ApiBaseClass):
             `GetTotalUsersStatsFiltered <https://api.mattermost.com/#operation/GetTotalUsersStatsFiltered>`_
         """
 
-        url = "/users/stats/filtered"
-        params: Dict[str, Any] = {
-            "in_team": in_team,
-            "in_channel": in_channel,
-            "include_deleted": include_deleted,
-            "include_bots": include_bots,
-            "roles": roles,
-            "channel_roles": channel_roles,
-            "team_roles": team_roles,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = UsersStats.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "get_total_users_stats_filtered",
+            in_team=in_team,
+            in_channel=in_channel,
+            include_deleted=include_deleted,
+            include_bots=include_bots,
+            roles=roles,
+            channel_roles=channel_roles,
+            team_roles=team_roles,
+        )
 
     async def get_user(
         self,
@@ -733,25 +477,7 @@ class UsersApi(ApiBaseClass):
             `GetUser <https://api.mattermost.com/#operation/GetUser>`_
         """
 
-        url = f"/users/{user_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = User.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_user", user_id=user_id)
 
     async def update_user(
         self,
@@ -774,31 +500,7 @@ class UsersApi(ApiBaseClass):
             `UpdateUser <https://api.mattermost.com/#operation/UpdateUser>`_
         """
 
-        url = f"/users/{user_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = User.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("update_user", user_id=user_id, json_body=json_body)
 
     async def delete_user(
         self,
@@ -822,25 +524,7 @@ class UsersApi(ApiBaseClass):
             `DeleteUser <https://api.mattermost.com/#operation/DeleteUser>`_
         """
 
-        url = f"/users/{user_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("delete_user", user_id=user_id)
 
     async def patch_user(
         self,
@@ -862,31 +546,7 @@ class UsersApi(ApiBaseClass):
             `PatchUser <https://api.mattermost.com/#operation/PatchUser>`_
         """
 
-        url = f"/users/{user_id}/patch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = User.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("patch_user", user_id=user_id, json_body=json_body)
 
     async def update_user_roles(
         self,
@@ -907,31 +567,11 @@ class UsersApi(ApiBaseClass):
             `UpdateUserRoles <https://api.mattermost.com/#operation/UpdateUserRoles>`_
         """
 
-        url = f"/users/{user_id}/roles"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "update_user_roles",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def update_user_active(
         self,
@@ -959,31 +599,11 @@ class UsersApi(ApiBaseClass):
             `UpdateUserActive <https://api.mattermost.com/#operation/UpdateUserActive>`_
         """
 
-        url = f"/users/{user_id}/active"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "update_user_active",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def get_profile_image(
         self,
@@ -1002,26 +622,7 @@ class UsersApi(ApiBaseClass):
             `GetProfileImage <https://api.mattermost.com/#operation/GetProfileImage>`_
         """
 
-        url = f"/users/{user_id}/image"
-        params: Dict[str, Any] = {
-            "_": _,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("get_profile_image", user_id=user_id, _=_)
 
     async def set_profile_image(
         self,
@@ -1041,29 +642,11 @@ class UsersApi(ApiBaseClass):
             `SetProfileImage <https://api.mattermost.com/#operation/SetProfileImage>`_
         """
 
-        url = f"/users/{user_id}/image"
-
-        multipart_body_data = SetProfileImageMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "set_profile_image",
+            user_id=user_id,
+            multipart_data=multipart_data,
+        )
 
     async def set_default_profile_image(
         self,
@@ -1084,25 +667,7 @@ class UsersApi(ApiBaseClass):
             `SetDefaultProfileImage <https://api.mattermost.com/#operation/SetDefaultProfileImage>`_
         """
 
-        url = f"/users/{user_id}/image"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("set_default_profile_image", user_id=user_id)
 
     async def get_default_profile_image(
         self,
@@ -1122,21 +687,7 @@ class UsersApi(ApiBaseClass):
             `GetDefaultProfileImage <https://api.mattermost.com/#operation/GetDefaultProfileImage>`_
         """
 
-        url = f"/users/{user_id}/image/default"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("get_default_profile_image", user_id=user_id)
 
     async def get_user_by_username(
         self,
@@ -1154,25 +705,7 @@ class UsersApi(ApiBaseClass):
             `GetUserByUsername <https://api.mattermost.com/#operation/GetUserByUsername>`_
         """
 
-        url = f"/users/username/{username}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = User.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_user_by_username", username=username)
 
     async def reset_password(
         self,
@@ -1191,31 +724,7 @@ class UsersApi(ApiBaseClass):
             `ResetPassword <https://api.mattermost.com/#operation/ResetPassword>`_
         """
 
-        url = "/users/password/reset"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("reset_password", json_body=json_body)
 
     async def update_user_mfa(
         self,
@@ -1237,31 +746,7 @@ class UsersApi(ApiBaseClass):
             `UpdateUserMfa <https://api.mattermost.com/#operation/UpdateUserMfa>`_
         """
 
-        url = f"/users/{user_id}/mfa"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("update_user_mfa", user_id=user_id, json_body=json_body)
 
     async def generate_mfa_secret(
         self,
@@ -1280,25 +765,7 @@ class UsersApi(ApiBaseClass):
             `GenerateMfaSecret <https://api.mattermost.com/#operation/GenerateMfaSecret>`_
         """
 
-        url = f"/users/{user_id}/mfa/generate"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GenerateMfaSecretResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("generate_mfa_secret", user_id=user_id)
 
     async def demote_user_to_guest(
         self,
@@ -1320,25 +787,7 @@ class UsersApi(ApiBaseClass):
             `DemoteUserToGuest <https://api.mattermost.com/#operation/DemoteUserToGuest>`_
         """
 
-        url = f"/users/{user_id}/demote"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("demote_user_to_guest", user_id=user_id)
 
     async def promote_guest_to_user(
         self,
@@ -1360,25 +809,7 @@ class UsersApi(ApiBaseClass):
             `PromoteGuestToUser <https://api.mattermost.com/#operation/PromoteGuestToUser>`_
         """
 
-        url = f"/users/{user_id}/promote"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("promote_guest_to_user", user_id=user_id)
 
     async def convert_user_to_bot(
         self,
@@ -1397,25 +828,7 @@ class UsersApi(ApiBaseClass):
             `ConvertUserToBot <https://api.mattermost.com/#operation/ConvertUserToBot>`_
         """
 
-        url = f"/users/{user_id}/convert_to_bot"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("convert_user_to_bot", user_id=user_id)
 
     async def check_user_mfa(
         self,
@@ -1435,31 +848,7 @@ class UsersApi(ApiBaseClass):
             `CheckUserMfa <https://api.mattermost.com/#operation/CheckUserMfa>`_
         """
 
-        url = "/users/mfa"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = CheckUserMfaResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("check_user_mfa", json_body=json_body)
 
     async def update_user_password(
         self,
@@ -1481,31 +870,11 @@ class UsersApi(ApiBaseClass):
             `UpdateUserPassword <https://api.mattermost.com/#operation/UpdateUserPassword>`_
         """
 
-        url = f"/users/{user_id}/password"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "update_user_password",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def send_password_reset_email(
         self,
@@ -1525,31 +894,7 @@ class UsersApi(ApiBaseClass):
             `SendPasswordResetEmail <https://api.mattermost.com/#operation/SendPasswordResetEmail>`_
         """
 
-        url = "/users/password/reset/send"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("send_password_reset_email", json_body=json_body)
 
     async def get_user_by_email(
         self,
@@ -1569,25 +914,7 @@ class UsersApi(ApiBaseClass):
             `GetUserByEmail <https://api.mattermost.com/#operation/GetUserByEmail>`_
         """
 
-        url = f"/users/email/{email}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = User.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_user_by_email", email=email)
 
     async def get_sessions(
         self,
@@ -1606,30 +933,7 @@ class UsersApi(ApiBaseClass):
             `GetSessions <https://api.mattermost.com/#operation/GetSessions>`_
         """
 
-        url = f"/users/{user_id}/sessions"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Session.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_sessions", user_id=user_id)
 
     async def revoke_session(
         self,
@@ -1649,31 +953,7 @@ class UsersApi(ApiBaseClass):
             `RevokeSession <https://api.mattermost.com/#operation/RevokeSession>`_
         """
 
-        url = f"/users/{user_id}/sessions/revoke"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("revoke_session", user_id=user_id, json_body=json_body)
 
     async def revoke_all_sessions(
         self,
@@ -1694,25 +974,7 @@ class UsersApi(ApiBaseClass):
             `RevokeAllSessions <https://api.mattermost.com/#operation/RevokeAllSessions>`_
         """
 
-        url = f"/users/{user_id}/sessions/revoke/all"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("revoke_all_sessions", user_id=user_id)
 
     async def attach_device_id(
         self,
@@ -1731,31 +993,7 @@ class UsersApi(ApiBaseClass):
             `AttachDeviceId <https://api.mattermost.com/#operation/AttachDeviceId>`_
         """
 
-        url = "/users/sessions/device"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("attach_device_id", json_body=json_body)
 
     async def get_user_audits(
         self,
@@ -1773,30 +1011,7 @@ class UsersApi(ApiBaseClass):
             `GetUserAudits <https://api.mattermost.com/#operation/GetUserAudits>`_
         """
 
-        url = f"/users/{user_id}/audits"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Audit.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_user_audits", user_id=user_id)
 
     async def verify_user_email_without_token(
         self,
@@ -1815,25 +1030,7 @@ class UsersApi(ApiBaseClass):
             `VerifyUserEmailWithoutToken <https://api.mattermost.com/#operation/VerifyUserEmailWithoutToken>`_
         """
 
-        url = f"/users/{user_id}/email/verify/member"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = User.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("verify_user_email_without_token", user_id=user_id)
 
     async def verify_user_email(
         self,
@@ -1851,31 +1048,7 @@ class UsersApi(ApiBaseClass):
             `VerifyUserEmail <https://api.mattermost.com/#operation/VerifyUserEmail>`_
         """
 
-        url = "/users/email/verify"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("verify_user_email", json_body=json_body)
 
     async def send_verification_email(
         self,
@@ -1895,31 +1068,7 @@ class UsersApi(ApiBaseClass):
             `SendVerificationEmail <https://api.mattermost.com/#operation/SendVerificationEmail>`_
         """
 
-        url = "/users/email/verify/send"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("send_verification_email", json_body=json_body)
 
     async def switch_account_type(
         self,
@@ -1958,31 +1107,7 @@ class UsersApi(ApiBaseClass):
             `SwitchAccountType <https://api.mattermost.com/#operation/SwitchAccountType>`_
         """
 
-        url = "/users/login/switch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = SwitchAccountTypeResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("switch_account_type", json_body=json_body)
 
     async def get_user_access_tokens_for_user(
         self,
@@ -2006,38 +1131,12 @@ class UsersApi(ApiBaseClass):
             `GetUserAccessTokensForUser <https://api.mattermost.com/#operation/GetUserAccessTokensForUser>`_
         """
 
-        url = f"/users/{user_id}/tokens"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = UserAccessTokenSanitized.parse_obj(
-                    response200_item_data
-                )
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_user_access_tokens_for_user",
+            user_id=user_id,
+            page=page,
+            per_page=per_page,
+        )
 
     async def create_user_access_token(
         self,
@@ -2061,31 +1160,11 @@ class UsersApi(ApiBaseClass):
             `CreateUserAccessToken <https://api.mattermost.com/#operation/CreateUserAccessToken>`_
         """
 
-        url = f"/users/{user_id}/tokens"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = UserAccessToken.parse_obj(response.json())
-
-            return response201
-        return response
+        return await self._call(
+            "create_user_access_token",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def get_user_access_tokens(
         self,
@@ -2108,38 +1187,7 @@ class UsersApi(ApiBaseClass):
             `GetUserAccessTokens <https://api.mattermost.com/#operation/GetUserAccessTokens>`_
         """
 
-        url = "/users/tokens"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = UserAccessTokenSanitized.parse_obj(
-                    response200_item_data
-                )
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_user_access_tokens", page=page, per_page=per_page)
 
     async def revoke_user_access_token(
         self,
@@ -2161,31 +1209,7 @@ class UsersApi(ApiBaseClass):
             `RevokeUserAccessToken <https://api.mattermost.com/#operation/RevokeUserAccessToken>`_
         """
 
-        url = "/users/tokens/revoke"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("revoke_user_access_token", json_body=json_body)
 
     async def get_user_access_token(
         self,
@@ -2206,25 +1230,7 @@ class UsersApi(ApiBaseClass):
             `GetUserAccessToken <https://api.mattermost.com/#operation/GetUserAccessToken>`_
         """
 
-        url = f"/users/tokens/{token_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = UserAccessTokenSanitized.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("get_user_access_token", token_id=token_id)
 
     async def disable_user_access_token(
         self,
@@ -2247,31 +1253,7 @@ class UsersApi(ApiBaseClass):
             `DisableUserAccessToken <https://api.mattermost.com/#operation/DisableUserAccessToken>`_
         """
 
-        url = "/users/tokens/disable"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("disable_user_access_token", json_body=json_body)
 
     async def enable_user_access_token(
         self,
@@ -2293,31 +1275,7 @@ class UsersApi(ApiBaseClass):
             `EnableUserAccessToken <https://api.mattermost.com/#operation/EnableUserAccessToken>`_
         """
 
-        url = "/users/tokens/enable"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call("enable_user_access_token", json_body=json_body)
 
     async def search_user_access_tokens(
         self,
@@ -2338,38 +1296,7 @@ class UsersApi(ApiBaseClass):
             `SearchUserAccessTokens <https://api.mattermost.com/#operation/SearchUserAccessTokens>`_
         """
 
-        url = "/users/tokens/search"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = UserAccessTokenSanitized.parse_obj(
-                    response200_item_data
-                )
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("search_user_access_tokens", json_body=json_body)
 
     async def update_user_auth(
         self,
@@ -2391,31 +1318,11 @@ class UsersApi(ApiBaseClass):
             `UpdateUserAuth <https://api.mattermost.com/#operation/UpdateUserAuth>`_
         """
 
-        url = f"/users/{user_id}/auth"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = UserAuthData.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "update_user_auth",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def get_user_terms_of_service(
         self,
@@ -2437,29 +1344,7 @@ class UsersApi(ApiBaseClass):
             `GetUserTermsOfService <https://api.mattermost.com/#operation/GetUserTermsOfService>`_
         """
 
-        url = f"/users/{user_id}/terms_of_service"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = UserTermsOfService.parse_obj(response.json())
-
-            return response200
-        if response.status_code == 404:
-            response404 = AppError.parse_obj(response.json())
-
-            return response404
-        return response
+        return await self._call("get_user_terms_of_service", user_id=user_id)
 
     async def register_terms_of_service_action(
         self,
@@ -2482,31 +1367,11 @@ class UsersApi(ApiBaseClass):
             `RegisterTermsOfServiceAction <https://api.mattermost.com/#operation/RegisterTermsOfServiceAction>`_
         """
 
-        url = f"/users/{user_id}/terms_of_service"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "register_terms_of_service_action",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def revoke_sessions_from_all_users(
         self,
@@ -2526,21 +1391,7 @@ class UsersApi(ApiBaseClass):
             `RevokeSessionsFromAllUsers <https://api.mattermost.com/#operation/RevokeSessionsFromAllUsers>`_
         """
 
-        url = "/users/sessions/revoke/all"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("revoke_sessions_from_all_users")
 
     async def publish_user_typing(
         self,
@@ -2563,27 +1414,11 @@ class UsersApi(ApiBaseClass):
             `PublishUserTyping <https://api.mattermost.com/#operation/PublishUserTyping>`_
         """
 
-        url = f"/users/{user_id}/typing"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call(
+            "publish_user_typing",
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     async def get_uploads_for_user(
         self,
@@ -2603,30 +1438,7 @@ class UsersApi(ApiBaseClass):
             `GetUploadsForUser <https://api.mattermost.com/#operation/GetUploadsForUser>`_
         """
 
-        url = f"/users/{user_id}/uploads"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = UploadSession.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call("get_uploads_for_user", user_id=user_id)
 
     async def get_channel_members_with_team_data_for_user(
         self,
@@ -2649,38 +1461,12 @@ class UsersApi(ApiBaseClass):
             `GetChannelMembersWithTeamDataForUser <https://api.mattermost.com/#operation/GetChannelMembersWithTeamDataForUser>`_
         """
 
-        url = f"/users/{user_id}/channel_members"
-        params: Dict[str, Any] = {
-            "page": page,
-            "pageSize": pageSize,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = ChannelMemberWithTeamData.parse_obj(
-                    response200_item_data
-                )
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return await self._call(
+            "get_channel_members_with_team_data_for_user",
+            user_id=user_id,
+            page=page,
+            pageSize=pageSize,
+        )
 
     async def migrate_auth_to_ldap(
         self,
@@ -2702,27 +1488,7 @@ class UsersApi(ApiBaseClass):
             `MigrateAuthToLdap <https://api.mattermost.com/#operation/MigrateAuthToLdap>`_
         """
 
-        url = "/users/migrate_auth/ldap"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("migrate_auth_to_ldap", json_body=json_body)
 
     async def migrate_auth_to_saml(
         self,
@@ -2744,27 +1510,7 @@ class UsersApi(ApiBaseClass):
             `MigrateAuthToSaml <https://api.mattermost.com/#operation/MigrateAuthToSaml>`_
         """
 
-        url = "/users/migrate_auth/saml"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return await self._call("migrate_auth_to_saml", json_body=json_body)
 
     async def convert_bot_to_user(
         self,
@@ -2786,33 +1532,9 @@ class UsersApi(ApiBaseClass):
             `ConvertBotToUser <https://api.mattermost.com/#operation/ConvertBotToUser>`_
         """
 
-        url = f"/bots/{bot_user_id}/convert_to_user"
-        params: Dict[str, Any] = {
-            "set_system_admin": set_system_admin,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        async with self.client._get_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return await self._call(
+            "convert_bot_to_user",
+            bot_user_id=bot_user_id,
+            json_body=json_body,
+            set_system_admin=set_system_admin,
+        )
@@ -1,7 +1,33 @@
+from typing import Dict, Optional
+
 from ..client.base import BaseClient
+from .operations import OPERATIONS
 
 
 class ApiBaseClass:
-    def __init__(self, client: BaseClient, skip_response_parsing: bool = False):
+    def __init__(
+        self,
+        client: BaseClient,
+        skip_response_parsing: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ):
         self.client = client
         self.skip_response_parsing = skip_response_parsing
+        self.headers = headers
+        """ Additional headers sent with every request, e.g. for conditional requests """
+
+    def _call(self, operation_name: str, **arguments):
+        """Execute the registered operation ``operation_name`` with the client
+
+        Returns the parsed response, or a coroutine resolving to it for async clients.
+        """
+        # pylint: disable-next=protected-access
+        return self.client._execute(self, OPERATIONS[operation_name], arguments)
+
+    def _stream(self, operation_name: str, **arguments):
+        """Iterate over the elements of the json array returned by ``operation_name``
+
+        Returns an iterator, or an async iterator for async clients.
+        """
+        # pylint: disable-next=protected-access
+        return self.client._stream(self, OPERATIONS[operation_name], arguments)
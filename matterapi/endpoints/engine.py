@@ -0,0 +1,385 @@
+""" Shared request pipeline executing operations for the sync and async endpoints """
+
+import codecs
+import functools
+import json
+import string
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from pydantic import BaseModel
+
+from ..fast import fast_model_parser
+from ..lazy import lazy_parse_obj
+from ..types import BaseArray
+
+JSON = "json"
+""" Body kind for ``json_body`` arguments, serialized as json """
+MULTIPART = "multipart"
+""" Body kind for ``multipart_data`` arguments, sent as multipart/form-data """
+FORM = "form"
+""" Body kind for ``form_data`` arguments, passed as request data """
+
+STREAM_CHUNK_SIZE = 64 * 1024
+""" Size of the chunks streamed responses are decoded in """
+
+PER_PAGE_PARAMS = ("per_page", "pageSize", "logs_per_page")
+""" Names used by the api for the page size of paginated operations """
+
+
+def _model_parser(model, lazy: bool, fast: bool) -> Callable[[Any], Any]:
+    if fast:
+        parser = fast_model_parser(model, lazy)
+        if parser is not None:
+            return parser
+    if lazy:
+        return functools.partial(lazy_parse_obj, model)
+    return model.parse_obj
+
+
+def _make_parser(
+    response_type, lazy: bool = False, fast: bool = False
+) -> Callable[[Any], Any]:
+    """Create a function converting decoded json into the given response type
+
+    Models are created with :func:`~matterapi.lazy.lazy_parse_obj` if ``lazy`` is set.
+    If ``fast`` is set, :func:`fast models <matterapi.fast.is_fast_model>` are created
+    with :func:`~matterapi.fast.fast_parse_obj`.
+    """
+    if isinstance(response_type, type) and issubclass(response_type, BaseModel):
+        return _model_parser(response_type, lazy, fast)
+    if getattr(response_type, "__origin__", None) is list:
+        (item_type,) = response_type.__args__
+        if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+            parse_item = _model_parser(item_type, lazy, fast)
+            return lambda data: [parse_item(item) for item in data]
+    return lambda data: data
+
+
+def _item_type(response_type) -> Optional[Any]:
+    """Return the element type of an array response type or ``None``"""
+    if getattr(response_type, "__origin__", None) is list:
+        return response_type.__args__[0]
+    if isinstance(response_type, type) and issubclass(response_type, BaseArray):
+        return response_type.__fields__["__root__"].type_
+    return None
+
+
+class Operation:
+    """Description of a single api operation
+
+    Args:
+        name: Name of the endpoint method executing the operation
+        method: HTTP method
+        path: Path template relative to the api base path, e.g. ``/channels/{channel_id}/posts``
+        tags: Names of the endpoint groups (client attributes) providing the operation
+        params: Names of the query parameters
+        body: Kind of the request body, one of :data:`JSON`, :data:`MULTIPART`, :data:`FORM`
+        multipart_model: Model used to split ``multipart_data`` into data and files
+        responses: Response types per status code. Responses with other status codes
+            are returned as ``httpx.Response``
+        read_only: Whether the operation has no side effects on the server.
+            Defaults to ``True`` for ``GET`` operations only
+        idempotent: Whether repeating the operation has the same effect as executing it
+            once. Defaults to ``True`` for read only, ``PUT`` and ``DELETE`` operations
+        bulk_ids: Whether the operation looks up several objects by a list of
+            identifiers passed as ``json_body``
+    """
+
+    __slots__ = (
+        "name",
+        "method",
+        "path",
+        "tags",
+        "params",
+        "body",
+        "multipart_model",
+        "responses",
+        "read_only",
+        "idempotent",
+        "bulk_ids",
+        "path_params",
+        "_parsers",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        method: str,
+        path: str,
+        *,
+        tags: Tuple[str, ...],
+        params: Tuple[str, ...] = (),
+        body: Optional[str] = None,
+        multipart_model: Optional[type] = None,
+        responses: Optional[Dict[int, Any]] = None,
+        read_only: Optional[bool] = None,
+        idempotent: Optional[bool] = None,
+        bulk_ids: bool = False,
+    ):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.tags = tags
+        self.params = params
+        self.body = body
+        self.multipart_model = multipart_model
+        self.responses = responses or {}
+        if read_only is None:
+            read_only = method == "GET"
+        if idempotent is None:
+            idempotent = read_only or method in ("PUT", "DELETE")
+        self.read_only = read_only
+        self.idempotent = idempotent
+        self.bulk_ids = bulk_ids
+        self.path_params = tuple(
+            field
+            for _, field, _, _ in string.Formatter().parse(path)
+            if field is not None
+        )
+        # Parsers per status code for every combination of lazy and fast
+        self._parsers = {
+            (lazy, fast): {
+                status_code: _make_parser(response_type, lazy, fast)
+                for status_code, response_type in self.responses.items()
+            }
+            for lazy in (False, True)
+            for fast in (False, True)
+        }
+
+    def __repr__(self):
+        return f"Operation({self.name!r}, {self.method!r}, {self.path!r})"
+
+    @property
+    def page_param(self) -> Optional[str]:
+        """Name of the page number parameter or ``None`` if the operation is not paginated"""
+        return "page" if self.paginated else None
+
+    @property
+    def per_page_param(self) -> Optional[str]:
+        """Name of the page size parameter or ``None`` if the operation is not paginated"""
+        for name in PER_PAGE_PARAMS:
+            if name in self.params:
+                return name
+        return None
+
+    @property
+    def paginated(self) -> bool:
+        """Whether results are returned in pages selected by a page number and size"""
+        return "page" in self.params and self.per_page_param is not None
+
+    @property
+    def accepts_since(self) -> bool:
+        """Whether the operation can be limited to changes after a ``since`` timestamp"""
+        return "since" in self.params
+
+    @property
+    def cacheable(self) -> bool:
+        """Whether responses can be cached, i.e. the operation is read only"""
+        return self.read_only
+
+    @property
+    def retryable(self) -> bool:
+        """Whether failed attempts can safely be retried, i.e. the operation is idempotent"""
+        return self.idempotent
+
+    def response_type(self, status_code: int = 200) -> Any:
+        """Return the type the response with ``status_code`` is parsed into, if any"""
+        return self.responses.get(status_code)
+
+    @property
+    def item_type(self) -> Optional[Any]:
+        """Element type if the operation returns a json array, otherwise ``None``"""
+        return _item_type(self.response_type())
+
+    def item_parser(
+        self, lazy: bool = False, fast: bool = False
+    ) -> Callable[[Any], Any]:
+        """Create a function converting a decoded array element into :attr:`item_type`"""
+        return _make_parser(self.item_type, lazy, fast)
+
+    def build_request(
+        self, arguments: Dict[str, Any], headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Create the keyword arguments for ``httpx.Client.request`` from the endpoint arguments
+
+        ``headers`` are sent in addition to the headers of the client.
+        """
+        request: Dict[str, Any] = {"method": self.method}
+        if headers:
+            request["headers"] = headers
+        if self.path_params:
+            request["url"] = self.path.format(
+                **{name: arguments[name] for name in self.path_params}
+            )
+        else:
+            request["url"] = self.path
+        if self.params:
+            request["params"] = {
+                name: arguments[name]
+                for name in self.params
+                if arguments[name] is not None
+            }
+        if self.body == JSON:
+            request["json"] = _dump_json(arguments["json_body"])
+        elif self.body == MULTIPART:
+            multipart_data = self.multipart_model.parse_obj(arguments["multipart_data"])
+            request["data"] = multipart_data.get_data()
+            if hasattr(multipart_data, "get_files"):
+                request["files"] = multipart_data.get_files()
+        elif self.body == FORM:
+            request["data"] = arguments["form_data"]
+        return request
+
+    def parse_response(
+        self, response: httpx.Response, lazy: bool = False, fast: bool = False
+    ) -> Any:
+        """Convert the response into the type declared for its status code
+
+        Args:
+            response: The received response
+            lazy: Create lazy models, see :func:`~matterapi.lazy.lazy_parse_obj`
+            fast: Create fast models, see :func:`~matterapi.fast.fast_parse_obj`
+        """
+        parser = self._parsers[lazy, fast].get(response.status_code)
+        if parser is None:
+            return response
+        return parser(response.json())
+
+    def parses(self, status_code: int) -> bool:
+        """Check if responses with ``status_code`` are converted into a declared type"""
+        return status_code in self.responses
+
+    def parse_content(
+        self, status_code: int, content: bytes, lazy: bool = False, fast: bool = False
+    ) -> Any:
+        """Convert a raw response body with a status code declared in :attr:`responses`"""
+        return self._parsers[lazy, fast][status_code](json.loads(content))
+
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+# States of JsonArrayDecoder, expecting the opening bracket, the first element or the
+# closing bracket, an element, a separator or the closing bracket and nothing but
+# whitespace after the array
+_OPEN, _FIRST, _ELEMENT, _SEPARATOR, _CLOSED = range(5)
+_TRANSITIONS = {
+    (_OPEN, "["): _FIRST,
+    (_FIRST, "]"): _CLOSED,
+    (_SEPARATOR, ","): _ELEMENT,
+    (_SEPARATOR, "]"): _CLOSED,
+}
+
+
+class JsonArrayDecoder:
+    """Incrementally decode the elements of a json array from chunks of bytes
+
+    Only the current element and the undecoded rest of the last chunk are kept in memory,
+    so arbitrarily large arrays can be processed as they are received.
+
+    .. code-block:: python
+
+        decoder = JsonArrayDecoder()
+        for chunk in response.iter_bytes():
+            for element in decoder.feed(chunk):
+                process(element)
+        decoder.close()
+    """
+
+    def __init__(self):
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = _OPEN
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add a chunk of the document and return all elements completed by it"""
+        self._buffer += self._text.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self):
+        """Check that the complete array was received
+
+        Raises:
+            ValueError: If the document is not a complete json array
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        self._drain(final=True)
+        if self._state != _CLOSED:
+            raise ValueError("Incomplete json array")
+
+    def _drain(self, final: bool) -> List[Any]:
+        buffer = self._buffer
+        position = 0
+        elements = []
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == len(buffer):
+                break
+            if self._state == _ELEMENT or (
+                self._state == _FIRST and buffer[position] != "]"
+            ):
+                decoded = self._decode(buffer, position, final)
+                if decoded is None:
+                    break
+                element, position = decoded
+                elements.append(element)
+                self._state = _SEPARATOR
+            else:
+                self._state = self._punctuation(buffer[position])
+                position += 1
+        self._buffer = buffer[position:]
+        return elements
+
+    def _decode(
+        self, buffer: str, position: int, final: bool
+    ) -> Optional[Tuple[Any, int]]:
+        """Decode the element at ``position``, ``None`` if it may be incomplete"""
+        if buffer[position] in ",]":
+            raise ValueError(f"Invalid json array, missing element at {position}")
+        try:
+            element, end = self._decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        # Numbers are only complete once the next character was received,
+        # e.g. ``1.5e`` is decoded as ``1.5`` until the exponent arrives
+        if not final and (end == len(buffer) or buffer[end] in _NUMBER_CHARS):
+            return None
+        return element, end
+
+    def _punctuation(self, char: str) -> int:
+        """Return the state following a bracket or separator"""
+        state = _TRANSITIONS.get((self._state, char))
+        if state is not None:
+            return state
+        if self._state == _OPEN:
+            raise ValueError("Response is not a json array")
+        if self._state == _CLOSED:
+            raise ValueError("Unexpected data after the json array")
+        raise ValueError(f"Invalid json array, unexpected {char!r}")
+
+
+def _dump_json(json_body: Any) -> Any:
+    if isinstance(json_body, BaseModel):
+        return json_body.dict(exclude_unset=True)
+    if isinstance(json_body, list):
+        return [
+            item.dict(exclude_unset=True) if isinstance(item, BaseModel) else item
+            for item in json_body
+        ]
+    return json_body
+
+
+__all__ = [
+    "Operation",
+    "JsonArrayDecoder",
+    "JSON",
+    "MULTIPART",
+    "FORM",
+    "PER_PAGE_PARAMS",
+    "STREAM_CHUNK_SIZE",
+]
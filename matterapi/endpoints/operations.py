@@ -0,0 +1,3313 @@
+""" Registry of all api operations executed by the endpoint classes """
+
+# pylint: disable=too-many-lines
+
+from typing import Any, Dict, List, Optional
+
+from ..models import (
+    AppError,
+    Audit,
+    AutocompleteSuggestion,
+    Bot,
+    Channel,
+    ChannelListWithTeamData,
+    ChannelMember,
+    ChannelMemberWithTeamData,
+    ChannelModeration,
+    ChannelStats,
+    ChannelUnread,
+    ChannelUnreadAt,
+    CheckUserMfaResponse200,
+    CloudCustomer,
+    ClusterInfo,
+    Command,
+    CommandResponse,
+    Compliance,
+    Config,
+    ConfirmCustomerPaymentMultipartData,
+    CreateEmojiMultipartData,
+    DataRetentionPolicyWithTeamAndChannelCounts,
+    Emoji,
+    EnvironmentConfig,
+    FileInfo,
+    FileInfoList,
+    GenerateMfaSecretResponse200,
+    GetDataRetentionPoliciesCountResponse200,
+    GetFileLinkResponse200,
+    GetGroupsAssociatedToChannelsByTeamResponse200,
+    GetGroupStatsResponse200,
+    GetGroupUsersResponse200,
+    GetPluginsResponse200,
+    GetTeamInviteInfoResponse200,
+    GetUsersByGroupChannelIdsResponse200,
+    GlobalDataRetentionPolicy,
+    Group,
+    GroupSyncableChannel,
+    GroupSyncableChannels,
+    GroupSyncableTeam,
+    GroupSyncableTeams,
+    ImportTeamMultipartData,
+    ImportTeamResponse200,
+    IncomingWebhook,
+    IntegrityCheckResult,
+    Invoice,
+    Job,
+    LDAPGroupsPaged,
+    LicenseRenewalLink,
+    MarketplacePlugin,
+    Notice,
+    OAuthApp,
+    OpenGraph,
+    OrderedSidebarCategories,
+    OutgoingWebhook,
+    PaymentSetupIntent,
+    PluginManifest,
+    PluginManifestWebapp,
+    PluginStatus,
+    Post,
+    PostIdToReactionsMap,
+    PostList,
+    PostListWithSearchMatches,
+    PostLogResponse200,
+    Preference,
+    Product,
+    PushNotification,
+    Reaction,
+    RegenCommandTokenResponse200,
+    RemoteClusterInfo,
+    ResetSamlAuthDataToEmailResponse200,
+    RetentionPolicyForChannelList,
+    RetentionPolicyForTeamList,
+    Role,
+    SamlCertificateStatus,
+    Scheme,
+    SearchAllChannelsResponse200,
+    SearchFilesMultipartData,
+    SearchTeamsResponse200,
+    Server_Busy,
+    Session,
+    SetBotIconImageMultipartData,
+    SetProfileImageMultipartData,
+    SetTeamIconMultipartData,
+    SharedChannel,
+    SidebarCategory,
+    Status,
+    StatusOK,
+    Subscription,
+    SubscriptionStats,
+    SwitchAccountTypeResponse200,
+    System,
+    SystemStatusResponse,
+    Team,
+    TeamExists,
+    TeamMember,
+    TeamStats,
+    TeamUnread,
+    TermsOfService,
+    UpgradeToEnterpriseStatusResponse200,
+    UploadBrandImageMultipartData,
+    UploadFileMultipartData,
+    UploadFileResponse201,
+    UploadLdapPrivateCertificateMultipartData,
+    UploadLdapPublicCertificateMultipartData,
+    UploadLicenseFileMultipartData,
+    UploadPluginMultipartData,
+    UploadSamlIdpCertificateMultipartData,
+    UploadSamlPrivateCertificateMultipartData,
+    UploadSamlPublicCertificateMultipartData,
+    UploadSession,
+    User,
+    UserAccessToken,
+    UserAccessTokenSanitized,
+    UserAuthData,
+    UserAutocomplete,
+    UsersStats,
+    UserTermsOfService,
+    UserThreads,
+    ViewChannelResponse200,
+)
+from .engine import FORM, JSON, MULTIPART, Operation
+
+OPERATIONS: Dict[str, Operation] = {
+    operation.name: operation
+    for operation in (
+        # authentication
+        Operation(
+            "migrate_auth_to_ldap",
+            "POST",
+            "/users/migrate_auth/ldap",
+            tags=("authentication", "ldap", "migrate", "users"),
+            body=JSON,
+        ),
+        Operation(
+            "migrate_auth_to_saml",
+            "POST",
+            "/users/migrate_auth/saml",
+            tags=("authentication", "migrate", "saml", "users"),
+            body=JSON,
+        ),
+        # bleve
+        Operation(
+            "purge_bleve_indexes",
+            "POST",
+            "/bleve/purge_indexes",
+            tags=("bleve",),
+            responses={200: StatusOK},
+        ),
+        # bots
+        Operation(
+            "convert_user_to_bot",
+            "POST",
+            "/users/{user_id}/convert_to_bot",
+            tags=("bots", "users"),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_bots",
+            "GET",
+            "/bots",
+            tags=("bots",),
+            params=("page", "per_page", "include_deleted", "only_orphaned"),
+            responses={200: List[Bot]},
+        ),
+        Operation(
+            "create_bot",
+            "POST",
+            "/bots",
+            tags=("bots",),
+            body=JSON,
+            responses={201: Bot},
+        ),
+        Operation(
+            "get_bot",
+            "GET",
+            "/bots/{bot_user_id}",
+            tags=("bots",),
+            params=("include_deleted",),
+            responses={200: Bot},
+        ),
+        Operation(
+            "patch_bot",
+            "PUT",
+            "/bots/{bot_user_id}",
+            tags=("bots",),
+            body=JSON,
+            responses={200: Bot},
+        ),
+        Operation(
+            "disable_bot",
+            "POST",
+            "/bots/{bot_user_id}/disable",
+            tags=("bots",),
+            responses={200: Bot},
+        ),
+        Operation(
+            "enable_bot",
+            "POST",
+            "/bots/{bot_user_id}/enable",
+            tags=("bots",),
+            responses={200: Bot},
+        ),
+        Operation(
+            "assign_bot",
+            "POST",
+            "/bots/{bot_user_id}/assign/{user_id}",
+            tags=("bots",),
+            responses={200: Bot},
+        ),
+        Operation(
+            "get_bot_icon_image", "GET", "/bots/{bot_user_id}/icon", tags=("bots",)
+        ),
+        Operation(
+            "set_bot_icon_image",
+            "POST",
+            "/bots/{bot_user_id}/icon",
+            tags=("bots",),
+            body=MULTIPART,
+            multipart_model=SetBotIconImageMultipartData,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "delete_bot_icon_image",
+            "DELETE",
+            "/bots/{bot_user_id}/icon",
+            tags=("bots",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "convert_bot_to_user",
+            "POST",
+            "/bots/{bot_user_id}/convert_to_user",
+            tags=("bots", "users"),
+            params=("set_system_admin",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        # brand
+        Operation(
+            "get_brand_image",
+            "GET",
+            "/brand/image",
+            tags=("brand",),
+            responses={200: Any},
+        ),
+        Operation(
+            "upload_brand_image",
+            "POST",
+            "/brand/image",
+            tags=("brand",),
+            body=MULTIPART,
+            multipart_model=UploadBrandImageMultipartData,
+            responses={201: StatusOK},
+        ),
+        Operation(
+            "delete_brand_image",
+            "DELETE",
+            "/brand/image",
+            tags=("brand",),
+            responses={200: StatusOK},
+        ),
+        # channels
+        Operation(
+            "get_all_channels",
+            "GET",
+            "/channels",
+            tags=("channels",),
+            params=(
+                "not_associated_to_group",
+                "page",
+                "per_page",
+                "exclude_default_channels",
+                "include_deleted",
+                "include_total_count",
+                "exclude_policy_constrained",
+            ),
+            responses={200: ChannelListWithTeamData},
+        ),
+        Operation(
+            "create_channel",
+            "POST",
+            "/channels",
+            tags=("channels",),
+            body=JSON,
+            responses={201: Channel},
+        ),
+        Operation(
+            "create_direct_channel",
+            "POST",
+            "/channels/direct",
+            tags=("channels",),
+            body=JSON,
+            responses={201: Channel},
+        ),
+        Operation(
+            "create_group_channel",
+            "POST",
+            "/channels/group",
+            tags=("channels",),
+            body=JSON,
+            responses={201: Channel},
+        ),
+        Operation(
+            "search_all_channels",
+            "POST",
+            "/channels/search",
+            tags=("channels",),
+            params=("system_console",),
+            body=JSON,
+            responses={200: SearchAllChannelsResponse200},
+            read_only=True,
+        ),
+        Operation(
+            "search_group_channels",
+            "POST",
+            "/channels/group/search",
+            tags=("channels",),
+            body=JSON,
+            responses={200: List[Channel]},
+            read_only=True,
+        ),
+        Operation(
+            "get_public_channels_by_ids_for_team",
+            "POST",
+            "/teams/{team_id}/channels/ids",
+            tags=("channels",),
+            body=JSON,
+            responses={200: List[Channel]},
+            read_only=True,
+            bulk_ids=True,
+        ),
+        Operation(
+            "get_channel_members_timezones",
+            "GET",
+            "/channels/{channel_id}/timezones",
+            tags=("channels",),
+            responses={200: List[str]},
+        ),
+        Operation(
+            "get_channel",
+            "GET",
+            "/channels/{channel_id}",
+            tags=("channels",),
+            responses={200: Channel},
+        ),
+        Operation(
+            "update_channel",
+            "PUT",
+            "/channels/{channel_id}",
+            tags=("channels",),
+            body=JSON,
+            responses={200: Channel},
+        ),
+        Operation(
+            "delete_channel",
+            "DELETE",
+            "/channels/{channel_id}",
+            tags=("channels",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "patch_channel",
+            "PUT",
+            "/channels/{channel_id}/patch",
+            tags=("channels",),
+            body=JSON,
+            responses={200: Channel},
+        ),
+        Operation(
+            "update_channel_privacy",
+            "PUT",
+            "/channels/{channel_id}/privacy",
+            tags=("channels",),
+            body=JSON,
+            responses={200: Channel},
+        ),
+        Operation(
+            "restore_channel",
+            "POST",
+            "/channels/{channel_id}/restore",
+            tags=("channels",),
+            responses={200: Channel},
+        ),
+        Operation(
+            "move_channel",
+            "POST",
+            "/channels/{channel_id}/move",
+            tags=("channels",),
+            body=JSON,
+            responses={200: Channel},
+        ),
+        Operation(
+            "get_channel_stats",
+            "GET",
+            "/channels/{channel_id}/stats",
+            tags=("channels",),
+            responses={200: ChannelStats},
+        ),
+        Operation(
+            "get_pinned_posts",
+            "GET",
+            "/channels/{channel_id}/pinned",
+            tags=("channels",),
+            responses={200: PostList},
+        ),
+        Operation(
+            "get_public_channels_for_team",
+            "GET",
+            "/teams/{team_id}/channels",
+            tags=("channels",),
+            params=("page", "per_page"),
+            responses={200: List[Channel]},
+        ),
+        Operation(
+            "get_private_channels_for_team",
+            "GET",
+            "/teams/{team_id}/channels/private",
+            tags=("channels",),
+            params=("page", "per_page"),
+            responses={200: List[Channel]},
+        ),
+        Operation(
+            "get_deleted_channels_for_team",
+            "GET",
+            "/teams/{team_id}/channels/deleted",
+            tags=("channels",),
+            params=("page", "per_page"),
+            responses={200: List[Channel]},
+        ),
+        Operation(
+            "autocomplete_channels_for_team",
+            "GET",
+            "/teams/{team_id}/channels/autocomplete",
+            tags=("channels",),
+            params=("name",),
+            responses={200: List[Channel]},
+        ),
+        Operation(
+            "autocomplete_channels_for_team_for_search",
+            "GET",
+            "/teams/{team_id}/channels/search_autocomplete",
+            tags=("channels",),
+            params=("name",),
+            responses={200: List[Channel]},
+        ),
+        Operation(
+            "search_channels",
+            "POST",
+            "/teams/{team_id}/channels/search",
+            tags=("channels",),
+            body=JSON,
+            responses={201: List[Channel]},
+            read_only=True,
+        ),
+        Operation(
+            "search_archived_channels",
+            "POST",
+            "/teams/{team_id}/channels/search_archived",
+            tags=("channels",),
+            body=JSON,
+            responses={201: List[Channel]},
+            read_only=True,
+        ),
+        Operation(
+            "get_channel_by_name",
+            "GET",
+            "/teams/{team_id}/channels/name/{channel_name}",
+            tags=("channels",),
+            params=("include_deleted",),
+            responses={200: Channel},
+        ),
+        Operation(
+            "get_channel_by_name_for_team_name",
+            "GET",
+            "/teams/name/{team_name}/channels/name/{channel_name}",
+            tags=("channels",),
+            params=("include_deleted",),
+            responses={200: Channel},
+        ),
+        Operation(
+            "get_channel_members",
+            "GET",
+            "/channels/{channel_id}/members",
+            tags=("channels",),
+            params=("page", "per_page"),
+            responses={200: List[ChannelMember]},
+        ),
+        Operation(
+            "add_channel_member",
+            "POST",
+            "/channels/{channel_id}/members",
+            tags=("channels",),
+            body=JSON,
+            responses={201: ChannelMember},
+        ),
+        Operation(
+            "get_channel_members_by_ids",
+            "POST",
+            "/channels/{channel_id}/members/ids",
+            tags=("channels",),
+            body=JSON,
+            responses={200: List[ChannelMember]},
+            read_only=True,
+            bulk_ids=True,
+        ),
+        Operation(
+            "get_channel_member",
+            "GET",
+            "/channels/{channel_id}/members/{user_id}",
+            tags=("channels",),
+            responses={200: ChannelMember},
+        ),
+        Operation(
+            "remove_user_from_channel",
+            "DELETE",
+            "/channels/{channel_id}/members/{user_id}",
+            tags=("channels",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "update_channel_roles",
+            "PUT",
+            "/channels/{channel_id}/members/{user_id}/roles",
+            tags=("channels",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "update_channel_member_scheme_roles",
+            "PUT",
+            "/channels/{channel_id}/members/{user_id}/schemeRoles",
+            tags=("channels",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "update_channel_notify_props",
+            "PUT",
+            "/channels/{channel_id}/members/{user_id}/notify_props",
+            tags=("channels",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "view_channel",
+            "POST",
+            "/channels/members/{user_id}/view",
+            tags=("channels",),
+            body=JSON,
+            responses={200: ViewChannelResponse200},
+        ),
+        Operation(
+            "get_channel_members_for_user",
+            "GET",
+            "/users/{user_id}/teams/{team_id}/channels/members",
+            tags=("channels",),
+            responses={200: List[ChannelMember]},
+        ),
+        Operation(
+            "get_channels_for_team_for_user",
+            "GET",
+            "/users/{user_id}/teams/{team_id}/channels",
+            tags=("channels",),
+            params=("include_deleted", "last_delete_at"),
+            responses={200: List[Channel]},
+        ),
+        Operation(
+            "get_channels_for_user",
+            "GET",
+            "/users/{user_id}/channels",
+            tags=("channels",),
+            params=("last_delete_at", "include_deleted"),
+            responses={200: List[Channel]},
+        ),
+        Operation(
+            "get_channel_unread",
+            "GET",
+            "/users/{user_id}/channels/{channel_id}/unread",
+            tags=("channels",),
+            responses={200: ChannelUnread},
+        ),
+        Operation(
+            "update_channel_scheme",
+            "PUT",
+            "/channels/{channel_id}/scheme",
+            tags=("channels",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "channel_members_minus_group_members",
+            "GET",
+            "/channels/{channel_id}/members_minus_group_members",
+            tags=("channels",),
+            params=("group_ids", "page", "per_page"),
+        ),
+        Operation(
+            "get_channel_member_counts_by_group",
+            "GET",
+            "/channels/{channel_id}/member_counts_by_group",
+            tags=("channels",),
+            params=("include_timezones",),
+        ),
+        Operation(
+            "get_channel_moderations",
+            "GET",
+            "/channels/{channel_id}/moderations",
+            tags=("channels",),
+            responses={200: List[ChannelModeration]},
+        ),
+        Operation(
+            "patch_channel_moderations",
+            "PUT",
+            "/channels/{channel_id}/moderations/patch",
+            tags=("channels",),
+            body=JSON,
+            responses={200: List[ChannelModeration]},
+        ),
+        Operation(
+            "get_sidebar_categories_for_team_for_user",
+            "GET",
+            "/users/{user_id}/teams/{team_id}/channels/categories",
+            tags=("channels",),
+            responses={200: List[OrderedSidebarCategories]},
+        ),
+        Operation(
+            "update_sidebar_categories_for_team_for_user",
+            "PUT",
+            "/users/{user_id}/teams/{team_id}/channels/categories",
+            tags=("channels",),
+            body=JSON,
+            responses={200: SidebarCategory},
+        ),
+        Operation(
+            "create_sidebar_category_for_team_for_user",
+            "POST",
+            "/users/{user_id}/teams/{team_id}/channels/categories",
+            tags=("channels",),
+            body=JSON,
+            responses={200: SidebarCategory},
+        ),
+        Operation(
+            "get_sidebar_category_order_for_team_for_user",
+            "GET",
+            "/users/{user_id}/teams/{team_id}/channels/categories/order",
+            tags=("channels",),
+            responses={200: List[str]},
+        ),
+        Operation(
+            "update_sidebar_category_order_for_team_for_user",
+            "PUT",
+            "/users/{user_id}/teams/{team_id}/channels/categories/order",
+            tags=("channels",),
+            body=JSON,
+            responses={200: List[str]},
+        ),
+        Operation(
+            "get_sidebar_category_for_team_for_user",
+            "GET",
+            "/users/{user_id}/teams/{team_id}/channels/categories/{category_id}",
+            tags=("channels",),
+            responses={200: SidebarCategory},
+        ),
+        Operation(
+            "update_sidebar_category_for_team_for_user",
+            "PUT",
+            "/users/{user_id}/teams/{team_id}/channels/categories/{category_id}",
+            tags=("channels",),
+            body=JSON,
+            responses={200: SidebarCategory},
+        ),
+        Operation(
+            "remove_sidebar_category_for_team_for_user",
+            "DELETE",
+            "/users/{user_id}/teams/{team_id}/channels/categories/{category_id}",
+            tags=("channels",),
+            responses={200: SidebarCategory},
+        ),
+        # cloud
+        Operation(
+            "get_cloud_products",
+            "GET",
+            "/cloud/products",
+            tags=("cloud",),
+            responses={200: List[Product]},
+        ),
+        Operation(
+            "create_customer_payment",
+            "POST",
+            "/cloud/payment",
+            tags=("cloud",),
+            responses={201: PaymentSetupIntent},
+        ),
+        Operation(
+            "confirm_customer_payment",
+            "POST",
+            "/cloud/payment/confirm",
+            tags=("cloud",),
+            body=MULTIPART,
+            multipart_model=ConfirmCustomerPaymentMultipartData,
+        ),
+        Operation(
+            "get_cloud_customer",
+            "GET",
+            "/cloud/customer",
+            tags=("cloud",),
+            responses={200: CloudCustomer},
+        ),
+        Operation(
+            "update_cloud_customer",
+            "PUT",
+            "/cloud/customer",
+            tags=("cloud",),
+            body=JSON,
+            responses={200: CloudCustomer},
+        ),
+        Operation(
+            "update_cloud_customer_address",
+            "PUT",
+            "/cloud/customer/address",
+            tags=("cloud",),
+            body=JSON,
+            responses={200: CloudCustomer},
+        ),
+        Operation(
+            "get_subscription",
+            "GET",
+            "/cloud/subscription",
+            tags=("cloud",),
+            responses={200: Subscription},
+        ),
+        Operation(
+            "get_invoices_for_subscription",
+            "GET",
+            "/cloud/subscription/invoices",
+            tags=("cloud",),
+            responses={200: List[Invoice]},
+        ),
+        Operation(
+            "get_invoice_for_subscription_as_pdf",
+            "GET",
+            "/cloud/subscription/invoices/{invoice_id}/pdf",
+            tags=("cloud",),
+        ),
+        Operation(
+            "post_endpoint_for_cws_webhooks", "POST", "/cloud/webhook", tags=("cloud",)
+        ),
+        Operation(
+            "get_subscription_stats",
+            "GET",
+            "/cloud/subscription/stats",
+            tags=("cloud",),
+            responses={200: SubscriptionStats},
+        ),
+        Operation(
+            "send_admin_upgrade_request_email",
+            "POST",
+            "/cloud/subscription/limitreached/invite",
+            tags=("cloud",),
+        ),
+        Operation(
+            "send_admin_upgrade_request_email_on_join",
+            "POST",
+            "/cloud/subscription/limitreached/join",
+            tags=("cloud",),
+        ),
+        # cluster
+        Operation(
+            "get_cluster_status",
+            "GET",
+            "/cluster/status",
+            tags=("cluster",),
+            responses={200: List[ClusterInfo]},
+        ),
+        # commands
+        Operation(
+            "list_commands",
+            "GET",
+            "/commands",
+            tags=("commands",),
+            params=("team_id", "custom_only"),
+            responses={200: List[Command]},
+        ),
+        Operation(
+            "create_command",
+            "POST",
+            "/commands",
+            tags=("commands",),
+            body=JSON,
+            responses={201: Command},
+        ),
+        Operation(
+            "list_autocomplete_commands",
+            "GET",
+            "/teams/{team_id}/commands/autocomplete",
+            tags=("commands",),
+            responses={200: List[Command]},
+        ),
+        Operation(
+            "list_command_autocomplete_suggestions",
+            "GET",
+            "/teams/{team_id}/commands/autocomplete_suggestions",
+            tags=("commands",),
+            params=("user_input",),
+            responses={200: List[AutocompleteSuggestion]},
+        ),
+        Operation(
+            "get_command_by_id",
+            "GET",
+            "/commands/{command_id}",
+            tags=("commands",),
+            responses={200: Command},
+        ),
+        Operation(
+            "update_command",
+            "PUT",
+            "/commands/{command_id}",
+            tags=("commands",),
+            body=JSON,
+            responses={200: Command},
+        ),
+        Operation(
+            "delete_command",
+            "DELETE",
+            "/commands/{command_id}",
+            tags=("commands",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "move_command",
+            "PUT",
+            "/commands/{command_id}/move",
+            tags=("commands",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "regen_command_token",
+            "PUT",
+            "/commands/{command_id}/regen_token",
+            tags=("commands",),
+            responses={200: RegenCommandTokenResponse200},
+            idempotent=False,
+        ),
+        Operation(
+            "execute_command",
+            "POST",
+            "/commands/execute",
+            tags=("commands",),
+            body=JSON,
+            responses={200: CommandResponse},
+        ),
+        # compliance
+        Operation(
+            "get_compliance_reports",
+            "GET",
+            "/compliance/reports",
+            tags=("compliance",),
+            params=("page", "per_page"),
+            responses={200: List[Compliance]},
+        ),
+        Operation(
+            "create_compliance_report",
+            "POST",
+            "/compliance/reports",
+            tags=("compliance",),
+            responses={201: Compliance},
+        ),
+        Operation(
+            "get_compliance_report",
+            "GET",
+            "/compliance/reports/{report_id}",
+            tags=("compliance",),
+            responses={200: Compliance},
+        ),
+        Operation(
+            "download_compliance_report",
+            "GET",
+            "/compliance/reports/{report_id}/download",
+            tags=("compliance",),
+        ),
+        # data_retention
+        Operation(
+            "get_team_policies_for_user",
+            "GET",
+            "/users/{user_id}/data_retention/team_policies",
+            tags=("data_retention",),
+            params=("page", "per_page"),
+            responses={200: RetentionPolicyForTeamList},
+        ),
+        Operation(
+            "get_channel_policies_for_user",
+            "GET",
+            "/users/{user_id}/data_retention/channel_policies",
+            tags=("data_retention",),
+            params=("page", "per_page"),
+            responses={200: RetentionPolicyForChannelList},
+        ),
+        Operation(
+            "get_data_retention_policy",
+            "GET",
+            "/data_retention/policy",
+            tags=("data_retention",),
+            responses={200: GlobalDataRetentionPolicy},
+        ),
+        Operation(
+            "get_data_retention_policies_count",
+            "GET",
+            "/data_retention/policies_count",
+            tags=("data_retention",),
+            responses={200: GetDataRetentionPoliciesCountResponse200},
+        ),
+        Operation(
+            "get_data_retention_policies",
+            "GET",
+            "/data_retention/policies",
+            tags=("data_retention",),
+            params=("page", "per_page"),
+            responses={200: List[DataRetentionPolicyWithTeamAndChannelCounts]},
+        ),
+        Operation(
+            "create_data_retention_policy",
+            "POST",
+            "/data_retention/policies",
+            tags=("data_retention",),
+            body=JSON,
+            responses={201: DataRetentionPolicyWithTeamAndChannelCounts},
+        ),
+        Operation(
+            "get_data_retention_policy_by_id",
+            "GET",
+            "/data_retention/policies/{policy_id}",
+            tags=("data_retention",),
+            responses={200: DataRetentionPolicyWithTeamAndChannelCounts},
+        ),
+        Operation(
+            "delete_data_retention_policy",
+            "DELETE",
+            "/data_retention/policies/{policy_id}",
+            tags=("data_retention",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "patch_data_retention_policy",
+            "PATCH",
+            "/data_retention/policies/{policy_id}",
+            tags=("data_retention",),
+            body=JSON,
+            responses={200: DataRetentionPolicyWithTeamAndChannelCounts},
+        ),
+        Operation(
+            "get_teams_for_retention_policy",
+            "GET",
+            "/data_retention/policies/{policy_id}/teams",
+            tags=("data_retention",),
+            params=("page", "per_page"),
+            responses={200: List[Team]},
+        ),
+        Operation(
+            "add_teams_to_retention_policy",
+            "POST",
+            "/data_retention/policies/{policy_id}/teams",
+            tags=("data_retention",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "remove_teams_from_retention_policy",
+            "DELETE",
+            "/data_retention/policies/{policy_id}/teams",
+            tags=("data_retention",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "search_teams_for_retention_policy",
+            "POST",
+            "/data_retention/policies/{policy_id}/teams/search",
+            tags=("data_retention",),
+            body=JSON,
+            responses={200: List[Team]},
+            read_only=True,
+        ),
+        Operation(
+            "get_channels_for_retention_policy",
+            "GET",
+            "/data_retention/policies/{policy_id}/channels",
+            tags=("data_retention",),
+            params=("page", "per_page"),
+            responses={200: ChannelListWithTeamData},
+        ),
+        Operation(
+            "add_channels_to_retention_policy",
+            "POST",
+            "/data_retention/policies/{policy_id}/channels",
+            tags=("data_retention",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "remove_channels_from_retention_policy",
+            "DELETE",
+            "/data_retention/policies/{policy_id}/channels",
+            tags=("data_retention",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "search_channels_for_retention_policy",
+            "POST",
+            "/data_retention/policies/{policy_id}/channels/search",
+            tags=("data_retention",),
+            body=JSON,
+            responses={200: ChannelListWithTeamData},
+            read_only=True,
+        ),
+        # elasticsearch
+        Operation(
+            "test_elasticsearch",
+            "POST",
+            "/elasticsearch/test",
+            tags=("elasticsearch",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "purge_elasticsearch_indexes",
+            "POST",
+            "/elasticsearch/purge_indexes",
+            tags=("elasticsearch",),
+            responses={200: StatusOK},
+        ),
+        # emoji
+        Operation(
+            "get_emoji_list",
+            "GET",
+            "/emoji",
+            tags=("emoji",),
+            params=("page", "per_page", "sort"),
+            responses={200: Emoji},
+        ),
+        Operation(
+            "create_emoji",
+            "POST",
+            "/emoji",
+            tags=("emoji",),
+            body=MULTIPART,
+            multipart_model=CreateEmojiMultipartData,
+            responses={201: Emoji},
+        ),
+        Operation(
+            "get_emoji",
+            "GET",
+            "/emoji/{emoji_id}",
+            tags=("emoji",),
+            responses={200: Emoji},
+        ),
+        Operation(
+            "delete_emoji",
+            "DELETE",
+            "/emoji/{emoji_id}",
+            tags=("emoji",),
+            responses={200: Emoji},
+        ),
+        Operation(
+            "get_emoji_by_name",
+            "GET",
+            "/emoji/name/{emoji_name}",
+            tags=("emoji",),
+            responses={200: Emoji},
+        ),
+        Operation("get_emoji_image", "GET", "/emoji/{emoji_id}/image", tags=("emoji",)),
+        Operation(
+            "search_emoji",
+            "POST",
+            "/emoji/search",
+            tags=("emoji",),
+            body=JSON,
+            responses={200: List[Emoji]},
+            read_only=True,
+        ),
+        Operation(
+            "autocomplete_emoji",
+            "GET",
+            "/emoji/autocomplete",
+            tags=("emoji",),
+            params=("name",),
+            responses={200: Emoji},
+        ),
+        # exports
+        Operation("list_exports", "GET", "/exports", tags=("exports",)),
+        Operation(
+            "download_export", "GET", "/exports/{export_name}", tags=("exports",)
+        ),
+        Operation(
+            "delete_export", "DELETE", "/exports/{export_name}", tags=("exports",)
+        ),
+        # files
+        Operation(
+            "upload_file",
+            "POST",
+            "/files",
+            tags=("files",),
+            params=("channel_id", "filename"),
+            body=MULTIPART,
+            multipart_model=UploadFileMultipartData,
+            responses={201: UploadFileResponse201},
+        ),
+        Operation("get_file", "GET", "/files/{file_id}", tags=("files",)),
+        Operation(
+            "get_file_thumbnail", "GET", "/files/{file_id}/thumbnail", tags=("files",)
+        ),
+        Operation(
+            "get_file_preview", "GET", "/files/{file_id}/preview", tags=("files",)
+        ),
+        Operation(
+            "get_file_link",
+            "GET",
+            "/files/{file_id}/link",
+            tags=("files",),
+            responses={200: GetFileLinkResponse200},
+        ),
+        Operation(
+            "get_file_info",
+            "GET",
+            "/files/{file_id}/info",
+            tags=("files",),
+            responses={200: FileInfo},
+        ),
+        Operation(
+            "get_file_public",
+            "GET",
+            "/files/{file_id}/public",
+            tags=("files",),
+            params=("h",),
+        ),
+        Operation(
+            "search_files",
+            "POST",
+            "/teams/{team_id}/files/search",
+            tags=("files", "search", "teams"),
+            body=MULTIPART,
+            multipart_model=SearchFilesMultipartData,
+            responses={200: FileInfoList},
+            read_only=True,
+        ),
+        # groups
+        Operation(
+            "unlink_ldap_group",
+            "DELETE",
+            "/ldap/groups/{remote_id}/link",
+            tags=("groups",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_groups",
+            "GET",
+            "/groups",
+            tags=("groups",),
+            params=(
+                "page",
+                "per_page",
+                "q",
+                "include_member_count",
+                "not_associated_to_team",
+                "not_associated_to_channel",
+                "since",
+                "filter_allow_reference",
+            ),
+            responses={200: List[Group]},
+        ),
+        Operation("create_group", "POST", "/groups", tags=("groups",), body=JSON),
+        Operation(
+            "get_group",
+            "GET",
+            "/groups/{group_id}",
+            tags=("groups",),
+            responses={200: Group},
+        ),
+        Operation(
+            "delete_group",
+            "DELETE",
+            "/groups/{group_id}",
+            tags=("groups",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "patch_group",
+            "PUT",
+            "/groups/{group_id}/patch",
+            tags=("groups",),
+            body=JSON,
+            responses={200: Group},
+        ),
+        Operation(
+            "link_group_syncable_for_team",
+            "POST",
+            "/groups/{group_id}/teams/{team_id}/link",
+            tags=("groups",),
+            responses={201: GroupSyncableTeam},
+        ),
+        Operation(
+            "unlink_group_syncable_for_team",
+            "DELETE",
+            "/groups/{group_id}/teams/{team_id}/link",
+            tags=("groups",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "link_group_syncable_for_channel",
+            "POST",
+            "/groups/{group_id}/channels/{channel_id}/link",
+            tags=("groups",),
+            responses={201: GroupSyncableChannel},
+        ),
+        Operation(
+            "unlink_group_syncable_for_channel",
+            "DELETE",
+            "/groups/{group_id}/channels/{channel_id}/link",
+            tags=("groups",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_group_syncable_for_team_id",
+            "GET",
+            "/groups/{group_id}/teams/{team_id}",
+            tags=("groups",),
+            responses={200: GroupSyncableTeam},
+        ),
+        Operation(
+            "get_group_syncable_for_channel_id",
+            "GET",
+            "/groups/{group_id}/channels/{channel_id}",
+            tags=("groups",),
+            responses={200: GroupSyncableChannel},
+        ),
+        Operation(
+            "get_group_syncables_teams",
+            "GET",
+            "/groups/{group_id}/teams",
+            tags=("groups",),
+            responses={200: List[GroupSyncableTeams]},
+        ),
+        Operation(
+            "get_group_syncables_channels",
+            "GET",
+            "/groups/{group_id}/channels",
+            tags=("groups",),
+            responses={200: List[GroupSyncableChannels]},
+        ),
+        Operation(
+            "patch_group_syncable_for_team",
+            "PUT",
+            "/groups/{group_id}/teams/{team_id}/patch",
+            tags=("groups",),
+            body=JSON,
+            responses={200: GroupSyncableTeam},
+        ),
+        Operation(
+            "patch_group_syncable_for_channel",
+            "PUT",
+            "/groups/{group_id}/channels/{channel_id}/patch",
+            tags=("groups",),
+            body=JSON,
+            responses={200: GroupSyncableChannel},
+        ),
+        Operation(
+            "get_group_users",
+            "GET",
+            "/groups/{group_id}/members",
+            tags=("groups",),
+            params=("page", "per_page"),
+            responses={200: GetGroupUsersResponse200},
+        ),
+        Operation(
+            "add_group_members",
+            "POST",
+            "/groups/{group_id}/members",
+            tags=("groups",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "delete_group_members",
+            "DELETE",
+            "/groups/{group_id}/members",
+            tags=("groups",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_group_stats",
+            "GET",
+            "/groups/{group_id}/stats",
+            tags=("groups",),
+            responses={200: GetGroupStatsResponse200},
+        ),
+        Operation(
+            "get_groups_by_channel",
+            "GET",
+            "/channels/{channel_id}/groups",
+            tags=("groups",),
+            params=("page", "per_page", "filter_allow_reference"),
+            responses={200: List[Group]},
+        ),
+        Operation(
+            "get_groups_by_team",
+            "GET",
+            "/teams/{team_id}/groups",
+            tags=("groups",),
+            params=("page", "per_page", "filter_allow_reference"),
+            responses={200: List[Group]},
+        ),
+        Operation(
+            "get_groups_associated_to_channels_by_team",
+            "GET",
+            "/teams/{team_id}/groups_by_channels",
+            tags=("groups",),
+            params=("page", "per_page", "filter_allow_reference", "paginate"),
+            responses={200: GetGroupsAssociatedToChannelsByTeamResponse200},
+        ),
+        Operation(
+            "get_groups_by_user_id",
+            "GET",
+            "/users/{user_id}/groups",
+            tags=("groups",),
+            responses={200: List[Group]},
+        ),
+        # imports
+        Operation("list_imports", "GET", "/imports", tags=("imports",)),
+        # integration_actions
+        Operation(
+            "open_interactive_dialog",
+            "POST",
+            "/actions/dialogs/open",
+            tags=("integration_actions",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "submit_interactive_dialog",
+            "POST",
+            "/actions/dialogs/submit",
+            tags=("integration_actions",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        # jobs
+        Operation(
+            "get_jobs",
+            "GET",
+            "/jobs",
+            tags=("jobs",),
+            params=("page", "per_page"),
+            responses={200: List[Job]},
+        ),
+        Operation(
+            "create_job",
+            "POST",
+            "/jobs",
+            tags=("jobs",),
+            body=JSON,
+            responses={201: Job},
+        ),
+        Operation(
+            "get_job", "GET", "/jobs/{job_id}", tags=("jobs",), responses={200: Job}
+        ),
+        Operation("download_job", "GET", "/jobs/{job_id}/download", tags=("jobs",)),
+        Operation(
+            "cancel_job",
+            "POST",
+            "/jobs/{job_id}/cancel",
+            tags=("jobs",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_jobs_by_type",
+            "GET",
+            "/jobs/type/{type}",
+            tags=("jobs",),
+            params=("page", "per_page"),
+            responses={200: List[Job]},
+        ),
+        # ldap
+        Operation(
+            "sync_ldap", "POST", "/ldap/sync", tags=("ldap",), responses={200: StatusOK}
+        ),
+        Operation(
+            "test_ldap", "POST", "/ldap/test", tags=("ldap",), responses={200: StatusOK}
+        ),
+        Operation(
+            "get_ldap_groups",
+            "GET",
+            "/ldap/groups",
+            tags=("ldap",),
+            params=("q", "page", "per_page"),
+            responses={200: List[LDAPGroupsPaged]},
+        ),
+        Operation(
+            "link_ldap_group",
+            "POST",
+            "/ldap/groups/{remote_id}/link",
+            tags=("ldap",),
+            responses={201: StatusOK},
+        ),
+        Operation(
+            "migrate_id_ldap",
+            "POST",
+            "/ldap/migrateid",
+            tags=("ldap",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "upload_ldap_public_certificate",
+            "POST",
+            "/ldap/certificate/public",
+            tags=("ldap",),
+            body=MULTIPART,
+            multipart_model=UploadLdapPublicCertificateMultipartData,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "delete_ldap_public_certificate",
+            "DELETE",
+            "/ldap/certificate/public",
+            tags=("ldap",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "upload_ldap_private_certificate",
+            "POST",
+            "/ldap/certificate/private",
+            tags=("ldap",),
+            body=MULTIPART,
+            multipart_model=UploadLdapPrivateCertificateMultipartData,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "delete_ldap_private_certificate",
+            "DELETE",
+            "/ldap/certificate/private",
+            tags=("ldap",),
+            responses={200: StatusOK},
+        ),
+        # oauth
+        Operation(
+            "get_oauth_apps",
+            "GET",
+            "/oauth/apps",
+            tags=("oauth",),
+            params=("page", "per_page"),
+            responses={200: List[OAuthApp]},
+        ),
+        Operation(
+            "create_oauth_app",
+            "POST",
+            "/oauth/apps",
+            tags=("oauth",),
+            body=JSON,
+            responses={201: OAuthApp},
+        ),
+        Operation(
+            "get_oauth_app",
+            "GET",
+            "/oauth/apps/{app_id}",
+            tags=("oauth",),
+            responses={200: OAuthApp},
+        ),
+        Operation(
+            "update_oauth_app",
+            "PUT",
+            "/oauth/apps/{app_id}",
+            tags=("oauth",),
+            body=JSON,
+            responses={200: OAuthApp},
+        ),
+        Operation(
+            "delete_oauth_app",
+            "DELETE",
+            "/oauth/apps/{app_id}",
+            tags=("oauth",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "regenerate_oauth_app_secret",
+            "POST",
+            "/oauth/apps/{app_id}/regen_secret",
+            tags=("oauth",),
+            responses={200: OAuthApp},
+        ),
+        Operation(
+            "get_oauth_app_info",
+            "GET",
+            "/oauth/apps/{app_id}/info",
+            tags=("oauth",),
+            responses={200: OAuthApp},
+        ),
+        Operation(
+            "get_authorized_oauth_apps_for_user",
+            "GET",
+            "/users/{user_id}/oauth/apps/authorized",
+            tags=("oauth",),
+            params=("page", "per_page"),
+            responses={200: List[OAuthApp]},
+        ),
+        # open_graph
+        Operation(
+            "open_graph",
+            "POST",
+            "/opengraph",
+            tags=("open_graph",),
+            body=JSON,
+            responses={200: OpenGraph},
+        ),
+        # permissions
+        Operation(
+            "get_ancillary_permissions",
+            "GET",
+            "/permissions/ancillary",
+            tags=("permissions",),
+            params=("subsection_permissions",),
+            responses={200: List[str]},
+        ),
+        # plugins
+        Operation(
+            "get_plugins",
+            "GET",
+            "/plugins",
+            tags=("plugins",),
+            responses={200: GetPluginsResponse200},
+        ),
+        Operation(
+            "upload_plugin",
+            "POST",
+            "/plugins",
+            tags=("plugins",),
+            body=MULTIPART,
+            multipart_model=UploadPluginMultipartData,
+            responses={201: StatusOK},
+        ),
+        Operation(
+            "install_plugin_from_url",
+            "POST",
+            "/plugins/install_from_url",
+            tags=("plugins",),
+            params=("plugin_download_url", "force"),
+            responses={201: StatusOK},
+        ),
+        Operation(
+            "remove_plugin",
+            "DELETE",
+            "/plugins/{plugin_id}",
+            tags=("plugins",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "enable_plugin",
+            "POST",
+            "/plugins/{plugin_id}/enable",
+            tags=("plugins",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "disable_plugin",
+            "POST",
+            "/plugins/{plugin_id}/disable",
+            tags=("plugins",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_webapp_plugins",
+            "GET",
+            "/plugins/webapp",
+            tags=("plugins",),
+            responses={200: List[PluginManifestWebapp]},
+        ),
+        Operation(
+            "get_plugin_statuses",
+            "GET",
+            "/plugins/statuses",
+            tags=("plugins",),
+            responses={200: List[PluginStatus]},
+        ),
+        Operation(
+            "get_marketplace_plugins",
+            "GET",
+            "/plugins/marketplace",
+            tags=("plugins",),
+            params=("page", "per_page", "filter", "server_version", "local_only"),
+            responses={200: List[MarketplacePlugin]},
+        ),
+        Operation(
+            "install_marketplace_plugin",
+            "POST",
+            "/plugins/marketplace",
+            tags=("plugins",),
+            body=JSON,
+            responses={200: PluginManifest},
+        ),
+        Operation(
+            "get_marketplace_visited_by_admin",
+            "GET",
+            "/plugins/marketplace/first_admin_visit",
+            tags=("plugins",),
+            responses={200: System},
+        ),
+        # posts
+        Operation(
+            "create_post",
+            "POST",
+            "/posts",
+            tags=("posts",),
+            params=("set_online",),
+            body=JSON,
+            responses={201: Post},
+        ),
+        Operation(
+            "create_post_ephemeral",
+            "POST",
+            "/posts/ephemeral",
+            tags=("posts",),
+            body=JSON,
+            responses={201: Post},
+        ),
+        Operation(
+            "get_post",
+            "GET",
+            "/posts/{post_id}",
+            tags=("posts",),
+            responses={200: Post},
+        ),
+        Operation(
+            "update_post",
+            "PUT",
+            "/posts/{post_id}",
+            tags=("posts",),
+            body=JSON,
+            responses={200: Post},
+        ),
+        Operation(
+            "delete_post",
+            "DELETE",
+            "/posts/{post_id}",
+            tags=("posts",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "set_post_unread",
+            "POST",
+            "/users/{user_id}/posts/{post_id}/set_unread",
+            tags=("posts",),
+            responses={200: ChannelUnreadAt},
+        ),
+        Operation(
+            "patch_post",
+            "PUT",
+            "/posts/{post_id}/patch",
+            tags=("posts",),
+            body=JSON,
+            responses={200: Post},
+        ),
+        Operation(
+            "get_post_thread",
+            "GET",
+            "/posts/{post_id}/thread",
+            tags=("posts",),
+            responses={200: PostList},
+        ),
+        Operation(
+            "get_flagged_posts_for_user",
+            "GET",
+            "/users/{user_id}/posts/flagged",
+            tags=("posts",),
+            params=("team_id", "channel_id", "page", "per_page"),
+            responses={200: List[PostList]},
+        ),
+        Operation(
+            "get_file_infos_for_post",
+            "GET",
+            "/posts/{post_id}/files/info",
+            tags=("posts",),
+            responses={200: List[FileInfo]},
+        ),
+        Operation(
+            "get_posts_for_channel",
+            "GET",
+            "/channels/{channel_id}/posts",
+            tags=("posts",),
+            params=("page", "per_page", "since", "before", "after"),
+            responses={200: PostList},
+        ),
+        Operation(
+            "get_posts_around_last_unread",
+            "GET",
+            "/users/{user_id}/channels/{channel_id}/posts/unread",
+            tags=("posts",),
+            params=(
+                "limit_before",
+                "limit_after",
+                "skipFetchThreads",
+                "collapsedThreads",
+                "collapsedThreadsExtended",
+            ),
+            responses={200: PostList},
+        ),
+        Operation(
+            "search_posts",
+            "POST",
+            "/teams/{team_id}/posts/search",
+            tags=("posts",),
+            body=JSON,
+            responses={200: PostListWithSearchMatches},
+            read_only=True,
+        ),
+        Operation(
+            "pin_post",
+            "POST",
+            "/posts/{post_id}/pin",
+            tags=("posts",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "unpin_post",
+            "POST",
+            "/posts/{post_id}/unpin",
+            tags=("posts",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "do_post_action",
+            "POST",
+            "/posts/{post_id}/actions/{action_id}",
+            tags=("posts",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_posts_by_ids",
+            "POST",
+            "/posts/ids",
+            tags=("posts",),
+            body=JSON,
+            responses={200: List[Post]},
+            read_only=True,
+            bulk_ids=True,
+        ),
+        # preferences
+        Operation(
+            "get_preferences",
+            "GET",
+            "/users/{user_id}/preferences",
+            tags=("preferences",),
+            responses={200: List[Preference]},
+        ),
+        Operation(
+            "update_preferences",
+            "PUT",
+            "/users/{user_id}/preferences",
+            tags=("preferences",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "delete_preferences",
+            "POST",
+            "/users/{user_id}/preferences/delete",
+            tags=("preferences",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_preferences_by_category",
+            "GET",
+            "/users/{user_id}/preferences/{category}",
+            tags=("preferences",),
+            responses={200: List[Preference]},
+        ),
+        Operation(
+            "get_preferences_by_category_by_name",
+            "GET",
+            "/users/{user_id}/preferences/{category}/name/{preference_name}",
+            tags=("preferences",),
+            responses={200: Preference},
+        ),
+        # reactions
+        Operation(
+            "save_reaction",
+            "POST",
+            "/reactions",
+            tags=("reactions",),
+            body=JSON,
+            responses={201: Reaction},
+        ),
+        Operation(
+            "get_reactions",
+            "GET",
+            "/posts/{post_id}/reactions",
+            tags=("reactions",),
+            responses={200: List[Reaction]},
+        ),
+        Operation(
+            "delete_reaction",
+            "DELETE",
+            "/users/{user_id}/posts/{post_id}/reactions/{emoji_name}",
+            tags=("reactions",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_bulk_reactions",
+            "POST",
+            "/posts/ids/reactions",
+            tags=("reactions",),
+            body=JSON,
+            responses={200: PostIdToReactionsMap},
+            read_only=True,
+            bulk_ids=True,
+        ),
+        # roles
+        Operation(
+            "get_all_roles",
+            "GET",
+            "/roles",
+            tags=("roles",),
+            responses={200: List[Role]},
+        ),
+        Operation(
+            "get_role",
+            "GET",
+            "/roles/{role_id}",
+            tags=("roles",),
+            responses={200: Role},
+        ),
+        Operation(
+            "get_role_by_name",
+            "GET",
+            "/roles/name/{role_name}",
+            tags=("roles",),
+            responses={200: Role},
+        ),
+        Operation(
+            "patch_role",
+            "PUT",
+            "/roles/{role_id}/patch",
+            tags=("roles",),
+            body=JSON,
+            responses={200: Role},
+        ),
+        Operation(
+            "get_roles_by_names",
+            "POST",
+            "/roles/names",
+            tags=("roles",),
+            body=JSON,
+            responses={200: List[Role]},
+            read_only=True,
+            bulk_ids=True,
+        ),
+        # root
+        Operation(
+            "acknowledge_notification",
+            "POST",
+            "/notifications/ack",
+            tags=("root",),
+            responses={200: PushNotification},
+        ),
+        # saml
+        Operation(
+            "get_saml_metadata",
+            "GET",
+            "/saml/metadata",
+            tags=("saml",),
+            responses={200: Any},
+        ),
+        Operation(
+            "get_saml_metadata_from_idp",
+            "POST",
+            "/saml/metadatafromidp",
+            tags=("saml",),
+            responses={200: Any},
+            read_only=True,
+        ),
+        Operation(
+            "upload_saml_idp_certificate",
+            "POST",
+            "/saml/certificate/idp",
+            tags=("saml",),
+            body=MULTIPART,
+            multipart_model=UploadSamlIdpCertificateMultipartData,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "delete_saml_idp_certificate",
+            "DELETE",
+            "/saml/certificate/idp",
+            tags=("saml",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "upload_saml_public_certificate",
+            "POST",
+            "/saml/certificate/public",
+            tags=("saml",),
+            body=MULTIPART,
+            multipart_model=UploadSamlPublicCertificateMultipartData,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "delete_saml_public_certificate",
+            "DELETE",
+            "/saml/certificate/public",
+            tags=("saml",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "upload_saml_private_certificate",
+            "POST",
+            "/saml/certificate/private",
+            tags=("saml",),
+            body=MULTIPART,
+            multipart_model=UploadSamlPrivateCertificateMultipartData,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "delete_saml_private_certificate",
+            "DELETE",
+            "/saml/certificate/private",
+            tags=("saml",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_saml_certificate_status",
+            "GET",
+            "/saml/certificate/status",
+            tags=("saml",),
+            responses={200: SamlCertificateStatus},
+        ),
+        Operation(
+            "reset_saml_auth_data_to_email",
+            "POST",
+            "/saml/reset_auth_data",
+            tags=("saml",),
+            body=JSON,
+            responses={200: ResetSamlAuthDataToEmailResponse200},
+        ),
+        # schemes
+        Operation(
+            "get_schemes",
+            "GET",
+            "/schemes",
+            tags=("schemes",),
+            params=("scope", "page", "per_page"),
+            responses={200: List[Scheme]},
+        ),
+        Operation(
+            "create_scheme",
+            "POST",
+            "/schemes",
+            tags=("schemes",),
+            body=JSON,
+            responses={201: Scheme},
+        ),
+        Operation(
+            "get_scheme",
+            "GET",
+            "/schemes/{scheme_id}",
+            tags=("schemes",),
+            responses={200: Scheme},
+        ),
+        Operation(
+            "delete_scheme",
+            "DELETE",
+            "/schemes/{scheme_id}",
+            tags=("schemes",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "patch_scheme",
+            "PUT",
+            "/schemes/{scheme_id}/patch",
+            tags=("schemes",),
+            body=JSON,
+            responses={200: Scheme},
+        ),
+        Operation(
+            "get_teams_for_scheme",
+            "GET",
+            "/schemes/{scheme_id}/teams",
+            tags=("schemes",),
+            params=("page", "per_page"),
+            responses={200: List[Team]},
+        ),
+        Operation(
+            "get_channels_for_scheme",
+            "GET",
+            "/schemes/{scheme_id}/channels",
+            tags=("schemes",),
+            params=("page", "per_page"),
+            responses={200: List[Channel]},
+        ),
+        # shared_channels
+        Operation(
+            "get_all_shared_channels",
+            "GET",
+            "/sharedchannels/{team_id}",
+            tags=("shared_channels",),
+            params=("page", "per_page"),
+            responses={200: List[SharedChannel]},
+        ),
+        Operation(
+            "get_remote_cluster_info",
+            "GET",
+            "/sharedchannels/remote_info/{remote_id}",
+            tags=("shared_channels",),
+            responses={200: RemoteClusterInfo},
+        ),
+        # status
+        Operation(
+            "get_user_status",
+            "GET",
+            "/users/{user_id}/status",
+            tags=("status",),
+            responses={200: Status},
+        ),
+        Operation(
+            "update_user_status",
+            "PUT",
+            "/users/{user_id}/status",
+            tags=("status",),
+            body=JSON,
+            responses={200: Status},
+        ),
+        Operation(
+            "get_users_statuses_by_ids",
+            "POST",
+            "/users/status/ids",
+            tags=("status",),
+            body=JSON,
+            responses={200: List[Status]},
+            read_only=True,
+            bulk_ids=True,
+        ),
+        Operation(
+            "update_user_custom_status",
+            "PUT",
+            "/users/{user_id}/status/custom",
+            tags=("status",),
+            body=JSON,
+        ),
+        Operation(
+            "unset_user_custom_status",
+            "DELETE",
+            "/users/{user_id}/status/custom",
+            tags=("status",),
+        ),
+        Operation(
+            "remove_recent_custom_status",
+            "DELETE",
+            "/users/{user_id}/status/custom/recent",
+            tags=("status",),
+            body=JSON,
+        ),
+        Operation(
+            "post_user_recent_custom_status_delete",
+            "POST",
+            "/users/{user_id}/status/custom/recent/delete",
+            tags=("status",),
+            body=JSON,
+        ),
+        # system
+        Operation(
+            "get_supported_timezone",
+            "GET",
+            "/system/timezones",
+            tags=("system",),
+            responses={200: List[str]},
+        ),
+        Operation(
+            "get_ping",
+            "GET",
+            "/system/ping",
+            tags=("system",),
+            params=("get_server_status", "device_id"),
+            responses={200: SystemStatusResponse},
+        ),
+        Operation(
+            "get_notices",
+            "GET",
+            "/system/notices/{teamId}",
+            tags=("system",),
+            params=("clientVersion", "locale", "client"),
+            responses={200: List[Notice]},
+        ),
+        Operation(
+            "mark_notices_viewed",
+            "PUT",
+            "/system/notices/view",
+            tags=("system",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "database_recycle",
+            "POST",
+            "/database/recycle",
+            tags=("system",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "test_email",
+            "POST",
+            "/email/test",
+            tags=("system",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "test_site_url",
+            "POST",
+            "/site_url/test",
+            tags=("system",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "test_s3_connection",
+            "POST",
+            "/file/s3_test",
+            tags=("system",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_config", "GET", "/config", tags=("system",), responses={200: Config}
+        ),
+        Operation(
+            "update_config",
+            "PUT",
+            "/config",
+            tags=("system",),
+            body=JSON,
+            responses={200: Config},
+        ),
+        Operation(
+            "reload_config",
+            "POST",
+            "/config/reload",
+            tags=("system",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_client_config",
+            "GET",
+            "/config/client",
+            tags=("system",),
+            params=("format",),
+        ),
+        Operation(
+            "get_environment_config",
+            "GET",
+            "/config/environment",
+            tags=("system",),
+            responses={200: EnvironmentConfig},
+        ),
+        Operation(
+            "patch_config",
+            "PUT",
+            "/config/patch",
+            tags=("system",),
+            body=JSON,
+            responses={200: Config},
+        ),
+        Operation(
+            "upload_license_file",
+            "POST",
+            "/license",
+            tags=("system",),
+            body=MULTIPART,
+            multipart_model=UploadLicenseFileMultipartData,
+            responses={201: StatusOK},
+        ),
+        Operation("remove_license_file", "DELETE", "/license", tags=("system",)),
+        Operation(
+            "get_client_license",
+            "GET",
+            "/license/client",
+            tags=("system",),
+            params=("format",),
+        ),
+        Operation(
+            "request_license_renewal_link",
+            "GET",
+            "/license/renewal",
+            tags=("system",),
+            responses={200: LicenseRenewalLink},
+            read_only=False,
+        ),
+        Operation(
+            "request_trial_license",
+            "POST",
+            "/trial-license",
+            tags=("system",),
+            body=JSON,
+        ),
+        Operation(
+            "get_prev_trial_license", "GET", "/trial-license/prev", tags=("system",)
+        ),
+        Operation(
+            "get_audits",
+            "GET",
+            "/audits",
+            tags=("system",),
+            params=("page", "per_page"),
+            responses={200: List[Audit]},
+        ),
+        Operation(
+            "invalidate_caches",
+            "POST",
+            "/caches/invalidate",
+            tags=("system",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_logs",
+            "GET",
+            "/logs",
+            tags=("system",),
+            params=("page", "logs_per_page"),
+            responses={200: List[str]},
+        ),
+        Operation(
+            "post_log",
+            "POST",
+            "/logs",
+            tags=("system",),
+            body=JSON,
+            responses={200: PostLogResponse200},
+        ),
+        Operation(
+            "get_analytics_old",
+            "GET",
+            "/analytics/old",
+            tags=("system",),
+            params=("name", "team_id"),
+        ),
+        Operation(
+            "get_server_busy_expires",
+            "GET",
+            "/server_busy",
+            tags=("system",),
+            responses={200: Server_Busy},
+        ),
+        Operation(
+            "set_server_busy",
+            "POST",
+            "/server_busy",
+            tags=("system",),
+            params=("seconds",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "clear_server_busy",
+            "DELETE",
+            "/server_busy",
+            tags=("system",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_redirect_location",
+            "GET",
+            "/redirect_location",
+            tags=("system",),
+            params=("url",),
+        ),
+        Operation("get_image_by_url", "GET", "/image", tags=("system",)),
+        Operation(
+            "upgrade_to_enterprise",
+            "POST",
+            "/upgrade_to_enterprise",
+            tags=("system",),
+            responses={202: PushNotification},
+        ),
+        Operation(
+            "upgrade_to_enterprise_status",
+            "GET",
+            "/upgrade_to_enterprise/status",
+            tags=("system",),
+            responses={200: UpgradeToEnterpriseStatusResponse200},
+        ),
+        Operation(
+            "restart_server",
+            "POST",
+            "/restart",
+            tags=("system",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_warn_metrics_status",
+            "GET",
+            "/warn_metrics/status",
+            tags=("system",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "send_warn_metric_ack",
+            "POST",
+            "/warn_metrics/ack/{warn_metric_id}",
+            tags=("system",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "send_trial_license_warn_metric_ack",
+            "POST",
+            "/warn_metrics/trial-license-ack/{warn_metric_id}",
+            tags=("system",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "check_integrity",
+            "POST",
+            "/integrity",
+            tags=("system",),
+            responses={200: List[IntegrityCheckResult]},
+        ),
+        Operation(
+            "generate_support_packet", "GET", "/system/support_packet", tags=("system",)
+        ),
+        Operation(
+            "update_marketplace_visited_by_admin",
+            "POST",
+            "/plugins/marketplace/first_admin_visit",
+            tags=("system",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        # teams
+        Operation(
+            "get_all_teams",
+            "GET",
+            "/teams",
+            tags=("teams",),
+            params=(
+                "page",
+                "per_page",
+                "include_total_count",
+                "exclude_policy_constrained",
+            ),
+            responses={200: List[Team]},
+        ),
+        Operation(
+            "create_team",
+            "POST",
+            "/teams",
+            tags=("teams",),
+            body=JSON,
+            responses={201: Team},
+        ),
+        Operation(
+            "get_team",
+            "GET",
+            "/teams/{team_id}",
+            tags=("teams",),
+            responses={200: Team},
+        ),
+        Operation(
+            "update_team",
+            "PUT",
+            "/teams/{team_id}",
+            tags=("teams",),
+            body=JSON,
+            responses={200: Team},
+        ),
+        Operation(
+            "soft_delete_team",
+            "DELETE",
+            "/teams/{team_id}",
+            tags=("teams",),
+            params=("permanent",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "patch_team",
+            "PUT",
+            "/teams/{team_id}/patch",
+            tags=("teams",),
+            body=JSON,
+            responses={200: Team},
+        ),
+        Operation(
+            "update_team_privacy",
+            "PUT",
+            "/teams/{team_id}/privacy",
+            tags=("teams",),
+            body=JSON,
+            responses={200: Team},
+        ),
+        Operation(
+            "restore_team",
+            "POST",
+            "/teams/{team_id}/restore",
+            tags=("teams",),
+            responses={200: Team},
+        ),
+        Operation(
+            "get_team_by_name",
+            "GET",
+            "/teams/name/{name}",
+            tags=("teams",),
+            responses={200: Team},
+        ),
+        Operation(
+            "search_teams",
+            "POST",
+            "/teams/search",
+            tags=("teams",),
+            body=JSON,
+            responses={200: SearchTeamsResponse200},
+            read_only=True,
+        ),
+        Operation(
+            "team_exists",
+            "GET",
+            "/teams/name/{name}/exists",
+            tags=("teams",),
+            responses={200: TeamExists},
+        ),
+        Operation(
+            "get_teams_for_user",
+            "GET",
+            "/users/{user_id}/teams",
+            tags=("teams",),
+            responses={200: List[Team]},
+        ),
+        Operation(
+            "get_team_members",
+            "GET",
+            "/teams/{team_id}/members",
+            tags=("teams",),
+            params=("page", "per_page"),
+            responses={200: List[TeamMember]},
+        ),
+        Operation(
+            "add_team_member",
+            "POST",
+            "/teams/{team_id}/members",
+            tags=("teams",),
+            body=JSON,
+            responses={201: TeamMember},
+        ),
+        Operation(
+            "add_team_member_from_invite",
+            "POST",
+            "/teams/members/invite",
+            tags=("teams",),
+            params=("token",),
+            responses={201: TeamMember},
+        ),
+        Operation(
+            "add_team_members",
+            "POST",
+            "/teams/{team_id}/members/batch",
+            tags=("teams",),
+            params=("graceful",),
+            body=JSON,
+            responses={201: List[TeamMember]},
+        ),
+        Operation(
+            "get_team_members_for_user",
+            "GET",
+            "/users/{user_id}/teams/members",
+            tags=("teams",),
+            responses={200: List[TeamMember]},
+        ),
+        Operation(
+            "get_team_member",
+            "GET",
+            "/teams/{team_id}/members/{user_id}",
+            tags=("teams",),
+            responses={200: TeamMember},
+        ),
+        Operation(
+            "remove_team_member",
+            "DELETE",
+            "/teams/{team_id}/members/{user_id}",
+            tags=("teams",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_team_members_by_ids",
+            "POST",
+            "/teams/{team_id}/members/ids",
+            tags=("teams",),
+            body=JSON,
+            responses={200: List[TeamMember]},
+            read_only=True,
+            bulk_ids=True,
+        ),
+        Operation(
+            "get_team_stats",
+            "GET",
+            "/teams/{team_id}/stats",
+            tags=("teams",),
+            responses={200: TeamStats},
+        ),
+        Operation(
+            "regenerate_team_invite_id",
+            "POST",
+            "/teams/{team_id}/regenerate_invite_id",
+            tags=("teams",),
+            responses={200: Team},
+        ),
+        Operation("get_team_icon", "GET", "/teams/{team_id}/image", tags=("teams",)),
+        Operation(
+            "set_team_icon",
+            "POST",
+            "/teams/{team_id}/image",
+            tags=("teams",),
+            body=MULTIPART,
+            multipart_model=SetTeamIconMultipartData,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "remove_team_icon",
+            "DELETE",
+            "/teams/{team_id}/image",
+            tags=("teams",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "update_team_member_roles",
+            "PUT",
+            "/teams/{team_id}/members/{user_id}/roles",
+            tags=("teams",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "update_team_member_scheme_roles",
+            "PUT",
+            "/teams/{team_id}/members/{user_id}/schemeRoles",
+            tags=("teams",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_teams_unread_for_user",
+            "GET",
+            "/users/{user_id}/teams/unread",
+            tags=("teams",),
+            params=("exclude_team", "include_collapsed_threads"),
+            responses={200: List[TeamUnread]},
+        ),
+        Operation(
+            "get_team_unread",
+            "GET",
+            "/users/{user_id}/teams/{team_id}/unread",
+            tags=("teams",),
+            responses={200: TeamUnread},
+        ),
+        Operation(
+            "invite_users_to_team",
+            "POST",
+            "/teams/{team_id}/invite/email",
+            tags=("teams",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "invite_guests_to_team",
+            "POST",
+            "/teams/{team_id}/invite-guests/email",
+            tags=("teams",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "invalidate_email_invites",
+            "DELETE",
+            "/teams/invites/email",
+            tags=("teams",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "import_team",
+            "POST",
+            "/teams/{team_id}/import",
+            tags=("teams",),
+            body=MULTIPART,
+            multipart_model=ImportTeamMultipartData,
+            responses={200: ImportTeamResponse200},
+        ),
+        Operation(
+            "get_team_invite_info",
+            "GET",
+            "/teams/invite/{invite_id}",
+            tags=("teams",),
+            responses={200: GetTeamInviteInfoResponse200},
+        ),
+        Operation(
+            "update_team_scheme",
+            "PUT",
+            "/teams/{team_id}/scheme",
+            tags=("teams",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "team_members_minus_group_members",
+            "GET",
+            "/teams/{team_id}/members_minus_group_members",
+            tags=("teams",),
+            params=("group_ids", "page", "per_page"),
+        ),
+        # terms_of_service
+        Operation(
+            "get_user_terms_of_service",
+            "GET",
+            "/users/{user_id}/terms_of_service",
+            tags=("terms_of_service", "users"),
+            responses={200: UserTermsOfService, 404: AppError},
+        ),
+        Operation(
+            "register_terms_of_service_action",
+            "POST",
+            "/users/{user_id}/terms_of_service",
+            tags=("terms_of_service", "users"),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_terms_of_service",
+            "GET",
+            "/terms_of_service",
+            tags=("terms_of_service",),
+            responses={200: TermsOfService},
+        ),
+        Operation(
+            "create_terms_of_service",
+            "POST",
+            "/terms_of_service",
+            tags=("terms_of_service",),
+            responses={200: TermsOfService},
+        ),
+        # threads
+        Operation(
+            "get_user_threads",
+            "GET",
+            "/users/{user_id}/teams/{team_id}/threads",
+            tags=("threads",),
+            params=("since", "deleted", "extended", "page", "pageSize", "totalsOnly"),
+            responses={200: UserThreads},
+        ),
+        Operation(
+            "get_thread_mention_counts_by_channel",
+            "GET",
+            "/users/{user_id}/teams/{team_id}/threads/mention_counts",
+            tags=("threads",),
+        ),
+        Operation(
+            "update_threads_read_for_user",
+            "PUT",
+            "/users/{user_id}/teams/{team_id}/threads/read",
+            tags=("threads",),
+        ),
+        Operation(
+            "update_thread_read_for_user",
+            "PUT",
+            "/users/{user_id}/teams/{team_id}/threads/{thread_id}/read/{timestamp}",
+            tags=("threads",),
+        ),
+        Operation(
+            "start_following_thread",
+            "PUT",
+            "/users/{user_id}/teams/{team_id}/threads/{thread_id}/following",
+            tags=("threads",),
+        ),
+        Operation(
+            "stop_following_thread",
+            "DELETE",
+            "/users/{user_id}/teams/{team_id}/threads/{thread_id}/following",
+            tags=("threads",),
+        ),
+        Operation(
+            "get_user_thread",
+            "GET",
+            "/users/{user_id}/teams/{team_id}/threads/{thread_id}",
+            tags=("threads",),
+        ),
+        # uploads
+        Operation(
+            "create_upload",
+            "POST",
+            "/uploads",
+            tags=("uploads",),
+            body=JSON,
+            responses={201: UploadSession},
+        ),
+        Operation("get_upload", "GET", "/uploads/{upload_id}", tags=("uploads",)),
+        Operation(
+            "upload_data",
+            "POST",
+            "/uploads/{upload_id}",
+            tags=("uploads",),
+            body=FORM,
+            responses={201: FileInfo},
+        ),
+        # users
+        Operation(
+            "login",
+            "POST",
+            "/users/login",
+            tags=("users",),
+            body=JSON,
+            responses={201: User},
+        ),
+        Operation(
+            "login_by_cws_token", "POST", "/users/login/cws", tags=("users",), body=JSON
+        ),
+        Operation(
+            "logout",
+            "POST",
+            "/users/logout",
+            tags=("users",),
+            responses={201: StatusOK},
+        ),
+        Operation(
+            "get_users",
+            "GET",
+            "/users",
+            tags=("users",),
+            params=(
+                "page",
+                "per_page",
+                "in_team",
+                "not_in_team",
+                "in_channel",
+                "not_in_channel",
+                "in_group",
+                "group_constrained",
+                "without_team",
+                "active",
+                "inactive",
+                "role",
+                "sort",
+                "roles",
+                "channel_roles",
+                "team_roles",
+            ),
+            responses={200: List[User]},
+        ),
+        Operation(
+            "create_user",
+            "POST",
+            "/users",
+            tags=("users",),
+            params=("t", "iid"),
+            body=JSON,
+            responses={201: User},
+        ),
+        Operation("permanent_delete_all_users", "DELETE", "/users", tags=("users",)),
+        Operation(
+            "get_users_by_ids",
+            "POST",
+            "/users/ids",
+            tags=("users",),
+            params=("since",),
+            body=JSON,
+            responses={200: List[User]},
+            read_only=True,
+            bulk_ids=True,
+        ),
+        Operation(
+            "get_users_by_group_channel_ids",
+            "POST",
+            "/users/group_channels",
+            tags=("users",),
+            body=JSON,
+            responses={200: GetUsersByGroupChannelIdsResponse200},
+            read_only=True,
+            bulk_ids=True,
+        ),
+        Operation(
+            "get_users_by_usernames",
+            "POST",
+            "/users/usernames",
+            tags=("users",),
+            body=JSON,
+            responses={200: List[User]},
+            read_only=True,
+            bulk_ids=True,
+        ),
+        Operation(
+            "search_users",
+            "POST",
+            "/users/search",
+            tags=("users",),
+            body=JSON,
+            responses={200: List[User]},
+            read_only=True,
+        ),
+        Operation(
+            "autocomplete_users",
+            "GET",
+            "/users/autocomplete",
+            tags=("users",),
+            params=("team_id", "channel_id", "name", "limit"),
+            responses={200: UserAutocomplete},
+        ),
+        Operation(
+            "get_known_users",
+            "GET",
+            "/users/known",
+            tags=("users",),
+            responses={200: UsersStats},
+        ),
+        Operation(
+            "get_total_users_stats",
+            "GET",
+            "/users/stats",
+            tags=("users",),
+            responses={200: UsersStats},
+        ),
+        Operation(
+            "get_total_users_stats_filtered",
+            "GET",
+            "/users/stats/filtered",
+            tags=("users",),
+            params=(
+                "in_team",
+                "in_channel",
+                "include_deleted",
+                "include_bots",
+                "roles",
+                "channel_roles",
+                "team_roles",
+            ),
+            responses={200: UsersStats},
+        ),
+        Operation(
+            "get_user",
+            "GET",
+            "/users/{user_id}",
+            tags=("users",),
+            responses={200: User},
+        ),
+        Operation(
+            "update_user",
+            "PUT",
+            "/users/{user_id}",
+            tags=("users",),
+            body=JSON,
+            responses={200: User},
+        ),
+        Operation(
+            "delete_user",
+            "DELETE",
+            "/users/{user_id}",
+            tags=("users",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "patch_user",
+            "PUT",
+            "/users/{user_id}/patch",
+            tags=("users",),
+            body=JSON,
+            responses={200: User},
+        ),
+        Operation(
+            "update_user_roles",
+            "PUT",
+            "/users/{user_id}/roles",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "update_user_active",
+            "PUT",
+            "/users/{user_id}/active",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_profile_image",
+            "GET",
+            "/users/{user_id}/image",
+            tags=("users",),
+            params=("_",),
+        ),
+        Operation(
+            "set_profile_image",
+            "POST",
+            "/users/{user_id}/image",
+            tags=("users",),
+            body=MULTIPART,
+            multipart_model=SetProfileImageMultipartData,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "set_default_profile_image",
+            "DELETE",
+            "/users/{user_id}/image",
+            tags=("users",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_default_profile_image",
+            "GET",
+            "/users/{user_id}/image/default",
+            tags=("users",),
+        ),
+        Operation(
+            "get_user_by_username",
+            "GET",
+            "/users/username/{username}",
+            tags=("users",),
+            responses={200: User},
+        ),
+        Operation(
+            "reset_password",
+            "POST",
+            "/users/password/reset",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "update_user_mfa",
+            "PUT",
+            "/users/{user_id}/mfa",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "generate_mfa_secret",
+            "POST",
+            "/users/{user_id}/mfa/generate",
+            tags=("users",),
+            responses={200: GenerateMfaSecretResponse200},
+        ),
+        Operation(
+            "demote_user_to_guest",
+            "POST",
+            "/users/{user_id}/demote",
+            tags=("users",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "promote_guest_to_user",
+            "POST",
+            "/users/{user_id}/promote",
+            tags=("users",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "check_user_mfa",
+            "POST",
+            "/users/mfa",
+            tags=("users",),
+            body=JSON,
+            responses={200: CheckUserMfaResponse200},
+        ),
+        Operation(
+            "update_user_password",
+            "PUT",
+            "/users/{user_id}/password",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "send_password_reset_email",
+            "POST",
+            "/users/password/reset/send",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_user_by_email",
+            "GET",
+            "/users/email/{email}",
+            tags=("users",),
+            responses={200: User},
+        ),
+        Operation(
+            "get_sessions",
+            "GET",
+            "/users/{user_id}/sessions",
+            tags=("users",),
+            responses={200: List[Session]},
+        ),
+        Operation(
+            "revoke_session",
+            "POST",
+            "/users/{user_id}/sessions/revoke",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "revoke_all_sessions",
+            "POST",
+            "/users/{user_id}/sessions/revoke/all",
+            tags=("users",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "attach_device_id",
+            "PUT",
+            "/users/sessions/device",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_user_audits",
+            "GET",
+            "/users/{user_id}/audits",
+            tags=("users",),
+            responses={200: List[Audit]},
+        ),
+        Operation(
+            "verify_user_email_without_token",
+            "POST",
+            "/users/{user_id}/email/verify/member",
+            tags=("users",),
+            responses={200: User},
+        ),
+        Operation(
+            "verify_user_email",
+            "POST",
+            "/users/email/verify",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "send_verification_email",
+            "POST",
+            "/users/email/verify/send",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "switch_account_type",
+            "POST",
+            "/users/login/switch",
+            tags=("users",),
+            body=JSON,
+            responses={200: SwitchAccountTypeResponse200},
+        ),
+        Operation(
+            "get_user_access_tokens_for_user",
+            "GET",
+            "/users/{user_id}/tokens",
+            tags=("users",),
+            params=("page", "per_page"),
+            responses={200: List[UserAccessTokenSanitized]},
+        ),
+        Operation(
+            "create_user_access_token",
+            "POST",
+            "/users/{user_id}/tokens",
+            tags=("users",),
+            body=JSON,
+            responses={201: UserAccessToken},
+        ),
+        Operation(
+            "get_user_access_tokens",
+            "GET",
+            "/users/tokens",
+            tags=("users",),
+            params=("page", "per_page"),
+            responses={200: List[UserAccessTokenSanitized]},
+        ),
+        Operation(
+            "revoke_user_access_token",
+            "POST",
+            "/users/tokens/revoke",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_user_access_token",
+            "GET",
+            "/users/tokens/{token_id}",
+            tags=("users",),
+            responses={200: UserAccessTokenSanitized},
+        ),
+        Operation(
+            "disable_user_access_token",
+            "POST",
+            "/users/tokens/disable",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "enable_user_access_token",
+            "POST",
+            "/users/tokens/enable",
+            tags=("users",),
+            body=JSON,
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "search_user_access_tokens",
+            "POST",
+            "/users/tokens/search",
+            tags=("users",),
+            body=JSON,
+            responses={200: List[UserAccessTokenSanitized]},
+            read_only=True,
+        ),
+        Operation(
+            "update_user_auth",
+            "PUT",
+            "/users/{user_id}/auth",
+            tags=("users",),
+            body=JSON,
+            responses={200: UserAuthData},
+        ),
+        Operation(
+            "revoke_sessions_from_all_users",
+            "POST",
+            "/users/sessions/revoke/all",
+            tags=("users",),
+        ),
+        Operation(
+            "publish_user_typing",
+            "POST",
+            "/users/{user_id}/typing",
+            tags=("users",),
+            body=JSON,
+        ),
+        Operation(
+            "get_uploads_for_user",
+            "GET",
+            "/users/{user_id}/uploads",
+            tags=("users",),
+            responses={200: List[UploadSession]},
+        ),
+        Operation(
+            "get_channel_members_with_team_data_for_user",
+            "GET",
+            "/users/{user_id}/channel_members",
+            tags=("users",),
+            params=("page", "pageSize"),
+            responses={200: List[ChannelMemberWithTeamData]},
+        ),
+        # webhooks
+        Operation(
+            "get_incoming_webhooks",
+            "GET",
+            "/hooks/incoming",
+            tags=("webhooks",),
+            params=("page", "per_page", "team_id"),
+            responses={200: List[IncomingWebhook]},
+        ),
+        Operation(
+            "create_incoming_webhook",
+            "POST",
+            "/hooks/incoming",
+            tags=("webhooks",),
+            body=JSON,
+            responses={201: IncomingWebhook},
+        ),
+        Operation(
+            "get_incoming_webhook",
+            "GET",
+            "/hooks/incoming/{hook_id}",
+            tags=("webhooks",),
+            responses={200: IncomingWebhook},
+        ),
+        Operation(
+            "update_incoming_webhook",
+            "PUT",
+            "/hooks/incoming/{hook_id}",
+            tags=("webhooks",),
+            body=JSON,
+            responses={200: IncomingWebhook},
+        ),
+        Operation(
+            "delete_incoming_webhook",
+            "DELETE",
+            "/hooks/incoming/{hook_id}",
+            tags=("webhooks",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "get_outgoing_webhooks",
+            "GET",
+            "/hooks/outgoing",
+            tags=("webhooks",),
+            params=("page", "per_page", "team_id", "channel_id"),
+            responses={200: List[OutgoingWebhook]},
+        ),
+        Operation(
+            "create_outgoing_webhook",
+            "POST",
+            "/hooks/outgoing",
+            tags=("webhooks",),
+            body=JSON,
+            responses={201: OutgoingWebhook},
+        ),
+        Operation(
+            "get_outgoing_webhook",
+            "GET",
+            "/hooks/outgoing/{hook_id}",
+            tags=("webhooks",),
+            responses={200: OutgoingWebhook},
+        ),
+        Operation(
+            "update_outgoing_webhook",
+            "PUT",
+            "/hooks/outgoing/{hook_id}",
+            tags=("webhooks",),
+            body=JSON,
+            responses={200: OutgoingWebhook},
+        ),
+        Operation(
+            "delete_outgoing_webhook",
+            "DELETE",
+            "/hooks/outgoing/{hook_id}",
+            tags=("webhooks",),
+            responses={200: StatusOK},
+        ),
+        Operation(
+            "regen_outgoing_hook_token",
+            "POST",
+            "/hooks/outgoing/{hook_id}/regen_token",
+            tags=("webhooks",),
+            responses={200: StatusOK},
+        ),
+    )
+}
+""" All operations by name """
+
+
+def get_operation(name: str) -> Operation:
+    """Return the operation executed by the endpoint method ``name``
+
+    Raises:
+        KeyError: If there is no such operation
+    """
+    try:
+        return OPERATIONS[name]
+    except KeyError:
+        raise KeyError(f"Unknown operation {name!r}") from None
+
+
+def find_operations(
+    *,
+    tag: Optional[str] = None,
+    method: Optional[str] = None,
+    paginated: Optional[bool] = None,
+    accepts_since: Optional[bool] = None,
+    bulk_ids: Optional[bool] = None,
+    cacheable: Optional[bool] = None,
+    retryable: Optional[bool] = None,
+) -> List[Operation]:
+    """Return all operations matching the given criteria
+
+    Criteria which are ``None`` are ignored, e.g. ``find_operations(tag="users", paginated=True)``
+    returns all paginated operations of the ``users`` endpoints.
+    """
+    flags = {
+        "paginated": paginated,
+        "accepts_since": accepts_since,
+        "bulk_ids": bulk_ids,
+        "cacheable": cacheable,
+        "retryable": retryable,
+    }
+    return [
+        operation
+        for operation in OPERATIONS.values()
+        if (tag is None or tag in operation.tags)
+        and (method is None or operation.method == method.upper())
+        and all(
+            value is None or getattr(operation, flag) == value
+            for flag, value in flags.items()
+        )
+    ]
+
+
+def parse_operation_content(
+    name: str,
+    status_code: int,
+    content: bytes,
+    lazy: bool = False,
+    fast: bool = False,
+) -> Any:
+    """Parse a raw response body of the operation ``name``
+
+    Takes only picklable arguments, so it can be submitted to a process pool.
+    """
+    return OPERATIONS[name].parse_content(status_code, content, lazy, fast)
+
+
+__all__ = ["OPERATIONS", "Operation", "get_operation", "find_operations"]
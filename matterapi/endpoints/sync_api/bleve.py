@@ -27,22 +27,4 @@ class BleveApi(ApiBaseClass):
             `PurgeBleveIndexes <https://api.mattermost.com/#operation/PurgeBleveIndexes>`_
         """
 
-        url = "/bleve/purge_indexes"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("purge_bleve_indexes")
@@ -1,9 +1,7 @@
 """ Module to access the Channels endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union, cast
-
-from pydantic import BaseModel
+from typing import Dict, Iterator, List, Optional, Union
 
 from ...models import (
     AddChannelMemberJsonBody,
@@ -15,6 +13,7 @@ from ...models import (
     ChannelNotifyProps,
     ChannelStats,
     ChannelUnread,
+    ChannelWithTeamData,
     CreateChannelJsonBody,
     MoveChannelJsonBody,
     OrderedSidebarCategories,
@@ -63,36 +62,52 @@ class ChannelsApi(ApiBaseClass):
             `GetAllChannels <https://api.mattermost.com/#operation/GetAllChannels>`_
         """
 
-        url = "/channels"
-        params: Dict[str, Any] = {
-            "not_associated_to_group": not_associated_to_group,
-            "page": page,
-            "per_page": per_page,
-            "exclude_default_channels": exclude_default_channels,
-            "include_deleted": include_deleted,
-            "include_total_count": include_total_count,
-            "exclude_policy_constrained": exclude_policy_constrained,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = ChannelListWithTeamData.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "get_all_channels",
+            not_associated_to_group=not_associated_to_group,
+            page=page,
+            per_page=per_page,
+            exclude_default_channels=exclude_default_channels,
+            include_deleted=include_deleted,
+            include_total_count=include_total_count,
+            exclude_policy_constrained=exclude_policy_constrained,
+        )
+
+    def iter_all_channels(
+        self,
+        *,
+        not_associated_to_group: Optional[str] = None,
+        page: Optional[int] = 0,
+        per_page: Optional[int] = 0,
+        exclude_default_channels: Optional[bool] = False,
+        include_deleted: Optional[bool] = False,
+        include_total_count: Optional[bool] = False,
+        exclude_policy_constrained: Optional[bool] = False,
+    ) -> Iterator[ChannelWithTeamData]:
+        """Get a list of all channels, one at a time
+
+        Streaming variant of :meth:`get_all_channels`. Elements are yielded as soon as they
+        were received and parsed instead of reading the whole response first.
+
+
+
+        Permissions:
+            `manage_system`
+
+        Api Reference:
+            `GetAllChannels <https://api.mattermost.com/#operation/GetAllChannels>`_
+        """
+
+        return self._stream(
+            "get_all_channels",
+            not_associated_to_group=not_associated_to_group,
+            page=page,
+            per_page=per_page,
+            exclude_default_channels=exclude_default_channels,
+            include_deleted=include_deleted,
+            include_total_count=include_total_count,
+            exclude_policy_constrained=exclude_policy_constrained,
+        )
 
     def create_channel(
         self,
@@ -112,31 +127,7 @@ class ChannelsApi(ApiBaseClass):
             `CreateChannel <https://api.mattermost.com/#operation/CreateChannel>`_
         """
 
-        url = "/channels"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Channel.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_channel", json_body=json_body)
 
     def create_direct_channel(
         self,
@@ -156,27 +147,7 @@ class ChannelsApi(ApiBaseClass):
             `CreateDirectChannel <https://api.mattermost.com/#operation/CreateDirectChannel>`_
         """
 
-        url = "/channels/direct"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Channel.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_direct_channel", json_body=json_body)
 
     def create_group_channel(
         self,
@@ -195,27 +166,7 @@ class ChannelsApi(ApiBaseClass):
             `CreateGroupChannel <https://api.mattermost.com/#operation/CreateGroupChannel>`_
         """
 
-        url = "/channels/group"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Channel.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_group_channel", json_body=json_body)
 
     def search_all_channels(
         self,
@@ -241,36 +192,11 @@ class ChannelsApi(ApiBaseClass):
             `SearchAllChannels <https://api.mattermost.com/#operation/SearchAllChannels>`_
         """
 
-        url = "/channels/search"
-        params: Dict[str, Any] = {
-            "system_console": system_console,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = SearchAllChannelsResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "search_all_channels",
+            json_body=json_body,
+            system_console=system_console,
+        )
 
     def search_group_channels(
         self,
@@ -289,36 +215,7 @@ class ChannelsApi(ApiBaseClass):
             `SearchGroupChannels <https://api.mattermost.com/#operation/SearchGroupChannels>`_
         """
 
-        url = "/channels/group/search"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Channel.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("search_group_channels", json_body=json_body)
 
     def get_public_channels_by_ids_for_team(
         self,
@@ -337,32 +234,11 @@ class ChannelsApi(ApiBaseClass):
             `GetPublicChannelsByIdsForTeam <https://api.mattermost.com/#operation/GetPublicChannelsByIdsForTeam>`_
         """
 
-        url = f"/teams/{team_id}/channels/ids"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Channel.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_public_channels_by_ids_for_team",
+            team_id=team_id,
+            json_body=json_body,
+        )
 
     def get_channel_members_timezones(
         self,
@@ -381,25 +257,7 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelMembersTimezones <https://api.mattermost.com/#operation/GetChannelMembersTimezones>`_
         """
 
-        url = f"/channels/{channel_id}/timezones"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = cast(List[str], response.json())
-
-            return response200
-        return response
+        return self._call("get_channel_members_timezones", channel_id=channel_id)
 
     def get_channel(
         self,
@@ -416,25 +274,7 @@ class ChannelsApi(ApiBaseClass):
             `GetChannel <https://api.mattermost.com/#operation/GetChannel>`_
         """
 
-        url = f"/channels/{channel_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Channel.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_channel", channel_id=channel_id)
 
     def update_channel(
         self,
@@ -457,31 +297,7 @@ class ChannelsApi(ApiBaseClass):
             `UpdateChannel <https://api.mattermost.com/#operation/UpdateChannel>`_
         """
 
-        url = f"/channels/{channel_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Channel.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("update_channel", channel_id=channel_id, json_body=json_body)
 
     def delete_channel(
         self,
@@ -511,25 +327,7 @@ class ChannelsApi(ApiBaseClass):
             `DeleteChannel <https://api.mattermost.com/#operation/DeleteChannel>`_
         """
 
-        url = f"/channels/{channel_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("delete_channel", channel_id=channel_id)
 
     def patch_channel(
         self,
@@ -554,31 +352,7 @@ class ChannelsApi(ApiBaseClass):
             `PatchChannel <https://api.mattermost.com/#operation/PatchChannel>`_
         """
 
-        url = f"/channels/{channel_id}/patch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Channel.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("patch_channel", channel_id=channel_id, json_body=json_body)
 
     def update_channel_privacy(
         self,
@@ -604,31 +378,11 @@ class ChannelsApi(ApiBaseClass):
             `UpdateChannelPrivacy <https://api.mattermost.com/#operation/UpdateChannelPrivacy>`_
         """
 
-        url = f"/channels/{channel_id}/privacy"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Channel.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_channel_privacy",
+            channel_id=channel_id,
+            json_body=json_body,
+        )
 
     def restore_channel(
         self,
@@ -647,25 +401,7 @@ class ChannelsApi(ApiBaseClass):
             `RestoreChannel <https://api.mattermost.com/#operation/RestoreChannel>`_
         """
 
-        url = f"/channels/{channel_id}/restore"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Channel.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("restore_channel", channel_id=channel_id)
 
     def move_channel(
         self,
@@ -686,31 +422,7 @@ class ChannelsApi(ApiBaseClass):
             `MoveChannel <https://api.mattermost.com/#operation/MoveChannel>`_
         """
 
-        url = f"/channels/{channel_id}/move"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Channel.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("move_channel", channel_id=channel_id, json_body=json_body)
 
     def get_channel_stats(
         self,
@@ -727,25 +439,7 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelStats <https://api.mattermost.com/#operation/GetChannelStats>`_
         """
 
-        url = f"/channels/{channel_id}/stats"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = ChannelStats.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_channel_stats", channel_id=channel_id)
 
     def get_pinned_posts(
         self,
@@ -759,25 +453,7 @@ class ChannelsApi(ApiBaseClass):
             `GetPinnedPosts <https://api.mattermost.com/#operation/GetPinnedPosts>`_
         """
 
-        url = f"/channels/{channel_id}/pinned"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = PostList.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_pinned_posts", channel_id=channel_id)
 
     def get_public_channels_for_team(
         self,
@@ -799,36 +475,12 @@ class ChannelsApi(ApiBaseClass):
             `GetPublicChannelsForTeam <https://api.mattermost.com/#operation/GetPublicChannelsForTeam>`_
         """
 
-        url = f"/teams/{team_id}/channels"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Channel.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_public_channels_for_team",
+            team_id=team_id,
+            page=page,
+            per_page=per_page,
+        )
 
     def get_private_channels_for_team(
         self,
@@ -851,36 +503,12 @@ class ChannelsApi(ApiBaseClass):
             `GetPrivateChannelsForTeam <https://api.mattermost.com/#operation/GetPrivateChannelsForTeam>`_
         """
 
-        url = f"/teams/{team_id}/channels/private"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Channel.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_private_channels_for_team",
+            team_id=team_id,
+            page=page,
+            per_page=per_page,
+        )
 
     def get_deleted_channels_for_team(
         self,
@@ -901,36 +529,12 @@ class ChannelsApi(ApiBaseClass):
             `GetDeletedChannelsForTeam <https://api.mattermost.com/#operation/GetDeletedChannelsForTeam>`_
         """
 
-        url = f"/teams/{team_id}/channels/deleted"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Channel.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_deleted_channels_for_team",
+            team_id=team_id,
+            page=page,
+            per_page=per_page,
+        )
 
     def autocomplete_channels_for_team(
         self,
@@ -952,35 +556,7 @@ class ChannelsApi(ApiBaseClass):
             `AutocompleteChannelsForTeam <https://api.mattermost.com/#operation/AutocompleteChannelsForTeam>`_
         """
 
-        url = f"/teams/{team_id}/channels/autocomplete"
-        params: Dict[str, Any] = {
-            "name": name,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Channel.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("autocomplete_channels_for_team", team_id=team_id, name=name)
 
     def autocomplete_channels_for_team_for_search(
         self,
@@ -1002,35 +578,11 @@ class ChannelsApi(ApiBaseClass):
             `AutocompleteChannelsForTeamForSearch <https://api.mattermost.com/#operation/AutocompleteChannelsForTeamForSearch>`_
         """
 
-        url = f"/teams/{team_id}/channels/search_autocomplete"
-        params: Dict[str, Any] = {
-            "name": name,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Channel.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "autocomplete_channels_for_team_for_search",
+            team_id=team_id,
+            name=name,
+        )
 
     def search_channels(
         self,
@@ -1054,36 +606,7 @@ class ChannelsApi(ApiBaseClass):
             `SearchChannels <https://api.mattermost.com/#operation/SearchChannels>`_
         """
 
-        url = f"/teams/{team_id}/channels/search"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = []
-            _response201 = response.json()
-            for response201_item_data in _response201:
-                response201_item = Channel.parse_obj(response201_item_data)
-
-                response201.append(response201_item)
-
-            return response201
-        return response
+        return self._call("search_channels", team_id=team_id, json_body=json_body)
 
     def search_archived_channels(
         self,
@@ -1109,36 +632,11 @@ class ChannelsApi(ApiBaseClass):
             `SearchArchivedChannels <https://api.mattermost.com/#operation/SearchArchivedChannels>`_
         """
 
-        url = f"/teams/{team_id}/channels/search_archived"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = []
-            _response201 = response.json()
-            for response201_item_data in _response201:
-                response201_item = Channel.parse_obj(response201_item_data)
-
-                response201.append(response201_item)
-
-            return response201
-        return response
+        return self._call(
+            "search_archived_channels",
+            team_id=team_id,
+            json_body=json_body,
+        )
 
     def get_channel_by_name(
         self,
@@ -1158,30 +656,12 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelByName <https://api.mattermost.com/#operation/GetChannelByName>`_
         """
 
-        url = f"/teams/{team_id}/channels/name/{channel_name}"
-        params: Dict[str, Any] = {
-            "include_deleted": include_deleted,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Channel.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "get_channel_by_name",
+            team_id=team_id,
+            channel_name=channel_name,
+            include_deleted=include_deleted,
+        )
 
     def get_channel_by_name_for_team_name(
         self,
@@ -1201,39 +681,49 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelByNameForTeamName <https://api.mattermost.com/#operation/GetChannelByNameForTeamName>`_
         """
 
-        url = f"/teams/name/{team_name}/channels/name/{channel_name}"
-        params: Dict[str, Any] = {
-            "include_deleted": include_deleted,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
+        return self._call(
+            "get_channel_by_name_for_team_name",
+            team_name=team_name,
+            channel_name=channel_name,
+            include_deleted=include_deleted,
+        )
 
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
+    def get_channel_members(
+        self,
+        channel_id: str,
+        *,
+        page: Optional[int] = 0,
+        per_page: Optional[int] = 60,
+    ) -> List[ChannelMember]:
+        """Get channel members
 
-        if self.skip_response_parsing:
-            return response
+        Get a page of members for a channel.
 
-        if response.status_code == 200:
-            response200 = Channel.parse_obj(response.json())
+        Permissions:
+            `read_channel` permission for the channel.
 
-            return response200
-        return response
+        Api Reference:
+            `GetChannelMembers <https://api.mattermost.com/#operation/GetChannelMembers>`_
+        """
 
-    def get_channel_members(
+        return self._call(
+            "get_channel_members",
+            channel_id=channel_id,
+            page=page,
+            per_page=per_page,
+        )
+
+    def iter_channel_members(
         self,
         channel_id: str,
         *,
         page: Optional[int] = 0,
         per_page: Optional[int] = 60,
-    ) -> List[ChannelMember]:
-        """Get channel members
+    ) -> Iterator[ChannelMember]:
+        """Get channel members, one at a time
+
+        Streaming variant of :meth:`get_channel_members`. Elements are yielded as soon as they
+        were received and parsed instead of reading the whole response first.
 
         Get a page of members for a channel.
 
@@ -1244,36 +734,12 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelMembers <https://api.mattermost.com/#operation/GetChannelMembers>`_
         """
 
-        url = f"/channels/{channel_id}/members"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = ChannelMember.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._stream(
+            "get_channel_members",
+            channel_id=channel_id,
+            page=page,
+            per_page=per_page,
+        )
 
     def add_channel_member(
         self,
@@ -1289,31 +755,11 @@ class ChannelsApi(ApiBaseClass):
             `AddChannelMember <https://api.mattermost.com/#operation/AddChannelMember>`_
         """
 
-        url = f"/channels/{channel_id}/members"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = ChannelMember.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call(
+            "add_channel_member",
+            channel_id=channel_id,
+            json_body=json_body,
+        )
 
     def get_channel_members_by_ids(
         self,
@@ -1332,32 +778,11 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelMembersByIds <https://api.mattermost.com/#operation/GetChannelMembersByIds>`_
         """
 
-        url = f"/channels/{channel_id}/members/ids"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = ChannelMember.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_channel_members_by_ids",
+            channel_id=channel_id,
+            json_body=json_body,
+        )
 
     def get_channel_member(
         self,
@@ -1375,25 +800,7 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelMember <https://api.mattermost.com/#operation/GetChannelMember>`_
         """
 
-        url = f"/channels/{channel_id}/members/{user_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = ChannelMember.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_channel_member", channel_id=channel_id, user_id=user_id)
 
     def remove_user_from_channel(
         self,
@@ -1416,25 +823,11 @@ class ChannelsApi(ApiBaseClass):
             `RemoveUserFromChannel <https://api.mattermost.com/#operation/RemoveUserFromChannel>`_
         """
 
-        url = f"/channels/{channel_id}/members/{user_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "remove_user_from_channel",
+            channel_id=channel_id,
+            user_id=user_id,
+        )
 
     def update_channel_roles(
         self,
@@ -1454,31 +847,12 @@ class ChannelsApi(ApiBaseClass):
             `UpdateChannelRoles <https://api.mattermost.com/#operation/UpdateChannelRoles>`_
         """
 
-        url = f"/channels/{channel_id}/members/{user_id}/roles"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_channel_roles",
+            channel_id=channel_id,
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     def update_channel_member_scheme_roles(
         self,
@@ -1504,31 +878,12 @@ class ChannelsApi(ApiBaseClass):
             `UpdateChannelMemberSchemeRoles <https://api.mattermost.com/#operation/UpdateChannelMemberSchemeRoles>`_
         """
 
-        url = f"/channels/{channel_id}/members/{user_id}/schemeRoles"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_channel_member_scheme_roles",
+            channel_id=channel_id,
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     def update_channel_notify_props(
         self,
@@ -1550,31 +905,12 @@ class ChannelsApi(ApiBaseClass):
             `UpdateChannelNotifyProps <https://api.mattermost.com/#operation/UpdateChannelNotifyProps>`_
         """
 
-        url = f"/channels/{channel_id}/members/{user_id}/notify_props"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_channel_notify_props",
+            channel_id=channel_id,
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     def view_channel(
         self,
@@ -1599,31 +935,7 @@ class ChannelsApi(ApiBaseClass):
             `ViewChannel <https://api.mattermost.com/#operation/ViewChannel>`_
         """
 
-        url = f"/channels/members/{user_id}/view"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = ViewChannelResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("view_channel", user_id=user_id, json_body=json_body)
 
     def get_channel_members_for_user(
         self,
@@ -1644,30 +956,11 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelMembersForUser <https://api.mattermost.com/#operation/GetChannelMembersForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/channels/members"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = ChannelMember.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_channel_members_for_user",
+            user_id=user_id,
+            team_id=team_id,
+        )
 
     def get_channels_for_team_for_user(
         self,
@@ -1689,36 +982,13 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelsForTeamForUser <https://api.mattermost.com/#operation/GetChannelsForTeamForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/channels"
-        params: Dict[str, Any] = {
-            "include_deleted": include_deleted,
-            "last_delete_at": last_delete_at,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Channel.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_channels_for_team_for_user",
+            user_id=user_id,
+            team_id=team_id,
+            include_deleted=include_deleted,
+            last_delete_at=last_delete_at,
+        )
 
     def get_channels_for_user(
         self,
@@ -1741,36 +1011,12 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelsForUser <https://api.mattermost.com/#operation/GetChannelsForUser>`_
         """
 
-        url = f"/users/{user_id}/channels"
-        params: Dict[str, Any] = {
-            "last_delete_at": last_delete_at,
-            "include_deleted": include_deleted,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Channel.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_channels_for_user",
+            user_id=user_id,
+            last_delete_at=last_delete_at,
+            include_deleted=include_deleted,
+        )
 
     def get_channel_unread(
         self,
@@ -1789,25 +1035,7 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelUnread <https://api.mattermost.com/#operation/GetChannelUnread>`_
         """
 
-        url = f"/users/{user_id}/channels/{channel_id}/unread"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = ChannelUnread.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_channel_unread", user_id=user_id, channel_id=channel_id)
 
     def update_channel_scheme(
         self,
@@ -1829,31 +1057,11 @@ class ChannelsApi(ApiBaseClass):
             `UpdateChannelScheme <https://api.mattermost.com/#operation/UpdateChannelScheme>`_
         """
 
-        url = f"/channels/{channel_id}/scheme"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_channel_scheme",
+            channel_id=channel_id,
+            json_body=json_body,
+        )
 
     def channel_members_minus_group_members(
         self,
@@ -1882,28 +1090,13 @@ class ChannelsApi(ApiBaseClass):
             `ChannelMembersMinusGroupMembers <https://api.mattermost.com/#operation/ChannelMembersMinusGroupMembers>`_
         """
 
-        url = f"/channels/{channel_id}/members_minus_group_members"
-        params: Dict[str, Any] = {
-            "group_ids": group_ids,
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call(
+            "channel_members_minus_group_members",
+            channel_id=channel_id,
+            group_ids=group_ids,
+            page=page,
+            per_page=per_page,
+        )
 
     def get_channel_member_counts_by_group(
         self,
@@ -1927,26 +1120,11 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelMemberCountsByGroup <https://api.mattermost.com/#operation/GetChannelMemberCountsByGroup>`_
         """
 
-        url = f"/channels/{channel_id}/member_counts_by_group"
-        params: Dict[str, Any] = {
-            "include_timezones": include_timezones,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call(
+            "get_channel_member_counts_by_group",
+            channel_id=channel_id,
+            include_timezones=include_timezones,
+        )
 
     def get_channel_moderations(
         self,
@@ -1965,30 +1143,7 @@ class ChannelsApi(ApiBaseClass):
             `GetChannelModerations <https://api.mattermost.com/#operation/GetChannelModerations>`_
         """
 
-        url = f"/channels/{channel_id}/moderations"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = ChannelModeration.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_channel_moderations", channel_id=channel_id)
 
     def patch_channel_moderations(
         self,
@@ -2009,36 +1164,11 @@ class ChannelsApi(ApiBaseClass):
             `PatchChannelModerations <https://api.mattermost.com/#operation/PatchChannelModerations>`_
         """
 
-        url = f"/channels/{channel_id}/moderations/patch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = ChannelModeration.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "patch_channel_moderations",
+            channel_id=channel_id,
+            json_body=json_body,
+        )
 
     def get_sidebar_categories_for_team_for_user(
         self,
@@ -2060,32 +1190,11 @@ class ChannelsApi(ApiBaseClass):
             `GetSidebarCategoriesForTeamForUser <https://api.mattermost.com/#operation/GetSidebarCategoriesForTeamForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/channels/categories"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = OrderedSidebarCategories.parse_obj(
-                    response200_item_data
-                )
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_sidebar_categories_for_team_for_user",
+            team_id=team_id,
+            user_id=user_id,
+        )
 
     def update_sidebar_categories_for_team_for_user(
         self,
@@ -2109,35 +1218,12 @@ class ChannelsApi(ApiBaseClass):
             `UpdateSidebarCategoriesForTeamForUser <https://api.mattermost.com/#operation/UpdateSidebarCategoriesForTeamForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/channels/categories"
-        json_json_body = []
-        for json_body_item_data in json_body:
-
-            if isinstance(json_body_item_data, BaseModel):
-                json_body_item = json_body_item_data.dict(exclude_unset=True)
-            else:
-                json_body_item = json_body_item_data
-
-            json_json_body.append(json_body_item)
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = SidebarCategory.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_sidebar_categories_for_team_for_user",
+            team_id=team_id,
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     def create_sidebar_category_for_team_for_user(
         self,
@@ -2160,31 +1246,12 @@ class ChannelsApi(ApiBaseClass):
             `CreateSidebarCategoryForTeamForUser <https://api.mattermost.com/#operation/CreateSidebarCategoryForTeamForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/channels/categories"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = SidebarCategory.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "create_sidebar_category_for_team_for_user",
+            team_id=team_id,
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     def get_sidebar_category_order_for_team_for_user(
         self,
@@ -2206,25 +1273,11 @@ class ChannelsApi(ApiBaseClass):
             `GetSidebarCategoryOrderForTeamForUser <https://api.mattermost.com/#operation/GetSidebarCategoryOrderForTeamForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/channels/categories/order"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = cast(List[str], response.json())
-
-            return response200
-        return response
+        return self._call(
+            "get_sidebar_category_order_for_team_for_user",
+            team_id=team_id,
+            user_id=user_id,
+        )
 
     def update_sidebar_category_order_for_team_for_user(
         self,
@@ -2249,27 +1302,12 @@ class ChannelsApi(ApiBaseClass):
             `UpdateSidebarCategoryOrderForTeamForUser <https://api.mattermost.com/#operation/UpdateSidebarCategoryOrderForTeamForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/channels/categories/order"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = cast(List[str], response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_sidebar_category_order_for_team_for_user",
+            team_id=team_id,
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     def get_sidebar_category_for_team_for_user(
         self,
@@ -2291,25 +1329,12 @@ class ChannelsApi(ApiBaseClass):
             `GetSidebarCategoryForTeamForUser <https://api.mattermost.com/#operation/GetSidebarCategoryForTeamForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/channels/categories/{category_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = SidebarCategory.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "get_sidebar_category_for_team_for_user",
+            team_id=team_id,
+            user_id=user_id,
+            category_id=category_id,
+        )
 
     def update_sidebar_category_for_team_for_user(
         self,
@@ -2333,31 +1358,13 @@ class ChannelsApi(ApiBaseClass):
             `UpdateSidebarCategoryForTeamForUser <https://api.mattermost.com/#operation/UpdateSidebarCategoryForTeamForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/channels/categories/{category_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = SidebarCategory.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_sidebar_category_for_team_for_user",
+            team_id=team_id,
+            user_id=user_id,
+            category_id=category_id,
+            json_body=json_body,
+        )
 
     def remove_sidebar_category_for_team_for_user(
         self,
@@ -2380,22 +1387,9 @@ class ChannelsApi(ApiBaseClass):
             `RemoveSidebarCategoryForTeamForUser <https://api.mattermost.com/#operation/RemoveSidebarCategoryForTeamForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/channels/categories/{category_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = SidebarCategory.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "remove_sidebar_category_for_team_for_user",
+            team_id=team_id,
+            user_id=user_id,
+            category_id=category_id,
+        )
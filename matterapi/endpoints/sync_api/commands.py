@@ -1,9 +1,7 @@
 """ Module to access the Commands endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import (
     AutocompleteSuggestion,
@@ -38,36 +36,7 @@ class CommandsApi(ApiBaseClass):
             `ListCommands <https://api.mattermost.com/#operation/ListCommands>`_
         """
 
-        url = "/commands"
-        params: Dict[str, Any] = {
-            "team_id": team_id,
-            "custom_only": custom_only,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Command.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("list_commands", team_id=team_id, custom_only=custom_only)
 
     def create_command(
         self,
@@ -85,31 +54,7 @@ class CommandsApi(ApiBaseClass):
             `CreateCommand <https://api.mattermost.com/#operation/CreateCommand>`_
         """
 
-        url = "/commands"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Command.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_command", json_body=json_body)
 
     def list_autocomplete_commands(
         self,
@@ -126,30 +71,7 @@ class CommandsApi(ApiBaseClass):
             `ListAutocompleteCommands <https://api.mattermost.com/#operation/ListAutocompleteCommands>`_
         """
 
-        url = f"/teams/{team_id}/commands/autocomplete"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Command.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("list_autocomplete_commands", team_id=team_id)
 
     def list_command_autocomplete_suggestions(
         self,
@@ -170,37 +92,11 @@ class CommandsApi(ApiBaseClass):
             `ListCommandAutocompleteSuggestions <https://api.mattermost.com/#operation/ListCommandAutocompleteSuggestions>`_
         """
 
-        url = f"/teams/{team_id}/commands/autocomplete_suggestions"
-        params: Dict[str, Any] = {
-            "user_input": user_input,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = AutocompleteSuggestion.parse_obj(
-                    response200_item_data
-                )
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "list_command_autocomplete_suggestions",
+            team_id=team_id,
+            user_input=user_input,
+        )
 
     def get_command_by_id(
         self,
@@ -220,25 +116,7 @@ class CommandsApi(ApiBaseClass):
             `GetCommandById <https://api.mattermost.com/#operation/GetCommandById>`_
         """
 
-        url = f"/commands/{command_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Command.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_command_by_id", command_id=command_id)
 
     def update_command(
         self,
@@ -258,31 +136,7 @@ class CommandsApi(ApiBaseClass):
             `UpdateCommand <https://api.mattermost.com/#operation/UpdateCommand>`_
         """
 
-        url = f"/commands/{command_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Command.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("update_command", command_id=command_id, json_body=json_body)
 
     def delete_command(
         self,
@@ -300,25 +154,7 @@ class CommandsApi(ApiBaseClass):
             `DeleteCommand <https://api.mattermost.com/#operation/DeleteCommand>`_
         """
 
-        url = f"/commands/{command_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("delete_command", command_id=command_id)
 
     def move_command(
         self,
@@ -340,31 +176,7 @@ class CommandsApi(ApiBaseClass):
             `MoveCommand <https://api.mattermost.com/#operation/MoveCommand>`_
         """
 
-        url = f"/commands/{command_id}/move"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("move_command", command_id=command_id, json_body=json_body)
 
     def regen_command_token(
         self,
@@ -382,25 +194,7 @@ class CommandsApi(ApiBaseClass):
             `RegenCommandToken <https://api.mattermost.com/#operation/RegenCommandToken>`_
         """
 
-        url = f"/commands/{command_id}/regen_token"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = RegenCommandTokenResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("regen_command_token", command_id=command_id)
 
     def execute_command(
         self,
@@ -419,28 +213,4 @@ class CommandsApi(ApiBaseClass):
             `ExecuteCommand <https://api.mattermost.com/#operation/ExecuteCommand>`_
         """
 
-        url = "/commands/execute"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = CommandResponse.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("execute_command", json_body=json_body)
@@ -1,7 +1,7 @@
 """ Module to access the Compliance endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional
+from typing import List, Optional
 
 from ...models import Compliance
 from ..base import ApiBaseClass
@@ -28,36 +28,7 @@ class ComplianceApi(ApiBaseClass):
             `GetComplianceReports <https://api.mattermost.com/#operation/GetComplianceReports>`_
         """
 
-        url = "/compliance/reports"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Compliance.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_compliance_reports", page=page, per_page=per_page)
 
     def create_compliance_report(
         self,
@@ -73,25 +44,7 @@ class ComplianceApi(ApiBaseClass):
             `CreateComplianceReport <https://api.mattermost.com/#operation/CreateComplianceReport>`_
         """
 
-        url = "/compliance/reports"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Compliance.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_compliance_report")
 
     def get_compliance_report(
         self,
@@ -108,25 +61,7 @@ class ComplianceApi(ApiBaseClass):
             `GetComplianceReport <https://api.mattermost.com/#operation/GetComplianceReport>`_
         """
 
-        url = f"/compliance/reports/{report_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Compliance.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_compliance_report", report_id=report_id)
 
     def download_compliance_report(
         self,
@@ -143,18 +78,4 @@ class ComplianceApi(ApiBaseClass):
             `DownloadComplianceReport <https://api.mattermost.com/#operation/DownloadComplianceReport>`_
         """
 
-        url = f"/compliance/reports/{report_id}/download"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("download_compliance_report", report_id=report_id)
@@ -28,25 +28,7 @@ class ElasticsearchApi(ApiBaseClass):
             `TestElasticsearch <https://api.mattermost.com/#operation/TestElasticsearch>`_
         """
 
-        url = "/elasticsearch/test"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("test_elasticsearch")
 
     def purge_elasticsearch_indexes(
         self,
@@ -67,22 +49,4 @@ class ElasticsearchApi(ApiBaseClass):
             `PurgeElasticsearchIndexes <https://api.mattermost.com/#operation/PurgeElasticsearchIndexes>`_
         """
 
-        url = "/elasticsearch/purge_indexes"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("purge_elasticsearch_indexes")
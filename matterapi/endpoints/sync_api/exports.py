@@ -23,21 +23,7 @@ class ExportsApi(ApiBaseClass):
             `ListExports <https://api.mattermost.com/#operation/ListExports>`_
         """
 
-        url = "/exports"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("list_exports")
 
     def download_export(
         self,
@@ -56,21 +42,7 @@ class ExportsApi(ApiBaseClass):
             `DownloadExport <https://api.mattermost.com/#operation/DownloadExport>`_
         """
 
-        url = f"/exports/{export_name}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("download_export", export_name=export_name)
 
     def delete_export(
         self,
@@ -89,18 +61,4 @@ class ExportsApi(ApiBaseClass):
             `DeleteExport <https://api.mattermost.com/#operation/DeleteExport>`_
         """
 
-        url = f"/exports/{export_name}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("delete_export", export_name=export_name)
@@ -1,7 +1,7 @@
 """ Module to access the Files endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, Optional, Union
+from typing import Dict, Optional, Union
 
 from ...models import (
     FileInfo,
@@ -46,35 +46,12 @@ class FilesApi(ApiBaseClass):
             `UploadFile <https://api.mattermost.com/#operation/UploadFile>`_
         """
 
-        url = "/files"
-        params: Dict[str, Any] = {
-            "channel_id": channel_id,
-            "filename": filename,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        multipart_body_data = UploadFileMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = UploadFileResponse201.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call(
+            "upload_file",
+            multipart_data=multipart_data,
+            channel_id=channel_id,
+            filename=filename,
+        )
 
     def get_file(
         self,
@@ -92,21 +69,7 @@ class FilesApi(ApiBaseClass):
             `GetFile <https://api.mattermost.com/#operation/GetFile>`_
         """
 
-        url = f"/files/{file_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_file", file_id=file_id)
 
     def get_file_thumbnail(
         self,
@@ -124,21 +87,7 @@ class FilesApi(ApiBaseClass):
             `GetFileThumbnail <https://api.mattermost.com/#operation/GetFileThumbnail>`_
         """
 
-        url = f"/files/{file_id}/thumbnail"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_file_thumbnail", file_id=file_id)
 
     def get_file_preview(
         self,
@@ -156,21 +105,7 @@ class FilesApi(ApiBaseClass):
             `GetFilePreview <https://api.mattermost.com/#operation/GetFilePreview>`_
         """
 
-        url = f"/files/{file_id}/preview"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_file_preview", file_id=file_id)
 
     def get_file_link(
         self,
@@ -189,25 +124,7 @@ class FilesApi(ApiBaseClass):
             `GetFileLink <https://api.mattermost.com/#operation/GetFileLink>`_
         """
 
-        url = f"/files/{file_id}/link"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GetFileLinkResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_file_link", file_id=file_id)
 
     def get_file_info(
         self,
@@ -225,25 +142,7 @@ class FilesApi(ApiBaseClass):
             `GetFileInfo <https://api.mattermost.com/#operation/GetFileInfo>`_
         """
 
-        url = f"/files/{file_id}/info"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = FileInfo.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_file_info", file_id=file_id)
 
     def get_file_public(
         self,
@@ -262,26 +161,7 @@ class FilesApi(ApiBaseClass):
             `GetFilePublic <https://api.mattermost.com/#operation/GetFilePublic>`_
         """
 
-        url = f"/files/{file_id}/public"
-        params: Dict[str, Any] = {
-            "h": h,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_file_public", file_id=file_id, h=h)
 
     def search_files(
         self,
@@ -304,25 +184,8 @@ class FilesApi(ApiBaseClass):
             `SearchFiles <https://api.mattermost.com/#operation/SearchFiles>`_
         """
 
-        url = f"/teams/{team_id}/files/search"
-
-        multipart_body_data = SearchFilesMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = FileInfoList.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "search_files",
+            team_id=team_id,
+            multipart_data=multipart_data,
+        )
@@ -1,9 +1,7 @@
 """ Module to access the Jobs endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import CreateJobJsonBody, Job, StatusOK
 from ..base import ApiBaseClass
@@ -33,36 +31,7 @@ class JobsApi(ApiBaseClass):
             `GetJobs <https://api.mattermost.com/#operation/GetJobs>`_
         """
 
-        url = "/jobs"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Job.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_jobs", page=page, per_page=per_page)
 
     def create_job(
         self,
@@ -82,31 +51,7 @@ class JobsApi(ApiBaseClass):
             `CreateJob <https://api.mattermost.com/#operation/CreateJob>`_
         """
 
-        url = "/jobs"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Job.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_job", json_body=json_body)
 
     def get_job(
         self,
@@ -125,25 +70,7 @@ class JobsApi(ApiBaseClass):
             `GetJob <https://api.mattermost.com/#operation/GetJob>`_
         """
 
-        url = f"/jobs/{job_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Job.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_job", job_id=job_id)
 
     def download_job(
         self,
@@ -162,21 +89,7 @@ class JobsApi(ApiBaseClass):
             `DownloadJob <https://api.mattermost.com/#operation/DownloadJob>`_
         """
 
-        url = f"/jobs/{job_id}/download"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("download_job", job_id=job_id)
 
     def cancel_job(
         self,
@@ -195,25 +108,7 @@ class JobsApi(ApiBaseClass):
             `CancelJob <https://api.mattermost.com/#operation/CancelJob>`_
         """
 
-        url = f"/jobs/{job_id}/cancel"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("cancel_job", job_id=job_id)
 
     def get_jobs_by_type(
         self,
@@ -236,33 +131,4 @@ class JobsApi(ApiBaseClass):
             `GetJobsByType <https://api.mattermost.com/#operation/GetJobsByType>`_
         """
 
-        url = f"/jobs/type/{type}"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Job.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_jobs_by_type", type=type, page=page, per_page=per_page)
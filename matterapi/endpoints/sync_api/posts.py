@@ -1,9 +1,7 @@
 """ Module to access the Posts endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import (
     ChannelUnreadAt,
@@ -43,36 +41,7 @@ class PostsApi(ApiBaseClass):
             `CreatePost <https://api.mattermost.com/#operation/CreatePost>`_
         """
 
-        url = "/posts"
-        params: Dict[str, Any] = {
-            "set_online": set_online,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Post.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_post", json_body=json_body, set_online=set_online)
 
     def create_post_ephemeral(
         self,
@@ -91,31 +60,7 @@ class PostsApi(ApiBaseClass):
             `CreatePostEphemeral <https://api.mattermost.com/#operation/CreatePostEphemeral>`_
         """
 
-        url = "/posts/ephemeral"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Post.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_post_ephemeral", json_body=json_body)
 
     def get_post(
         self,
@@ -134,25 +79,7 @@ class PostsApi(ApiBaseClass):
             `GetPost <https://api.mattermost.com/#operation/GetPost>`_
         """
 
-        url = f"/posts/{post_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Post.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_post", post_id=post_id)
 
     def update_post(
         self,
@@ -173,31 +100,7 @@ class PostsApi(ApiBaseClass):
             `UpdatePost <https://api.mattermost.com/#operation/UpdatePost>`_
         """
 
-        url = f"/posts/{post_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Post.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("update_post", post_id=post_id, json_body=json_body)
 
     def delete_post(
         self,
@@ -216,25 +119,7 @@ class PostsApi(ApiBaseClass):
             `DeletePost <https://api.mattermost.com/#operation/DeletePost>`_
         """
 
-        url = f"/posts/{post_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("delete_post", post_id=post_id)
 
     def set_post_unread(
         self,
@@ -258,25 +143,7 @@ class PostsApi(ApiBaseClass):
             `SetPostUnread <https://api.mattermost.com/#operation/SetPostUnread>`_
         """
 
-        url = f"/users/{user_id}/posts/{post_id}/set_unread"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = ChannelUnreadAt.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("set_post_unread", user_id=user_id, post_id=post_id)
 
     def patch_post(
         self,
@@ -297,31 +164,7 @@ class PostsApi(ApiBaseClass):
             `PatchPost <https://api.mattermost.com/#operation/PatchPost>`_
         """
 
-        url = f"/posts/{post_id}/patch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Post.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("patch_post", post_id=post_id, json_body=json_body)
 
     def get_post_thread(
         self,
@@ -340,25 +183,7 @@ class PostsApi(ApiBaseClass):
             `GetPostThread <https://api.mattermost.com/#operation/GetPostThread>`_
         """
 
-        url = f"/posts/{post_id}/thread"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = PostList.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_post_thread", post_id=post_id)
 
     def get_flagged_posts_for_user(
         self,
@@ -382,38 +207,14 @@ class PostsApi(ApiBaseClass):
             `GetFlaggedPostsForUser <https://api.mattermost.com/#operation/GetFlaggedPostsForUser>`_
         """
 
-        url = f"/users/{user_id}/posts/flagged"
-        params: Dict[str, Any] = {
-            "team_id": team_id,
-            "channel_id": channel_id,
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = PostList.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_flagged_posts_for_user",
+            user_id=user_id,
+            team_id=team_id,
+            channel_id=channel_id,
+            page=page,
+            per_page=per_page,
+        )
 
     def get_file_infos_for_post(
         self,
@@ -432,30 +233,7 @@ class PostsApi(ApiBaseClass):
             `GetFileInfosForPost <https://api.mattermost.com/#operation/GetFileInfosForPost>`_
         """
 
-        url = f"/posts/{post_id}/files/info"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = FileInfo.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_file_infos_for_post", post_id=post_id)
 
     def get_posts_for_channel(
         self,
@@ -485,34 +263,15 @@ class PostsApi(ApiBaseClass):
             `GetPostsForChannel <https://api.mattermost.com/#operation/GetPostsForChannel>`_
         """
 
-        url = f"/channels/{channel_id}/posts"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "since": since,
-            "before": before,
-            "after": after,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = PostList.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "get_posts_for_channel",
+            channel_id=channel_id,
+            page=page,
+            per_page=per_page,
+            since=since,
+            before=before,
+            after=after,
+        )
 
     def get_posts_around_last_unread(
         self,
@@ -542,34 +301,16 @@ class PostsApi(ApiBaseClass):
             `GetPostsAroundLastUnread <https://api.mattermost.com/#operation/GetPostsAroundLastUnread>`_
         """
 
-        url = f"/users/{user_id}/channels/{channel_id}/posts/unread"
-        params: Dict[str, Any] = {
-            "limit_before": limit_before,
-            "limit_after": limit_after,
-            "skipFetchThreads": skipFetchThreads,
-            "collapsedThreads": collapsedThreads,
-            "collapsedThreadsExtended": collapsedThreadsExtended,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = PostList.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "get_posts_around_last_unread",
+            user_id=user_id,
+            channel_id=channel_id,
+            limit_before=limit_before,
+            limit_after=limit_after,
+            skipFetchThreads=skipFetchThreads,
+            collapsedThreads=collapsedThreads,
+            collapsedThreadsExtended=collapsedThreadsExtended,
+        )
 
     def search_posts(
         self,
@@ -588,31 +329,7 @@ class PostsApi(ApiBaseClass):
             `SearchPosts <https://api.mattermost.com/#operation/SearchPosts>`_
         """
 
-        url = f"/teams/{team_id}/posts/search"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = PostListWithSearchMatches.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("search_posts", team_id=team_id, json_body=json_body)
 
     def pin_post(
         self,
@@ -630,25 +347,7 @@ class PostsApi(ApiBaseClass):
             `PinPost <https://api.mattermost.com/#operation/PinPost>`_
         """
 
-        url = f"/posts/{post_id}/pin"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("pin_post", post_id=post_id)
 
     def unpin_post(
         self,
@@ -667,25 +366,7 @@ class PostsApi(ApiBaseClass):
             `UnpinPost <https://api.mattermost.com/#operation/UnpinPost>`_
         """
 
-        url = f"/posts/{post_id}/unpin"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("unpin_post", post_id=post_id)
 
     def do_post_action(
         self,
@@ -705,25 +386,7 @@ class PostsApi(ApiBaseClass):
             `DoPostAction <https://api.mattermost.com/#operation/DoPostAction>`_
         """
 
-        url = f"/posts/{post_id}/actions/{action_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("do_post_action", post_id=post_id, action_id=action_id)
 
     def get_posts_by_ids(
         self,
@@ -743,29 +406,4 @@ class PostsApi(ApiBaseClass):
             `GetPostsByIds <https://api.mattermost.com/#operation/GetPostsByIds>`_
         """
 
-        url = "/posts/ids"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Post.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_posts_by_ids", json_body=json_body)
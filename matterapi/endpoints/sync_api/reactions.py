@@ -3,8 +3,6 @@
 
 from typing import Dict, List, Union
 
-from pydantic import BaseModel
-
 from ...models import PostIdToReactionsMap, Reaction, StatusOK
 from ..base import ApiBaseClass
 
@@ -29,31 +27,7 @@ class ReactionsApi(ApiBaseClass):
             `SaveReaction <https://api.mattermost.com/#operation/SaveReaction>`_
         """
 
-        url = "/reactions"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Reaction.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("save_reaction", json_body=json_body)
 
     def get_reactions(
         self,
@@ -71,30 +45,7 @@ class ReactionsApi(ApiBaseClass):
             `GetReactions <https://api.mattermost.com/#operation/GetReactions>`_
         """
 
-        url = f"/posts/{post_id}/reactions"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Reaction.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_reactions", post_id=post_id)
 
     def delete_reaction(
         self,
@@ -113,25 +64,12 @@ class ReactionsApi(ApiBaseClass):
             `DeleteReaction <https://api.mattermost.com/#operation/DeleteReaction>`_
         """
 
-        url = f"/users/{user_id}/posts/{post_id}/reactions/{emoji_name}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "delete_reaction",
+            user_id=user_id,
+            post_id=post_id,
+            emoji_name=emoji_name,
+        )
 
     def get_bulk_reactions(
         self,
@@ -152,24 +90,4 @@ class ReactionsApi(ApiBaseClass):
             `GetBulkReactions <https://api.mattermost.com/#operation/GetBulkReactions>`_
         """
 
-        url = "/posts/ids/reactions"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = PostIdToReactionsMap.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_bulk_reactions", json_body=json_body)
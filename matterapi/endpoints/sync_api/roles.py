@@ -3,8 +3,6 @@
 
 from typing import Dict, List, Union
 
-from pydantic import BaseModel
-
 from ...models import PatchRoleJsonBody, Role
 from ..base import ApiBaseClass
 
@@ -28,30 +26,7 @@ class RolesApi(ApiBaseClass):
             `GetAllRoles <https://api.mattermost.com/#operation/GetAllRoles>`_
         """
 
-        url = "/roles"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Role.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_all_roles")
 
     def get_role(
         self,
@@ -70,25 +45,7 @@ class RolesApi(ApiBaseClass):
             `GetRole <https://api.mattermost.com/#operation/GetRole>`_
         """
 
-        url = f"/roles/{role_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Role.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_role", role_id=role_id)
 
     def get_role_by_name(
         self,
@@ -107,25 +64,7 @@ class RolesApi(ApiBaseClass):
             `GetRoleByName <https://api.mattermost.com/#operation/GetRoleByName>`_
         """
 
-        url = f"/roles/name/{role_name}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Role.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_role_by_name", role_name=role_name)
 
     def patch_role(
         self,
@@ -148,31 +87,7 @@ class RolesApi(ApiBaseClass):
             `PatchRole <https://api.mattermost.com/#operation/PatchRole>`_
         """
 
-        url = f"/roles/{role_id}/patch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Role.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("patch_role", role_id=role_id, json_body=json_body)
 
     def get_roles_by_names(
         self,
@@ -192,29 +107,4 @@ class RolesApi(ApiBaseClass):
             `GetRolesByNames <https://api.mattermost.com/#operation/GetRolesByNames>`_
         """
 
-        url = "/roles/names"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Role.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_roles_by_names", json_body=json_body)
@@ -3,8 +3,6 @@
 
 from typing import Dict, Union
 
-from pydantic import BaseModel
-
 from ...models import (
     MigrateAuthToSamlJsonBody,
     ResetSamlAuthDataToEmailJsonBody,
@@ -41,27 +39,7 @@ class SamlApi(ApiBaseClass):
             `MigrateAuthToSaml <https://api.mattermost.com/#operation/MigrateAuthToSaml>`_
         """
 
-        url = "/users/migrate_auth/saml"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("migrate_auth_to_saml", json_body=json_body)
 
     def get_saml_metadata(
         self,
@@ -77,24 +55,7 @@ class SamlApi(ApiBaseClass):
             `GetSamlMetadata <https://api.mattermost.com/#operation/GetSamlMetadata>`_
         """
 
-        url = "/saml/metadata"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = response.json()
-            return response200
-        return response
+        return self._call("get_saml_metadata")
 
     def get_saml_metadata_from_idp(
         self,
@@ -111,24 +72,7 @@ class SamlApi(ApiBaseClass):
             `GetSamlMetadataFromIdp <https://api.mattermost.com/#operation/GetSamlMetadataFromIdp>`_
         """
 
-        url = "/saml/metadatafromidp"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = response.json()
-            return response200
-        return response
+        return self._call("get_saml_metadata_from_idp")
 
     def upload_saml_idp_certificate(
         self,
@@ -148,31 +92,7 @@ class SamlApi(ApiBaseClass):
             `UploadSamlIdpCertificate <https://api.mattermost.com/#operation/UploadSamlIdpCertificate>`_
         """
 
-        url = "/saml/certificate/idp"
-
-        multipart_body_data = UploadSamlIdpCertificateMultipartData.parse_obj(
-            multipart_data
-        )
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("upload_saml_idp_certificate", multipart_data=multipart_data)
 
     def delete_saml_idp_certificate(
         self,
@@ -190,25 +110,7 @@ class SamlApi(ApiBaseClass):
             `DeleteSamlIdpCertificate <https://api.mattermost.com/#operation/DeleteSamlIdpCertificate>`_
         """
 
-        url = "/saml/certificate/idp"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("delete_saml_idp_certificate")
 
     def upload_saml_public_certificate(
         self,
@@ -228,32 +130,11 @@ class SamlApi(ApiBaseClass):
             `UploadSamlPublicCertificate <https://api.mattermost.com/#operation/UploadSamlPublicCertificate>`_
         """
 
-        url = "/saml/certificate/public"
-
-        multipart_body_data = UploadSamlPublicCertificateMultipartData.parse_obj(
-            multipart_data
+        return self._call(
+            "upload_saml_public_certificate",
+            multipart_data=multipart_data,
         )
 
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
-
     def delete_saml_public_certificate(
         self,
     ) -> StatusOK:
@@ -270,25 +151,7 @@ class SamlApi(ApiBaseClass):
             `DeleteSamlPublicCertificate <https://api.mattermost.com/#operation/DeleteSamlPublicCertificate>`_
         """
 
-        url = "/saml/certificate/public"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("delete_saml_public_certificate")
 
     def upload_saml_private_certificate(
         self,
@@ -308,32 +171,11 @@ class SamlApi(ApiBaseClass):
             `UploadSamlPrivateCertificate <https://api.mattermost.com/#operation/UploadSamlPrivateCertificate>`_
         """
 
-        url = "/saml/certificate/private"
-
-        multipart_body_data = UploadSamlPrivateCertificateMultipartData.parse_obj(
-            multipart_data
+        return self._call(
+            "upload_saml_private_certificate",
+            multipart_data=multipart_data,
         )
 
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
-
     def delete_saml_private_certificate(
         self,
     ) -> StatusOK:
@@ -350,25 +192,7 @@ class SamlApi(ApiBaseClass):
             `DeleteSamlPrivateCertificate <https://api.mattermost.com/#operation/DeleteSamlPrivateCertificate>`_
         """
 
-        url = "/saml/certificate/private"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("delete_saml_private_certificate")
 
     def get_saml_certificate_status(
         self,
@@ -385,25 +209,7 @@ class SamlApi(ApiBaseClass):
             `GetSamlCertificateStatus <https://api.mattermost.com/#operation/GetSamlCertificateStatus>`_
         """
 
-        url = "/saml/certificate/status"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = SamlCertificateStatus.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_saml_certificate_status")
 
     def reset_saml_auth_data_to_email(
         self,
@@ -425,28 +231,4 @@ class SamlApi(ApiBaseClass):
             `ResetSamlAuthDataToEmail <https://api.mattermost.com/#operation/ResetSamlAuthDataToEmail>`_
         """
 
-        url = "/saml/reset_auth_data"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = ResetSamlAuthDataToEmailResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("reset_saml_auth_data_to_email", json_body=json_body)
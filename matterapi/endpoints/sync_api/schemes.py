@@ -1,9 +1,7 @@
 """ Module to access the Schemes endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import (
     Channel,
@@ -40,37 +38,7 @@ class SchemesApi(ApiBaseClass):
             `GetSchemes <https://api.mattermost.com/#operation/GetSchemes>`_
         """
 
-        url = "/schemes"
-        params: Dict[str, Any] = {
-            "scope": scope,
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Scheme.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_schemes", scope=scope, page=page, per_page=per_page)
 
     def create_scheme(
         self,
@@ -90,31 +58,7 @@ class SchemesApi(ApiBaseClass):
             `CreateScheme <https://api.mattermost.com/#operation/CreateScheme>`_
         """
 
-        url = "/schemes"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Scheme.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_scheme", json_body=json_body)
 
     def get_scheme(
         self,
@@ -133,25 +77,7 @@ class SchemesApi(ApiBaseClass):
             `GetScheme <https://api.mattermost.com/#operation/GetScheme>`_
         """
 
-        url = f"/schemes/{scheme_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Scheme.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_scheme", scheme_id=scheme_id)
 
     def delete_scheme(
         self,
@@ -170,25 +96,7 @@ class SchemesApi(ApiBaseClass):
             `DeleteScheme <https://api.mattermost.com/#operation/DeleteScheme>`_
         """
 
-        url = f"/schemes/{scheme_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("delete_scheme", scheme_id=scheme_id)
 
     def patch_scheme(
         self,
@@ -212,31 +120,7 @@ class SchemesApi(ApiBaseClass):
             `PatchScheme <https://api.mattermost.com/#operation/PatchScheme>`_
         """
 
-        url = f"/schemes/{scheme_id}/patch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Scheme.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("patch_scheme", scheme_id=scheme_id, json_body=json_body)
 
     def get_teams_for_scheme(
         self,
@@ -260,36 +144,12 @@ class SchemesApi(ApiBaseClass):
             `GetTeamsForScheme <https://api.mattermost.com/#operation/GetTeamsForScheme>`_
         """
 
-        url = f"/schemes/{scheme_id}/teams"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Team.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_teams_for_scheme",
+            scheme_id=scheme_id,
+            page=page,
+            per_page=per_page,
+        )
 
     def get_channels_for_scheme(
         self,
@@ -313,33 +173,9 @@ class SchemesApi(ApiBaseClass):
             `GetChannelsForScheme <https://api.mattermost.com/#operation/GetChannelsForScheme>`_
         """
 
-        url = f"/schemes/{scheme_id}/channels"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Channel.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_channels_for_scheme",
+            scheme_id=scheme_id,
+            page=page,
+            per_page=per_page,
+        )
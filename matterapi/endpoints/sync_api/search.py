@@ -31,25 +31,8 @@ class SearchApi(ApiBaseClass):
             `SearchFiles <https://api.mattermost.com/#operation/SearchFiles>`_
         """
 
-        url = f"/teams/{team_id}/files/search"
-
-        multipart_body_data = SearchFilesMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = FileInfoList.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "search_files",
+            team_id=team_id,
+            multipart_data=multipart_data,
+        )
@@ -1,9 +1,7 @@
 """ Module to access the System endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union, cast
-
-from pydantic import BaseModel
+from typing import Dict, Iterator, List, Optional, Union
 
 from ...models import (
     Audit,
@@ -48,25 +46,7 @@ class SystemApi(ApiBaseClass):
             `GetSupportedTimezone <https://api.mattermost.com/#operation/GetSupportedTimezone>`_
         """
 
-        url = "/system/timezones"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = cast(List[str], response.json())
-
-            return response200
-        return response
+        return self._call("get_supported_timezone")
 
     def get_ping(
         self,
@@ -100,31 +80,11 @@ class SystemApi(ApiBaseClass):
             `GetPing <https://api.mattermost.com/#operation/GetPing>`_
         """
 
-        url = "/system/ping"
-        params: Dict[str, Any] = {
-            "get_server_status": get_server_status,
-            "device_id": device_id,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = SystemStatusResponse.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "get_ping",
+            get_server_status=get_server_status,
+            device_id=device_id,
+        )
 
     def get_notices(
         self,
@@ -148,37 +108,13 @@ class SystemApi(ApiBaseClass):
             `GetNotices <https://api.mattermost.com/#operation/GetNotices>`_
         """
 
-        url = f"/system/notices/{teamId}"
-        params: Dict[str, Any] = {
-            "clientVersion": clientVersion,
-            "locale": locale,
-            "client": client,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Notice.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_notices",
+            teamId=teamId,
+            clientVersion=clientVersion,
+            locale=locale,
+            client=client,
+        )
 
     def mark_notices_viewed(
         self,
@@ -198,27 +134,7 @@ class SystemApi(ApiBaseClass):
             `MarkNoticesViewed <https://api.mattermost.com/#operation/MarkNoticesViewed>`_
         """
 
-        url = "/system/notices/view"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("mark_notices_viewed", json_body=json_body)
 
     def database_recycle(
         self,
@@ -235,25 +151,7 @@ class SystemApi(ApiBaseClass):
             `DatabaseRecycle <https://api.mattermost.com/#operation/DatabaseRecycle>`_
         """
 
-        url = "/database/recycle"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("database_recycle")
 
     def test_email(
         self,
@@ -274,31 +172,7 @@ class SystemApi(ApiBaseClass):
             `TestEmail <https://api.mattermost.com/#operation/TestEmail>`_
         """
 
-        url = "/email/test"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("test_email", json_body=json_body)
 
     def test_site_url(
         self,
@@ -319,31 +193,7 @@ class SystemApi(ApiBaseClass):
             `TestSiteURL <https://api.mattermost.com/#operation/TestSiteURL>`_
         """
 
-        url = "/site_url/test"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("test_site_url", json_body=json_body)
 
     def test_s3_connection(
         self,
@@ -366,31 +216,7 @@ class SystemApi(ApiBaseClass):
             `TestS3Connection <https://api.mattermost.com/#operation/TestS3Connection>`_
         """
 
-        url = "/file/s3_test"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("test_s3_connection", json_body=json_body)
 
     def get_config(
         self,
@@ -406,25 +232,7 @@ class SystemApi(ApiBaseClass):
             `GetConfig <https://api.mattermost.com/#operation/GetConfig>`_
         """
 
-        url = "/config"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Config.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_config")
 
     def update_config(
         self,
@@ -444,31 +252,7 @@ class SystemApi(ApiBaseClass):
             `UpdateConfig <https://api.mattermost.com/#operation/UpdateConfig>`_
         """
 
-        url = "/config"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Config.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("update_config", json_body=json_body)
 
     def reload_config(
         self,
@@ -484,25 +268,7 @@ class SystemApi(ApiBaseClass):
             `ReloadConfig <https://api.mattermost.com/#operation/ReloadConfig>`_
         """
 
-        url = "/config/reload"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("reload_config")
 
     def get_client_config(
         self,
@@ -520,26 +286,7 @@ class SystemApi(ApiBaseClass):
             `GetClientConfig <https://api.mattermost.com/#operation/GetClientConfig>`_
         """
 
-        url = "/config/client"
-        params: Dict[str, Any] = {
-            "format": format,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_client_config", format=format)
 
     def get_environment_config(
         self,
@@ -562,25 +309,7 @@ class SystemApi(ApiBaseClass):
             `GetEnvironmentConfig <https://api.mattermost.com/#operation/GetEnvironmentConfig>`_
         """
 
-        url = "/config/environment"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = EnvironmentConfig.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_environment_config")
 
     def patch_config(
         self,
@@ -602,31 +331,7 @@ class SystemApi(ApiBaseClass):
             `PatchConfig <https://api.mattermost.com/#operation/PatchConfig>`_
         """
 
-        url = "/config/patch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Config.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("patch_config", json_body=json_body)
 
     def upload_license_file(
         self,
@@ -646,29 +351,7 @@ class SystemApi(ApiBaseClass):
             `UploadLicenseFile <https://api.mattermost.com/#operation/UploadLicenseFile>`_
         """
 
-        url = "/license"
-
-        multipart_body_data = UploadLicenseFileMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = StatusOK.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("upload_license_file", multipart_data=multipart_data)
 
     def remove_license_file(
         self,
@@ -687,21 +370,7 @@ class SystemApi(ApiBaseClass):
             `RemoveLicenseFile <https://api.mattermost.com/#operation/RemoveLicenseFile>`_
         """
 
-        url = "/license"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("remove_license_file")
 
     def get_client_license(
         self,
@@ -720,26 +389,7 @@ class SystemApi(ApiBaseClass):
             `GetClientLicense <https://api.mattermost.com/#operation/GetClientLicense>`_
         """
 
-        url = "/license/client"
-        params: Dict[str, Any] = {
-            "format": format,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_client_license", format=format)
 
     def request_license_renewal_link(
         self,
@@ -758,25 +408,7 @@ class SystemApi(ApiBaseClass):
             `RequestLicenseRenewalLink <https://api.mattermost.com/#operation/RequestLicenseRenewalLink>`_
         """
 
-        url = "/license/renewal"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = LicenseRenewalLink.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("request_license_renewal_link")
 
     def request_trial_license(
         self,
@@ -796,27 +428,7 @@ class SystemApi(ApiBaseClass):
             `RequestTrialLicense <https://api.mattermost.com/#operation/RequestTrialLicense>`_
         """
 
-        url = "/trial-license"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("request_trial_license", json_body=json_body)
 
     def get_prev_trial_license(
         self,
@@ -834,21 +446,7 @@ class SystemApi(ApiBaseClass):
             `GetPrevTrialLicense <https://api.mattermost.com/#operation/GetPrevTrialLicense>`_
         """
 
-        url = "/trial-license/prev"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_prev_trial_license")
 
     def get_audits(
         self,
@@ -868,36 +466,30 @@ class SystemApi(ApiBaseClass):
             `GetAudits <https://api.mattermost.com/#operation/GetAudits>`_
         """
 
-        url = "/audits"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Audit.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_audits", page=page, per_page=per_page)
+
+    def iter_audits(
+        self,
+        *,
+        page: Optional[int] = 0,
+        per_page: Optional[int] = 60,
+    ) -> Iterator[Audit]:
+        """Get audits, one at a time
+
+        Streaming variant of :meth:`get_audits`. Elements are yielded as soon as they
+        were received and parsed instead of reading the whole response first.
+
+        Get a page of audits for all users on the system, selected with `page`
+        and `per_page` query parameters.
+
+        Permissions:
+            Must have `manage_system` permission.
+
+        Api Reference:
+            `GetAudits <https://api.mattermost.com/#operation/GetAudits>`_
+        """
+
+        return self._stream("get_audits", page=page, per_page=per_page)
 
     def invalidate_caches(
         self,
@@ -915,25 +507,7 @@ class SystemApi(ApiBaseClass):
             `InvalidateCaches <https://api.mattermost.com/#operation/InvalidateCaches>`_
         """
 
-        url = "/caches/invalidate"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("invalidate_caches")
 
     def get_logs(
         self,
@@ -953,31 +527,30 @@ class SystemApi(ApiBaseClass):
             `GetLogs <https://api.mattermost.com/#operation/GetLogs>`_
         """
 
-        url = "/logs"
-        params: Dict[str, Any] = {
-            "page": page,
-            "logs_per_page": logs_per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
+        return self._call("get_logs", page=page, logs_per_page=logs_per_page)
 
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
+    def iter_logs(
+        self,
+        *,
+        page: Optional[int] = 0,
+        logs_per_page: Optional[str] = "10000",
+    ) -> Iterator[str]:
+        """Get logs, one at a time
 
-        if self.skip_response_parsing:
-            return response
+        Streaming variant of :meth:`get_logs`. Elements are yielded as soon as they
+        were received and parsed instead of reading the whole response first.
 
-        if response.status_code == 200:
-            response200 = cast(List[str], response.json())
+        Get a page of server logs, selected with `page` and `logs_per_page`
+        query parameters.
+
+        Permissions:
+            Must have `manage_system` permission.
+
+        Api Reference:
+            `GetLogs <https://api.mattermost.com/#operation/GetLogs>`_
+        """
 
-            return response200
-        return response
+        return self._stream("get_logs", page=page, logs_per_page=logs_per_page)
 
     def post_log(
         self,
@@ -1001,31 +574,7 @@ class SystemApi(ApiBaseClass):
             `PostLog <https://api.mattermost.com/#operation/PostLog>`_
         """
 
-        url = "/logs"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = PostLogResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("post_log", json_body=json_body)
 
     def get_analytics_old(
         self,
@@ -1051,27 +600,7 @@ class SystemApi(ApiBaseClass):
             `GetAnalyticsOld <https://api.mattermost.com/#operation/GetAnalyticsOld>`_
         """
 
-        url = "/analytics/old"
-        params: Dict[str, Any] = {
-            "name": name,
-            "team_id": team_id,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_analytics_old", name=name, team_id=team_id)
 
     def get_server_busy_expires(
         self,
@@ -1090,25 +619,7 @@ class SystemApi(ApiBaseClass):
             `GetServerBusyExpires <https://api.mattermost.com/#operation/GetServerBusyExpires>`_
         """
 
-        url = "/server_busy"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Server_Busy.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_server_busy_expires")
 
     def set_server_busy(
         self,
@@ -1129,30 +640,7 @@ class SystemApi(ApiBaseClass):
             `SetServerBusy <https://api.mattermost.com/#operation/SetServerBusy>`_
         """
 
-        url = "/server_busy"
-        params: Dict[str, Any] = {
-            "seconds": seconds,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("set_server_busy", seconds=seconds)
 
     def clear_server_busy(
         self,
@@ -1171,25 +659,7 @@ class SystemApi(ApiBaseClass):
             `ClearServerBusy <https://api.mattermost.com/#operation/ClearServerBusy>`_
         """
 
-        url = "/server_busy"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("clear_server_busy")
 
     def get_redirect_location(
         self,
@@ -1209,26 +679,7 @@ class SystemApi(ApiBaseClass):
             `GetRedirectLocation <https://api.mattermost.com/#operation/GetRedirectLocation>`_
         """
 
-        url = "/redirect_location"
-        params: Dict[str, Any] = {
-            "url": url,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_redirect_location", url=url)
 
     def get_image_by_url(
         self,
@@ -1246,21 +697,7 @@ class SystemApi(ApiBaseClass):
             `GetImageByUrl <https://api.mattermost.com/#operation/GetImageByUrl>`_
         """
 
-        url = "/image"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_image_by_url")
 
     def upgrade_to_enterprise(
         self,
@@ -1280,25 +717,7 @@ class SystemApi(ApiBaseClass):
             `UpgradeToEnterprise <https://api.mattermost.com/#operation/UpgradeToEnterprise>`_
         """
 
-        url = "/upgrade_to_enterprise"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 202:
-            response202 = PushNotification.parse_obj(response.json())
-
-            return response202
-        return response
+        return self._call("upgrade_to_enterprise")
 
     def upgrade_to_enterprise_status(
         self,
@@ -1318,27 +737,7 @@ class SystemApi(ApiBaseClass):
             `UpgradeToEnterpriseStatus <https://api.mattermost.com/#operation/UpgradeToEnterpriseStatus>`_
         """
 
-        url = "/upgrade_to_enterprise/status"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = UpgradeToEnterpriseStatusResponse200.parse_obj(
-                response.json()
-            )
-
-            return response200
-        return response
+        return self._call("upgrade_to_enterprise_status")
 
     def restart_server(
         self,
@@ -1358,25 +757,7 @@ class SystemApi(ApiBaseClass):
             `RestartServer <https://api.mattermost.com/#operation/RestartServer>`_
         """
 
-        url = "/restart"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("restart_server")
 
     def get_warn_metrics_status(
         self,
@@ -1403,25 +784,7 @@ class SystemApi(ApiBaseClass):
             `GetWarnMetricsStatus <https://api.mattermost.com/#operation/GetWarnMetricsStatus>`_
         """
 
-        url = "/warn_metrics/status"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_warn_metrics_status")
 
     def send_warn_metric_ack(
         self,
@@ -1446,31 +809,11 @@ class SystemApi(ApiBaseClass):
             `SendWarnMetricAck <https://api.mattermost.com/#operation/SendWarnMetricAck>`_
         """
 
-        url = f"/warn_metrics/ack/{warn_metric_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "send_warn_metric_ack",
+            warn_metric_id=warn_metric_id,
+            json_body=json_body,
+        )
 
     def send_trial_license_warn_metric_ack(
         self,
@@ -1492,25 +835,10 @@ class SystemApi(ApiBaseClass):
             `SendTrialLicenseWarnMetricAck <https://api.mattermost.com/#operation/SendTrialLicenseWarnMetricAck>`_
         """
 
-        url = f"/warn_metrics/trial-license-ack/{warn_metric_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "send_trial_license_warn_metric_ack",
+            warn_metric_id=warn_metric_id,
+        )
 
     def check_integrity(
         self,
@@ -1532,30 +860,7 @@ class SystemApi(ApiBaseClass):
             `CheckIntegrity <https://api.mattermost.com/#operation/CheckIntegrity>`_
         """
 
-        url = "/integrity"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = IntegrityCheckResult.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("check_integrity")
 
     def generate_support_packet(
         self,
@@ -1577,21 +882,7 @@ class SystemApi(ApiBaseClass):
             `GenerateSupportPacket <https://api.mattermost.com/#operation/GenerateSupportPacket>`_
         """
 
-        url = "/system/support_packet"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("generate_support_packet")
 
     def update_marketplace_visited_by_admin(
         self,
@@ -1613,28 +904,4 @@ class SystemApi(ApiBaseClass):
             `UpdateMarketplaceVisitedByAdmin <https://api.mattermost.com/#operation/UpdateMarketplaceVisitedByAdmin>`_
         """
 
-        url = "/plugins/marketplace/first_admin_visit"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("update_marketplace_visited_by_admin", json_body=json_body)
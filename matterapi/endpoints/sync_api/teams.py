@@ -1,9 +1,7 @@
 """ Module to access the Teams endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, Iterator, List, Optional, Union
 
 from ...models import (
     AddTeamMemberJsonBody,
@@ -58,38 +56,13 @@ class TeamsApi(ApiBaseClass):
             `GetAllTeams <https://api.mattermost.com/#operation/GetAllTeams>`_
         """
 
-        url = "/teams"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "include_total_count": include_total_count,
-            "exclude_policy_constrained": exclude_policy_constrained,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Team.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_all_teams",
+            page=page,
+            per_page=per_page,
+            include_total_count=include_total_count,
+            exclude_policy_constrained=exclude_policy_constrained,
+        )
 
     def create_team(
         self,
@@ -107,31 +80,7 @@ class TeamsApi(ApiBaseClass):
             `CreateTeam <https://api.mattermost.com/#operation/CreateTeam>`_
         """
 
-        url = "/teams"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = Team.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_team", json_body=json_body)
 
     def get_team(
         self,
@@ -148,25 +97,7 @@ class TeamsApi(ApiBaseClass):
             `GetTeam <https://api.mattermost.com/#operation/GetTeam>`_
         """
 
-        url = f"/teams/{team_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Team.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_team", team_id=team_id)
 
     def update_team(
         self,
@@ -187,31 +118,7 @@ class TeamsApi(ApiBaseClass):
             `UpdateTeam <https://api.mattermost.com/#operation/UpdateTeam>`_
         """
 
-        url = f"/teams/{team_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Team.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("update_team", team_id=team_id, json_body=json_body)
 
     def soft_delete_team(
         self,
@@ -236,30 +143,7 @@ class TeamsApi(ApiBaseClass):
             `SoftDeleteTeam <https://api.mattermost.com/#operation/SoftDeleteTeam>`_
         """
 
-        url = f"/teams/{team_id}"
-        params: Dict[str, Any] = {
-            "permanent": permanent,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("soft_delete_team", team_id=team_id, permanent=permanent)
 
     def patch_team(
         self,
@@ -280,31 +164,7 @@ class TeamsApi(ApiBaseClass):
             `PatchTeam <https://api.mattermost.com/#operation/PatchTeam>`_
         """
 
-        url = f"/teams/{team_id}/patch"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Team.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("patch_team", team_id=team_id, json_body=json_body)
 
     def update_team_privacy(
         self,
@@ -326,31 +186,7 @@ class TeamsApi(ApiBaseClass):
             `UpdateTeamPrivacy <https://api.mattermost.com/#operation/UpdateTeamPrivacy>`_
         """
 
-        url = f"/teams/{team_id}/privacy"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Team.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("update_team_privacy", team_id=team_id, json_body=json_body)
 
     def restore_team(
         self,
@@ -369,25 +205,7 @@ class TeamsApi(ApiBaseClass):
             `RestoreTeam <https://api.mattermost.com/#operation/RestoreTeam>`_
         """
 
-        url = f"/teams/{team_id}/restore"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Team.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("restore_team", team_id=team_id)
 
     def get_team_by_name(
         self,
@@ -405,25 +223,7 @@ class TeamsApi(ApiBaseClass):
             `GetTeamByName <https://api.mattermost.com/#operation/GetTeamByName>`_
         """
 
-        url = f"/teams/name/{name}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Team.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_team_by_name", name=name)
 
     def search_teams(
         self,
@@ -444,31 +244,7 @@ class TeamsApi(ApiBaseClass):
             `SearchTeams <https://api.mattermost.com/#operation/SearchTeams>`_
         """
 
-        url = "/teams/search"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = SearchTeamsResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("search_teams", json_body=json_body)
 
     def team_exists(
         self,
@@ -485,25 +261,7 @@ class TeamsApi(ApiBaseClass):
             `TeamExists <https://api.mattermost.com/#operation/TeamExists>`_
         """
 
-        url = f"/teams/name/{name}/exists"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = TeamExists.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("team_exists", name=name)
 
     def get_teams_for_user(
         self,
@@ -521,39 +279,45 @@ class TeamsApi(ApiBaseClass):
             `GetTeamsForUser <https://api.mattermost.com/#operation/GetTeamsForUser>`_
         """
 
-        url = f"/users/{user_id}/teams"
+        return self._call("get_teams_for_user", user_id=user_id)
 
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
+    def get_team_members(
+        self,
+        team_id: str,
+        *,
+        page: Optional[int] = 0,
+        per_page: Optional[int] = 60,
+    ) -> List[TeamMember]:
+        """Get team members
 
-        if self.skip_response_parsing:
-            return response
+        Get a page team members list based on query string parameters - team id,
+        page and per page.
 
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = Team.parse_obj(response200_item_data)
+        Permissions:
+            Must be authenticated and have the `view_team` permission.
 
-                response200.append(response200_item)
+        Api Reference:
+            `GetTeamMembers <https://api.mattermost.com/#operation/GetTeamMembers>`_
+        """
 
-            return response200
-        return response
+        return self._call(
+            "get_team_members",
+            team_id=team_id,
+            page=page,
+            per_page=per_page,
+        )
 
-    def get_team_members(
+    def iter_team_members(
         self,
         team_id: str,
         *,
         page: Optional[int] = 0,
         per_page: Optional[int] = 60,
-    ) -> List[TeamMember]:
-        """Get team members
+    ) -> Iterator[TeamMember]:
+        """Get team members, one at a time
+
+        Streaming variant of :meth:`get_team_members`. Elements are yielded as soon as they
+        were received and parsed instead of reading the whole response first.
 
         Get a page team members list based on query string parameters - team id,
         page and per page.
@@ -565,36 +329,12 @@ class TeamsApi(ApiBaseClass):
             `GetTeamMembers <https://api.mattermost.com/#operation/GetTeamMembers>`_
         """
 
-        url = f"/teams/{team_id}/members"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = TeamMember.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._stream(
+            "get_team_members",
+            team_id=team_id,
+            page=page,
+            per_page=per_page,
+        )
 
     def add_team_member(
         self,
@@ -615,31 +355,7 @@ class TeamsApi(ApiBaseClass):
             `AddTeamMember <https://api.mattermost.com/#operation/AddTeamMember>`_
         """
 
-        url = f"/teams/{team_id}/members"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = TeamMember.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("add_team_member", team_id=team_id, json_body=json_body)
 
     def add_team_member_from_invite(
         self,
@@ -658,30 +374,7 @@ class TeamsApi(ApiBaseClass):
             `AddTeamMemberFromInvite <https://api.mattermost.com/#operation/AddTeamMemberFromInvite>`_
         """
 
-        url = "/teams/members/invite"
-        params: Dict[str, Any] = {
-            "token": token,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = TeamMember.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("add_team_member_from_invite", token=token)
 
     def add_team_members(
         self,
@@ -702,46 +395,12 @@ class TeamsApi(ApiBaseClass):
             `AddTeamMembers <https://api.mattermost.com/#operation/AddTeamMembers>`_
         """
 
-        url = f"/teams/{team_id}/members/batch"
-        params: Dict[str, Any] = {
-            "graceful": graceful,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        json_json_body = []
-        for json_body_item_data in json_body:
-
-            if isinstance(json_body_item_data, BaseModel):
-                json_body_item = json_body_item_data.dict(exclude_unset=True)
-            else:
-                json_body_item = json_body_item_data
-
-            json_json_body.append(json_body_item)
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = []
-            _response201 = response.json()
-            for response201_item_data in _response201:
-                response201_item = TeamMember.parse_obj(response201_item_data)
-
-                response201.append(response201_item)
-
-            return response201
-        return response
+        return self._call(
+            "add_team_members",
+            team_id=team_id,
+            json_body=json_body,
+            graceful=graceful,
+        )
 
     def get_team_members_for_user(
         self,
@@ -760,30 +419,7 @@ class TeamsApi(ApiBaseClass):
             `GetTeamMembersForUser <https://api.mattermost.com/#operation/GetTeamMembersForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/members"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = TeamMember.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call("get_team_members_for_user", user_id=user_id)
 
     def get_team_member(
         self,
@@ -801,25 +437,7 @@ class TeamsApi(ApiBaseClass):
             `GetTeamMember <https://api.mattermost.com/#operation/GetTeamMember>`_
         """
 
-        url = f"/teams/{team_id}/members/{user_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = TeamMember.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_team_member", team_id=team_id, user_id=user_id)
 
     def remove_team_member(
         self,
@@ -839,25 +457,7 @@ class TeamsApi(ApiBaseClass):
             `RemoveTeamMember <https://api.mattermost.com/#operation/RemoveTeamMember>`_
         """
 
-        url = f"/teams/{team_id}/members/{user_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("remove_team_member", team_id=team_id, user_id=user_id)
 
     def get_team_members_by_ids(
         self,
@@ -876,32 +476,11 @@ class TeamsApi(ApiBaseClass):
             `GetTeamMembersByIds <https://api.mattermost.com/#operation/GetTeamMembersByIds>`_
         """
 
-        url = f"/teams/{team_id}/members/ids"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = TeamMember.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_team_members_by_ids",
+            team_id=team_id,
+            json_body=json_body,
+        )
 
     def get_team_stats(
         self,
@@ -918,25 +497,7 @@ class TeamsApi(ApiBaseClass):
             `GetTeamStats <https://api.mattermost.com/#operation/GetTeamStats>`_
         """
 
-        url = f"/teams/{team_id}/stats"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = TeamStats.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_team_stats", team_id=team_id)
 
     def regenerate_team_invite_id(
         self,
@@ -953,25 +514,7 @@ class TeamsApi(ApiBaseClass):
             `RegenerateTeamInviteId <https://api.mattermost.com/#operation/RegenerateTeamInviteId>`_
         """
 
-        url = f"/teams/{team_id}/regenerate_invite_id"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = Team.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("regenerate_team_invite_id", team_id=team_id)
 
     def get_team_icon(
         self,
@@ -991,21 +534,7 @@ class TeamsApi(ApiBaseClass):
             `GetTeamIcon <https://api.mattermost.com/#operation/GetTeamIcon>`_
         """
 
-        url = f"/teams/{team_id}/image"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_team_icon", team_id=team_id)
 
     def set_team_icon(
         self,
@@ -1026,29 +555,11 @@ class TeamsApi(ApiBaseClass):
             `SetTeamIcon <https://api.mattermost.com/#operation/SetTeamIcon>`_
         """
 
-        url = f"/teams/{team_id}/image"
-
-        multipart_body_data = SetTeamIconMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "set_team_icon",
+            team_id=team_id,
+            multipart_data=multipart_data,
+        )
 
     def remove_team_icon(
         self,
@@ -1067,25 +578,7 @@ class TeamsApi(ApiBaseClass):
             `RemoveTeamIcon <https://api.mattermost.com/#operation/RemoveTeamIcon>`_
         """
 
-        url = f"/teams/{team_id}/image"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("remove_team_icon", team_id=team_id)
 
     def update_team_member_roles(
         self,
@@ -1108,31 +601,12 @@ class TeamsApi(ApiBaseClass):
             `UpdateTeamMemberRoles <https://api.mattermost.com/#operation/UpdateTeamMemberRoles>`_
         """
 
-        url = f"/teams/{team_id}/members/{user_id}/roles"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_team_member_roles",
+            team_id=team_id,
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     def update_team_member_scheme_roles(
         self,
@@ -1158,31 +632,12 @@ class TeamsApi(ApiBaseClass):
             `UpdateTeamMemberSchemeRoles <https://api.mattermost.com/#operation/UpdateTeamMemberSchemeRoles>`_
         """
 
-        url = f"/teams/{team_id}/members/{user_id}/schemeRoles"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_team_member_scheme_roles",
+            team_id=team_id,
+            user_id=user_id,
+            json_body=json_body,
+        )
 
     def get_teams_unread_for_user(
         self,
@@ -1203,36 +658,12 @@ class TeamsApi(ApiBaseClass):
             `GetTeamsUnreadForUser <https://api.mattermost.com/#operation/GetTeamsUnreadForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/unread"
-        params: Dict[str, Any] = {
-            "exclude_team": exclude_team,
-            "include_collapsed_threads": include_collapsed_threads,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = TeamUnread.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_teams_unread_for_user",
+            user_id=user_id,
+            exclude_team=exclude_team,
+            include_collapsed_threads=include_collapsed_threads,
+        )
 
     def get_team_unread(
         self,
@@ -1252,25 +683,7 @@ class TeamsApi(ApiBaseClass):
             `GetTeamUnread <https://api.mattermost.com/#operation/GetTeamUnread>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/unread"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = TeamUnread.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_team_unread", user_id=user_id, team_id=team_id)
 
     def invite_users_to_team(
         self,
@@ -1294,27 +707,7 @@ class TeamsApi(ApiBaseClass):
             `InviteUsersToTeam <https://api.mattermost.com/#operation/InviteUsersToTeam>`_
         """
 
-        url = f"/teams/{team_id}/invite/email"
-        json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("invite_users_to_team", team_id=team_id, json_body=json_body)
 
     def invite_guests_to_team(
         self,
@@ -1339,31 +732,7 @@ class TeamsApi(ApiBaseClass):
             `InviteGuestsToTeam <https://api.mattermost.com/#operation/InviteGuestsToTeam>`_
         """
 
-        url = f"/teams/{team_id}/invite-guests/email"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("invite_guests_to_team", team_id=team_id, json_body=json_body)
 
     def invalidate_email_invites(
         self,
@@ -1380,25 +749,7 @@ class TeamsApi(ApiBaseClass):
             `InvalidateEmailInvites <https://api.mattermost.com/#operation/InvalidateEmailInvites>`_
         """
 
-        url = "/teams/invites/email"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("invalidate_email_invites")
 
     def import_team(
         self,
@@ -1418,29 +769,7 @@ class TeamsApi(ApiBaseClass):
             `ImportTeam <https://api.mattermost.com/#operation/ImportTeam>`_
         """
 
-        url = f"/teams/{team_id}/import"
-
-        multipart_body_data = ImportTeamMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-            "files": multipart_body_data.get_files(),
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = ImportTeamResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("import_team", team_id=team_id, multipart_data=multipart_data)
 
     def get_team_invite_info(
         self,
@@ -1460,25 +789,7 @@ class TeamsApi(ApiBaseClass):
             `GetTeamInviteInfo <https://api.mattermost.com/#operation/GetTeamInviteInfo>`_
         """
 
-        url = f"/teams/invite/{invite_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = GetTeamInviteInfoResponse200.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_team_invite_info", invite_id=invite_id)
 
     def update_team_scheme(
         self,
@@ -1500,31 +811,7 @@ class TeamsApi(ApiBaseClass):
             `UpdateTeamScheme <https://api.mattermost.com/#operation/UpdateTeamScheme>`_
         """
 
-        url = f"/teams/{team_id}/scheme"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("update_team_scheme", team_id=team_id, json_body=json_body)
 
     def team_members_minus_group_members(
         self,
@@ -1553,28 +840,13 @@ class TeamsApi(ApiBaseClass):
             `TeamMembersMinusGroupMembers <https://api.mattermost.com/#operation/TeamMembersMinusGroupMembers>`_
         """
 
-        url = f"/teams/{team_id}/members_minus_group_members"
-        params: Dict[str, Any] = {
-            "group_ids": group_ids,
-            "page": page,
-            "per_page": per_page,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call(
+            "team_members_minus_group_members",
+            team_id=team_id,
+            group_ids=group_ids,
+            page=page,
+            per_page=per_page,
+        )
 
     def search_files(
         self,
@@ -1597,25 +869,8 @@ class TeamsApi(ApiBaseClass):
             `SearchFiles <https://api.mattermost.com/#operation/SearchFiles>`_
         """
 
-        url = f"/teams/{team_id}/files/search"
-
-        multipart_body_data = SearchFilesMultipartData.parse_obj(multipart_data)
-
-        request_kwargs = {
-            "url": url,
-            "data": multipart_body_data.get_data(),
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = FileInfoList.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "search_files",
+            team_id=team_id,
+            multipart_data=multipart_data,
+        )
@@ -1,7 +1,7 @@
 """ Module to access the Threads endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, Optional
+from typing import Optional
 
 from ...models import UserThreads
 from ..base import ApiBaseClass
@@ -36,35 +36,17 @@ class ThreadsApi(ApiBaseClass):
             `GetUserThreads <https://api.mattermost.com/#operation/GetUserThreads>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/threads"
-        params: Dict[str, Any] = {
-            "since": since,
-            "deleted": deleted,
-            "extended": extended,
-            "page": page,
-            "pageSize": pageSize,
-            "totalsOnly": totalsOnly,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = UserThreads.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "get_user_threads",
+            user_id=user_id,
+            team_id=team_id,
+            since=since,
+            deleted=deleted,
+            extended=extended,
+            page=page,
+            pageSize=pageSize,
+            totalsOnly=totalsOnly,
+        )
 
     def get_thread_mention_counts_by_channel(
         self,
@@ -85,21 +67,11 @@ class ThreadsApi(ApiBaseClass):
             `GetThreadMentionCountsByChannel <https://api.mattermost.com/#operation/GetThreadMentionCountsByChannel>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/threads/mention_counts"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call(
+            "get_thread_mention_counts_by_channel",
+            user_id=user_id,
+            team_id=team_id,
+        )
 
     def update_threads_read_for_user(
         self,
@@ -120,21 +92,11 @@ class ThreadsApi(ApiBaseClass):
             `UpdateThreadsReadForUser <https://api.mattermost.com/#operation/UpdateThreadsReadForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/threads/read"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call(
+            "update_threads_read_for_user",
+            user_id=user_id,
+            team_id=team_id,
+        )
 
     def update_thread_read_for_user(
         self,
@@ -157,21 +119,13 @@ class ThreadsApi(ApiBaseClass):
             `UpdateThreadReadForUser <https://api.mattermost.com/#operation/UpdateThreadReadForUser>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/threads/{thread_id}/read/{timestamp}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call(
+            "update_thread_read_for_user",
+            user_id=user_id,
+            team_id=team_id,
+            thread_id=thread_id,
+            timestamp=timestamp,
+        )
 
     def start_following_thread(
         self,
@@ -193,21 +147,12 @@ class ThreadsApi(ApiBaseClass):
             `StartFollowingThread <https://api.mattermost.com/#operation/StartFollowingThread>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/threads/{thread_id}/following"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call(
+            "start_following_thread",
+            user_id=user_id,
+            team_id=team_id,
+            thread_id=thread_id,
+        )
 
     def stop_following_thread(
         self,
@@ -229,21 +174,12 @@ class ThreadsApi(ApiBaseClass):
             `StopFollowingThread <https://api.mattermost.com/#operation/StopFollowingThread>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/threads/{thread_id}/following"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call(
+            "stop_following_thread",
+            user_id=user_id,
+            team_id=team_id,
+            thread_id=thread_id,
+        )
 
     def get_user_thread(
         self,
@@ -265,18 +201,9 @@ class ThreadsApi(ApiBaseClass):
             `GetUserThread <https://api.mattermost.com/#operation/GetUserThread>`_
         """
 
-        url = f"/users/{user_id}/teams/{team_id}/threads/{thread_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call(
+            "get_user_thread",
+            user_id=user_id,
+            team_id=team_id,
+            thread_id=thread_id,
+        )
@@ -3,8 +3,6 @@
 
 from typing import Dict, Union
 
-from pydantic import BaseModel
-
 from ...models import CreateUploadJsonBody, FileInfo, UploadDataFormData, UploadSession
 from ..base import ApiBaseClass
 
@@ -30,31 +28,7 @@ class UploadsApi(ApiBaseClass):
             `CreateUpload <https://api.mattermost.com/#operation/CreateUpload>`_
         """
 
-        url = "/uploads"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = UploadSession.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_upload", json_body=json_body)
 
     def get_upload(
         self,
@@ -72,21 +46,7 @@ class UploadsApi(ApiBaseClass):
             `GetUpload <https://api.mattermost.com/#operation/GetUpload>`_
         """
 
-        url = f"/uploads/{upload_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        return response
+        return self._call("get_upload", upload_id=upload_id)
 
     def upload_data(
         self,
@@ -112,23 +72,4 @@ class UploadsApi(ApiBaseClass):
             `UploadData <https://api.mattermost.com/#operation/UploadData>`_
         """
 
-        url = f"/uploads/{upload_id}"
-
-        request_kwargs = {
-            "url": url,
-            "data": form_data,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = FileInfo.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("upload_data", upload_id=upload_id, form_data=form_data)
@@ -1,9 +1,7 @@
 """ Module to access the Webhooks endpoints """
 # pylint: disable=too-many-lines,too-many-locals,too-many-public-methods,too-few-public-methods
 
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
 
 from ...models import (
     CreateIncomingWebhookJsonBody,
@@ -40,37 +38,12 @@ class WebhooksApi(ApiBaseClass):
             `GetIncomingWebhooks <https://api.mattermost.com/#operation/GetIncomingWebhooks>`_
         """
 
-        url = "/hooks/incoming"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "team_id": team_id,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = IncomingWebhook.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_incoming_webhooks",
+            page=page,
+            per_page=per_page,
+            team_id=team_id,
+        )
 
     def create_incoming_webhook(
         self,
@@ -91,31 +64,7 @@ class WebhooksApi(ApiBaseClass):
             `CreateIncomingWebhook <https://api.mattermost.com/#operation/CreateIncomingWebhook>`_
         """
 
-        url = "/hooks/incoming"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = IncomingWebhook.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_incoming_webhook", json_body=json_body)
 
     def get_incoming_webhook(
         self,
@@ -133,25 +82,7 @@ class WebhooksApi(ApiBaseClass):
             `GetIncomingWebhook <https://api.mattermost.com/#operation/GetIncomingWebhook>`_
         """
 
-        url = f"/hooks/incoming/{hook_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = IncomingWebhook.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_incoming_webhook", hook_id=hook_id)
 
     def update_incoming_webhook(
         self,
@@ -171,31 +102,11 @@ class WebhooksApi(ApiBaseClass):
             `UpdateIncomingWebhook <https://api.mattermost.com/#operation/UpdateIncomingWebhook>`_
         """
 
-        url = f"/hooks/incoming/{hook_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = IncomingWebhook.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_incoming_webhook",
+            hook_id=hook_id,
+            json_body=json_body,
+        )
 
     def delete_incoming_webhook(
         self,
@@ -213,25 +124,7 @@ class WebhooksApi(ApiBaseClass):
             `DeleteIncomingWebhook <https://api.mattermost.com/#operation/DeleteIncomingWebhook>`_
         """
 
-        url = f"/hooks/incoming/{hook_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("delete_incoming_webhook", hook_id=hook_id)
 
     def get_outgoing_webhooks(
         self,
@@ -254,38 +147,13 @@ class WebhooksApi(ApiBaseClass):
             `GetOutgoingWebhooks <https://api.mattermost.com/#operation/GetOutgoingWebhooks>`_
         """
 
-        url = "/hooks/outgoing"
-        params: Dict[str, Any] = {
-            "page": page,
-            "per_page": per_page,
-            "team_id": team_id,
-            "channel_id": channel_id,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        request_kwargs = {
-            "url": url,
-            "params": params,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = []
-            _response200 = response.json()
-            for response200_item_data in _response200:
-                response200_item = OutgoingWebhook.parse_obj(response200_item_data)
-
-                response200.append(response200_item)
-
-            return response200
-        return response
+        return self._call(
+            "get_outgoing_webhooks",
+            page=page,
+            per_page=per_page,
+            team_id=team_id,
+            channel_id=channel_id,
+        )
 
     def create_outgoing_webhook(
         self,
@@ -306,31 +174,7 @@ class WebhooksApi(ApiBaseClass):
             `CreateOutgoingWebhook <https://api.mattermost.com/#operation/CreateOutgoingWebhook>`_
         """
 
-        url = "/hooks/outgoing"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 201:
-            response201 = OutgoingWebhook.parse_obj(response.json())
-
-            return response201
-        return response
+        return self._call("create_outgoing_webhook", json_body=json_body)
 
     def get_outgoing_webhook(
         self,
@@ -348,25 +192,7 @@ class WebhooksApi(ApiBaseClass):
             `GetOutgoingWebhook <https://api.mattermost.com/#operation/GetOutgoingWebhook>`_
         """
 
-        url = f"/hooks/outgoing/{hook_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.get(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = OutgoingWebhook.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("get_outgoing_webhook", hook_id=hook_id)
 
     def update_outgoing_webhook(
         self,
@@ -386,31 +212,11 @@ class WebhooksApi(ApiBaseClass):
             `UpdateOutgoingWebhook <https://api.mattermost.com/#operation/UpdateOutgoingWebhook>`_
         """
 
-        url = f"/hooks/outgoing/{hook_id}"
-
-        if isinstance(json_body, BaseModel):
-            json_json_body = json_body.dict(exclude_unset=True)
-        else:
-            json_json_body = json_body
-
-        request_kwargs = {
-            "url": url,
-            "json": json_json_body,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.put(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = OutgoingWebhook.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call(
+            "update_outgoing_webhook",
+            hook_id=hook_id,
+            json_body=json_body,
+        )
 
     def delete_outgoing_webhook(
         self,
@@ -428,25 +234,7 @@ class WebhooksApi(ApiBaseClass):
             `DeleteOutgoingWebhook <https://api.mattermost.com/#operation/DeleteOutgoingWebhook>`_
         """
 
-        url = f"/hooks/outgoing/{hook_id}"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.delete(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("delete_outgoing_webhook", hook_id=hook_id)
 
     def regen_outgoing_hook_token(
         self,
@@ -464,22 +252,4 @@ class WebhooksApi(ApiBaseClass):
             `RegenOutgoingHookToken <https://api.mattermost.com/#operation/RegenOutgoingHookToken>`_
         """
 
-        url = f"/hooks/outgoing/{hook_id}/regen_token"
-
-        request_kwargs = {
-            "url": url,
-        }
-        # pylint: disable-next=protected-access
-        with self.client._get_httpx_client() as httpx_client:
-            response = httpx_client.post(
-                **request_kwargs,
-            )
-
-        if self.skip_response_parsing:
-            return response
-
-        if response.status_code == 200:
-            response200 = StatusOK.parse_obj(response.json())
-
-            return response200
-        return response
+        return self._call("regen_outgoing_hook_token", hook_id=hook_id)
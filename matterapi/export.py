@@ -0,0 +1,363 @@
+""" Sharded export of the full post history into compressed NDJSON files """
+
+import contextlib
+import gzip
+import itertools
+import json
+import multiprocessing
+import os
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from .client.base import logger
+from .client.bulk import read_records
+from .paging import _decoded, channel_posts
+
+if TYPE_CHECKING:
+    from .client.sync_client import SyncClient
+
+MANIFEST = "manifest.json"
+""" Name of the file recording the channels and their assignment to shards """
+
+
+@dataclass
+class ChannelState:
+    """Export progress of a single channel, as recorded in the shard checkpoint"""
+
+    channel_id: str
+    """ Id of the channel """
+    files: List[str] = field(default_factory=list)
+    """ Completed files, relative to the export directory, oldest page last """
+    posts: int = 0
+    """ Number of posts in the completed files """
+    before: Optional[str] = None
+    """ Id of the oldest exported post, the next page is requested before it """
+    done: bool = False
+    """ Whether the whole history of the channel was exported """
+    error: Optional[str] = None
+    """ Error of the last attempt, the channel is retried when the export is resumed """
+
+
+@dataclass
+class ExportStats:
+    """Summary of an export, collected from the checkpoints of all shards"""
+
+    channels: int = 0
+    """ Number of channels in the export """
+    completed: int = 0
+    """ Number of completely exported channels """
+    posts: int = 0
+    """ Number of exported posts """
+    files: int = 0
+    """ Number of written files """
+    failed: Dict[str, str] = field(default_factory=dict)
+    """ Error message per channel which failed in the last run """
+
+
+class ShardCheckpoint:
+    """Append-only record of the progress of one shard
+
+    Every completed file and every finished channel is written as one json line,
+    so an interrupted export continues after the last completed file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.channels: Dict[str, ChannelState] = {}
+        if os.path.exists(path):
+            for record in read_records(path):
+                self._apply(record)
+        self._file = None
+
+    def _apply(self, record: Dict[str, Any]):
+        state = self.state(record["channel_id"])
+        if "file" in record:
+            state.files.append(record["file"])
+            state.posts += record["posts"]
+            state.before = record["before"]
+        state.error = record.get("error")
+        state.done = state.done or record.get("done", False)
+
+    def state(self, channel_id: str) -> ChannelState:
+        state = self.channels.get(channel_id)
+        if state is None:
+            state = self.channels[channel_id] = ChannelState(channel_id)
+        return state
+
+    def record(self, **record):
+        self._apply(record)
+        if self._file is None:
+            # pylint: disable-next=consider-using-with
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def shard_of(channel_id: str, shards: int) -> int:
+    """Return the shard a channel is assigned to, stable across runs and processes"""
+    return zlib.crc32(channel_id.encode("utf-8")) % shards
+
+
+class HistoryExporter:
+    """Export the posts of many channels in parallel worker processes
+
+    Channels are distributed over ``workers`` shards. Every shard is exported by its own
+    process with its own client session, which pages through each channel from the newest
+    to the oldest post using ``before`` cursors. Posts are written as one json object per
+    line into gzip compressed files of at most ``posts_per_file`` posts:
+
+    .. code-block:: text
+
+        export/
+            manifest.json                           channels per shard
+            shard-0000.jsonl                        checkpoint of shard 0
+            <channel_id>/00000.ndjson.gz            newest posts of the channel
+            <channel_id>/00001.ndjson.gz
+
+    Files are written under a temporary name and renamed once complete, and each
+    completed file is recorded in the checkpoint of its shard. Running the exporter again
+    with the same directory continues after the last completed file of every channel and
+    retries channels which failed. Each file starts with the post following the last post
+    of the previous file, so no post is exported twice.
+
+    .. code-block:: python
+
+        exporter = HistoryExporter(sd, "export", workers=8)
+        stats = exporter.run()
+        print(stats.posts, stats.failed)
+
+    Worker processes are started with ``mp_context``, the platform default if not set. With
+    the ``spawn`` and ``forkserver`` start methods the client has to be picklable, i.e.
+    ``httpx_client_options`` must not contain transports or hooks.
+
+    Args:
+        client: Client used for the channel enumeration and copied into each worker
+        directory: Directory the export is written to
+        workers: Number of worker processes and shards. Only used when a new export is
+            started, resumed exports keep their sharding. ``1`` exports in the current process.
+        per_page: Number of posts requested per page
+        posts_per_file: Maximum number of posts per file
+        user_id: Export the channels of this user on all of their teams. By default all
+            channels of the server are exported, which needs the ``manage_system`` permission.
+        include_deleted: Include archived channels
+        retries: Number of retries for pages failing with 429, 5xx or transport errors
+        retry_backoff: Delay in seconds before the first retry, doubled for every further retry
+        compresslevel: gzip compression level
+        mp_context: ``multiprocessing`` context used to start the workers
+    """
+
+    def __init__(
+        self,
+        client: "SyncClient",
+        directory: str,
+        *,
+        workers: int = 4,
+        per_page: int = 200,
+        posts_per_file: int = 100000,
+        user_id: Optional[str] = None,
+        include_deleted: bool = False,
+        retries: int = 3,
+        retry_backoff: float = 1.0,
+        compresslevel: int = 6,
+        mp_context: Optional[Any] = None,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.client = client
+        self.directory = directory
+        self.workers = workers
+        self.per_page = per_page
+        self.posts_per_file = posts_per_file
+        self.user_id = user_id
+        self.include_deleted = include_deleted
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.compresslevel = compresslevel
+        self.mp_context = mp_context or multiprocessing.get_context()
+
+    def list_channels(self) -> List[str]:
+        """Return the ids of all channels to export, see ``user_id``"""
+        channel_ids: Dict[str, None] = {}
+        with self.client.session() as api:
+            if self.user_id is None:
+                page = 0
+                while True:
+                    count = 0
+                    for channel in api.channels.iter_all_channels(
+                        page=page,
+                        per_page=200,
+                        include_deleted=self.include_deleted,
+                    ):
+                        channel_ids[_decoded(channel)["id"]] = None
+                        count += 1
+                    if count < 200:
+                        break
+                    page += 1
+            else:
+                for team in _decoded(api.teams.get_teams_for_user(self.user_id)):
+                    channels = api.channels.get_channels_for_team_for_user(
+                        self.user_id,
+                        _decoded(team)["id"],
+                        include_deleted=self.include_deleted,
+                    )
+                    for channel in _decoded(channels):
+                        channel_ids[_decoded(channel)["id"]] = None
+        return list(channel_ids)
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.directory, MANIFEST)
+
+    def _checkpoint_path(self, shard: int) -> str:
+        return os.path.join(self.directory, f"shard-{shard:04d}.jsonl")
+
+    def load_manifest(self) -> Optional[Dict[str, Any]]:
+        """Return the manifest of an existing export in the directory, if any"""
+        if not os.path.exists(self._manifest_path()):
+            return None
+        with open(self._manifest_path(), encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+
+    def _create_manifest(self, channel_ids: Iterable[str]) -> Dict[str, Any]:
+        shards: List[List[str]] = [[] for _ in range(self.workers)]
+        for channel_id in channel_ids:
+            shards[shard_of(channel_id, self.workers)].append(channel_id)
+        manifest = {"version": 1, "created_at": int(time.time()), "shards": shards}
+        os.makedirs(self.directory, exist_ok=True)
+        temporary = self._manifest_path() + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(temporary, self._manifest_path())
+        return manifest
+
+    def run(self, channel_ids: Optional[Iterable[str]] = None) -> ExportStats:
+        """Export all channels, or resume the export in the directory
+
+        Args:
+            channel_ids: Channels to export instead of the enumerated ones. Ignored when
+                resuming an existing export.
+
+        Raises:
+            RuntimeError: If a worker process died. Completed files are kept, so the
+                export can be resumed.
+        """
+        manifest = self.load_manifest()
+        if manifest is None:
+            if channel_ids is None:
+                channel_ids = self.list_channels()
+            manifest = self._create_manifest(channel_ids)
+        shards = manifest["shards"]
+        if len(shards) == 1:
+            self.export_shard(0, shards[0])
+        else:
+            processes = []
+            for shard, shard_channels in enumerate(shards):
+                process = self.mp_context.Process(
+                    target=self.export_shard,
+                    args=(shard, shard_channels),
+                    name=f"matterapi-export-{shard}",
+                )
+                process.start()
+                processes.append(process)
+            for process in processes:
+                process.join()
+            failed = [process.name for process in processes if process.exitcode]
+            if failed:
+                raise RuntimeError(f"Export workers failed: {', '.join(failed)}")
+        return self.stats()
+
+    def stats(self) -> ExportStats:
+        """Summarize the progress of the export in the directory"""
+        stats = ExportStats()
+        manifest = self.load_manifest()
+        if manifest is None:
+            return stats
+        for shard, shard_channels in enumerate(manifest["shards"]):
+            checkpoint = ShardCheckpoint(self._checkpoint_path(shard))
+            stats.channels += len(shard_channels)
+            for state in checkpoint.channels.values():
+                stats.completed += state.done
+                stats.posts += state.posts
+                stats.files += len(state.files)
+                if state.error and not state.done:
+                    stats.failed[state.channel_id] = state.error
+        return stats
+
+    def export_shard(self, shard: int, channel_ids: List[str]):
+        """Export all unfinished channels of one shard, called in the worker process"""
+        checkpoint = ShardCheckpoint(self._checkpoint_path(shard))
+        options = self.client.options.copy(update={"skip_response_parsing": True})
+        try:
+            with self.client.copy(update={"options": options}).session() as api:
+                for channel_id in channel_ids:
+                    state = checkpoint.state(channel_id)
+                    if state.done:
+                        continue
+                    # pylint: disable=broad-except
+                    try:
+                        self._export_channel(api, checkpoint, state)
+                    except Exception as error:
+                        logger.warning(
+                            "Export of channel %s failed: %s", channel_id, error
+                        )
+                        checkpoint.record(channel_id=channel_id, error=str(error))
+        finally:
+            checkpoint.close()
+
+    def _export_channel(self, api, checkpoint: ShardCheckpoint, state: ChannelState):
+        os.makedirs(os.path.join(self.directory, state.channel_id), exist_ok=True)
+        posts = channel_posts(
+            api,
+            state.channel_id,
+            self.per_page,
+            before=state.before,
+            retries=self.retries,
+            retry_backoff=self.retry_backoff,
+        )
+        for first in posts:
+            # Takes the following posts of the file from the same iterator
+            chunk = itertools.chain(
+                (first,), itertools.islice(posts, self.posts_per_file - 1)
+            )
+            self._export_file(checkpoint, state, chunk)
+        checkpoint.record(channel_id=state.channel_id, done=True)
+
+    def _export_file(
+        self, checkpoint: ShardCheckpoint, state: ChannelState, posts: Iterable[Any]
+    ):
+        name = os.path.join(state.channel_id, f"{len(state.files):05d}.ndjson.gz")
+        path = os.path.join(self.directory, name)
+        count = 0
+        before = None
+        try:
+            with gzip.open(path + ".tmp", "wt", self.compresslevel, "utf-8") as output:
+                for post in posts:
+                    output.write(json.dumps(post, separators=(",", ":")))
+                    output.write("\n")
+                    count += 1
+                    before = post["id"]
+            os.replace(path + ".tmp", path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(path + ".tmp")
+            raise
+        checkpoint.record(
+            channel_id=state.channel_id, file=name, posts=count, before=before
+        )
+
+
+__all__ = [
+    "HistoryExporter",
+    "ExportStats",
+    "ChannelState",
+    "ShardCheckpoint",
+    "shard_of",
+    "MANIFEST",
+]
@@ -0,0 +1,270 @@
+""" Fast construction of frequently parsed models """
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel, Extra, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_MAPPING, SHAPE_SINGLETON
+
+from . import models
+from .lazy import lazy_parse_obj
+
+Model = TypeVar("Model", bound=BaseModel)
+
+HOT_MODELS: Tuple[Type[BaseModel], ...] = (
+    models.Post,
+    models.User,
+    models.Channel,
+    models.ChannelMember,
+    models.TeamMember,
+    models.Status,
+    models.Reaction,
+)
+""" Models which dominate parsing time in typical workloads """
+
+_BASIC_TYPES = (str, int, float, bool)
+
+# Returned by converters for values which have to be validated by pydantic
+_VALIDATE = object()
+
+# name, alias, exact type, converter, whether None is allowed, default factory
+_Plan = List[
+    Tuple[str, str, Optional[type], Optional[Callable], bool, Optional[Callable]]
+]
+_PLANS: Dict[Tuple[Type[BaseModel], bool], _Plan] = {}
+_FAST_MODELS: Dict[Type[BaseModel], bool] = {}
+
+
+def _contains_hot_model(model: Type[BaseModel], seen: Set[Type[BaseModel]]) -> bool:
+    if model in HOT_MODELS:
+        return True
+    seen.add(model)
+    return any(
+        _is_model(field.type_)
+        and field.type_ not in seen
+        and _contains_hot_model(field.type_, seen)
+        for field in model.__fields__.values()
+    )
+
+
+def _is_model(type_: Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, BaseModel)
+
+
+def is_fast_model(model: Any) -> bool:
+    """Check if ``model`` is created by :func:`fast_parse_obj` when fast models are enabled
+
+    This is the case for all :data:`HOT_MODELS` and models containing them, e.g. ``PostList``.
+    """
+    if not _is_model(model):
+        return False
+    fast = _FAST_MODELS.get(model)
+    if fast is None:
+        fast = _FAST_MODELS[model] = _contains_hot_model(model, set())
+    return fast
+
+
+def _is_trusted(model: Type[BaseModel], lazy: bool) -> bool:
+    """Check if all fields of ``model`` can be created without pydantic"""
+    return all(
+        exact is not None or convert is not None
+        for _, _, exact, convert, _, _ in _plan(model, lazy)
+    )
+
+
+def _nested_parser(type_: Type[BaseModel], lazy: bool) -> Callable[[Any], Any]:
+    # Small nested models like notify props consist of basic types only, creating
+    # them directly is cheaper than creating them lazily
+    if is_fast_model(type_) or _is_trusted(type_, lazy):
+        return lambda data: fast_parse_obj(type_, data, lazy=lazy)
+    if lazy:
+        return lambda data: lazy_parse_obj(type_, data)
+    return type_.parse_obj
+
+
+def _all_dicts(items: Iterable[Any]) -> bool:
+    return all(type(item) is dict for item in items)
+
+
+def _list_converter(type_: type) -> Callable[[Any], Any]:
+    def convert_list(data):
+        if type(data) is list and all(type(item) is type_ for item in data):
+            return data
+        return _VALIDATE
+
+    return convert_list
+
+
+def _model_converter(field, lazy: bool) -> Optional[Callable[[Any], Any]]:
+    """Return a converter for a model, a list of models or a mapping of models
+
+    Pydantic accepts other mappings and sequences of pairs as models as well, nested
+    values which are not a ``dict`` are left to it unless the model has a custom root.
+    """
+    parse = _nested_parser(field.type_, lazy)
+    any_value = bool(field.type_.__custom_root_type__)
+    if field.shape == SHAPE_SINGLETON:
+
+        def convert_model(data):
+            if not any_value and type(data) is not dict:
+                return _VALIDATE
+            return parse(data)
+
+        return convert_model
+    if field.shape == SHAPE_LIST:
+
+        def convert_models(data):
+            if type(data) is not list or not (any_value or _all_dicts(data)):
+                return _VALIDATE
+            return [parse(item) for item in data]
+
+        return convert_models
+    if field.shape in (SHAPE_DICT, SHAPE_MAPPING):
+
+        def convert_mapping(data):
+            if type(data) is not dict or not (any_value or _all_dicts(data.values())):
+                return _VALIDATE
+            return {key: parse(item) for key, item in data.items()}
+
+        return convert_mapping
+    return None
+
+
+def _converter(field, lazy: bool) -> Tuple[Optional[type], Optional[Callable]]:
+    """Return how values of a field are created without pydantic
+
+    Values of the returned exact type are used as they are. Other values are passed to
+    the returned converter, if any, which returns :data:`_VALIDATE` for values it can not
+    handle. Everything else is validated by pydantic.
+    """
+    type_ = field.type_
+    if field.sub_fields_mapping or (
+        field.sub_fields and field.shape == SHAPE_SINGLETON
+    ):
+        return None, None
+    if type_ in _BASIC_TYPES:
+        if field.shape == SHAPE_SINGLETON:
+            return type_, None
+        if field.shape == SHAPE_LIST:
+            return None, _list_converter(type_)
+        return None, None
+    if _is_model(type_):
+        return None, _model_converter(field, lazy)
+    return None, None
+
+
+def _plan(model: Type[BaseModel], lazy: bool) -> _Plan:
+    plan = _PLANS.get((model, lazy))
+    if plan is None:
+        plan = [
+            (
+                name,
+                field.alias,
+                *_converter(field, lazy),
+                field.allow_none,
+                None if field.required else field.get_default,
+            )
+            for name, field in model.__fields__.items()
+        ]
+        plan = _PLANS.setdefault((model, lazy), plan)
+    return plan
+
+
+def _convert(
+    model: Type[BaseModel],
+    name: str,
+    convert: Optional[Callable],
+    allow_none: bool,
+    value: Any,
+    values: Dict[str, Any],
+) -> Any:
+    """Create the value of a field which does not have the exact type"""
+    if value is None:
+        if allow_none:
+            return None
+    elif convert is not None:
+        converted = convert(value)
+        if converted is not _VALIDATE:
+            return converted
+    field = model.__fields__[name]
+    value, errors = field.validate(value, values, loc=field.alias, cls=model)
+    if errors:
+        raise ValidationError([errors], model)
+    return value
+
+
+def _add_extra(data: Dict[str, Any], values: Dict[str, Any], fields_set: Set[str]):
+    """Keep values of undeclared fields like pydantic does for ``Extra.allow``"""
+    for key, value in data.items():
+        if key not in values:
+            values[key] = value
+            fields_set.add(key)
+
+
+def fast_parse_obj(model: Type[Model], data: Any, lazy: bool = False) -> Model:
+    """Create an instance of ``model`` from decoded json, skipping pydantic where possible
+
+    Values of basic fields (strings, numbers, booleans and lists of them) which already
+    have the declared type are taken from the json as they are. Only values which need a
+    conversion, like booleans sent as ``"true"``, and fields of other types are validated
+    by pydantic. Nested models are created the same way if they are :func:`fast models
+    <is_fast_model>` or consist of basic fields only, other nested models are parsed
+    regularly, or as :func:`lazy models <matterapi.lazy.lazy_parse_obj>` if ``lazy`` is
+    set. The result is a regular instance of ``model`` and equal to the result of
+    ``model.parse_obj(data)``.
+
+    Raises:
+        ValidationError: If ``data`` is not a mapping, required fields are missing or
+            values can not be converted
+    """
+    if model.__custom_root_type__:
+        data = {"__root__": data}
+    elif not isinstance(data, dict):
+        raise ValidationError(
+            [ErrorWrapper(TypeError("value is not a valid dict"), loc="__root__")],
+            model,
+        )
+    values: Dict[str, Any] = {}
+    fields_set = set()
+    for name, alias, exact, convert, allow_none, default in _plan(model, lazy):
+        if alias in data:
+            value = data[alias]
+            fields_set.add(name)
+            if type(value) is not exact:
+                value = _convert(model, name, convert, allow_none, value, values)
+        elif default is None:
+            raise ValidationError(
+                [ErrorWrapper(ValueError("field required"), loc=alias)], model
+            )
+        else:
+            value = default()
+        values[name] = value
+    if len(fields_set) < len(data) and model.__config__.extra == Extra.allow:
+        _add_extra(data, values, fields_set)
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__fields_set__", fields_set)
+    # pylint: disable-next=protected-access
+    instance._init_private_attributes()
+    return instance
+
+
+def fast_model_parser(model: Type[Model], lazy: bool = False) -> Optional[Callable]:
+    """Return a function creating fast instances of ``model`` or ``None`` if it is not a fast model"""
+    if not is_fast_model(model):
+        return None
+    return lambda data: fast_parse_obj(model, data, lazy=lazy)
+
+
+__all__ = ["HOT_MODELS", "fast_parse_obj", "fast_model_parser", "is_fast_model"]
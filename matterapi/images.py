@@ -0,0 +1,339 @@
+""" Content addressed disk cache for profile images, icons, emoji and file thumbnails """
+
+import asyncio
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .client.base import logger
+
+
+class ImageKind(NamedTuple):
+    """Endpoint serving one kind of image"""
+
+    endpoint: str
+    """ Name of the endpoint group on the client, e.g. ``users`` """
+    method: str
+    """ Name of the endpoint method """
+    argument: str
+    """ Name of the id argument of the method """
+    immutable: bool
+    """ Whether the image of an id never changes, so it is never revalidated """
+
+
+IMAGE_KINDS: Dict[str, ImageKind] = {
+    "profile_image": ImageKind("users", "get_profile_image", "user_id", False),
+    "bot_icon": ImageKind("bots", "get_bot_icon_image", "bot_user_id", False),
+    "team_icon": ImageKind("teams", "get_team_icon", "team_id", False),
+    "emoji_image": ImageKind("emoji", "get_emoji_image", "emoji_id", True),
+    "file_thumbnail": ImageKind("files", "get_file_thumbnail", "file_id", True),
+    "file_preview": ImageKind("files", "get_file_preview", "file_id", True),
+}
+""" Kinds of images the cache can fetch """
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_type TEXT,
+    etag TEXT,
+    version INTEGER,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+"""
+
+_COLUMNS = "key, digest, size, content_type, etag, version, fetched_at"
+
+
+@dataclass
+class CachedImage:
+    """An image stored in the cache"""
+
+    key: str
+    """ Kind and id of the image, e.g. ``profile_image/<user_id>`` """
+    path: str
+    """ Path of the file holding the image """
+    digest: str
+    """ SHA-256 of the image, identical images of different ids share one file """
+    size: int
+    content_type: Optional[str]
+    etag: Optional[str]
+    version: Optional[int]
+    """ Version the image was requested for, e.g. ``last_picture_update`` of the user """
+    fetched_at: float
+    """ Time the image was last fetched or revalidated, in seconds since the epoch """
+
+    def read(self) -> bytes:
+        """Return the content of the image"""
+        with open(self.path, "rb") as image_file:
+            return image_file.read()
+
+    def open(self) -> mmap.mmap:
+        """Map the image into memory, e.g. to serve it without copying
+
+        The map can be used as context manager. It stays valid if the image is evicted
+        from the cache in the meantime.
+        """
+        with open(self.path, "rb") as image_file:
+            return mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class ImageCache:
+    """Least recently used cache of images on disk, shared by all ids with the same content
+
+    Images are stored under the SHA-256 of their content, so the many users with the
+    default profile image share a single file. An index database maps the kind and id of
+    every image to its content, ``ETag`` and the time it was last used. Once the files
+    exceed ``max_size`` bytes, the least recently used images are evicted.
+
+    Images of emoji and files never change and are served from the cache until evicted.
+    Profile images are requested with the ``last_picture_update`` of the user as
+    ``version``, which is sent as ``_`` query parameter like the web app does. A cached
+    image is used as long as the version did not change. Without a version, and for team
+    and bot icons, images older than ``max_age`` seconds are revalidated with their
+    ``ETag``; an unchanged image costs a ``304 Not Modified`` response without content.
+
+    Concurrent requests for the same image, from threads or from tasks of one event
+    loop, are combined into a single download.
+
+    .. code-block:: python
+
+        cache = ImageCache("image-cache", max_size=512 * 1024 * 1024)
+        image = cache.get(sd, "profile_image", user.id, version=user.last_picture_update)
+        with image.open() as data:
+            respond(data, content_type=image.content_type)
+
+    Args:
+        directory: Directory of the index and the image files, created if needed
+        max_size: Maximum total size of the image files in bytes
+        max_age: Seconds after which images of mutable kinds without version are
+            revalidated
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int = 256 * 1024 * 1024,
+        max_age: float = 3600,
+    ):
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+        os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(
+            os.path.join(directory, "index.db"), check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self.size = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM"
+            " (SELECT DISTINCT digest, size FROM entries)"
+        ).fetchone()[0]
+        """ Total size of the cached images in bytes """
+        self._downloads: Dict[str, threading.Event] = {}
+        self._async_downloads: Dict[Tuple[int, str], asyncio.Event] = {}
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "ImageCache":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "blobs", digest[:2], digest)
+
+    def _image(self, row: Tuple[Any, ...]) -> CachedImage:
+        return CachedImage(row[0], self._blob_path(row[1]), *row[1:])
+
+    def lookup(self, kind: str, object_id: str) -> Optional[CachedImage]:
+        """Return the cached image without any request, even if it is outdated"""
+        key = f"{kind}/{object_id}"
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {_COLUMNS} FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        return self._image(row)
+
+    def _is_fresh(self, kind: str, image: CachedImage, version: Optional[int]) -> bool:
+        if IMAGE_KINDS[kind].immutable:
+            return True
+        if version is not None:
+            return image.version == version
+        return time.time() - image.fetched_at < self.max_age
+
+    def invalidate(self, kind: str, object_id: str):
+        """Remove an image from the cache, e.g. after a ``user_updated`` event"""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT digest FROM entries WHERE key = ?", (f"{kind}/{object_id}",)
+            ).fetchone()
+            if row is not None:
+                self._connection.execute(
+                    "DELETE FROM entries WHERE key = ?", (f"{kind}/{object_id}",)
+                )
+                self._release(row[0])
+
+    def _release(self, digest: str):
+        """Delete the file of a digest no longer used by any entry"""
+        used = self._connection.execute(
+            "SELECT size FROM entries WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if used is not None:
+            return
+        path = self._blob_path(digest)
+        try:
+            self.size -= os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            logger.warning("Could not remove cached image %s", path, exc_info=True)
+
+    def _evict(self, keep: str):
+        while self.size > self.max_size:
+            row = self._connection.execute(
+                "SELECT key, digest FROM entries WHERE key != ?"
+                " ORDER BY accessed_at LIMIT 1",
+                (keep,),
+            ).fetchone()
+            if row is None:
+                break
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (row[0],))
+            self._release(row[1])
+
+    def _request(
+        self, api, kind: str, object_id: str, cached: Optional[CachedImage], version
+    ):
+        image_kind = IMAGE_KINDS[kind]
+        group = getattr(api, image_kind.endpoint)
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag else None
+        endpoint = type(group)(client=api, skip_response_parsing=True, headers=headers)
+        arguments = {image_kind.argument: object_id}
+        if version is not None and kind == "profile_image":
+            arguments["_"] = version
+        return getattr(endpoint, image_kind.method)(**arguments)
+
+    def _store(
+        self, key: str, cached: Optional[CachedImage], response, version
+    ) -> CachedImage:
+        now = time.time()
+        if response.status_code == 304 and cached is not None:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "UPDATE entries SET version = ?, fetched_at = ?, accessed_at = ?"
+                    " WHERE key = ?",
+                    (version, now, now, key),
+                )
+            cached.version = version
+            cached.fetched_at = now
+            return cached
+        response.raise_for_status()
+        content = response.content
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+        with self._lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temporary, "wb") as blob_file:
+                    blob_file.write(content)
+                os.replace(temporary, path)
+                self.size += len(content)
+            row = (
+                key,
+                digest,
+                len(content),
+                response.headers.get("content-type"),
+                response.headers.get("etag"),
+                version,
+                now,
+            )
+            with self._connection:
+                self._connection.execute(
+                    f"INSERT OR REPLACE INTO entries ({_COLUMNS}, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    row + (now,),
+                )
+                if cached is not None and cached.digest != digest:
+                    self._release(cached.digest)
+                self._evict(key)
+        return self._image(row)
+
+    def get(
+        self, api, kind: str, object_id: str, version: Optional[int] = None
+    ) -> CachedImage:
+        """Return an image from the cache, fetching it if missing or outdated
+
+        Args:
+            api: A :class:`~matterapi.client.sync_client.SyncClient`
+            kind: One of :data:`IMAGE_KINDS`
+            object_id: Id of the user, bot, team, emoji or file
+            version: ``last_picture_update`` of the user for profile images, or any
+                number which changes with the image. Cached images of a different
+                version are fetched again.
+        """
+        key = f"{kind}/{object_id}"
+        while True:
+            cached = self.lookup(kind, object_id)
+            if cached is not None and self._is_fresh(kind, cached, version):
+                return cached
+            with self._lock:
+                download = self._downloads.get(key)
+                if download is None:
+                    download = self._downloads[key] = threading.Event()
+                    break
+            # Another thread is fetching the image, use its result or try again
+            download.wait()
+        try:
+            response = self._request(api, kind, object_id, cached, version)
+            return self._store(key, cached, response, version)
+        finally:
+            with self._lock:
+                del self._downloads[key]
+            download.set()
+
+    async def get_async(
+        self, api, kind: str, object_id: str, version: Optional[int] = None
+    ) -> CachedImage:
+        """Same as :meth:`get` with an :class:`~matterapi.client.async_client.AsyncClient`"""
+        key = f"{kind}/{object_id}"
+        # Events are bound to their event loop
+        download_key = (id(asyncio.get_running_loop()), key)
+        while True:
+            cached = self.lookup(kind, object_id)
+            if cached is not None and self._is_fresh(kind, cached, version):
+                return cached
+            download = self._async_downloads.get(download_key)
+            if download is None:
+                download = self._async_downloads[download_key] = asyncio.Event()
+                break
+            await download.wait()
+        try:
+            response = await self._request(api, kind, object_id, cached, version)
+            return self._store(key, cached, response, version)
+        finally:
+            del self._async_downloads[download_key]
+            download.set()
+
+
+__all__ = ["ImageCache", "CachedImage", "ImageKind", "IMAGE_KINDS"]
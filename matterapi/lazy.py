@@ -0,0 +1,198 @@
+""" Lazy models which validate fields on first access """
+
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import BaseModel, Extra, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.fields import (
+    SHAPE_DICT,
+    SHAPE_LIST,
+    SHAPE_MAPPING,
+    SHAPE_SINGLETON,
+    ModelField,
+)
+
+Model = TypeVar("Model", bound=BaseModel)
+
+_LAZY_CLASSES: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
+
+def _is_model(type_: Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, BaseModel)
+
+
+def _parses_lazily(type_: Type[BaseModel], raw: Any) -> bool:
+    # Other values pydantic accepts as model, like sequences of pairs, are validated
+    return isinstance(raw, dict) or bool(type_.__custom_root_type__)
+
+
+def _lazy_value(model: Type[BaseModel], field: ModelField, raw: Any) -> Any:
+    """Convert the raw value of a field, creating lazy models for nested models"""
+    type_ = field.type_
+    if raw is not None and _is_model(type_) and not field.sub_fields_mapping:
+        if field.shape == SHAPE_SINGLETON and _parses_lazily(type_, raw):
+            return lazy_parse_obj(type_, raw)
+        if (
+            field.shape == SHAPE_LIST
+            and isinstance(raw, list)
+            and all(_parses_lazily(type_, item) for item in raw)
+        ):
+            return [lazy_parse_obj(type_, item) for item in raw]
+        if (
+            field.shape in (SHAPE_DICT, SHAPE_MAPPING)
+            and isinstance(raw, dict)
+            and all(_parses_lazily(type_, item) for item in raw.values())
+        ):
+            return {key: lazy_parse_obj(type_, item) for key, item in raw.items()}
+    value, errors = field.validate(raw, {}, loc=field.alias, cls=model)
+    if errors:
+        raise ValidationError([errors], model)
+    return value
+
+
+def _field_value(self, field: ModelField) -> Any:
+    data = object.__getattribute__(self, "_lazy_data")
+    if field.alias in data:
+        return _lazy_value(type(self).__lazy_model__, field, data[field.alias])
+    if field.required:
+        raise ValidationError(
+            [ErrorWrapper(ValueError("field required"), loc=field.alias)],
+            type(self).__lazy_model__,
+        )
+    return field.get_default()
+
+
+def _getattr(self, name: str) -> Any:
+    if name.startswith("__") and name != "__root__":
+        raise AttributeError(name)
+    try:
+        data = object.__getattribute__(self, "_lazy_data")
+    except AttributeError:
+        data = None
+    if data is None:
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+    field = self.__fields__.get(name)
+    if field is not None:
+        value = _field_value(self, field)
+    elif (
+        name in data
+        and name not in self.__alias_fields__
+        and self.__config__.extra == Extra.allow
+    ):
+        value = data[name]
+    else:
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+    self.__dict__[name] = value
+    return value
+
+
+def _materialize(self):
+    """Convert all remaining fields, keeping the field order of eagerly parsed models"""
+    # Copies created by ``copy()`` never had lazy data
+    data = getattr(self, "_lazy_data", None)
+    if data is None:
+        return
+    cached = self.__dict__
+    values = {}
+    for name, field in self.__fields__.items():
+        values[name] = cached[name] if name in cached else _field_value(self, field)
+    if self.__config__.extra == Extra.allow:
+        for key, value in data.items():
+            if key not in self.__alias_fields__:
+                values[key] = cached.get(key, value)
+    object.__setattr__(self, "__dict__", values)
+    object.__setattr__(self, "_lazy_data", None)
+
+
+def _materializing(method_name: str):
+    method = getattr(BaseModel, method_name)
+
+    def wrapper(self, *args, **kwargs):
+        _materialize(self)
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method_name
+    return wrapper
+
+
+def _reduce(self):
+    _materialize(self)
+    return (_restore, (type(self).__lazy_model__, self.__getstate__()))
+
+
+def _restore(model: Type[BaseModel], state: Dict[str, Any]) -> BaseModel:
+    instance = model.__new__(model)
+    instance.__setstate__(state)
+    return instance
+
+
+def lazy_model_class(model: Type[Model]) -> Type[Model]:
+    """Return the lazy subclass of ``model``
+
+    Instances of the subclass are instances of ``model`` as well and behave the same,
+    but convert a field only when it is accessed for the first time.
+    """
+    lazy_class = _LAZY_CLASSES.get(model)
+    if lazy_class is None:
+        namespace = {
+            "__module__": model.__module__,
+            "__qualname__": model.__qualname__,
+            "__slots__": ("_lazy_data",),
+            "__lazy_model__": model,
+            "__alias_fields__": frozenset(
+                field.alias for field in model.__fields__.values()
+            ),
+            "__field_names__": {
+                field.alias: name for name, field in model.__fields__.items()
+            },
+            "__getattr__": _getattr,
+            "__reduce__": _reduce,
+        }
+        for method_name in ("_iter", "__iter__", "__repr_args__", "__getstate__"):
+            namespace[method_name] = _materializing(method_name)
+        lazy_class = type(model.__name__, (model,), namespace)
+        # Creating the subclass runs the model metaclass again, which would apply
+        # config based aliases a second time
+        lazy_class.__fields__ = model.__fields__
+        lazy_class = _LAZY_CLASSES.setdefault(model, lazy_class)
+    return lazy_class
+
+
+def lazy_parse_obj(model: Type[Model], data: Any) -> Model:
+    """Create a lazy instance of ``model`` from decoded json
+
+    Nothing is validated up front. Every field is converted on first access and cached,
+    nested models become lazy instances themselves. ``dict()``, ``json()``, ``copy()``,
+    comparisons and pickling convert all remaining fields first, so they return the
+    same results as for ``model.parse_obj(data)``.
+
+    Raises:
+        ValidationError: If ``data`` is not a mapping. Invalid fields raise on access.
+    """
+    if model.__custom_root_type__:
+        data = {"__root__": data}
+    elif not isinstance(data, dict):
+        raise ValidationError(
+            [ErrorWrapper(TypeError("value is not a valid dict"), loc="__root__")],
+            model,
+        )
+    lazy_class = lazy_model_class(model)
+    instance = lazy_class.__new__(lazy_class)
+    object.__setattr__(instance, "__dict__", {})
+    # Like eager parsing, extra keys count as set fields
+    names = lazy_class.__field_names__
+    allow_extra = model.__config__.extra == Extra.allow
+    object.__setattr__(
+        instance,
+        "__fields_set__",
+        {names.get(key, key) for key in data if allow_extra or key in names},
+    )
+    object.__setattr__(instance, "_lazy_data", data)
+    return instance
+
+
+__all__ = ["lazy_parse_obj", "lazy_model_class"]
@@ -0,0 +1,499 @@
+""" Local read model of teams, channels, members, posts and user state kept current by websocket events """
+
+import bisect
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple
+
+from .models import Channel, Post, Status, Team, User
+from .paging import _apply_event, _loads
+
+SNAPSHOT_VERSION = 1
+""" Version of the snapshot format written by :meth:`ReadModel.snapshot` """
+
+# Number of ids passed to a single bulk lookup
+_LOOKUP_CHUNK = 100
+
+
+def _now() -> int:
+    return int(time.time() * 1000)
+
+
+def _dump(model: Any) -> Dict[str, Any]:
+    return model.dict(by_alias=True, exclude_unset=True)
+
+
+class ReadModel:
+    """In-memory, indexed view of the data visible to a user
+
+    The model is filled from the REST api once with :meth:`bootstrap` and then kept
+    current by passing every websocket event to :meth:`apply`. Lookups like the members
+    of a channel or its most recent posts are answered locally without any requests.
+
+    .. code-block:: python
+
+        mirror = ReadModel(posts_per_channel=100)
+        mirror.bootstrap(sd)
+        sd.start_ws_sync(mirror.apply)
+
+        # elsewhere, e.g. in another thread
+        mirror.recent_posts(channel_id, limit=10)
+        mirror.channels_of_user(user_id)
+
+    Events are applied under a lock, so the model can be queried from other threads
+    while it is updated. Set :attr:`~matterapi.client.base.ApiClientOptions.ws_concurrent`
+    to ``False`` so events are applied in the order they were sent.
+
+    :meth:`snapshot` writes the model to a file and :meth:`restore` loads it again.
+    After a restart :meth:`catch_up` only fetches what changed while no events were
+    received, instead of running a full bootstrap.
+
+    Args:
+        posts_per_channel: Number of most recent posts kept per channel
+    """
+
+    def __init__(self, posts_per_channel: int = 200):
+        self.posts_per_channel = posts_per_channel
+        self.user_id: Optional[str] = None
+        """ Id of the user the model was bootstrapped for """
+        self.updated_at = 0
+        """ Time of the last bootstrap, catch up or applied event in milliseconds """
+        self.teams: Dict[str, Team] = {}
+        self.channels: Dict[str, Channel] = {}
+        self.users: Dict[str, User] = {}
+        self.statuses: Dict[str, Status] = {}
+        self.posts: Dict[str, Post] = {}
+        self._team_channels: Dict[str, Set[str]] = {}
+        self._team_members: Dict[str, Set[str]] = {}
+        self._channel_members: Dict[str, Set[str]] = {}
+        self._user_channels: Dict[str, Set[str]] = {}
+        # (create_at, post_id) of the kept posts of every channel, oldest first
+        self._channel_posts: Dict[str, List[Tuple[int, str]]] = {}
+        self._lock = threading.RLock()
+
+    # Queries
+
+    def channel(self, channel_id: str) -> Optional[Channel]:
+        return self.channels.get(channel_id)
+
+    def channels_of_team(self, team_id: str) -> List[Channel]:
+        with self._lock:
+            return [
+                self.channels[channel_id]
+                for channel_id in self._team_channels.get(team_id, ())
+                if channel_id in self.channels
+            ]
+
+    def members(self, channel_id: str) -> Set[str]:
+        """Return the ids of the members of a channel"""
+        with self._lock:
+            return set(self._channel_members.get(channel_id, ()))
+
+    def team_members(self, team_id: str) -> Set[str]:
+        """Return the ids of the members of a team"""
+        with self._lock:
+            return set(self._team_members.get(team_id, ()))
+
+    def channels_of_user(self, user_id: str) -> Set[str]:
+        """Return the ids of all known channels the user is a member of"""
+        with self._lock:
+            return set(self._user_channels.get(user_id, ()))
+
+    def is_member(self, channel_id: str, user_id: str) -> bool:
+        with self._lock:
+            return user_id in self._channel_members.get(channel_id, ())
+
+    def recent_posts(self, channel_id: str, limit: Optional[int] = None) -> List[Post]:
+        """Return the most recent kept posts of a channel, newest first"""
+        with self._lock:
+            entries = self._channel_posts.get(channel_id, [])
+            if limit is not None:
+                entries = entries[-limit:] if limit > 0 else []
+            return [self.posts[post_id] for _, post_id in reversed(entries)]
+
+    def status(self, user_id: str) -> Optional[str]:
+        """Return the last known status of a user, e.g. ``online`` or ``away``"""
+        status = self.statuses.get(user_id)
+        return status.status if status is not None else None
+
+    # Updates
+
+    def _add_member(self, channel_id: str, user_id: str):
+        self._channel_members.setdefault(channel_id, set()).add(user_id)
+        self._user_channels.setdefault(user_id, set()).add(channel_id)
+
+    def _remove_member(self, channel_id: str, user_id: str):
+        self._channel_members.get(channel_id, set()).discard(user_id)
+        self._user_channels.get(user_id, set()).discard(channel_id)
+
+    def _put_channel(self, channel: Channel):
+        self.channels[channel.id] = channel
+        if channel.team_id:
+            self._team_channels.setdefault(channel.team_id, set()).add(channel.id)
+
+    def _remove_channel(self, channel_id: str):
+        channel = self.channels.pop(channel_id, None)
+        if channel is not None and channel.team_id:
+            self._team_channels.get(channel.team_id, set()).discard(channel_id)
+        for user_id in self._channel_members.pop(channel_id, ()):
+            self._user_channels.get(user_id, set()).discard(channel_id)
+        for _, post_id in self._channel_posts.pop(channel_id, ()):
+            self.posts.pop(post_id, None)
+
+    def _put_post(self, post: Post):
+        if post.delete_at:
+            self._remove_post(post.id)
+            return
+        entries = self._channel_posts.setdefault(post.channel_id, [])
+        known = self.posts.get(post.id)
+        self.posts[post.id] = post
+        if known is not None:
+            return
+        entry = (post.create_at or 0, post.id)
+        if not entries or entry > entries[-1]:
+            entries.append(entry)
+        else:
+            bisect.insort(entries, entry)
+        while len(entries) > self.posts_per_channel:
+            _, post_id = entries.pop(0)
+            self.posts.pop(post_id, None)
+
+    def _remove_post(self, post_id: str):
+        post = self.posts.pop(post_id, None)
+        if post is None:
+            return
+        entries = self._channel_posts.get(post.channel_id, [])
+        entry = (post.create_at or 0, post_id)
+        index = bisect.bisect_left(entries, entry)
+        if index < len(entries) and entries[index] == entry:
+            del entries[index]
+
+    def _put_status(self, status: Status):
+        self.statuses[status.user_id] = status
+
+    # Websocket events
+
+    def apply(self, event: Dict[str, Any]) -> bool:
+        """Apply a websocket event, returns ``True`` if the event changed the model
+
+        Can be passed to :meth:`~matterapi.client.base.BaseClient.start_ws` directly.
+        """
+        with self._lock:
+            if not _apply_event(self, self._EVENT_HANDLERS, event):
+                return False
+            self.updated_at = _now()
+        return True
+
+    def _on_posted(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self._put_post(Post.parse_obj(_loads(data["post"])))
+
+    def _on_post_deleted(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self._remove_post(_loads(data["post"])["id"])
+
+    def _on_channel_created(self, data, broadcast):
+        channel_id = data["channel_id"]
+        if channel_id not in self.channels:
+            team_id = data.get("team_id") or broadcast.get("team_id")
+            self._put_channel(Channel(id=channel_id, team_id=team_id))
+
+    def _on_channel_updated(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self._put_channel(Channel.parse_obj(_loads(data["channel"])))
+
+    def _on_channel_converted(self, data, broadcast):
+        # pylint: disable=unused-argument
+        # Only the id is sent, the changed channel follows with channel_updated
+        channel = self.channels.get(data["channel_id"])
+        if channel is not None:
+            self._put_channel(channel.copy(update={"type": "P"}))
+
+    def _on_channel_deleted(self, data, broadcast):
+        channel_id = data.get("channel_id") or broadcast["channel_id"]
+        channel = self.channels.get(channel_id)
+        if channel is not None:
+            self._put_channel(channel.copy(update={"delete_at": data.get("delete_at")}))
+
+    def _on_user_added(self, data, broadcast):
+        channel_id = broadcast.get("channel_id") or data["channel_id"]
+        self._add_member(channel_id, data["user_id"])
+
+    def _on_user_removed(self, data, broadcast):
+        # Sent to the channel with the removed user in data, or to the removed user
+        # with the channel in data
+        if data.get("user_id"):
+            self._remove_member(
+                broadcast.get("channel_id") or data["channel_id"], data["user_id"]
+            )
+        else:
+            self._remove_member(data["channel_id"], broadcast["user_id"])
+            if broadcast["user_id"] == self.user_id:
+                self._remove_channel(data["channel_id"])
+
+    def _on_added_to_team(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self._team_members.setdefault(data["team_id"], set()).add(data["user_id"])
+
+    def _on_leave_team(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self._team_members.get(data["team_id"], set()).discard(data["user_id"])
+        if data["user_id"] == self.user_id:
+            for channel_id in list(self._team_channels.get(data["team_id"], ())):
+                self._remove_channel(channel_id)
+            self._team_channels.pop(data["team_id"], None)
+            self.teams.pop(data["team_id"], None)
+
+    def _on_status_change(self, data, broadcast):
+        user_id = data.get("user_id") or broadcast["user_id"]
+        status = self.statuses.get(user_id)
+        if status is None:
+            self._put_status(Status(user_id=user_id, status=data["status"]))
+        else:
+            self._put_status(status.copy(update={"status": data["status"]}))
+
+    def _on_user_updated(self, data, broadcast):
+        # pylint: disable=unused-argument
+        user = User.parse_obj(_loads(data["user"]))
+        self.users[user.id] = user
+
+    _EVENT_HANDLERS: Dict[str, Callable] = {
+        "posted": _on_posted,
+        "post_edited": _on_posted,
+        "post_deleted": _on_post_deleted,
+        "channel_created": _on_channel_created,
+        "channel_updated": _on_channel_updated,
+        "channel_converted": _on_channel_converted,
+        "channel_deleted": _on_channel_deleted,
+        "user_added": _on_user_added,
+        "user_removed": _on_user_removed,
+        "added_to_team": _on_added_to_team,
+        "leave_team": _on_leave_team,
+        "status_change": _on_status_change,
+        "user_updated": _on_user_updated,
+    }
+
+    # Bootstrap from the REST api
+
+    def _bootstrap_steps(
+        self, user_id: str, since: Optional[int]
+    ) -> Generator[Callable, Any, None]:
+        """Yield the api calls needed to fill the model and receive their results
+
+        Shared by the sync and async drivers, which execute each yielded call with or
+        without awaiting it.
+        """
+        yield from self._membership_steps(user_id, since)
+        # Direct and group channels are returned for every team
+        for channel_id in list(self.channels):
+            yield from self._channel_member_steps(channel_id)
+            yield from self._channel_post_steps(channel_id, since)
+        for team_id, channel_ids in self._team_channels.items():
+            self._team_members.setdefault(team_id, set())
+            for channel_id in channel_ids:
+                self._team_members[team_id].update(
+                    self._channel_members.get(channel_id, ())
+                )
+        yield from self._user_steps()
+
+    def _membership_steps(
+        self, user_id: str, since: Optional[int]
+    ) -> Generator[Callable, Any, None]:
+        """Load the user, their teams and channels"""
+        user = yield lambda api: api.users.get_user(user_id)
+        if since is not None:
+            # Memberships might have changed while no events were received, only the
+            # kept posts are updated incrementally
+            for index in (
+                self.teams,
+                self.channels,
+                self._team_channels,
+                self._team_members,
+                self._channel_members,
+                self._user_channels,
+            ):
+                index.clear()
+        self.user_id = user.id
+        self.users[user.id] = user
+        teams = yield lambda api: api.teams.get_teams_for_user(user.id)
+        for team in teams:
+            self.teams[team.id] = team
+            channels = yield lambda api, team=team: (
+                api.channels.get_channels_for_team_for_user(user.id, team.id)
+            )
+            for channel in channels:
+                self._put_channel(channel)
+        for channel_id in list(self._channel_posts):
+            if channel_id not in self.channels:
+                for _, post_id in self._channel_posts.pop(channel_id):
+                    self.posts.pop(post_id, None)
+
+    def _channel_member_steps(self, channel_id: str) -> Generator[Callable, Any, None]:
+        page = 0
+        while True:
+            members = yield lambda api, page=page: api.channels.get_channel_members(
+                channel_id, page=page, per_page=200
+            )
+            for member in members:
+                self._add_member(channel_id, member.user_id)
+            if len(members) < 200:
+                return
+            page += 1
+
+    def _channel_post_steps(
+        self, channel_id: str, since: Optional[int]
+    ) -> Generator[Callable, Any, None]:
+        post_list = yield lambda api: (
+            api.posts.get_posts_for_channel(
+                channel_id, page=None, per_page=None, since=since
+            )
+            if since
+            else api.posts.get_posts_for_channel(
+                channel_id, per_page=self.posts_per_channel
+            )
+        )
+        for post in (post_list.posts or {}).values():
+            self._put_post(post)
+
+    def _user_steps(self) -> Generator[Callable, Any, None]:
+        """Load the users and statuses of all channel members"""
+        user_ids = sorted(self._user_channels)
+        for start in range(0, len(user_ids), _LOOKUP_CHUNK):
+            chunk = user_ids[start : start + _LOOKUP_CHUNK]
+            users = yield lambda api, chunk=chunk: api.users.get_users_by_ids(
+                json_body=chunk
+            )
+            for user in users:
+                self.users[user.id] = user
+            statuses = yield lambda api, chunk=chunk: (
+                api.status.get_users_statuses_by_ids(json_body=chunk)
+            )
+            for status in statuses:
+                self._put_status(status)
+
+    def _run_sync(self, api, steps: Generator):
+        result = None
+        try:
+            while True:
+                call = steps.send(result)
+                result = call(api)
+        except StopIteration:
+            pass
+        self.updated_at = _now()
+
+    async def _run_async(self, api, steps: Generator):
+        result = None
+        try:
+            while True:
+                call = steps.send(result)
+                result = await call(api)
+        except StopIteration:
+            pass
+        self.updated_at = _now()
+
+    def bootstrap(self, api, user_id: str = "me"):
+        """Fill the model using a :class:`~matterapi.client.sync_client.SyncClient`
+
+        Loads the teams and channels of the user, the members of these channels, their
+        users and statuses and the most recent posts of every channel. Run it before
+        events are applied, the model is not locked while it is filled.
+        """
+        self._run_sync(api, self._bootstrap_steps(user_id, None))
+
+    async def bootstrap_async(self, api, user_id: str = "me"):
+        """Same as :meth:`bootstrap`, using an :class:`~matterapi.client.async_client.AsyncClient`"""
+        await self._run_async(api, self._bootstrap_steps(user_id, None))
+
+    def catch_up(self, api, margin: int = 60000):
+        """Fetch what changed since :attr:`updated_at`, e.g. after :meth:`restore`
+
+        Channels, members, users and statuses are reloaded, but only posts created,
+        edited or deleted since the last update (minus ``margin`` milliseconds to allow
+        for clock differences) are requested.
+        """
+        since = max(self.updated_at - margin, 1)
+        self._run_sync(api, self._bootstrap_steps(self.user_id or "me", since))
+
+    async def catch_up_async(self, api, margin: int = 60000):
+        """Same as :meth:`catch_up`, using an :class:`~matterapi.client.async_client.AsyncClient`"""
+        since = max(self.updated_at - margin, 1)
+        await self._run_async(api, self._bootstrap_steps(self.user_id or "me", since))
+
+    # Snapshots
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the state of the model as json compatible dictionary"""
+        with self._lock:
+            return {
+                "version": SNAPSHOT_VERSION,
+                "posts_per_channel": self.posts_per_channel,
+                "user_id": self.user_id,
+                "updated_at": self.updated_at,
+                "teams": [_dump(team) for team in self.teams.values()],
+                "channels": [_dump(channel) for channel in self.channels.values()],
+                "users": [_dump(user) for user in self.users.values()],
+                "statuses": [_dump(status) for status in self.statuses.values()],
+                "posts": [_dump(post) for post in self.posts.values()],
+                "channel_members": {
+                    channel_id: sorted(user_ids)
+                    for channel_id, user_ids in self._channel_members.items()
+                },
+                "team_members": {
+                    team_id: sorted(user_ids)
+                    for team_id, user_ids in self._team_members.items()
+                },
+            }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "ReadModel":
+        """Create a model from the result of :meth:`to_dict`
+
+        Raises:
+            ValueError: If the state was written by an incompatible version
+        """
+        if state.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {state.get('version')!r}")
+        model = cls(posts_per_channel=state["posts_per_channel"])
+        model.user_id = state["user_id"]
+        model.updated_at = state["updated_at"]
+        for team in state["teams"]:
+            team = Team.parse_obj(team)
+            model.teams[team.id] = team
+        for channel in state["channels"]:
+            model._put_channel(Channel.parse_obj(channel))
+        for user in state["users"]:
+            user = User.parse_obj(user)
+            model.users[user.id] = user
+        for status in state["statuses"]:
+            model._put_status(Status.parse_obj(status))
+        for post in state["posts"]:
+            model._put_post(Post.parse_obj(post))
+        for channel_id, user_ids in state["channel_members"].items():
+            for user_id in user_ids:
+                model._add_member(channel_id, user_id)
+        for team_id, user_ids in state["team_members"].items():
+            model._team_members[team_id] = set(user_ids)
+        return model
+
+    def snapshot(self, path: str):
+        """Write the model to a gzip compressed json file
+
+        The file is replaced atomically, so an interrupted snapshot never leaves a
+        corrupt file behind.
+        """
+        temporary = f"{path}.tmp"
+        with gzip.open(temporary, "wt", encoding="utf-8") as snapshot_file:
+            json.dump(self.to_dict(), snapshot_file, separators=(",", ":"))
+        os.replace(temporary, path)
+
+    @classmethod
+    def restore(cls, path: str) -> "ReadModel":
+        """Load a model written by :meth:`snapshot`"""
+        with gzip.open(path, "rt", encoding="utf-8") as snapshot_file:
+            return cls.from_dict(json.load(snapshot_file))
+
+
+__all__ = ["ReadModel", "SNAPSHOT_VERSION"]
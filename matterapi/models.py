@@ -3,6 +3,7 @@ from typing import ClassVar, Dict, List, Optional, Set
 
 from pydantic import Field
 
+from . import threads
 from .enums import (
     PluginStatusState,
     PostMetadataEmbedsItemType,
@@ -3906,6 +3907,26 @@ class PostList(BaseConfig):
     next_post_id: Optional[str] = None
     prev_post_id: Optional[str] = None
 
+    def merge(self, *others: "PostList") -> "PostList":
+        """Merge this list with further pages, see :func:`~matterapi.threads.merge_post_lists`"""
+        return threads.merge_post_lists((self,) + others)
+
+    def thread_index(self) -> Dict[str, List[str]]:
+        """Map root post ids to their reply ids, see :func:`~matterapi.threads.thread_index`"""
+        return threads.thread_index(self)
+
+    def iter_thread(self, root_id: str):
+        """Yield a thread in chronological order, see :func:`~matterapi.threads.iter_thread`"""
+        return threads.iter_thread(self, root_id)
+
+    def iter_threads(self):
+        """Yield all threads, oldest first, see :func:`~matterapi.threads.iter_threads`"""
+        return threads.iter_threads(self)
+
+    def gaps(self, *others: "PostList") -> List["threads.PostGap"]:
+        """Find missing adjacent posts, see :func:`~matterapi.threads.find_gaps`"""
+        return threads.find_gaps((self,) + others)
+
 
 class PostListWithSearchMatches(BaseConfig):
     """
@@ -0,0 +1,158 @@
+""" Helpers paging through list endpoints """
+
+import json
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Type
+
+import httpx
+from pydantic import BaseModel
+
+from .client.base import logger
+from .client.bulk import is_retryable
+
+
+def _decoded(result: Any) -> Any:
+    if isinstance(result, httpx.Response):
+        return result.json()
+    if isinstance(result, BaseModel):
+        return result.dict(by_alias=True, exclude_unset=True)
+    return result
+
+
+def _loads(value: Any) -> Any:
+    """Decode payloads which the server sends as json strings inside the event"""
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+def _apply_event(
+    target: Any,
+    handlers: Dict[str, Callable],
+    event: Dict[str, Any],
+    errors: Tuple[Type[Exception], ...] = (KeyError, TypeError, ValueError),
+) -> bool:
+    """Call the handler of a websocket event, returns ``False`` if there is none or it failed
+
+    Handlers are called with ``target``, the data and the broadcast of the event.
+    """
+    handler = handlers.get(event.get("event"))
+    if handler is None:
+        return False
+    try:
+        handler(target, event.get("data") or {}, event.get("broadcast") or {})
+    except errors:
+        logger.warning("Could not apply %s event", event.get("event"), exc_info=True)
+        return False
+    return True
+
+
+def paginate(method: Callable, *args, per_page: int = 200, **kwargs) -> Iterator[Any]:
+    """Yield the elements of all pages of a paginated endpoint method
+
+    Pages are requested until one returns fewer than ``per_page`` elements. Streaming
+    variants like :meth:`iter_users <matterapi.endpoints.sync_api.users.UsersApi.iter_users>`
+    keep only one element in memory at a time.
+
+    .. code-block:: python
+
+        for user in paginate(api.users.iter_users, per_page=200, active=True):
+            print(user.username)
+    """
+    page = 0
+    while True:
+        count = 0
+        for item in _decoded(method(*args, page=page, per_page=per_page, **kwargs)):
+            count += 1
+            yield item
+        if count < per_page:
+            return
+        page += 1
+
+
+def _retry(call: Callable[[], Any], retries: int, backoff: float) -> Any:
+    attempt = 0
+    while True:
+        attempt += 1
+        # pylint: disable=broad-except
+        try:
+            return call()
+        except Exception as error:
+            if attempt > retries or not is_retryable(error):
+                raise
+            time.sleep(backoff * 2 ** (attempt - 1))
+
+
+def channel_posts(
+    api,
+    channel_id: str,
+    per_page: int = 200,
+    before: Optional[str] = None,
+    retries: int = 0,
+    retry_backoff: float = 1.0,
+) -> Iterator[Any]:
+    """Yield all posts of a channel from the newest to the oldest
+
+    Pages are requested with ``before`` cursors, so posts created during the export do not
+    shift the pages. Works with parsed and raw responses (``skip_response_parsing``).
+
+    Args:
+        before: Only yield posts older than the post with this id, e.g. the last post
+            processed by an interrupted run
+        retries: Number of retries for pages failing with 429, 5xx or transport errors
+        retry_backoff: Delay in seconds before the first retry, doubled for every further retry
+    """
+    while True:
+        page = _decoded(
+            _retry(
+                lambda: api.posts.get_posts_for_channel(
+                    channel_id, per_page=per_page, before=before
+                ),
+                retries,
+                retry_backoff,
+            )
+        )
+        order = page.get("order") or []
+        if not order:
+            return
+        posts = page.get("posts") or {}
+        for post_id in order:
+            if post_id in posts:
+                yield posts[post_id]
+        before = order[-1]
+
+
+def modified_posts(api, channel_id: str, since: int) -> Iterator[Any]:
+    """Yield all posts of a channel created, edited or deleted since a time in milliseconds
+
+    Deleted posts are included with ``delete_at`` set.
+    """
+    page = _decoded(
+        api.posts.get_posts_for_channel(
+            channel_id, page=None, per_page=None, since=since
+        )
+    )
+    posts = page.get("posts") or {}
+    for post_id in page.get("order") or posts:
+        if post_id in posts:
+            yield posts[post_id]
+
+
+def post_reactions(posts: Iterable[Any]) -> Iterator[Any]:
+    """Yield the reactions contained in the metadata of posts
+
+    Posts returned by the api include their reactions, so reactions can be collected
+    together with the posts without extra requests:
+
+    .. code-block:: python
+
+        reactions = list(post_reactions(channel_posts(api, channel_id)))
+    """
+    for post in posts:
+        if isinstance(post, (BaseModel, httpx.Response)):
+            post = _decoded(post)
+        metadata = post.get("metadata") or {}
+        yield from metadata.get("reactions") or ()
+
+
+__all__ = ["paginate", "channel_posts", "modified_posts", "post_reactions"]
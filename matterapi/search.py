@@ -0,0 +1,660 @@
+""" Local full-text index over posts answering searches without requests """
+
+import bisect
+import heapq
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .paging import _apply_event, _decoded, _loads
+
+MANIFEST = "manifest.json"
+""" Name of the file recording the segments and deletions of an index directory """
+
+_TOKEN = re.compile(r"\w+")
+_QUERY_WORD = re.compile(r'(-?)"([^"]*)"|(\S+)')
+_MAGIC = b"MAPIIDX1"
+_HEADER = struct.Struct("<I")
+
+# (post_id, channel_id, user_id, create_at, update_at) of an indexed post
+_Document = Tuple[str, str, str, int, int]
+# Tokens of a term or phrase, with a flag for trailing wildcards
+_Clause = List[Tuple[str, bool]]
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into the lower case words which are indexed and searched"""
+    return _TOKEN.findall(text.casefold())
+
+
+@dataclass
+class SearchQuery:
+    """Parsed search terms, see :func:`parse_query`"""
+
+    clauses: List[_Clause] = field(default_factory=list)
+    """ Terms and phrases the posts have to contain """
+    excluded: List[_Clause] = field(default_factory=list)
+    """ Terms and phrases the posts must not contain """
+    from_users: List[str] = field(default_factory=list)
+    """ Usernames or user ids of ``from:`` filters """
+    in_channels: List[str] = field(default_factory=list)
+    """ Channel names or ids of ``in:`` filters """
+    after: Optional[int] = None
+    """ Only posts created at or after this time in milliseconds """
+    before: Optional[int] = None
+    """ Only posts created before this time in milliseconds """
+
+
+@dataclass
+class SearchHit:
+    """A post matching a search"""
+
+    post_id: str
+    channel_id: str
+    user_id: str
+    create_at: int
+    """ Creation time of the post in milliseconds """
+
+
+def _day_start(value: str, time_zone: tzinfo) -> int:
+    day = date.fromisoformat(value)
+    start = datetime(day.year, day.month, day.day, tzinfo=time_zone)
+    return int(start.timestamp() * 1000)
+
+
+def _clause(text: str, prefix: bool) -> _Clause:
+    tokens = tokenize(text)
+    return [(token, prefix and i == len(tokens) - 1) for i, token in enumerate(tokens)]
+
+
+def _add_date_filter(query: SearchQuery, key: str, value: str, time_zone: tzinfo):
+    start = _day_start(value, time_zone)
+    next_day = _day_start(
+        (date.fromisoformat(value) + timedelta(days=1)).isoformat(), time_zone
+    )
+    if key == "after":
+        query.after = max(query.after or 0, next_day)
+    elif key == "before":
+        query.before = min(query.before or start, start)
+    else:
+        query.after = max(query.after or 0, start)
+        query.before = min(query.before or next_day, next_day)
+
+
+def parse_query(terms: str, time_zone: tzinfo = timezone.utc) -> SearchQuery:
+    """Parse search terms in the syntax of the Mattermost search box
+
+    Supported are words, ``"quoted phrases"``, trailing wildcards like ``deploy*``,
+    excluded words and phrases prefixed with ``-``, ``from:username``, ``in:channel-name``
+    and ``after:``, ``before:`` and ``on:`` followed by a date as ``YYYY-MM-DD``, which
+    is interpreted in ``time_zone``. Words containing punctuation, like ``foo-bar``,
+    are searched as phrase.
+
+    Raises:
+        ValueError: If a date is not a valid ``YYYY-MM-DD`` date
+    """
+    query = SearchQuery()
+    for match in _QUERY_WORD.finditer(terms):
+        excluded, phrase, word = match.groups()
+        if phrase is not None:
+            clause = _clause(phrase, False)
+            if clause:
+                (query.excluded if excluded else query.clauses).append(clause)
+            continue
+        key, _, value = word.partition(":")
+        key = key.lower()
+        if value and key == "from":
+            query.from_users.append(value.lstrip("@").lower())
+        elif value and key == "in":
+            query.in_channels.append(value.lstrip("~").lower())
+        elif value and key in ("after", "before", "on"):
+            _add_date_filter(query, key, value, time_zone)
+        else:
+            excluded = word.startswith("-") and len(word) > 1
+            if excluded:
+                word = word[1:]
+            clause = _clause(word.rstrip("*"), word.endswith("*"))
+            if clause:
+                (query.excluded if excluded else query.clauses).append(clause)
+    return query
+
+
+def _put_varint(output: bytearray, value: int):
+    while value >= 0x80:
+        output.append((value & 0x7F) | 0x80)
+        value >>= 7
+    output.append(value)
+
+
+def _encode_postings(postings: Dict[int, List[int]]) -> bytes:
+    output = bytearray()
+    _put_varint(output, len(postings))
+    previous = 0
+    for doc in sorted(postings):
+        positions = postings[doc]
+        _put_varint(output, doc - previous)
+        _put_varint(output, len(positions))
+        previous = doc
+        last = 0
+        for position in positions:
+            _put_varint(output, position - last)
+            last = position
+    return bytes(output)
+
+
+def _decode_postings(data: bytes) -> Dict[int, List[int]]:
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    postings = {}
+    doc = 0
+    index = 1
+    for _ in range(values[0]):
+        doc += values[index]
+        count = values[index + 1]
+        index += 2
+        positions = []
+        position = 0
+        for delta in values[index : index + count]:
+            position += delta
+            positions.append(position)
+        index += count
+        postings[doc] = positions
+    return postings
+
+
+class _MemorySegment:
+    """Segment collecting newly indexed posts until it is written to disk"""
+
+    def __init__(self):
+        self.docs: Dict[int, _Document] = {}
+        self.postings: Dict[str, Dict[int, List[int]]] = {}
+        self._terms: Optional[List[str]] = None
+
+    def add(self, doc: int, document: _Document, tokens: List[str]):
+        self.docs[doc] = document
+        for position, token in enumerate(tokens):
+            self.postings.setdefault(token, {}).setdefault(doc, []).append(position)
+        self._terms = None
+
+    def terms(self) -> List[str]:
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+        return self._terms
+
+    def get(self, term: str) -> Dict[int, List[int]]:
+        return self.postings.get(term, {})
+
+    def write(self, path: str, deleted: Set[int]):
+        """Write the live documents into a segment file"""
+        docs = {
+            doc: document for doc, document in self.docs.items() if doc not in deleted
+        }
+        blob = bytearray()
+        terms = []
+        for term in self.terms():
+            postings = {
+                doc: positions
+                for doc, positions in self.postings[term].items()
+                if doc in docs
+            }
+            if postings:
+                data = _encode_postings(postings)
+                terms.append([term, len(blob), len(data)])
+                blob += data
+        header = zlib.compress(
+            json.dumps(
+                {
+                    "docs": [[doc, *document] for doc, document in docs.items()],
+                    "terms": terms,
+                },
+                separators=(",", ":"),
+            ).encode("utf-8")
+        )
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as segment_file:
+            segment_file.write(_MAGIC + _HEADER.pack(len(header)) + header + blob)
+        os.replace(temporary, path)
+
+
+class _DiskSegment:
+    """Immutable segment file, postings are read from a memory map when needed
+
+    File layout: magic, length of the header, zlib compressed json header with the
+    documents and the offset of the postings of every term, followed by the postings
+    encoded as delta and varint compressed document numbers and positions.
+    Decoded postings of the most recently searched terms are cached.
+    """
+
+    def __init__(self, path: str, cache_size: int = 4096):
+        self.path = path
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[int, List[int]]]" = OrderedDict()
+        with open(path, "rb") as segment_file:
+            self._map = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"{path} is not an index segment")
+        start = len(_MAGIC) + _HEADER.size
+        (length,) = _HEADER.unpack(self._map[len(_MAGIC) : start])
+        header = json.loads(zlib.decompress(self._map[start : start + length]))
+        self._base = start + length
+        self.docs: Dict[int, _Document] = {
+            row[0]: tuple(row[1:]) for row in header["docs"]
+        }
+        self._offsets = {term: (offset, size) for term, offset, size in header["terms"]}
+        self._terms = sorted(self._offsets)
+
+    def terms(self) -> List[str]:
+        return self._terms
+
+    def get(self, term: str) -> Dict[int, List[int]]:
+        postings = self._cache.get(term)
+        if postings is not None:
+            self._cache.move_to_end(term)
+            return postings
+        location = self._offsets.get(term)
+        if location is None:
+            return {}
+        start = self._base + location[0]
+        postings = _decode_postings(self._map[start : start + location[1]])
+        self._cache[term] = postings
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return postings
+
+    def close(self):
+        self._map.close()
+
+
+class PostIndex:
+    """Inverted index of post messages for local keyword searches
+
+    Posts are added from history syncs with :meth:`add_posts` and kept current by
+    passing websocket events to :meth:`apply`; edited posts are indexed again and
+    deleted posts removed. :meth:`search` supports the syntax of the Mattermost search
+    box, see :func:`parse_query`, and answers from the index without any request.
+
+    .. code-block:: python
+
+        index = PostIndex("search-index")
+        index.add_channels(channels)
+        index.add_users(users)
+        for channel_id in channel_ids:
+            index.add_posts(channel_posts(sd, channel_id))
+        sd.start_ws_sync(index.apply)
+
+        hits = index.search('"release notes" from:alice in:town-square after:2021-03-01')
+
+    New posts are collected in memory and written as an immutable segment file once
+    ``segment_size`` posts were added or :meth:`flush` is called. Every segment stores
+    its postings delta and varint encoded and is read through a memory map. Removed and
+    replaced posts are only marked as deleted until :meth:`compact` merges all segments
+    into one. Without a ``directory`` the index is kept in memory only.
+
+    Args:
+        directory: Directory of the segment files, created if needed. An existing index in
+            the directory is loaded.
+        segment_size: Number of posts collected in memory before a segment is written
+        time_zone: Time zone of the dates in ``after:``, ``before:`` and ``on:`` filters
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        segment_size: int = 50000,
+        time_zone: tzinfo = timezone.utc,
+    ):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.time_zone = time_zone
+        self._lock = threading.RLock()
+        self._segments: List[_DiskSegment] = []
+        self._memory = _MemorySegment()
+        self._deleted: Set[int] = set()
+        self._posts: Dict[str, int] = {}
+        self._usernames: Dict[str, str] = {}
+        self._channel_names: Dict[str, List[str]] = {}
+        self._next_doc = 0
+        self._next_segment = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._load()
+
+    def __len__(self):
+        return len(self._posts)
+
+    def __contains__(self, post_id: str) -> bool:
+        return post_id in self._posts
+
+    # Persistence
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.directory, MANIFEST)
+
+    def _load(self):
+        if not os.path.exists(self._manifest_path()):
+            return
+        with open(self._manifest_path(), encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+        self._next_doc = manifest["next_doc"]
+        self._next_segment = manifest["next_segment"]
+        self._deleted = set(manifest["deleted"])
+        self._usernames = manifest["usernames"]
+        self._channel_names = manifest["channel_names"]
+        for name in manifest["segments"]:
+            segment = _DiskSegment(os.path.join(self.directory, name))
+            self._segments.append(segment)
+            for doc, document in segment.docs.items():
+                if doc not in self._deleted:
+                    self._posts[document[0]] = doc
+
+    def _write_manifest(self):
+        manifest = {
+            "version": 1,
+            "next_doc": self._next_doc,
+            "next_segment": self._next_segment,
+            "segments": [os.path.basename(segment.path) for segment in self._segments],
+            "deleted": sorted(self._deleted),
+            "usernames": self._usernames,
+            "channel_names": self._channel_names,
+        }
+        temporary = self._manifest_path() + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(temporary, self._manifest_path())
+
+    def _write_segment(self, segment: _MemorySegment) -> _DiskSegment:
+        path = os.path.join(self.directory, f"segment-{self._next_segment:06d}.idx")
+        self._next_segment += 1
+        segment.write(path, self._deleted)
+        return _DiskSegment(path)
+
+    def flush(self):
+        """Write the posts collected in memory into a segment and save the manifest
+
+        Posts added since the last flush are lost if the process exits without it.
+        Does nothing for an index without directory.
+        """
+        if self.directory is None:
+            return
+        with self._lock:
+            if self._memory.docs:
+                segment = self._write_segment(self._memory)
+                self._deleted.difference_update(self._memory.docs)
+                self._segments.append(segment)
+                self._memory = _MemorySegment()
+            self._write_manifest()
+
+    def compact(self):
+        """Merge all segments into one, dropping removed and replaced posts"""
+        if self.directory is None:
+            return
+        with self._lock:
+            merged = _MemorySegment()
+            for segment in self._segments + [self._memory]:
+                for doc in segment.docs.keys() - self._deleted:
+                    merged.docs[doc] = segment.docs[doc]
+                for term in segment.terms():
+                    for doc, positions in segment.get(term).items():
+                        if doc not in self._deleted:
+                            merged.postings.setdefault(term, {})[doc] = positions
+            old = self._segments
+            self._segments = [self._write_segment(merged)] if merged.docs else []
+            self._memory = _MemorySegment()
+            self._deleted = set()
+            self._write_manifest()
+            for segment in old:
+                segment.close()
+                os.remove(segment.path)
+
+    def close(self):
+        """Flush the index and release the segment files"""
+        with self._lock:
+            self.flush()
+            for segment in self._segments:
+                segment.close()
+            self._segments = []
+
+    def __enter__(self) -> "PostIndex":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # Indexing
+
+    def add_users(self, users: Iterable[Any]):
+        """Register usernames for ``from:`` filters, users as models or decoded json"""
+        with self._lock:
+            for user in map(_decoded, users):
+                if user.get("username"):
+                    self._usernames[user["username"].lower()] = user["id"]
+
+    def add_channels(self, channels: Iterable[Any]):
+        """Register channel names for ``in:`` filters, channels as models or decoded json"""
+        with self._lock:
+            for channel in map(_decoded, channels):
+                if channel.get("name"):
+                    ids = self._channel_names.setdefault(channel["name"].lower(), [])
+                    if channel["id"] not in ids:
+                        ids.append(channel["id"])
+
+    def add_posts(self, posts: Iterable[Any]) -> int:
+        """Index posts given as models or decoded json, returns the number of indexed posts
+
+        Posts already indexed with the same or a later ``update_at`` are skipped, deleted
+        posts are removed from the index.
+        """
+        count = 0
+        with self._lock:
+            for post in map(_decoded, posts):
+                if post.get("delete_at"):
+                    self.remove(post["id"])
+                elif self._add(post):
+                    count += 1
+            if len(self._memory.docs) >= self.segment_size:
+                self.flush()
+        return count
+
+    def _document(self, doc: int) -> Optional[_Document]:
+        document = self._memory.docs.get(doc)
+        if document is None:
+            for segment in self._segments:
+                document = segment.docs.get(doc)
+                if document is not None:
+                    break
+        return document
+
+    def _add(self, post: Dict[str, Any]) -> bool:
+        update_at = post.get("update_at") or 0
+        current = self._posts.get(post["id"])
+        if current is not None:
+            if self._document(current)[4] >= update_at:
+                return False
+            self._deleted.add(current)
+        doc = self._next_doc
+        self._next_doc += 1
+        document = (
+            post["id"],
+            post.get("channel_id") or "",
+            post.get("user_id") or "",
+            post.get("create_at") or 0,
+            update_at,
+        )
+        self._memory.add(doc, document, tokenize(post.get("message") or ""))
+        self._posts[post["id"]] = doc
+        return True
+
+    def remove(self, post_id: str) -> bool:
+        """Remove a post from the index, returns ``False`` if it was not indexed"""
+        with self._lock:
+            doc = self._posts.pop(post_id, None)
+            if doc is None:
+                return False
+            self._deleted.add(doc)
+            return True
+
+    def apply(self, event: Dict[str, Any]) -> bool:
+        """Apply a websocket event, returns ``True`` if the event changed the index
+
+        Can be passed to :meth:`~matterapi.client.base.BaseClient.start_ws` directly.
+        """
+        return _apply_event(self, self._EVENT_HANDLERS, event)
+
+    def _on_posted(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self.add_posts([_loads(data["post"])])
+
+    def _on_post_deleted(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self.remove(_loads(data["post"])["id"])
+
+    def _on_user_updated(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self.add_users([_loads(data["user"])])
+
+    def _on_channel_updated(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self.add_channels([_loads(data["channel"])])
+
+    # channel_converted only carries the id and does not change the channel name
+    _EVENT_HANDLERS: Dict[str, Callable] = {
+        "posted": _on_posted,
+        "post_edited": _on_posted,
+        "post_deleted": _on_post_deleted,
+        "user_updated": _on_user_updated,
+        "channel_updated": _on_channel_updated,
+    }
+
+    # Searching
+
+    def _clause_docs(self, segment: Any, clause: _Clause) -> Set[int]:
+        postings = []
+        for token, prefix in clause:
+            if prefix:
+                terms = segment.terms()
+                merged: Dict[int, Set[int]] = {}
+                for term in terms[bisect.bisect_left(terms, token) :]:
+                    if not term.startswith(token):
+                        break
+                    for doc, positions in segment.get(term).items():
+                        merged.setdefault(doc, set()).update(positions)
+                postings.append(merged)
+            else:
+                postings.append(segment.get(token))
+            if not postings[-1]:
+                return set()
+        docs = set(postings[0]).intersection(*postings[1:])
+        if len(clause) == 1:
+            return docs
+        # Phrases need the tokens at consecutive positions
+        return {
+            doc
+            for doc in docs
+            if any(
+                all(
+                    position + offset in postings[offset][doc]
+                    for offset in range(1, len(postings))
+                )
+                for position in postings[0][doc]
+            )
+        }
+
+    def _segment_docs(
+        self, segment: Any, query: SearchQuery, or_search: bool
+    ) -> Set[int]:
+        docs: Optional[Set[int]] = None
+        for clause in query.clauses:
+            matches = self._clause_docs(segment, clause)
+            if docs is None:
+                docs = matches
+            elif or_search:
+                docs |= matches
+            else:
+                docs &= matches
+        if docs is None:
+            docs = set(segment.docs)
+        for clause in query.excluded:
+            if docs:
+                docs -= self._clause_docs(segment, clause)
+        return docs
+
+    def _resolve(
+        self, values: List[str], names: Dict[str, Any], multiple: bool
+    ) -> Optional[Set[str]]:
+        if not values:
+            return None
+        ids = set()
+        for value in values:
+            if value in names:
+                ids.update(names[value] if multiple else [names[value]])
+            else:
+                ids.add(value)
+        return ids
+
+    def search(
+        self,
+        terms: str,
+        limit: Optional[int] = 60,
+        or_search: bool = False,
+        channel_ids: Optional[Iterable[str]] = None,
+    ) -> List[SearchHit]:
+        """Return the posts matching search terms, newest first
+
+        Args:
+            terms: Search terms, see :func:`parse_query`
+            limit: Maximum number of results, ``None`` for all
+            or_search: Match posts containing any instead of all terms and phrases
+            channel_ids: Only search these channels, e.g. those visible to a user
+        """
+        query = parse_query(terms, self.time_zone)
+        with self._lock:
+            users = self._resolve(query.from_users, self._usernames, False)
+            channels = self._resolve(query.in_channels, self._channel_names, True)
+            if channel_ids is not None:
+                channel_ids = set(channel_ids)
+                channels = channel_ids if channels is None else channels & channel_ids
+            hits = []
+            for segment in self._segments + [self._memory]:
+                docs = self._segment_docs(segment, query, or_search)
+                for doc in docs - self._deleted:
+                    post_id, channel_id, user_id, create_at, _ = segment.docs[doc]
+                    if (
+                        (channels is None or channel_id in channels)
+                        and (users is None or user_id in users)
+                        and (query.after is None or create_at >= query.after)
+                        and (query.before is None or create_at < query.before)
+                    ):
+                        hits.append((create_at, post_id, channel_id, user_id))
+        if limit is None:
+            hits.sort(reverse=True)
+        else:
+            hits = heapq.nlargest(limit, hits)
+        return [
+            SearchHit(post_id, channel_id, user_id, create_at)
+            for create_at, post_id, channel_id, user_id in hits
+        ]
+
+
+__all__ = [
+    "PostIndex",
+    "SearchHit",
+    "SearchQuery",
+    "parse_query",
+    "tokenize",
+    "MANIFEST",
+]
@@ -0,0 +1,705 @@
+""" Persistent SQLite store of users, channels, members, posts and reactions """
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .fast import fast_parse_obj
+from .models import Channel, Post, PostList, Reaction, User
+from .paging import (
+    _apply_event,
+    _decoded,
+    _loads,
+    channel_posts,
+    modified_posts,
+    paginate,
+)
+
+SCHEMA_VERSION = 1
+""" Version of the table layout, stored as ``user_version`` of the database """
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    username TEXT,
+    update_at INTEGER NOT NULL DEFAULT 0,
+    delete_at INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_username ON users (username);
+
+CREATE TABLE IF NOT EXISTS channels (
+    id TEXT PRIMARY KEY,
+    team_id TEXT,
+    type TEXT,
+    name TEXT,
+    update_at INTEGER NOT NULL DEFAULT 0,
+    delete_at INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS channels_team ON channels (team_id, name);
+
+CREATE TABLE IF NOT EXISTS channel_members (
+    channel_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    PRIMARY KEY (channel_id, user_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS channel_members_user ON channel_members (user_id);
+
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    user_id TEXT,
+    root_id TEXT,
+    create_at INTEGER NOT NULL DEFAULT 0,
+    update_at INTEGER NOT NULL DEFAULT 0,
+    delete_at INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_channel ON posts (channel_id, create_at);
+CREATE INDEX IF NOT EXISTS posts_user ON posts (user_id, create_at);
+CREATE INDEX IF NOT EXISTS posts_root ON posts (root_id, create_at) WHERE root_id != '';
+
+CREATE TABLE IF NOT EXISTS reactions (
+    post_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    emoji_name TEXT NOT NULL,
+    create_at INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    PRIMARY KEY (post_id, user_id, emoji_name)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    channel_id TEXT PRIMARY KEY,
+    synced_at INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+_UPSERT_USER = """
+INSERT INTO users (id, username, update_at, delete_at, data) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    username = excluded.username, update_at = excluded.update_at,
+    delete_at = excluded.delete_at, data = excluded.data
+WHERE excluded.update_at >= users.update_at
+"""
+
+_UPSERT_CHANNEL = """
+INSERT INTO channels (id, team_id, type, name, update_at, delete_at, data)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    team_id = excluded.team_id, type = excluded.type, name = excluded.name,
+    update_at = excluded.update_at, delete_at = excluded.delete_at, data = excluded.data
+WHERE excluded.update_at >= channels.update_at
+"""
+
+_UPSERT_POST = """
+INSERT INTO posts (id, channel_id, user_id, root_id, create_at, update_at, delete_at, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    update_at = excluded.update_at, delete_at = excluded.delete_at, data = excluded.data
+WHERE excluded.update_at >= posts.update_at
+"""
+
+_UPSERT_REACTION = """
+INSERT OR REPLACE INTO reactions (post_id, user_id, emoji_name, create_at, data)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def _now() -> int:
+    return int(time.time() * 1000)
+
+
+def _dumps(value: Dict[str, Any]) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _chunks(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class SqliteStore:
+    """Local database of the data mirrored from a server
+
+    Users, channels, channel members, posts and reactions are kept in a SQLite database,
+    so mirrored data survives restarts and is not limited by the available memory.
+    The database uses write-ahead logging, so readers in other threads or processes are
+    not blocked by writes, and rows are written in batches of ``batch_size`` rows per
+    transaction. Posts are indexed by channel, author and thread, each ordered by
+    creation time.
+
+    The store is filled with :meth:`sync`, or the ``sync_*`` methods for single kinds of
+    data, and kept current by passing every websocket event to :meth:`apply`. Syncing a
+    channel again only requests posts changed since its last sync.
+
+    .. code-block:: python
+
+        with SqliteStore("mirror.db") as store:
+            store.sync(sd)
+            sd.start_ws_sync(store.apply)
+
+            # elsewhere, e.g. in another thread
+            store.posts_for_channel(channel_id, limit=30)
+            store.thread(root_id)
+
+    Query methods return :mod:`~matterapi.models` instances. Rows are written only if
+    they are at least as recent as the stored row according to ``update_at``, so stale
+    pages and late events do not overwrite newer data.
+
+    Args:
+        path: Path of the database file, ``:memory:`` for a temporary database
+        batch_size: Number of rows written per transaction
+    """
+
+    def __init__(self, path: str, batch_size: int = 1000):
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+            if version > SCHEMA_VERSION:
+                raise ValueError(
+                    f"{path} was created by a newer version (schema {version})"
+                )
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "SqliteStore":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _write(self, statement: str, rows: Iterable[Sequence[Any]]) -> int:
+        count = 0
+        for chunk in _chunks(rows, self.batch_size):
+            with self._lock, self._connection:
+                self._connection.executemany(statement, chunk)
+            count += len(chunk)
+        return count
+
+    def _query(self, sql: str, parameters: Sequence[Any] = ()) -> List[Any]:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    # Writing
+
+    def put_users(self, users: Iterable[Any]) -> int:
+        """Store users given as models or decoded json, returns their number"""
+        return self._write(
+            _UPSERT_USER,
+            (
+                (
+                    user["id"],
+                    user.get("username"),
+                    user.get("update_at") or 0,
+                    user.get("delete_at") or 0,
+                    _dumps(user),
+                )
+                for user in map(_decoded, users)
+            ),
+        )
+
+    def put_channels(self, channels: Iterable[Any]) -> int:
+        """Store channels given as models or decoded json, returns their number"""
+        return self._write(
+            _UPSERT_CHANNEL,
+            (
+                (
+                    channel["id"],
+                    channel.get("team_id"),
+                    channel.get("type"),
+                    channel.get("name"),
+                    channel.get("update_at") or 0,
+                    channel.get("delete_at") or 0,
+                    _dumps(channel),
+                )
+                for channel in map(_decoded, channels)
+            ),
+        )
+
+    def put_members(self, channel_id: str, user_ids: Iterable[str]) -> int:
+        """Add users to the members of a channel, returns their number"""
+        return self._write(
+            "INSERT OR IGNORE INTO channel_members (channel_id, user_id) VALUES (?, ?)",
+            ((channel_id, user_id) for user_id in user_ids),
+        )
+
+    def remove_member(self, channel_id: str, user_id: str):
+        """Remove a user from the members of a channel"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM channel_members WHERE channel_id = ? AND user_id = ?",
+                (channel_id, user_id),
+            )
+
+    def put_posts(self, posts: Iterable[Any]) -> int:
+        """Store posts given as models or decoded json, returns their number
+
+        Posts older than the stored version, by ``update_at``, are skipped. The reactions
+        contained in the metadata of the stored posts replace their stored reactions.
+        """
+        count = 0
+        for chunk in _chunks(map(_decoded, posts), self.batch_size):
+            with self._lock, self._connection:
+                # Posts rejected by the update_at guard keep their stored reactions
+                reacted = [
+                    post
+                    for post in chunk
+                    if "metadata" in post and self._is_current(post)
+                ]
+                self._connection.executemany(
+                    _UPSERT_POST,
+                    [
+                        (
+                            post["id"],
+                            post["channel_id"],
+                            post.get("user_id"),
+                            post.get("root_id") or "",
+                            post.get("create_at") or 0,
+                            post.get("update_at") or 0,
+                            post.get("delete_at") or 0,
+                            _dumps(post),
+                        )
+                        for post in chunk
+                    ],
+                )
+                self._connection.executemany(
+                    "DELETE FROM reactions WHERE post_id = ?",
+                    [(post["id"],) for post in reacted],
+                )
+                self._connection.executemany(
+                    _UPSERT_REACTION,
+                    [
+                        self._reaction_row(reaction)
+                        for post in reacted
+                        for reaction in (post["metadata"] or {}).get("reactions") or ()
+                    ],
+                )
+            count += len(chunk)
+        return count
+
+    def _is_current(self, post: Dict[str, Any]) -> bool:
+        """Check if a post is not older than the stored one, called with the lock held"""
+        row = self._connection.execute(
+            "SELECT update_at FROM posts WHERE id = ?", (post["id"],)
+        ).fetchone()
+        return row is None or (post.get("update_at") or 0) >= row[0]
+
+    @staticmethod
+    def _reaction_row(reaction: Dict[str, Any]) -> Sequence[Any]:
+        return (
+            reaction["post_id"],
+            reaction["user_id"],
+            reaction["emoji_name"],
+            reaction.get("create_at") or 0,
+            _dumps(reaction),
+        )
+
+    def delete_post(self, post_id: str, delete_at: Optional[int] = None):
+        """Mark a post as deleted, deleted posts are excluded from queries by default"""
+        delete_at = delete_at or _now()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT data FROM posts WHERE id = ?", (post_id,)
+            ).fetchone()
+            if row is None:
+                return
+            data = json.loads(row[0])
+            data["delete_at"] = delete_at
+            self._connection.execute(
+                "UPDATE posts SET delete_at = ?, data = ? WHERE id = ?",
+                (delete_at, _dumps(data), post_id),
+            )
+
+    def put_reactions(self, reactions: Iterable[Any]) -> int:
+        """Store reactions given as models or decoded json, returns their number"""
+        return self._write(
+            _UPSERT_REACTION, (self._reaction_row(_decoded(row)) for row in reactions)
+        )
+
+    def remove_reaction(self, post_id: str, user_id: str, emoji_name: str):
+        """Remove a single reaction"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM reactions"
+                " WHERE post_id = ? AND user_id = ? AND emoji_name = ?",
+                (post_id, user_id, emoji_name),
+            )
+
+    # Websocket events
+
+    def apply(self, event: Dict[str, Any]) -> bool:
+        """Apply a websocket event, returns ``True`` if the event changed the store
+
+        Can be passed to :meth:`~matterapi.client.base.BaseClient.start_ws` directly.
+        """
+        return _apply_event(
+            self,
+            self._EVENT_HANDLERS,
+            event,
+            (KeyError, TypeError, ValueError, sqlite3.Error),
+        )
+
+    def _on_posted(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self.put_posts([_loads(data["post"])])
+
+    def _on_post_deleted(self, data, broadcast):
+        # pylint: disable=unused-argument
+        post = _loads(data["post"])
+        self.delete_post(post["id"], post.get("delete_at"))
+
+    def _on_reaction_added(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self.put_reactions([_loads(data["reaction"])])
+
+    def _on_reaction_removed(self, data, broadcast):
+        # pylint: disable=unused-argument
+        reaction = _loads(data["reaction"])
+        self.remove_reaction(
+            reaction["post_id"], reaction["user_id"], reaction["emoji_name"]
+        )
+
+    def _on_channel_updated(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self.put_channels([_loads(data["channel"])])
+
+    def _on_channel_converted(self, data, broadcast):
+        # pylint: disable=unused-argument
+        # Only the id is sent, the changed channel follows with channel_updated
+        channel = self.channel(data["channel_id"])
+        if channel is not None:
+            self.put_channels([channel.copy(update={"type": "P"})])
+
+    def _on_channel_deleted(self, data, broadcast):
+        channel_id = data.get("channel_id") or broadcast["channel_id"]
+        channel = self.channel(channel_id)
+        if channel is not None:
+            delete_at = data.get("delete_at") or _now()
+            self.put_channels([channel.copy(update={"delete_at": delete_at})])
+
+    def _on_user_added(self, data, broadcast):
+        channel_id = broadcast.get("channel_id") or data["channel_id"]
+        self.put_members(channel_id, [data["user_id"]])
+
+    def _on_user_removed(self, data, broadcast):
+        # Sent to the channel with the removed user in data, or to the removed user
+        # with the channel in data
+        if data.get("user_id"):
+            channel_id = broadcast.get("channel_id") or data["channel_id"]
+            self.remove_member(channel_id, data["user_id"])
+        else:
+            self.remove_member(data["channel_id"], broadcast["user_id"])
+
+    def _on_user_updated(self, data, broadcast):
+        # pylint: disable=unused-argument
+        self.put_users([_loads(data["user"])])
+
+    _EVENT_HANDLERS: Dict[str, Callable] = {
+        "posted": _on_posted,
+        "post_edited": _on_posted,
+        "post_deleted": _on_post_deleted,
+        "reaction_added": _on_reaction_added,
+        "reaction_removed": _on_reaction_removed,
+        "channel_updated": _on_channel_updated,
+        "channel_converted": _on_channel_converted,
+        "channel_deleted": _on_channel_deleted,
+        "user_added": _on_user_added,
+        "user_removed": _on_user_removed,
+        "user_updated": _on_user_updated,
+    }
+
+    # Syncing from the REST api
+
+    def sync_users(self, api, per_page: int = 200, **filters) -> int:
+        """Store all users returned by ``get_users`` with the given filters"""
+        return self.put_users(
+            paginate(api.users.get_users, per_page=per_page, **filters)
+        )
+
+    def sync_users_by_ids(self, api, user_ids: Iterable[str], chunk: int = 100) -> int:
+        """Store the users with the given ids, requested in chunks of ``chunk`` ids"""
+        count = 0
+        for user_ids_chunk in _chunks(user_ids, chunk):
+            count += self.put_users(
+                _decoded(api.users.get_users_by_ids(json_body=user_ids_chunk))
+            )
+        return count
+
+    def sync_channels(self, api, user_id: str = "me") -> List[str]:
+        """Store the channels of a user on all of their teams, returns the channel ids"""
+        channel_ids: Dict[str, None] = {}
+        for team in map(_decoded, _decoded(api.teams.get_teams_for_user(user_id))):
+            channels = [
+                _decoded(channel)
+                for channel in _decoded(
+                    api.channels.get_channels_for_team_for_user(user_id, team["id"])
+                )
+            ]
+            self.put_channels(channels)
+            channel_ids.update((channel["id"], None) for channel in channels)
+        return list(channel_ids)
+
+    def sync_members(self, api, channel_id: str, per_page: int = 200) -> int:
+        """Replace the stored members of a channel with the current ones"""
+        user_ids = [
+            _decoded(member)["user_id"]
+            for member in paginate(
+                api.channels.get_channel_members, channel_id, per_page=per_page
+            )
+        ]
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM channel_members WHERE channel_id = ?", (channel_id,)
+            )
+        return self.put_members(channel_id, user_ids)
+
+    def sync_posts(
+        self, api, channel_id: str, per_page: int = 200, margin: int = 60000
+    ) -> int:
+        """Store the posts of a channel, returns the number of stored posts
+
+        The first sync of a channel pages through its whole history. Later syncs only
+        request posts created, edited or deleted since the previous sync, minus
+        ``margin`` milliseconds to allow for clock differences.
+        """
+        started = _now()
+        synced_at = self.synced_at(channel_id)
+        if synced_at is None:
+            posts = channel_posts(api, channel_id, per_page=per_page)
+        else:
+            posts = modified_posts(api, channel_id, max(synced_at - margin, 1))
+        count = self.put_posts(posts)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state (channel_id, synced_at) VALUES (?, ?)",
+                (channel_id, started),
+            )
+        return count
+
+    def synced_at(self, channel_id: str) -> Optional[int]:
+        """Return the time of the last post sync of a channel in milliseconds"""
+        rows = self._query(
+            "SELECT synced_at FROM sync_state WHERE channel_id = ?", (channel_id,)
+        )
+        return rows[0][0] if rows else None
+
+    def sync(self, api, user_id: str = "me", per_page: int = 200) -> int:
+        """Sync the channels of a user, their members, the members' users and all posts
+
+        Works with a :class:`~matterapi.client.sync_client.SyncClient` session with or
+        without ``skip_response_parsing``. Returns the number of stored posts.
+        """
+        count = 0
+        channel_ids = self.sync_channels(api, user_id)
+        for channel_id in channel_ids:
+            self.sync_members(api, channel_id, per_page=per_page)
+            count += self.sync_posts(api, channel_id, per_page=per_page)
+        user_ids = [
+            row[0]
+            for row in self._query(
+                "SELECT DISTINCT user_id FROM channel_members ORDER BY user_id"
+            )
+        ]
+        self.sync_users_by_ids(api, user_ids)
+        return count
+
+    # Queries
+
+    def _models(self, model: type, rows: Iterable[Sequence[Any]]) -> List[Any]:
+        return [fast_parse_obj(model, json.loads(row[0])) for row in rows]
+
+    def user(self, user_id: str) -> Optional[User]:
+        users = self._models(
+            User, self._query("SELECT data FROM users WHERE id = ?", (user_id,))
+        )
+        return users[0] if users else None
+
+    def user_by_username(self, username: str) -> Optional[User]:
+        users = self._models(
+            User,
+            self._query("SELECT data FROM users WHERE username = ?", (username,)),
+        )
+        return users[0] if users else None
+
+    def users(self, user_ids: Sequence[str]) -> List[User]:
+        """Return the stored users of the given ids, unknown ids are skipped"""
+        users = []
+        for chunk in _chunks(user_ids, 500):
+            users.extend(
+                self._models(
+                    User,
+                    self._query(
+                        "SELECT data FROM users WHERE id IN "
+                        f"({', '.join('?' * len(chunk))})",
+                        chunk,
+                    ),
+                )
+            )
+        return users
+
+    def channel(self, channel_id: str) -> Optional[Channel]:
+        channels = self._models(
+            Channel,
+            self._query("SELECT data FROM channels WHERE id = ?", (channel_id,)),
+        )
+        return channels[0] if channels else None
+
+    def channels_of_team(
+        self, team_id: str, include_deleted: bool = False
+    ) -> List[Channel]:
+        """Return the stored channels of a team ordered by name"""
+        return self._models(
+            Channel,
+            self._query(
+                "SELECT data FROM channels WHERE team_id = ?"
+                + ("" if include_deleted else " AND delete_at = 0")
+                + " ORDER BY name",
+                (team_id,),
+            ),
+        )
+
+    def members(self, channel_id: str) -> List[str]:
+        """Return the ids of the members of a channel"""
+        return [
+            row[0]
+            for row in self._query(
+                "SELECT user_id FROM channel_members WHERE channel_id = ?",
+                (channel_id,),
+            )
+        ]
+
+    def channels_of_user(self, user_id: str) -> List[str]:
+        """Return the ids of the channels a user is a member of"""
+        return [
+            row[0]
+            for row in self._query(
+                "SELECT channel_id FROM channel_members WHERE user_id = ?", (user_id,)
+            )
+        ]
+
+    def post(self, post_id: str) -> Optional[Post]:
+        posts = self._models(
+            Post, self._query("SELECT data FROM posts WHERE id = ?", (post_id,))
+        )
+        return posts[0] if posts else None
+
+    def _posts(
+        self,
+        column: str,
+        value: str,
+        since: Optional[int],
+        before: Optional[int],
+        limit: Optional[int],
+        include_deleted: bool,
+        newest_first: bool,
+    ) -> List[Post]:
+        sql = f"SELECT data FROM posts WHERE {column} = ?"
+        parameters: List[Any] = [value]
+        if column == "root_id":
+            # Matches the condition of the partial posts_root index
+            sql += " AND root_id != ''"
+        if since is not None:
+            sql += " AND create_at >= ?"
+            parameters.append(since)
+        if before is not None:
+            sql += " AND create_at < ?"
+            parameters.append(before)
+        if not include_deleted:
+            sql += " AND delete_at = 0"
+        sql += " ORDER BY create_at DESC" if newest_first else " ORDER BY create_at"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        return self._models(Post, self._query(sql, parameters))
+
+    def posts_for_channel(
+        self,
+        channel_id: str,
+        since: Optional[int] = None,
+        before: Optional[int] = None,
+        limit: Optional[int] = 60,
+        include_deleted: bool = False,
+    ) -> List[Post]:
+        """Return the posts of a channel, newest first
+
+        Args:
+            since: Only posts created at or after this time in milliseconds
+            before: Only posts created before this time in milliseconds, pass the
+                ``create_at`` of the oldest post of a page to get the next page
+            limit: Maximum number of posts, ``None`` for all
+            include_deleted: Include deleted posts
+        """
+        return self._posts(
+            "channel_id", channel_id, since, before, limit, include_deleted, True
+        )
+
+    def post_list(self, channel_id: str, **kwargs) -> PostList:
+        """Same as :meth:`posts_for_channel`, returned as :class:`~matterapi.models.PostList`"""
+        posts = self.posts_for_channel(channel_id, **kwargs)
+        posts_model = PostList.__fields__["posts"].type_
+        return PostList.construct(
+            order=[post.id for post in posts],
+            posts=posts_model.construct(__root__={post.id: post for post in posts}),
+        )
+
+    def posts_by_user(
+        self,
+        user_id: str,
+        since: Optional[int] = None,
+        before: Optional[int] = None,
+        limit: Optional[int] = 60,
+        include_deleted: bool = False,
+    ) -> List[Post]:
+        """Return the posts of a user in all channels, newest first"""
+        return self._posts(
+            "user_id", user_id, since, before, limit, include_deleted, True
+        )
+
+    def thread(self, root_id: str, include_deleted: bool = False) -> List[Post]:
+        """Return the root post, if stored, and its replies in chronological order"""
+        root = self.post(root_id)
+        replies = self._posts(
+            "root_id", root_id, None, None, None, include_deleted, False
+        )
+        if root is None or (root.delete_at and not include_deleted):
+            return replies
+        return [root] + replies
+
+    def reactions(self, post_id: str) -> List[Reaction]:
+        """Return the reactions to a post in the order they were added"""
+        return self._models(
+            Reaction,
+            self._query(
+                "SELECT data FROM reactions WHERE post_id = ? ORDER BY create_at",
+                (post_id,),
+            ),
+        )
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of stored rows per table"""
+        return {
+            table: self._query(f"SELECT COUNT(*) FROM {table}")[0][0]
+            for table in ("users", "channels", "channel_members", "posts", "reactions")
+        }
+
+
+__all__ = ["SqliteStore", "SCHEMA_VERSION"]
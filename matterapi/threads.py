@@ -0,0 +1,160 @@
+""" Merging of post list pages and reconstruction of threads """
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .models import Post, PostList
+
+
+@dataclass
+class PostGap:
+    """Posts missing next to a post of a post list
+
+    Fetch the missing posts with ``get_posts_for_channel(channel_id, before=post_id)`` for
+    gaps in direction ``before`` and ``after=post_id`` for gaps in direction ``after``.
+    """
+
+    post_id: str
+    """ Id of the post next to the gap, the oldest or newest post of a page """
+    missing_post_id: str
+    """ Id of the adjacent post which is not contained in the list """
+    direction: str
+    """ ``before`` if older posts are missing, ``after`` if newer posts are missing """
+
+
+def _posts(post_list: "PostList") -> Dict[str, "Post"]:
+    posts = post_list.posts
+    return posts.__root__ if posts is not None else {}
+
+
+def merge_post_lists(post_lists: Iterable["PostList"]) -> "PostList":
+    """Merge pages of posts into one post list
+
+    Orders are concatenated in the given sequence, e.g. newest page first when paging with
+    ``before`` cursors, and ids appearing on several pages are kept at their first position.
+    Of duplicate posts the one with the latest ``update_at`` is kept. ``next_post_id`` is
+    taken from the first and ``prev_post_id`` from the last list. Runs in linear time in
+    the total number of posts and does not validate the posts again.
+
+    Raises:
+        ValueError: If no post lists are given
+    """
+    post_lists = list(post_lists)
+    if not post_lists:
+        raise ValueError("At least one post list is required")
+    first = post_lists[0]
+    order: List[str] = []
+    seen = set()
+    posts: Dict[str, "Post"] = {}
+    for post_list in post_lists:
+        for post_id in post_list.order or ():
+            if post_id not in seen:
+                seen.add(post_id)
+                order.append(post_id)
+        for post_id, post in _posts(post_list).items():
+            current = posts.get(post_id)
+            if current is None or (post.update_at or 0) > (current.update_at or 0):
+                posts[post_id] = post
+    model = type(first)
+    posts_model = model.__fields__["posts"].type_
+    return model.construct(
+        order=order,
+        posts=posts_model.construct(__root__=posts),
+        next_post_id=first.next_post_id,
+        prev_post_id=post_lists[-1].prev_post_id,
+    )
+
+
+def _chronological(post: "Post") -> Tuple[int, str]:
+    return (post.create_at or 0, post.id or "")
+
+
+def thread_index(post_list: "PostList") -> Dict[str, List[str]]:
+    """Map the id of every root post to the ids of its replies in chronological order
+
+    Contains an entry for every root post in the list, with an empty list if none of its
+    replies are included, and for every ``root_id`` referenced by a reply, even if the
+    root post itself is not contained.
+    """
+    posts = _posts(post_list)
+    replies: Dict[str, List["Post"]] = {}
+    for post_id, post in posts.items():
+        if post.root_id:
+            replies.setdefault(post.root_id, []).append(post)
+        else:
+            replies.setdefault(post_id, [])
+    return {
+        root_id: [reply.id for reply in sorted(thread, key=_chronological)]
+        for root_id, thread in replies.items()
+    }
+
+
+def iter_thread(
+    post_list: "PostList",
+    root_id: str,
+    index: Optional[Dict[str, List[str]]] = None,
+) -> Iterator["Post"]:
+    """Yield the root post, if contained, and its replies in chronological order
+
+    Pass the result of :func:`thread_index` as ``index`` when walking many threads of the
+    same list, otherwise it is built on every call.
+    """
+    posts = _posts(post_list)
+    if index is None:
+        index = thread_index(post_list)
+    if root_id in posts:
+        yield posts[root_id]
+    for reply_id in index.get(root_id, ()):
+        yield posts[reply_id]
+
+
+def iter_threads(post_list: "PostList") -> Iterator[Tuple[str, List["Post"]]]:
+    """Yield ``(root_id, posts)`` for every thread, oldest thread first
+
+    Threads are ordered by the creation time of their root post, or of their first reply
+    if the root post is not contained. The posts of every thread are in chronological order.
+    """
+    posts = _posts(post_list)
+    index = thread_index(post_list)
+
+    def started(root_id: str) -> Tuple[int, str]:
+        if root_id in posts:
+            return _chronological(posts[root_id])
+        return _chronological(posts[index[root_id][0]])
+
+    for root_id in sorted(index, key=started):
+        yield root_id, list(iter_thread(post_list, root_id, index))
+
+
+def find_gaps(post_lists: Iterable["PostList"]) -> List[PostGap]:
+    """Find posts adjacent to the given pages which are contained in none of them
+
+    Every page names the post preceding its oldest post (``prev_post_id``) and following
+    its newest post (``next_post_id``). If such a post is not part of any page, posts
+    between the pages are missing, e.g. because pages were fetched at different times.
+    """
+    post_lists = list(post_lists)
+    known = set()
+    for post_list in post_lists:
+        known.update(_posts(post_list))
+    gaps = []
+    for post_list in post_lists:
+        order = post_list.order
+        if not order:
+            continue
+        if post_list.prev_post_id and post_list.prev_post_id not in known:
+            gaps.append(PostGap(order[-1], post_list.prev_post_id, "before"))
+        if post_list.next_post_id and post_list.next_post_id not in known:
+            gaps.append(PostGap(order[0], post_list.next_post_id, "after"))
+    return gaps
+
+
+__all__ = [
+    "PostGap",
+    "merge_post_lists",
+    "thread_index",
+    "iter_thread",
+    "iter_threads",
+    "find_gaps",
+]